@@ -23,6 +23,7 @@
 
 import concurrent.futures
 
+from collections import defaultdict
 from itertools import chain
 import os
 from typing import Dict, List, Optional, Set
@@ -203,82 +204,43 @@ class GeneralizeNetworkEdgesWithLengthAlgorithm(ValidationAlgorithm):
             self.manageSelectedIdsUsingInputMethod(networkLayer, method, idsToRemove)
             return {}
 
-        def compute(localGeographicBoundsLayer):
-            localContext = QgsProcessingContext()
-            if multiStepFeedback.isCanceled():
-                return set()
-            localNetworkCacheLyr = self.extractFeaturesRelatedToLayer(
-                localCache, localGeographicBoundsLayer
-            )
-            if multiStepFeedback.isCanceled():
-                return set()
-            localNodesLyr = self.extractFeaturesRelatedToLayer(
-                nodesLayer, localNetworkCacheLyr
-            )
-            if multiStepFeedback.isCanceled():
-                return set()
-            localPointFeatList = (
-                list(
-                    map(
-                        lambda x: self.extractFeaturesRelatedToLayer(
-                            x, localGeographicBoundsLayer
-                        ),
-                        pointLayerList,
-                    )
-                )
-                if len(pointLayerList) > 0
-                else []
-            )
-            if multiStepFeedback.isCanceled():
-                return set()
-            localLineFeatList = (
-                list(
-                    map(
-                        lambda x: self.extractFeaturesRelatedToLayer(
-                            x, localGeographicBoundsLayer
-                        ),
-                        lineLayerList,
-                    )
-                )
-                if len(lineLayerList) > 0
-                else []
+        currentStep += 1
+        multiStepFeedback.setCurrentStep(currentStep)
+        multiStepFeedback.setProgressText(self.tr("Partitioning inputs by region"))
+        constraintLayerDict = {
+            (geometryType, i): lyr
+            for geometryType, lyrList in (
+                ("point", pointLayerList),
+                ("line", lineLayerList),
+                ("polygon", polygonLayerList),
             )
+            for i, lyr in enumerate(lyrList)
+        }
+        featureCacheDict, regionViewList = self.layerHandler.buildRegionPartition(
+            regionLayer=geographicBoundsLayer,
+            layerDict={"network": localCache, **constraintLayerDict},
+            feedback=multiStepFeedback,
+        )
+        nodeFeatDict, _ = self.layerHandler.buildFeatureCache(nodesLayer)
+        nodeFeatListByEdgeDict = defaultdict(list)
+        for nodeFeat in nodeFeatDict.values():
+            nodeFeatListByEdgeDict[nodeFeat["featid"]].append(nodeFeat)
+
+        def compute(regionView):
             if multiStepFeedback.isCanceled():
                 return set()
-            localPolygonFeatList = (
-                list(
-                    map(
-                        lambda x: self.extractFeaturesRelatedToLayer(
-                            x, localGeographicBoundsLayer
-                        ),
-                        polygonLayerList,
-                    )
-                )
-                if len(polygonLayerList) > 0
-                else []
-            )
-            return self.findIdsToRemove(
+            return self.findIdsToRemoveOnRegion(
                 nx,
-                localNetworkCacheLyr,
-                localNodesLyr,
+                regionView,
+                featureCacheDict,
+                nodeFeatListByEdgeDict,
                 threshold,
-                localGeographicBoundsLayer,
-                localPointFeatList,
-                localLineFeatList,
-                localPolygonFeatList,
-                localContext,
-                None,
+                constraintKeyList=list(constraintLayerDict.keys()),
             )
 
         currentStep += 1
         multiStepFeedback.setCurrentStep(currentStep)
-        multiStepFeedback.setProgressText(self.tr("Splitting geographic bounds"))
-        geographicBoundaryLayerList = self.layerHandler.createMemoryLayerForEachFeature(
-            layer=geographicBoundsLayer, context=context, feedback=multiStepFeedback
-        )
-        currentStep += 1
-        multiStepFeedback.setCurrentStep(currentStep)
-        nRegions = len(geographicBoundaryLayerList)
+        nRegions = len(regionViewList)
         if nRegions == 0:
             return {}
         stepSize = 100 / nRegions
@@ -286,13 +248,11 @@ class GeneralizeNetworkEdgesWithLengthAlgorithm(ValidationAlgorithm):
         idsToRemove = set()
         pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() - 1)
         multiStepFeedback.setProgressText(self.tr("Submitting tasks to thread..."))
-        for current, localGeographicBoundsLayer in enumerate(
-            geographicBoundaryLayerList, start=0
-        ):
+        for current, regionView in enumerate(regionViewList, start=0):
             if multiStepFeedback.isCanceled():
                 pool.shutdown(cancel_futures=True)
                 break
-            futures.add(pool.submit(compute, localGeographicBoundsLayer))
+            futures.add(pool.submit(compute, regionView))
             multiStepFeedback.setProgress(current * stepSize)
 
         currentStep += 1
@@ -376,18 +336,84 @@ class GeneralizeNetworkEdgesWithLengthAlgorithm(ValidationAlgorithm):
             currentStep += 1
             multiStepFeedback.setCurrentStep(currentStep)
             multiStepFeedback.setProgressText(self.tr("Applying algorithm heurisic"))
+        return self.getGeneralizedIds(
+            networkBidirectionalGraph, constraintSet, threshold, multiStepFeedback
+        )
+
+    def getGeneralizedIds(self, G, constraintSet, threshold, feedback=None):
         G_out = graphHandler.generalize_edges_according_to_degrees(
-            G=networkBidirectionalGraph,
+            G=G,
             constraintSet=constraintSet,
             threshold=threshold,
-            feedback=multiStepFeedback,
+            feedback=feedback,
+        )
+        idsToRemove = set(G[a][b]["featid"] for a, b in G.edges) - set(
+            G_out[a][b]["featid"] for a, b in G_out.edges
         )
-        idsToRemove = set(
-            networkBidirectionalGraph[a][b]["featid"]
-            for a, b in networkBidirectionalGraph.edges
-        ) - set(G_out[a][b]["featid"] for a, b in G_out.edges)
         return idsToRemove
 
+    def findIdsToRemoveOnRegion(
+        self,
+        nx,
+        regionView,
+        featureCacheDict,
+        nodeFeatListByEdgeDict,
+        threshold,
+        constraintKeyList=None,
+    ):
+        """
+        Runs the generalization on a region of the partition built by
+        LayerHandler.buildRegionPartition, reading the shared features listed
+        on the region view instead of extracting layers for the region.
+        """
+        networkFeatDict = featureCacheDict["network"]
+        edgeFeatList = [networkFeatDict[featId] for featId in regionView["network"]]
+        if edgeFeatList == []:
+            return set()
+        nodeFeatList = list(
+            chain.from_iterable(
+                nodeFeatListByEdgeDict[feat["featid"]] for feat in edgeFeatList
+            )
+        )
+        (
+            nodeDict,
+            _,
+            _,
+            _,
+            networkBidirectionalGraph,
+            nodeLayerIdDict,
+        ) = graphHandler.buildAuxStructuresFromFeatures(
+            nx,
+            nodeFeatures=nodeFeatList,
+            edgeFeatures=edgeFeatList,
+            nodeCount=len(nodeFeatList),
+            useWkt=False,
+            computeNodeLayerIdDict=True,
+            addEdgeLength=True,
+        )
+        (
+            fixedInNodeSet,
+            fixedOutNodeSet,
+        ) = graphHandler.get_in_and_out_nodes_outside_geometry(
+            nodeDict=nodeDict,
+            nodeFeatures=nodeFeatList,
+            boundsGeom=regionView["region"].geometry(),
+        )
+        constraintSet = fixedInNodeSet | fixedOutNodeSet
+        constraintSet |= graphHandler.find_constraint_points_from_features(
+            nodeFeatures=nodeFeatList,
+            constraintGeoms=(
+                featureCacheDict[key][featId].geometry()
+                for key in constraintKeyList or []
+                for featId in regionView[key]
+            ),
+            nodeDict=nodeDict,
+            nodeLayerIdDict=nodeLayerIdDict,
+        )
+        return self.getGeneralizedIds(
+            networkBidirectionalGraph, constraintSet, threshold
+        )
+
     def getConstraintSet(
         self,
         nodeDict: Dict[QByteArray, int],
@@ -443,33 +469,6 @@ class GeneralizeNetworkEdgesWithLengthAlgorithm(ValidationAlgorithm):
         constraintPointSet |= constraintPointSetFromLambda
         return constraintPointSet
 
-    def extractFeaturesRelatedToLayer(
-        self, inputLyr, referenceLyr, context=None, feedback=None
-    ):
-        context = QgsProcessingContext() if context is None else context
-        multiStepFeedback = (
-            QgsProcessingMultiStepFeedback(2, feedback)
-            if feedback is not None
-            else None
-        )
-        if multiStepFeedback is not None:
-            multiStepFeedback.setCurrentStep(0)
-        extractedLyr = self.algRunner.runExtractByLocation(
-            inputLyr=inputLyr,
-            intersectLyr=referenceLyr,
-            context=context,
-            feedback=multiStepFeedback,
-        )
-        if multiStepFeedback is not None:
-            multiStepFeedback.setCurrentStep(1)
-        self.algRunner.runCreateSpatialIndex(
-            inputLyr=extractedLyr,
-            context=context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
-        return extractedLyr
-
     def name(self):
         """
         Returns the algorithm name, used for identifying the algorithm. This
@@ -23,14 +23,12 @@
 from collections import defaultdict
 import itertools
 import json
-import os
-
-import concurrent.futures
 
 from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.validationAlgorithm import (
     ValidationAlgorithm,
 )
 from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
+from DsgTools.core.GeometricTools import graphHandler
 from DsgTools.core.GeometricTools.featureHandler import FeatureHandler
 from DsgTools.core.GeometricTools.layerHandler import LayerHandler
 
@@ -52,7 +50,9 @@ from qgis.core import (
     QgsProcessingParameterNumber,
     QgsProcessingParameterExpression,
     QgsFeatureRequest,
-    QgsProcessingContext,
+    QgsExpression,
+    QgsExpressionContext,
+    QgsExpressionContextUtils,
 )
 
 
@@ -186,7 +186,7 @@ class ReclassifyAdjacentPolygonsAlgorithm(ValidationAlgorithm):
         )
         if output_sink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
-        nSteps = 6 + (dissolveOutput is True)
+        nSteps = 5 + (dissolveOutput is True)
         multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
         currentStep = 0
         multiStepFeedback.setCurrentStep(currentStep)
@@ -203,16 +203,6 @@ class ReclassifyAdjacentPolygonsAlgorithm(ValidationAlgorithm):
         )
         currentStep += 1
 
-        multiStepFeedback.setCurrentStep(currentStep)
-        multiStepFeedback.setProgressText(self.tr("Creating spatial index on cache"))
-        self.algRunner.runCreateSpatialIndex(
-            cacheLyr,
-            context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
-        currentStep += 1
-
         multiStepFeedback.setCurrentStep(currentStep)
         multiStepFeedback.setProgressText(self.tr("Building aux structures"))
         G, featDict, idSet = self.buildAuxStructures(
@@ -245,16 +235,16 @@ class ReclassifyAdjacentPolygonsAlgorithm(ValidationAlgorithm):
         nFeatsToUpdate = len(featureIdsToUpdateSet)
         if nFeatsToUpdate == 0:
             return {self.OUTPUT: output_sink_id}
-        stepSize = 100 / nFeatsToUpdate
         cacheLyr.startEditing()
         cacheLyr.beginEditCommand("Updating features")
         cacheLyrDataProvider = cacheLyr.dataProvider()
         fieldIdx = cacheLyrDataProvider.fields().indexFromName(classFieldName)
-        for current, (featid, classValue) in enumerate(featureIdsToUpdateSet):
-            if multiStepFeedback.isCanceled():
-                break
-            cacheLyrDataProvider.changeAttributeValues({featid: {fieldIdx: classValue}})
-            multiStepFeedback.setProgress(current * stepSize)
+        cacheLyrDataProvider.changeAttributeValues(
+            {
+                featid: {fieldIdx: classValue}
+                for featid, classValue in featureIdsToUpdateSet
+            }
+        )
         currentStep += 1
         cacheLyr.endEditCommand()
 
@@ -296,121 +286,47 @@ class ReclassifyAdjacentPolygonsAlgorithm(ValidationAlgorithm):
     def buildAuxStructures(
         self, nx, inputLyr, context, filterExpression=None, feedback=None
     ):
-        G = nx.Graph()
-        featDict = dict()
-        idSet = set()
-        multiStepFeedback = QgsProcessingMultiStepFeedback(3, feedback)
+        """
+        Builds the adjacency graph of the candidate polygons, weighted by the
+        shared boundary length, with a single read of the input layer.
+        :return: (tuple) graph, dict of the features on the graph by featid and
+            set of the candidate featids.
+        """
+        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
         multiStepFeedback.setCurrentStep(0)
-        candidatesLayer = self.algRunner.runFilterExpression(
-            inputLyr=inputLyr,
-            expression=filterExpression,
-            context=context,
-            feedback=multiStepFeedback,
+        multiStepFeedback.setProgressText(self.tr("Reading input features"))
+        expression = (
+            QgsExpression(filterExpression) if filterExpression is not None else None
         )
-        nFeats = candidatesLayer.featureCount()
-        multiStepFeedback.setCurrentStep(1)
-
-        def compute(feat, featLayer):
-            context = QgsProcessingContext()
-            algRunner = AlgRunner()
-            itemSet = set()
-            featId = feat["featid"]
-            if multiStepFeedback.isCanceled():
-                return itemSet
-            extractedFeaturesLayer = algRunner.runExtractByLocation(
-                inputLyr=inputLyr,
-                intersectLyr=featLayer,
-                context=context,
-                is_child_algorithm=True,
-            )
-            if multiStepFeedback.isCanceled():
-                return itemSet
-            extractedBoundariesLayer = algRunner.runPolygonsToLines(
-                inputLyr=extractedFeaturesLayer, context=context
-            )
-            if multiStepFeedback.isCanceled():
-                return itemSet
-            algRunner.runCreateSpatialIndex(
-                inputLyr=extractedBoundariesLayer,
-                context=context,
-                is_child_algorithm=True,
-            )
-            if multiStepFeedback.isCanceled():
-                return itemSet
-            splitBounds = algRunner.runClip(
-                extractedBoundariesLayer, featLayer, context=context
-            )
-            if multiStepFeedback.isCanceled():
-                return itemSet
-            for candidateFeat in splitBounds.getFeatures():
-                if multiStepFeedback.isCanceled():
-                    return set((None, None, None, -1))
-                candidateFeatId = candidateFeat["featid"]
-                if candidateFeatId == featId:
-                    continue
-                candidateLength = candidateFeat.geometry().length()
-                if candidateLength <= 0:
-                    continue
-                itemSet.add((featId, candidateFeatId, candidateFeat, candidateLength))
-            return itemSet
-
-        def build_graph(item):
-            featId, candidateFeatId, candidateFeat, intersectionLength = item
-            if featId is None:
-                return
-            if candidateFeatId not in featDict:
-                featDict[candidateFeatId] = candidateFeat
-            G.add_edge(featId, candidateFeatId)
-            G[featId][candidateFeatId]["length"] = intersectionLength
-
-        if nFeats == 0:
-            return G, featDict, idSet
-        multiStepFeedback.pushInfo(f"Submitting {nFeats} features to thread.")
-        stepSize = 100 / nFeats
-        logInterval = 1000
-        futures = set()
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() - 1)
-        for current, feat in enumerate(candidatesLayer.getFeatures()):
+        expressionContext = QgsExpressionContext(
+            QgsExpressionContextUtils.globalProjectLayerScopes(inputLyr)
+        )
+        if expression is not None:
+            expression.prepare(expressionContext)
+        allFeatDict = dict()
+        idSet = set()
+        nFeats = inputLyr.featureCount()
+        stepSize = 100 / nFeats if nFeats else 0
+        for current, feat in enumerate(inputLyr.getFeatures()):
             if multiStepFeedback.isCanceled():
                 break
             featId = feat["featid"]
-            featDict[featId] = feat
+            allFeatDict[featId] = feat
+            if expression is not None:
+                expressionContext.setFeature(feat)
+                if not expression.evaluate(expressionContext):
+                    continue
             idSet.add(featId)
-            featLayer = self.layerHandler.createMemoryLayerWithFeature(
-                inputLyr, feat, context
-            )
-            # result = compute(feat, featLayer)
-            # list(map(build_graph, result))
-            futures.add(executor.submit(compute, feat, featLayer))
             multiStepFeedback.setProgress(current * stepSize)
         multiStepFeedback.setCurrentStep(1)
-        nFeats = len(featDict)
-        stepSize = 100 / nFeats
-        if nFeats == 0:
-            return G, featDict, idSet
-
-        multiStepFeedback.setProgressText(
-            self.tr(
-                f"Starting the processess of building graph using parallel computing. Evaluating {nFeats:n} features."
-            )
+        multiStepFeedback.setProgressText(self.tr("Building adjacency graph"))
+        G = graphHandler.buildPolygonAdjacencyGraph(
+            nx, allFeatDict, idSet, feedback=multiStepFeedback
         )
-        candidateCount = 0
-        for candidateCount, future in enumerate(
-            concurrent.futures.as_completed(futures)
-        ):
-            if multiStepFeedback.isCanceled():
-                break
-            result = future.result()
-            list(map(build_graph, result))
-            if candidateCount % logInterval == 0:
-                multiStepFeedback.setProgressText(
-                    self.tr(f"Evaluated {candidateCount:n} / {nFeats:n} features.")
-                )
-            multiStepFeedback.setProgress(candidateCount * stepSize)
-
+        featDict = {featId: allFeatDict[featId] for featId in idSet.union(G.nodes)}
         multiStepFeedback.pushInfo(
             self.tr(
-                f"{nFeats:n} evaluated. Found {candidateCount:n} candidates to evaluate in next step."
+                f"{len(idSet):n} evaluated. Found {G.number_of_edges():n} adjacencies to evaluate in next step."
             )
         )
         return G, featDict, idSet
@@ -20,14 +20,12 @@
  ***************************************************************************/
 """
 
-import concurrent.futures
-import os
+import numpy as np
 from DsgTools.core.Utils.threadingTools import concurrently
 
 from qgis.core import (
     QgsProcessing,
     QgsProcessingAlgorithm,
-    QgsProcessingContext,
     QgsProcessingMultiStepFeedback,
     QgsProcessingParameterDistance,
     QgsProcessingParameterFeatureSink,
@@ -35,15 +33,19 @@ from qgis.core import (
     QgsProcessingParameterField,
     QgsSpatialIndex,
     QgsProcessingParameterNumber,
-    QgsFields,
-    QgsVectorLayer,
+    QgsGeometry,
+    QgsRectangle,
     QgsFeatureRequest,
     QgsFeature,
 )
 from qgis.PyQt.QtCore import QCoreApplication
 
-from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
-from DsgTools.core.GeometricTools.layerHandler import LayerHandler
+from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+from DsgTools.core.GeometricTools.polygonGrid import (
+    findNearestIndexes,
+    getGridCells,
+    getGridSpacing,
+)
 
 
 class SplitPolygonsByGrid(QgsProcessingAlgorithm):
@@ -165,10 +167,8 @@ class SplitPolygonsByGrid(QgsProcessingAlgorithm):
         )
 
     def processAlgorithm(self, parameters, context, feedback):
-        self.algRunner = AlgRunner()
-        self.layerHandler = LayerHandler()
+        self.geometryHandler = GeometryHandler()
         source = self.parameterAsSource(parameters, self.INPUT, context)
-        inputLyr = self.parameterAsVectorLayer(parameters, self.INPUT, context)
         x_distance = self.parameterAsDouble(parameters, self.X_DISTANCE, context)
         y_distance = self.parameterAsDouble(parameters, self.Y_DISTANCE, context)
         min_area = self.parameterAsDouble(parameters, self.MIN_AREA, context)
@@ -193,265 +193,161 @@ class SplitPolygonsByGrid(QgsProcessingAlgorithm):
         orderby = QgsFeatureRequest.OrderBy([clause])
         request.setOrderBy(orderby)
         iterator = source.getFeatures(request)
-        nSteps = nFeats + 2
-        multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
+        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
         multiStepFeedback.setCurrentStep(0)
-        multiStepFeedback.setProgressText(self.tr("Extracting vertexes..."))
-        verticesLyr = self.algRunner.runExtractVertices(
-            inputLyr=parameters[self.NEIGHBOUR],
-            context=context,
-            feedback=multiStepFeedback,
+        multiStepFeedback.setProgressText(self.tr("Indexing neighbour vertexes..."))
+        neighbourIndex, vertexXY, vertexClassList = self.buildNeighbourVertexIndex(
+            neighbour_source, classFieldName, feedback=multiStepFeedback
         )
+        if multiStepFeedback.isCanceled():
+            return {self.OUTPUT: dest_id}
         multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.setProgressText(self.tr("Creating spatial index..."))
-        self.algRunner.runCreateSpatialIndex(
-            verticesLyr,
-            context=context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
         multiStepFeedback.setProgressText(self.tr("Processing features..."))
 
-        def prepare_data(feature):
-            geom = feature.geometry()
-            bbox = geom.boundingBox()
-            try:
-                featureLayer = self.layerHandler.createMemoryLayerWithFeature(
-                    source, feature, context=context, isSource=True
-                )
-            except:
-                return None, None
-            if bbox.isEmpty() or bbox.isNull() or not bbox.isFinite():
-                return None, None
-            try:
-                localNeighborVertexes = self.algRunner.runExtractByExtent(
-                    inputLayer=verticesLyr, extent=bbox, context=context, clip=True
-                )
-            except:
-                return None, None
-            return featureLayer, localNeighborVertexes
-
-        def output_data(feature):
-            newFeat = QgsFeature(source.fields())
-            newFeat.setGeometry(feature.geometry())
-            newFeat[classFieldName] = feature[classFieldName]
-            return newFeat
-
-        if max_concurrency == 1:
-            for current, feature in enumerate(iterator, start=2):
-                if multiStepFeedback.isCanceled():
-                    return {self.OUTPUT: dest_id}
-                multiStepFeedback.setCurrentStep(current)
-                geom = feature.geometry()
-                if geom.isNull() or geom.isEmpty():
-                    continue
-                featureLayer, localNeighborVertexes = prepare_data(feature)
-                if featureLayer is None:
-                    continue
-                if multiStepFeedback.isCanceled():
-                    return {self.OUTPUT: dest_id}
-                outputFeatures = self.compute(
-                    localNeighborVertexes=localNeighborVertexes,
-                    feature=feature,
-                    featureLayer=featureLayer,
-                    x_distance=x_distance,
-                    y_distance=y_distance,
-                    classFieldName=classFieldName,
-                    source_fields=source.fields(),
-                    min_area=min_area,
-                    feedback=multiStepFeedback,
-                )
-                if outputFeatures is None or outputFeatures == set():
-                    if current % 500 == 0:
-                        multiStepFeedback.pushInfo(
-                            self.tr(f"Processed {current}/{nFeats}.")
-                        )
-                    continue
-                sink.addFeatures(list(map(output_data, outputFeatures)))
-                if current % 500 == 0:
-                    multiStepFeedback.pushInfo(
-                        self.tr(f"Processed {current}/{nFeats}.")
-                    )
-            return {self.OUTPUT: dest_id}
-
-        def compute_in_paralel(feature):
-            featureLayer, localNeighborVertexes = prepare_data(feature)
-            if featureLayer is None:
-                return set()
+        def compute(feature):
+            if multiStepFeedback.isCanceled():
+                return []
             return self.compute(
-                localNeighborVertexes=localNeighborVertexes,
-                feature=feature,
-                featureLayer=featureLayer,
+                geometry=feature.geometry(),
                 x_distance=x_distance,
                 y_distance=y_distance,
-                classFieldName=classFieldName,
-                source_fields=QgsFields(source.fields()),
                 min_area=min_area,
-                feedback=feedback,
+                neighbourIndex=neighbourIndex,
+                vertexXY=vertexXY,
+                vertexClassList=vertexClassList,
+                feedback=multiStepFeedback,
             )
 
-        for current, outputFeatures in enumerate(
-            concurrently(compute_in_paralel, iterator, max_concurrency=max_concurrency),
-            start=2,
+        def output_data(item):
+            geom, classValue = item
+            newFeat = QgsFeature(source.fields())
+            newFeat.setGeometry(geom)
+            newFeat[classFieldName] = classValue
+            return newFeat
+
+        stepSize = 100 / nFeats
+        for current, outputList in enumerate(
+            map(compute, iterator)
+            if max_concurrency == 1
+            else concurrently(compute, iterator, max_concurrency=max_concurrency),
+            start=1,
         ):
-            multiStepFeedback.setCurrentStep(current)
             if multiStepFeedback.isCanceled():
                 return {self.OUTPUT: dest_id}
-            if outputFeatures is None or outputFeatures == set():
-                continue
-            sink.addFeatures(list(map(output_data, outputFeatures)))
+            if outputList:
+                sink.addFeatures(list(map(output_data, outputList)))
             if current % 500 == 0:
                 multiStepFeedback.pushInfo(self.tr(f"Processed {current}/{nFeats}."))
+            multiStepFeedback.setProgress(current * stepSize)
 
         return {self.OUTPUT: dest_id}
 
+    def buildNeighbourVertexIndex(self, neighbour_source, classFieldName, feedback):
+        """
+        Reads the vertexes of the neighbour polygons once into a spatial index
+        shared by every input feature.
+        :return: (tuple) (QgsSpatialIndex, np.array, list) the index, whose
+            ids are positions on the (n, 2) array of vertex coordinates, and
+            the class value of each vertex.
+        """
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [classFieldName], neighbour_source.fields()
+        )
+        nFeats = neighbour_source.featureCount()
+        stepSize = 100 / nFeats if nFeats else 0
+        neighbourIndex = QgsSpatialIndex()
+        coordList, vertexClassList = [], []
+        for current, feat in enumerate(neighbour_source.getFeatures(request)):
+            if feedback.isCanceled():
+                break
+            geom = feat.geometry()
+            if geom.isNull() or geom.isEmpty():
+                continue
+            classValue = feat[classFieldName]
+            for vertex in geom.vertices():
+                neighbourIndex.addFeature(
+                    len(coordList),
+                    QgsRectangle(vertex.x(), vertex.y(), vertex.x(), vertex.y()),
+                )
+                coordList.append((vertex.x(), vertex.y()))
+                vertexClassList.append(classValue)
+            feedback.setProgress(current * stepSize)
+        vertexXY = np.array(coordList, dtype=np.float64).reshape(-1, 2)
+        return neighbourIndex, vertexXY, vertexClassList
+
     def compute(
         self,
-        localNeighborVertexes,
-        feature,
-        featureLayer,
+        geometry,
         x_distance,
         y_distance,
-        classFieldName,
-        source_fields,
         min_area,
+        neighbourIndex,
+        vertexXY,
+        vertexClassList,
         feedback=None,
     ):
-        context = QgsProcessingContext()
-        algRunner = AlgRunner()
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        if (
-            (feedback is not None and feedback.isCanceled())
-            or feature is None
-            or localNeighborVertexes is None
-            or featureLayer is None
-            or isinstance(localNeighborVertexes, str)
-            or localNeighborVertexes.featureCount() == 0
-        ):
-            return set()
-        neighbour_idx = QgsSpatialIndex(localNeighborVertexes.getFeatures())
-        neighbourFeatDict = {
-            feat.id(): feat for feat in localNeighborVertexes.getFeatures()
-        }
-        geometry = feature.geometry()
-        if geometry.isEmpty() or geometry.isNull():
-            return set()
+        """
+        Splits geometry by a grid, gives each piece the class of the nearest
+        neighbour vertex and dissolves the pieces by class. Only the neighbour
+        vertexes inside the bounding box of geometry are considered. Polygons
+        smaller than min_area or than a grid cell, or split into less than
+        four pieces, are only reclassified.
+        :return: (list) list of (QgsGeometry, class value) tuples.
+        """
+        if geometry is None or geometry.isNull() or geometry.isEmpty():
+            return []
         bbox = geometry.boundingBox()
-        xmin, ymin, xmax, ymax = bbox.toRectF().getCoords()
-        xSpacing = (
-            x_distance
-            if abs(xmax - xmin) > x_distance
-            else min(abs(xmax - xmin) / 2, abs(ymax - ymin) / 2)
-        )
-        ySpacing = (
-            y_distance
-            if abs(ymax - ymin) > y_distance
-            else min(abs(xmax - xmin) / 2, abs(ymax - ymin) / 2)
-        )
-        if geometry.area() <= min_area or geometry.area() <= xSpacing * ySpacing:
-            nearest_neighbor_ids = neighbour_idx.nearestNeighbor(
-                geometry.centroid().asPoint(), 1
-            )
-            if nearest_neighbor_ids == []:
-                return set()
-            nearest_neighbor_id = nearest_neighbor_ids[0]
-            if nearest_neighbor_id not in neighbourFeatDict:
-                return set()
-            feature[classFieldName] = neighbourFeatDict[nearest_neighbor_id][
-                classFieldName
+        if bbox.isEmpty() or bbox.isNull() or not bbox.isFinite():
+            return []
+        candidateIds = np.array(neighbourIndex.intersects(bbox), dtype=np.int64)
+        if len(candidateIds) == 0:
+            return []
+        candidateXY = vertexXY[candidateIds]
+
+        def getClassValues(geomList):
+            centroidXY = [
+                (point.x(), point.y())
+                for point in (geom.centroid().asPoint() for geom in geomList)
             ]
-            returnSet = set()
-            returnSet.add(feature)
-            return returnSet
-        gridLayer = algRunner.runCreateGrid(
-            extent=bbox,
-            crs=featureLayer.crs(),
-            hSpacing=xSpacing,
-            vSpacing=ySpacing,
-            context=context,
-            is_child_algorithm=True,
-        )
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        algRunner.runCreateSpatialIndex(
-            gridLayer, context=context, is_child_algorithm=True
+            return [
+                vertexClassList[candidateIds[i]]
+                for i in findNearestIndexes(centroidXY, candidateXY)
+            ]
+
+        extent = (
+            bbox.xMinimum(),
+            bbox.yMinimum(),
+            bbox.xMaximum(),
+            bbox.yMaximum(),
         )
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        try:
-            clippedPolygons = algRunner.runClip(
-                gridLayer, featureLayer, context=context
-            )
-        except:
-            clippedPolygons = None
+        xSpacing, ySpacing = getGridSpacing(extent, x_distance, y_distance)
+        area = geometry.area()
         if (
-            not isinstance(clippedPolygons, QgsVectorLayer)
-            or clippedPolygons.featureCount() < 4
+            area <= min_area
+            or area <= xSpacing * ySpacing
+            or xSpacing <= 0
+            or ySpacing <= 0
         ):
-            nearest_neighbors = neighbour_idx.nearestNeighbor(
-                geometry.centroid().asPoint(), 1
-            )
-            if nearest_neighbors == []:
-                return set()
-            nearest_neighbor_id = nearest_neighbors[0]
-            if nearest_neighbor_id not in neighbourFeatDict:
-                return set()
-            feature[classFieldName] = neighbourFeatDict[nearest_neighbor_id][
-                classFieldName
-            ]
-            returnSet = set()
-            returnSet.add(feature)
-            return returnSet
-        clippedPolygons.startEditing()
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        algRunner.runCreateSpatialIndex(
-            clippedPolygons, context=context, is_child_algorithm=True
-        )
-        nFeats = clippedPolygons.featureCount()
-        if nFeats == 0:
-            return None
-        clippedPolygons.beginEditCommand("Updating features")
-        clippedPolygonsDataProvider = clippedPolygons.dataProvider()
-        if not any(i.name() == classFieldName for i in clippedPolygons.fields()):
-            clippedPolygonsDataProvider.addAttributes(
-                [i for i in source_fields if i.name() == classFieldName]
-            )
-            clippedPolygons.updateFields()
-        fieldIdx = clippedPolygons.fields().indexFromName(classFieldName)
-        for feat in clippedPolygons.getFeatures():
-            if feedback is not None and feedback.isCanceled():
-                return set()
-            geom = feat.geometry()
-            if geom.isEmpty() or geom.isNull():
-                continue
-            nearest_neighbor_ids = neighbour_idx.nearestNeighbor(
-                geom.centroid().asPoint(), 1
-            )
-            if nearest_neighbor_ids == []:
-                continue
-            nearest_neighbor_id = nearest_neighbor_ids[0]
-            destinationAttr = neighbourFeatDict[nearest_neighbor_id][classFieldName]
-            clippedPolygonsDataProvider.changeAttributeValues(
-                {feat.id(): {fieldIdx: destinationAttr}}
-            )
-        clippedPolygons.endEditCommand()
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        snappedToGrid = algRunner.runSnapToGrid(
-            inputLayer=clippedPolygons, tol=1e-15, context=context
+            return [(geometry, getClassValues([geometry])[0])]
+        pieceList = self.geometryHandler.splitPolygonByCells(
+            geometry, getGridCells(extent, xSpacing, ySpacing), feedback=feedback
         )
         if feedback is not None and feedback.isCanceled():
-            return set()
-        dissolvedLyr = algRunner.runDissolve(
-            inputLyr=snappedToGrid,
-            field=[classFieldName],
-            context=context,
-        )
-        if feedback is not None and feedback.isCanceled():
-            return set()
-        retainedFields = algRunner.runRetainFields(
-            dissolvedLyr, [field.name() for field in source_fields], context=context
-        )
-        return set(feat for feat in retainedFields.getFeatures())
+            return []
+        if len(pieceList) < 4:
+            return [(geometry, getClassValues([geometry])[0])]
+        # class values may be unhashable QVariants, so the pieces are grouped
+        # by comparison
+        groupList = []
+        for piece, classValue in zip(pieceList, getClassValues(pieceList)):
+            piece = piece.snappedToGrid(1e-15, 1e-15)
+            for groupValue, groupPieceList in groupList:
+                if groupValue == classValue:
+                    groupPieceList.append(piece)
+                    break
+            else:
+                groupList.append((classValue, [piece]))
+        return [
+            (QgsGeometry.unaryUnion(groupPieceList), classValue)
+            for classValue, groupPieceList in groupList
+        ]
@@ -20,24 +20,29 @@
  *                                                                         *
  ***************************************************************************/
 """
-import os
-
 from pathlib import Path
-import zipfile
 
 from PyQt5.QtCore import QCoreApplication
 from qgis.core import (
     QgsProcessingAlgorithm,
+    QgsProcessingOutputFile,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterNumber,
     QgsProcessingParameterString,
     QgsProcessingParameterFile,
 )
 
+from DsgTools.core.Utils.zipPackageBuilder import buildZipPackages, writeManifest
+
 
 class BuildZipPackageAlgorithm(QgsProcessingAlgorithm):
 
     INPUT_SHAPEFILE_FOLDER = "INPUT_SHAPEFILE_FOLDER"
     OUTPUT_PREFIX = "OUTPUT_PREFIX"
     OUTPUT_ZIP_FOLDER = "OUTPUT_ZIP_FOLDER"
+    STORE_COMPRESSED_FORMATS = "STORE_COMPRESSED_FORMATS"
+    MAX_CONCURRENCY = "MAX_CONCURRENCY"
+    MANIFEST = "MANIFEST"
 
     def __init__(self):
         super().__init__()
@@ -69,6 +74,35 @@ class BuildZipPackageAlgorithm(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.STORE_COMPRESSED_FORMATS,
+                self.tr(
+                    "Store already compressed files (TIFF, JPEG, zip) without recompressing"
+                ),
+                defaultValue=True,
+            )
+        )
+
+        maxConcurrency = QgsProcessingParameterNumber(
+            self.MAX_CONCURRENCY,
+            self.tr("Max Concurrency"),
+            type=QgsProcessingParameterNumber.Integer,
+            defaultValue=1,
+            minValue=1,
+        )
+        maxConcurrency.setHelp(
+            self.tr("Number of packages compressed at the same time.")
+        )
+        self.addParameter(maxConcurrency)
+
+        self.addOutput(
+            QgsProcessingOutputFile(
+                self.MANIFEST,
+                self.tr("Manifest with the sizes and checksums of the packages"),
+            )
+        )
+
     def processAlgorithm(self, parameters, context, feedback):
         folderPath = self.parameterAsString(
             parameters, self.INPUT_SHAPEFILE_FOLDER, context
@@ -77,29 +111,48 @@ class BuildZipPackageAlgorithm(QgsProcessingAlgorithm):
         outputFolderPath = self.parameterAsString(
             parameters, self.OUTPUT_ZIP_FOLDER, context
         )
+        storeCompressedFormats = self.parameterAsBool(
+            parameters, self.STORE_COMPRESSED_FORMATS, context
+        )
+        maxConcurrency = self.parameterAsInt(parameters, self.MAX_CONCURRENCY, context)
         p = Path(folderPath)
-        folderList = [f.stem for f in p.iterdir() if f.is_dir()]
-        if len(folderList) == 0:
+        packageList = [
+            (f, Path(outputFolderPath, f"{outputPrefix}{f.stem}.zip"))
+            for f in p.iterdir()
+            if f.is_dir()
+        ]
+        if len(packageList) == 0:
             return {}
-        stepSize = 100 / len(folderList)
-        for current, folderName in enumerate(folderList):
-            if feedback.isCanceled():
-                break
-            outputZipName = f"{outputPrefix}{folderName}"
-            with zipfile.ZipFile(
-                Path(outputFolderPath, f"{outputZipName}.zip"),
-                "w",
-                zipfile.ZIP_DEFLATED,
-            ) as zf:
-                for item in Path(p / folderName).glob("*"):
-                    if ".DS_Store" in str(item) or "__MACOSX/" in str(item):
-                        continue
-                    zf.write(
-                        item, Path(folderName / item.relative_to(os.path.dirname(item)))
-                    )
-
+        stepSize = 100 / len(packageList)
+        entryList = []
+        for current, entry in enumerate(
+            buildZipPackages(
+                packageList,
+                maxConcurrency=maxConcurrency,
+                storeCompressedFormats=storeCompressedFormats,
+                feedback=feedback,
+            ),
+            start=1,
+        ):
+            entryList.append(entry)
+            feedback.pushInfo(
+                self.tr(
+                    "{0}: {1} files, {2:.1f} MB compressed to {3:.1f} MB in {4:.1f} s ({5:.1f} MB/s)."
+                ).format(
+                    entry["package"],
+                    len(entry["files"]),
+                    entry["input_size"] / (1024 * 1024),
+                    entry["size"] / (1024 * 1024),
+                    entry["elapsed_seconds"],
+                    entry["throughput_mb_per_second"] or 0,
+                )
+            )
             feedback.setProgress(current * stepSize)
-        return {}
+        if feedback.isCanceled():
+            return {}
+        manifestPath = str(Path(outputFolderPath, f"{outputPrefix}manifest.json"))
+        writeManifest(manifestPath, entryList)
+        return {self.MANIFEST: manifestPath}
 
     def name(self):
         """
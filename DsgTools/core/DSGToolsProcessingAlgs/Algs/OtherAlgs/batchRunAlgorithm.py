@@ -22,6 +22,9 @@
 
 from PyQt5.QtCore import QCoreApplication
 from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
+from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.concurrentRunAlgorithm import (
+    ConcurrentRunAlgorithm,
+)
 from qgis.PyQt.QtCore import QVariant
 import json, processing
 from qgis.core import (
@@ -41,7 +44,7 @@ from qgis.core import (
 )
 
 
-class BatchRunAlgorithm(QgsProcessingAlgorithm):
+class BatchRunAlgorithm(ConcurrentRunAlgorithm):
     INPUTLAYERS = "INPUTLAYERS"
     INPUT_LAYER_PARAMETER_NAME = "INPUT_LAYER_PARAMETER_NAME"
     ALG_NAME = "ALG_NAME"
@@ -92,6 +95,7 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
                 optional=True,
             )
         )
+        self.addMaxConcurrencyParameter(self.tr("layers"))
         self.addParameter(
             QgsProcessingParameterFeatureSink(self.OUTPUT, self.tr("Batch run output"))
         )
@@ -122,6 +126,21 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
             )
             return {"OUTPUT": flag_id}
         layerList = AlgRunner().runStringCsvToLayerList(layerCsv, context)
+        maxConcurrency = self.parameterAsInt(parameters, self.MAX_CONCURRENCY, context)
+        if maxConcurrency > 1 and self.supportsThreading(
+            algName, feedback, self.tr("layers")
+        ):
+            return self.runLayerJobsConcurrently(
+                parameters,
+                context,
+                feedback,
+                layerList=layerList,
+                algName=algName,
+                algParameterDict=algParameterDict,
+                inputKey=inputKey,
+                outputKey=outputKey,
+                maxConcurrency=maxConcurrency,
+            )
         nSteps = len(layerList)
         multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
         for idx, layer_id in enumerate(layerList):
@@ -150,9 +169,8 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
                     self.tr(f"Layer {layerName} is empty. Skipping step.")
                 )
                 continue
-            fieldNameSet = set(f.name() for f in layer.fields())
-            currentDict = self.parseParameterDict(
-                context, algParameterDict, fieldNameSet
+            currentDict = self.buildJobParameters(
+                context, algParameterDict, layer_id, layer
             )
             currentDict[inputKey] = layer
             output = self.runProcessingAlg(
@@ -213,6 +231,10 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
             )
         return currentDict
 
+    def buildJobParameters(self, context, algParameterDict, layerId, layer):
+        fieldNameSet = set(f.name() for f in layer.fields())
+        return self.parseParameterDict(context, algParameterDict, fieldNameSet)
+
     def loadAlgorithmParametersDict(self, parameters, context):
         rules_text = self.parameterAsString(parameters, self.PARAMETER_DICT, context)
         return json.loads(rules_text)
@@ -222,7 +244,10 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
         return output[outputKey] if outputKey else None
 
     def flagFeatures(self, outputLyr, algName, inputLyrName, context):
-        for feat in outputLyr.getFeatures():
+        self.addFlagFeatures(outputLyr.getFeatures(), algName, inputLyrName)
+
+    def addFlagFeatures(self, featList, algName, inputLyrName):
+        for feat in featList:
             newFeat = QgsFeature(self.flagFields)
             for field in feat.fields():
                 newFeat[field.name()] = feat[field.name()]
@@ -232,15 +257,24 @@ class BatchRunAlgorithm(QgsProcessingAlgorithm):
             self.flagSink.addFeature(newFeat, QgsFeatureSink.FastInsert)
 
     def prepareFlagSink(self, parameters, flagSource, context):
-        for field in flagSource.fields():
+        self.prepareFlagSinkFromDefinition(
+            parameters,
+            flagSource.fields(),
+            flagSource.wkbType(),
+            flagSource.sourceCrs(),
+            context,
+        )
+
+    def prepareFlagSinkFromDefinition(self, parameters, fields, wkbType, crs, context):
+        for field in fields:
             self.flagFields.append(field)
         (self.flagSink, self.flag_id) = self.parameterAsSink(
             parameters,
             self.OUTPUT,
             context,
             self.flagFields,
-            flagSource.wkbType(),
-            flagSource.sourceCrs(),
+            wkbType,
+            crs,
         )
         if self.flagSink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
@@ -22,6 +22,9 @@
 
 from PyQt5.QtCore import QCoreApplication
 from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
+from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.concurrentRunAlgorithm import (
+    ConcurrentRunAlgorithm,
+)
 from qgis.PyQt.QtCore import QVariant
 import json, processing
 from qgis.core import (
@@ -44,7 +47,7 @@ from qgis.core import (
 )
 
 
-class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
+class BatchRunAlgorithmWithGeographicBoundsConstraint(ConcurrentRunAlgorithm):
     INPUTLAYERS = "INPUTLAYERS"
     INPUT_LAYER_PARAMETER_NAME = "INPUT_LAYER_PARAMETER_NAME"
     ALG_NAME = "ALG_NAME"
@@ -62,6 +65,8 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
         self.flagFields = QgsFields()
         self.flagFields.append(QgsField("alg_name", QVariant.String))
         self.flagFields.append(QgsField("layer_name", QVariant.String))
+        self.geographicBoundaryLyr = None
+        self.geographicBoundaryKey = None
 
     def initAlgorithm(self, config=None):
         """
@@ -128,6 +133,7 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
                 optional=True,
             )
         )
+        self.addMaxConcurrencyParameter(self.tr("layers"))
         self.addParameter(
             QgsProcessingParameterFeatureSink(self.OUTPUT, self.tr("Batch run output"))
         )
@@ -145,10 +151,10 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
         outputKey = self.parameterAsString(
             parameters, self.OUTPUT_LAYER_PARAMETER_NAME, context
         )
-        geographicBoundaryLyr = self.parameterAsVectorLayer(
+        self.geographicBoundaryLyr = self.parameterAsVectorLayer(
             parameters, self.GEOGRAPHIC_BOUNDARY, context
         )
-        geographicBoundaryKey = self.parameterAsString(
+        self.geographicBoundaryKey = self.parameterAsString(
             parameters, self.GEOGRAPHIC_BOUNDARY_PARAMETER_NAME, context
         )
         self.mode = self.parameterAsEnum(parameters, self.MODE, context)
@@ -165,6 +171,21 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
             )
             return {"OUTPUT": flag_id}
         layerList = AlgRunner().runStringCsvToLayerList(layerCsv, context)
+        maxConcurrency = self.parameterAsInt(parameters, self.MAX_CONCURRENCY, context)
+        if maxConcurrency > 1 and self.supportsThreading(
+            algName, feedback, self.tr("layers")
+        ):
+            return self.runLayerJobsConcurrently(
+                parameters,
+                context,
+                feedback,
+                layerList=layerList,
+                algName=algName,
+                algParameterDict=algParameterDict,
+                inputKey=inputKey,
+                outputKey=outputKey,
+                maxConcurrency=maxConcurrency,
+            )
         nSteps = len(layerList)
         multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
         for idx, layer_id in enumerate(layerList):
@@ -193,17 +214,10 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
                     self.tr(f"Layer {layerName} is empty. Skipping step.")
                 )
                 continue
-            fieldNameSet = set(f.name() for f in layer.fields())
-            currentDict = self.parseParameterDict(
-                context, algParameterDict, input_id=layer_id, fieldNameSet=fieldNameSet
+            currentDict = self.buildJobParameters(
+                context, algParameterDict, layer_id, layer
             )
             currentDict[inputKey] = layer
-            if (
-                geographicBoundaryLyr is not None
-                and geographicBoundaryKey is not None
-                and geographicBoundaryKey != ""
-            ):
-                currentDict[geographicBoundaryKey] = geographicBoundaryLyr
             output = self.runProcessingAlg(
                 algName,
                 outputKey,
@@ -227,7 +241,7 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
                 algName,
                 layerName,
                 context,
-                geographicBoundaryLyr=geographicBoundaryLyr,
+                geographicBoundaryLyr=self.geographicBoundaryLyr,
             )
         if self.flag_id is None:
             _, self.flag_id = self.parameterAsSink(
@@ -275,6 +289,24 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
             )
         return currentDict
 
+    def buildJobParameters(self, context, algParameterDict, layerId, layer):
+        fieldNameSet = set(f.name() for f in layer.fields())
+        currentDict = self.parseParameterDict(
+            context, algParameterDict, input_id=layerId, fieldNameSet=fieldNameSet
+        )
+        if (
+            self.geographicBoundaryLyr is not None
+            and self.geographicBoundaryKey is not None
+            and self.geographicBoundaryKey != ""
+        ):
+            currentDict[self.geographicBoundaryKey] = self.geographicBoundaryLyr
+        return currentDict
+
+    def filterJobOutput(self, outputLyr, jobContext):
+        return self.filterByGeographicBoundary(
+            outputLyr, jobContext, self.geographicBoundaryLyr
+        )
+
     def loadAlgorithmParametersDict(self, parameters, context):
         rules_text = self.parameterAsString(parameters, self.PARAMETER_DICT, context)
         return json.loads(rules_text)
@@ -286,7 +318,13 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
     def flagFeatures(
         self, outputLyr, algName, inputLyrName, context, geographicBoundaryLyr=None
     ):
-        lyrToHandle = (
+        lyrToHandle = self.filterByGeographicBoundary(
+            outputLyr, context, geographicBoundaryLyr
+        )
+        self.addFlagFeatures(lyrToHandle.getFeatures(), algName, inputLyrName)
+
+    def filterByGeographicBoundary(self, outputLyr, context, geographicBoundaryLyr):
+        return (
             AlgRunner().runExtractByLocation(
                 inputLyr=outputLyr,
                 intersectLyr=geographicBoundaryLyr,
@@ -297,7 +335,8 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
             else outputLyr
         )
 
-        for feat in lyrToHandle.getFeatures():
+    def addFlagFeatures(self, featList, algName, inputLyrName):
+        for feat in featList:
             newFeat = QgsFeature(self.flagFields)
             for field in feat.fields():
                 newFeat[field.name()] = feat[field.name()]
@@ -307,15 +346,24 @@ class BatchRunAlgorithmWithGeographicBoundsConstraint(QgsProcessingAlgorithm):
             self.flagSink.addFeature(newFeat, QgsFeatureSink.FastInsert)
 
     def prepareFlagSink(self, parameters, flagSource, context):
-        for field in flagSource.fields():
+        self.prepareFlagSinkFromDefinition(
+            parameters,
+            flagSource.fields(),
+            flagSource.wkbType(),
+            flagSource.sourceCrs(),
+            context,
+        )
+
+    def prepareFlagSinkFromDefinition(self, parameters, fields, wkbType, crs, context):
+        for field in fields:
             self.flagFields.append(field)
         (self.flagSink, self.flag_id) = self.parameterAsSink(
             parameters,
             self.OUTPUT,
             context,
             self.flagFields,
-            flagSource.wkbType(),
-            flagSource.sourceCrs(),
+            wkbType,
+            crs,
         )
         if self.flagSink is None:
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
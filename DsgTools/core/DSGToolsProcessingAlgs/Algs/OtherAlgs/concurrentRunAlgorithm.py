@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import (
+    QgsApplication,
+    QgsFields,
+    QgsProcessingAlgorithm,
+    QgsProcessingContext,
+    QgsProcessingFeedback,
+    QgsProcessingMultiStepFeedback,
+    QgsProcessingParameterNumber,
+    QgsProcessingUtils,
+    QgsProject,
+    QgsWkbTypes,
+)
+from qgis.PyQt.QtCore import Qt
+
+from DsgTools.core.Utils.threadingTools import concurrently
+
+
+class ConcurrentRunAlgorithm(QgsProcessingAlgorithm):
+    """
+    Base of the algorithms that run another processing algorithm once per
+    job (a layer, a tile) and may run the jobs on worker threads.
+    """
+
+    MAX_CONCURRENCY = "MAX_CONCURRENCY"
+
+    def addMaxConcurrencyParameter(self, jobDescription):
+        """
+        :param jobDescription: (str) translated plural of what a job runs on,
+            e.g. layers or tiles.
+        """
+        maxConcurrency = QgsProcessingParameterNumber(
+            self.MAX_CONCURRENCY,
+            self.tr("Max Concurrency"),
+            type=QgsProcessingParameterNumber.Integer,
+            defaultValue=1,
+            minValue=1,
+        )
+        maxConcurrency.setHelp(
+            self.tr(
+                "Number of {0} processed at the same time. Use values above 1 "
+                "only with algorithms that do not edit their input layers."
+            ).format(jobDescription)
+        )
+        self.addParameter(maxConcurrency)
+
+    def supportsThreading(self, algName, feedback, jobDescription):
+        alg = QgsApplication.processingRegistry().algorithmById(algName)
+        if alg is not None and alg.flags() & QgsProcessingAlgorithm.FlagNoThreading:
+            feedback.pushInfo(
+                self.tr(
+                    "Algorithm {0} cannot run on worker threads. The {1} will be processed one at a time."
+                ).format(algName, jobDescription)
+            )
+            return False
+        return True
+
+    @staticmethod
+    def createJobContext(context):
+        """
+        Returns a new processing context on the project of context. The
+        temporary layers of a job are kept on it and released with it.
+        """
+        jobContext = QgsProcessingContext()
+        jobContext.setProject(context.project())
+        return jobContext
+
+    def runConcurrently(self, handler, jobList, maxConcurrency, context, feedback):
+        """
+        Calls handler(job, jobContext, jobFeedback) on up to maxConcurrency
+        jobs at the same time. Each job gets its own processing context on
+        the project of context and its own feedback, canceled along with
+        feedback.
+        :return: (generator) handler results, as the jobs finish.
+        """
+
+        def runOnWorker(job):
+            workerContext = self.createJobContext(context)
+            workerFeedback = QgsProcessingFeedback()
+            feedback.canceled.connect(workerFeedback.cancel, Qt.DirectConnection)
+            if feedback.isCanceled():
+                workerFeedback.cancel()
+            try:
+                return handler(job, workerContext, workerFeedback)
+            finally:
+                feedback.canceled.disconnect(workerFeedback.cancel)
+
+        return concurrently(
+            runOnWorker, jobList, max_concurrency=maxConcurrency, feedback=feedback
+        )
+
+    @staticmethod
+    def getOutputLayer(output, context):
+        return (
+            QgsProcessingUtils.mapLayerFromString(output, context)
+            if isinstance(output, str)
+            else output
+        )
+
+    @staticmethod
+    def getOutputDefinition(outputLyr, featList=None):
+        """
+        The context of a worker and its layers are discarded when its job
+        ends, so only the definition and features of the output are returned.
+        :return: (tuple) fields, wkb type, crs and list of features.
+        """
+        return (
+            QgsFields(outputLyr.fields()),
+            outputLyr.wkbType(),
+            outputLyr.sourceCrs(),
+            list(outputLyr.getFeatures()) if featList is None else featList,
+        )
+
+    def buildJobParameters(self, context, algParameterDict, layerId, layer):
+        """
+        Returns the parameters of the run on layer, except for the input
+        layer itself. Must be implemented by the batch algorithms.
+        :param algParameterDict: (dict) parameters given by the user;
+        :param layerId: (str) id of layer;
+        :param layer: (QgsVectorLayer) input layer of the run;
+        :return: (dict) parameters of the run.
+        """
+        raise NotImplementedError
+
+    def filterJobOutput(self, outputLyr, jobContext):
+        """
+        Returns the layer whose features are flagged, out of the output of a
+        run. By default, every output feature is flagged.
+        """
+        return outputLyr
+
+    def buildLayerJobList(
+        self, context, feedback, layerList, algParameterDict, inputKey
+    ):
+        """
+        Builds the batch jobs, skipping the layers that are not found, are
+        read only or are empty.
+        :return: (list) (layer name, parameter dict) tuples.
+        """
+        jobList = []
+        for layerId in layerList:
+            layer = QgsProcessingUtils.mapLayerFromString(layerId, context)
+            if layer is None:
+                feedback.pushInfo(self.tr(f"Layer {layerId} not found. Skipping step."))
+                continue
+            layerName = layer.name()
+            if layer.readOnly():
+                feedback.pushInfo(
+                    self.tr(f"Layer {layerName} is read only. Skipping step.")
+                )
+                continue
+            if layer.featureCount() == 0:
+                feedback.pushInfo(
+                    self.tr(f"Layer {layerName} is empty. Skipping step.")
+                )
+                continue
+            currentDict = self.buildJobParameters(
+                context, algParameterDict, layerId, layer
+            )
+            currentDict[inputKey] = layer
+            jobList.append((layerName, currentDict))
+        return jobList
+
+    def runLayerJobsConcurrently(
+        self,
+        parameters,
+        context,
+        feedback,
+        layerList,
+        algName,
+        algParameterDict,
+        inputKey,
+        outputKey,
+        maxConcurrency,
+    ):
+        """
+        Runs the algorithm on up to maxConcurrency layers at the same time.
+        Each run has its own processing context and feedback and returns its
+        flags as plain features, which are written to the output in the
+        input layer order once every run finishes. Subclasses provide
+        buildJobParameters, runProcessingAlg, prepareFlagSinkFromDefinition
+        and addFlagFeatures and may override filterJobOutput.
+        :param layerList: (list) ids of the input layers;
+        :param algParameterDict: (dict) parameters given by the user;
+        :param inputKey: (str) name of the input layer parameter.
+        """
+        jobList = self.buildLayerJobList(
+            context, feedback, layerList, algParameterDict, inputKey
+        )
+        nJobs = len(jobList)
+        multiStepFeedback = QgsProcessingMultiStepFeedback(max(nJobs, 1), feedback)
+
+        def runOnLayer(job, jobContext, jobFeedback):
+            idx, (layerName, currentDict) = job
+            if jobFeedback.isCanceled():
+                return idx, layerName, None
+            output = self.runProcessingAlg(
+                algName,
+                outputKey,
+                currentDict,
+                context=jobContext,
+                feedback=jobFeedback,
+            )
+            if output is None:
+                return idx, layerName, None
+            outputLyr = self.getOutputLayer(output, jobContext)
+            if outputLyr is None or outputLyr.featureCount() == 0:
+                return idx, layerName, None
+            outputLyr = self.filterJobOutput(outputLyr, jobContext)
+            return idx, layerName, self.getOutputDefinition(outputLyr)
+
+        resultDict = dict()
+        for current, (idx, layerName, result) in enumerate(
+            self.runConcurrently(
+                runOnLayer, list(enumerate(jobList)), maxConcurrency, context, feedback
+            )
+        ):
+            multiStepFeedback.setCurrentStep(current)
+            multiStepFeedback.pushInfo(
+                self.tr("Step {0}/{1}: algorithm {2} finished on {3}").format(
+                    current + 1, nJobs, algName, layerName
+                )
+            )
+            resultDict[idx] = (layerName, result)
+        for idx in sorted(resultDict.keys()):
+            layerName, result = resultDict[idx]
+            if result is None:
+                continue
+            fields, wkbType, crs, featList = result
+            if self.flagSink is None:
+                self.prepareFlagSinkFromDefinition(
+                    parameters, fields, wkbType, crs, context
+                )
+            self.addFlagFeatures(featList, algName, layerName)
+        if self.flag_id is None:
+            _, self.flag_id = self.parameterAsSink(
+                parameters,
+                self.OUTPUT,
+                context,
+                self.flagFields,
+                QgsWkbTypes.Point,
+                QgsProject.instance().crs(),
+            )
+        return {self.OUTPUT: self.flag_id}
@@ -22,8 +22,7 @@
  *                                                                         *
  ***************************************************************************/
 """
-import math
-import functools
+import numpy as np
 from ...algRunner import AlgRunner
 import processing
 from PyQt5.QtCore import QCoreApplication
@@ -91,83 +90,85 @@ class PecCalculatorAlgorithm(QgsProcessingAlgorithm):
         """
         Here is where the processing itself takes place.
         """
+        try:
+            from scipy.spatial import KDTree
+        except ImportError:
+            raise QgsProcessingException(
+                self.tr(
+                    "This algorithm requires the Python scipy library. Please install this library and try again."
+                )
+            )
         inputLyr = self.parameterAsVectorLayer(parameters, self.INPUT, context)
         referenceLyr = self.parameterAsVectorLayer(parameters, self.REFERENCE, context)
         tol = self.parameterAsDouble(parameters, self.TOLERANCE, context)
-        distanceDict = dict()
-        featList = [i for i in inputLyr.getFeatures()]
-        step = 100 / len(featList) if featList else 0
-        for current, feat in enumerate(featList):
-            if feedback.isCanceled():
-                break
-            if not feat.geometry().isGeosValid():
-                continue
-            id = feat.id()
-            geom = feat.geometry().asGeometryCollection()[0].asPoint()
-            x = geom.x()
-            y = geom.y()
-            bbox = QgsRectangle(x - tol, y - tol, x + tol, y + tol)
-            request = QgsFeatureRequest()
-            request.setFilterRect(bbox)
-            minDistance = 0
-            candidateId = None
-            for candidateFeat in referenceLyr.getFeatures(request):
-                dist = feat.geometry().distance(candidateFeat.geometry())
-                if candidateId is None:
-                    minDistance = dist
-                    candidateId = candidateFeat.id()
-                    continue
-                elif dist < minDistance:
-                    minDistance = dist
-                    candidateId = candidateFeat.id()
-            if candidateId is not None:
-                distanceDict[id] = {
-                    "minDistance": minDistance,
-                    "candidateId": candidateId,
-                }
-            feedback.setProgress(current * step)
-
-        distanceList = [i["minDistance"] for i in distanceDict.values()]
-        n = len(distanceList)
-        distanceSquared = [i["minDistance"] ** 2 for i in distanceDict.values()]
-        rms = math.sqrt(sum(distanceSquared) / n)
-        percFunc = functools.partial(self.percentile, frequency=0.9)
-        perc = percFunc(distanceList)
-        mean = sum(distanceList) / n
+        multiStepFeedback = QgsProcessingMultiStepFeedback(3, feedback)
+        multiStepFeedback.setCurrentStep(0)
+        referenceXY = self.getCoordinateArray(
+            referenceLyr, allParts=True, feedback=multiStepFeedback
+        )
+        multiStepFeedback.setCurrentStep(1)
+        inputXY = self.getCoordinateArray(inputLyr, feedback=multiStepFeedback)
+        if multiStepFeedback.isCanceled():
+            return {}
+        multiStepFeedback.setCurrentStep(2)
+        if referenceXY.shape[0] == 0 or inputXY.shape[0] == 0:
+            feedback.pushInfo(self.tr("No points within the max distance."))
+            return {}
+        distances, _ = KDTree(referenceXY).query(inputXY, k=1, distance_upper_bound=tol)
+        distances = distances[np.isfinite(distances)]
+        if distances.size == 0:
+            feedback.pushInfo(self.tr("No points within the max distance."))
+            return {}
+        rms = np.sqrt(np.mean(distances**2))
+        perc = self.percentile(distances, frequency=0.9)
+        mean = np.mean(distances)
         feedback.pushInfo("MEAN: {mean}".format(mean=mean))
         feedback.pushInfo("RMS: {rms}".format(rms=rms))
         feedback.pushInfo("PERC: {perc}".format(perc=perc))
 
         return {}
 
-    def percentile(self, N, frequency, key=lambda x: x):
+    def getCoordinateArray(self, lyr, allParts=False, feedback=None):
+        """
+        Reads the point coordinates of the layer in a single request.
+        :param lyr: (QgsVectorLayer) point layer;
+        :param allParts: (bool) whether every part of multipoints is read or
+            only the first one;
+        :param feedback: (QgsFeedback) optional feedback;
+        :return: (np.array) array of shape (n, 2).
         """
-        Find the percentile of a list of values.
+        request = QgsFeatureRequest()
+        request.setNoAttributes()
+        coordList = []
+        nFeats = lyr.featureCount()
+        stepSize = 100 / nFeats if nFeats else 0
+        for current, feat in enumerate(lyr.getFeatures(request)):
+            if feedback is not None and feedback.isCanceled():
+                break
+            geom = feat.geometry()
+            if geom.isEmpty():
+                continue
+            pointList = geom.asMultiPoint() if geom.isMultipart() else [geom.asPoint()]
+            coordList.extend(
+                (p.x(), p.y()) for p in (pointList if allParts else pointList[:1])
+            )
+            if feedback is not None:
+                feedback.setProgress(current * stepSize)
+        return np.array(coordList, dtype=float).reshape(-1, 2)
 
-        @parameter N - is a list of values. Note N MUST BE already sorted.
-        @parameter percent - a float value from 0.0 to 1.0.
-        @parameter key - optional key function to compute value from each element of N.
+    def percentile(self, N, frequency):
+        """
+        Find the percentile of a list of values, interpolating linearly
+        between the closest ranks.
+
+        @parameter N - is a list or array of values.
+        @parameter frequency - a float value from 0.0 to 1.0.
 
         @return - the percentile of the values
         """
-        if not N:
+        if len(N) == 0:
             return None
-        sortedN = sorted(N)
-        if len(sortedN) < 1:
-            return 0 if not sortedN else 1
-        if frequency <= 0:
-            return sortedN[0]
-        elif frequency >= 1:
-            return sortedN[-1]
-        position = frequency * (len(sortedN) - 1)
-
-        bottom = math.floor(position)
-        top = math.ceil(position)
-        if top == bottom:
-            return sortedN[top]
-        return sortedN[bottom] * (1.0 + bottom - position) + sortedN[top] * (
-            1.0 + position - top
-        )
+        return float(np.percentile(N, 100 * min(max(frequency, 0), 1)))
 
     def name(self):
         """
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import json
+
+import processing
+from PyQt5.QtCore import QCoreApplication
+from qgis.core import (
+    QgsCoordinateTransform,
+    QgsFeature,
+    QgsFeatureSink,
+    QgsFields,
+    QgsProcessing,
+    QgsProcessingException,
+    QgsProcessingMultiStepFeedback,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterString,
+    QgsProcessingUtils,
+    QgsProject,
+    QgsRectangle,
+    QgsReferencedRectangle,
+    QgsWkbTypes,
+)
+
+from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.concurrentRunAlgorithm import (
+    ConcurrentRunAlgorithm,
+)
+from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
+from DsgTools.core.GeometricTools.tilePartition import TilePartition
+
+
+class RunAlgorithmByTilesAlgorithm(ConcurrentRunAlgorithm):
+    ALG_NAME = "ALG_NAME"
+    PARAMETER_DICT = "PARAMETER_DICT"
+    TILED_PARAMETER_NAMES = "TILED_PARAMETER_NAMES"
+    FLAG_PARAMETER_NAME = "FLAG_PARAMETER_NAME"
+    TILE_LAYER = "TILE_LAYER"
+    TILE_SIZE = "TILE_SIZE"
+    HALO = "HALO"
+    DISCARD_HALO_CROSSING = "DISCARD_HALO_CROSSING"
+    OUTPUT = "OUTPUT"
+
+    def initAlgorithm(self, config=None):
+        """
+        Parameter setting.
+        """
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.ALG_NAME, self.tr("Name of the algorithm with provider")
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.PARAMETER_DICT,
+                description=self.tr("Json parameter dict"),
+                multiLine=True,
+                defaultValue="{}",
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.TILED_PARAMETER_NAMES,
+                self.tr("Comma separated names of the layer parameters split by tile"),
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.FLAG_PARAMETER_NAME,
+                self.tr("Flag output parameter name"),
+                defaultValue="FLAGS",
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.TILE_LAYER,
+                self.tr("Tile layer (e.g. frames by inom)"),
+                [QgsProcessing.TypeVectorPolygon],
+                optional=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.TILE_SIZE,
+                self.tr("Tile size, used when no tile layer is given"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=10000,
+                minValue=0,
+            )
+        )
+        halo = QgsProcessingParameterNumber(
+            self.HALO,
+            self.tr("Halo"),
+            type=QgsProcessingParameterNumber.Double,
+            defaultValue=0,
+            minValue=0,
+        )
+        halo.setHelp(
+            self.tr(
+                "Distance the tiles are expanded by when the inputs are "
+                "extracted. It must be at least the search distance of the "
+                "algorithm, so that features near the tile border see their "
+                "neighbours."
+            )
+        )
+        self.addParameter(halo)
+        discardHaloCrossing = QgsProcessingParameterBoolean(
+            self.DISCARD_HALO_CROSSING,
+            self.tr("Discard flags that reach the halo border"),
+            defaultValue=False,
+        )
+        discardHaloCrossing.setHelp(
+            self.tr(
+                "Flags of checks that depend on the surroundings, such as gaps, "
+                "may be artifacts of the tile cut when they reach the border "
+                "of the expanded tile."
+            )
+        )
+        self.addParameter(discardHaloCrossing)
+        self.addMaxConcurrencyParameter(self.tr("tiles"))
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(self.OUTPUT, self.tr("Tiled run output"))
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        """
+        Here is where the processing itself takes place.
+        """
+        algName = self.parameterAsString(parameters, self.ALG_NAME, context)
+        algParameterDict = json.loads(
+            self.parameterAsString(parameters, self.PARAMETER_DICT, context)
+        )
+        tiledKeyList = [
+            key.strip()
+            for key in self.parameterAsString(
+                parameters, self.TILED_PARAMETER_NAMES, context
+            ).split(",")
+            if key.strip() != ""
+        ]
+        flagKey = self.parameterAsString(parameters, self.FLAG_PARAMETER_NAME, context)
+        tileSource = self.parameterAsSource(parameters, self.TILE_LAYER, context)
+        tileSize = self.parameterAsDouble(parameters, self.TILE_SIZE, context)
+        halo = self.parameterAsDouble(parameters, self.HALO, context)
+        discardHaloCrossing = self.parameterAsBool(
+            parameters, self.DISCARD_HALO_CROSSING, context
+        )
+        maxConcurrency = self.parameterAsInt(parameters, self.MAX_CONCURRENCY, context)
+        self.flagSink, self.flag_id = None, None
+        tiledLayerDict = self.getTiledLayerDict(algParameterDict, tiledKeyList, context)
+        if not any(tiledLayerDict.values()):
+            raise QgsProcessingException(
+                self.tr("None of the tiled parameters refers to a loaded layer.")
+            )
+        crs = next(lyrList[0] for lyrList in tiledLayerDict.values() if lyrList).crs()
+        partition = self.buildPartition(
+            tiledLayerDict, tileSource, tileSize, halo, crs, context
+        )
+        nTiles = len(partition)
+        feedback.pushInfo(self.tr(f"Running {algName} on {nTiles} tiles."))
+        jobList = [
+            (
+                tileIndex,
+                dict(algParameterDict),
+                QgsReferencedRectangle(
+                    QgsRectangle(*partition.getExpandedBox(tileIndex)), crs
+                ),
+            )
+            for tileIndex in range(nTiles)
+        ]
+
+        def runOnTile(job, tileContext, tileFeedback):
+            tileIndex, currentDict, extent = job
+            if tileFeedback.isCanceled():
+                return tileIndex, None, 0
+            hasFeatures = False
+            for key, layerList in tiledLayerDict.items():
+                tileLayerList = [
+                    AlgRunner().runExtractByExtent(
+                        layer, extent, tileContext, clip=False
+                    )
+                    for layer in layerList
+                ]
+                hasFeatures |= any(lyr.featureCount() > 0 for lyr in tileLayerList)
+                currentDict[key] = (
+                    tileLayerList
+                    if isinstance(algParameterDict[key], list)
+                    else tileLayerList[0]
+                )
+            if not hasFeatures or tileFeedback.isCanceled():
+                return tileIndex, None, 0
+            currentDict[flagKey] = QgsProcessing.TEMPORARY_OUTPUT
+            output = processing.run(
+                algName, currentDict, context=tileContext, feedback=tileFeedback
+            )[flagKey]
+            outputLyr = self.getOutputLayer(output, tileContext)
+            if outputLyr is None or outputLyr.featureCount() == 0:
+                return tileIndex, None, 0
+            featList, nWithoutGeometry = self.getOwnedFlags(
+                outputLyr,
+                partition,
+                tileIndex,
+                crs,
+                discardHaloCrossing,
+                tileContext,
+            )
+            return (
+                tileIndex,
+                self.getOutputDefinition(outputLyr, featList),
+                nWithoutGeometry,
+            )
+
+        if maxConcurrency > 1 and self.supportsThreading(
+            algName, feedback, self.tr("tiles")
+        ):
+            resultIterator = self.runConcurrently(
+                runOnTile, jobList, maxConcurrency, context, feedback
+            )
+        else:
+            multiStepFeedback = QgsProcessingMultiStepFeedback(max(nTiles, 1), feedback)
+
+            def runSerially():
+                # each tile gets its own context, dropped once its flags are
+                # collected, so that memory is bounded by the tile size
+                for current, job in enumerate(jobList):
+                    multiStepFeedback.setCurrentStep(current)
+                    tileContext = self.createJobContext(context)
+                    result = runOnTile(job, tileContext, multiStepFeedback)
+                    del tileContext
+                    yield result
+
+            resultIterator = runSerially()
+        # flags are written as the tiles finish, so that at most
+        # maxConcurrency tiles are held in memory
+        nWithoutGeometry = 0
+        for current, (tileIndex, result, nTileWithoutGeometry) in enumerate(
+            resultIterator
+        ):
+            if feedback.isCanceled():
+                break
+            nWithoutGeometry += nTileWithoutGeometry
+            if result is not None:
+                fields, wkbType, flagCrs, featList = result
+                if self.flagSink is None:
+                    self.prepareFlagSink(parameters, fields, wkbType, flagCrs, context)
+                self.addFlagFeatures(featList)
+            feedback.setProgress(100 * (current + 1) / nTiles)
+        if nWithoutGeometry > 0:
+            feedback.pushWarning(
+                self.tr(
+                    "Flags without geometry cannot be assigned to a tile and were discarded ({0} found over all tiles)."
+                ).format(nWithoutGeometry)
+            )
+        if self.flag_id is None:
+            _, self.flag_id = self.parameterAsSink(
+                parameters,
+                self.OUTPUT,
+                context,
+                QgsFields(),
+                QgsWkbTypes.Point,
+                QgsProject.instance().crs(),
+            )
+        return {self.OUTPUT: self.flag_id}
+
+    def getTiledLayerDict(self, algParameterDict, tiledKeyList, context):
+        """
+        Resolves the layer names of the tiled parameters.
+        :return: (dict) parameter name -> list of QgsVectorLayer.
+        """
+        tiledLayerDict = dict()
+        for key in tiledKeyList:
+            if key not in algParameterDict:
+                raise QgsProcessingException(
+                    self.tr(f"Parameter {key} is not on the parameter dict.")
+                )
+            value = algParameterDict[key]
+            layerCsv = ",".join(value) if isinstance(value, list) else value
+            tiledLayerDict[key] = [
+                QgsProcessingUtils.mapLayerFromString(layerId, context)
+                for layerId in AlgRunner().runStringCsvToLayerList(layerCsv, context)
+            ]
+        return tiledLayerDict
+
+    def buildPartition(self, tiledLayerDict, tileSource, tileSize, halo, crs, context):
+        """
+        Builds the tiles either from the bounding boxes of the features of
+        tileSource or from a regular grid over the extent of the inputs.
+        """
+        if tileSource is not None:
+            transform = QgsCoordinateTransform(
+                tileSource.sourceCrs(), crs, context.transformContext()
+            )
+            boxList = []
+            for feat in tileSource.getFeatures():
+                if not feat.hasGeometry():
+                    continue
+                bbox = transform.transformBoundingBox(feat.geometry().boundingBox())
+                boxList.append(
+                    (bbox.xMinimum(), bbox.yMinimum(), bbox.xMaximum(), bbox.yMaximum())
+                )
+            return TilePartition(boxList, halo=halo)
+        if tileSize <= 0:
+            raise QgsProcessingException(
+                self.tr("Either a tile layer or a positive tile size must be given.")
+            )
+        extent = QgsRectangle()
+        extent.setMinimal()
+        for layerList in tiledLayerDict.values():
+            for layer in layerList:
+                extent.combineExtentWith(layer.extent())
+        return TilePartition.fromRegularGrid(
+            (
+                extent.xMinimum(),
+                extent.yMinimum(),
+                extent.xMaximum(),
+                extent.yMaximum(),
+            ),
+            tileSize,
+            halo=halo,
+        )
+
+    def getOwnedFlags(
+        self, outputLyr, partition, tileIndex, crs, discardHaloCrossing, context
+    ):
+        """
+        Keeps the flags whose point on surface lies on the core of the tile.
+        Each point has exactly one owner tile, therefore flags found on the
+        halo of more than one tile are written only once. Flags outside
+        every core box are kept by the nearest tile. Flags without geometry
+        cannot be assigned to a tile and are discarded.
+        :return: (tuple) list of the owned flags and number of flags without
+            geometry.
+        """
+        transform = QgsCoordinateTransform(
+            outputLyr.sourceCrs(), crs, context.transformContext()
+        )
+        featList, pointList, bboxList = [], [], []
+        nWithoutGeometry = 0
+        for feat in outputLyr.getFeatures():
+            if not feat.hasGeometry():
+                nWithoutGeometry += 1
+                continue
+            geom = feat.geometry()
+            if outputLyr.sourceCrs() != crs:
+                geom.transform(transform)
+            point = geom.pointOnSurface().asPoint()
+            bbox = geom.boundingBox()
+            featList.append(feat)
+            pointList.append((point.x(), point.y()))
+            bboxList.append(
+                (bbox.xMinimum(), bbox.yMinimum(), bbox.xMaximum(), bbox.yMaximum())
+            )
+        if not featList:
+            return [], nWithoutGeometry
+        mask = partition.getOwnedMask(tileIndex, pointList)
+        if discardHaloCrossing:
+            mask &= partition.isWithinExpandedBox(tileIndex, bboxList)
+        return [feat for feat, keep in zip(featList, mask) if keep], nWithoutGeometry
+
+    def prepareFlagSink(self, parameters, fields, wkbType, crs, context):
+        (self.flagSink, self.flag_id) = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            fields,
+            wkbType,
+            crs,
+        )
+        if self.flagSink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        self.flagFields = fields
+
+    def addFlagFeatures(self, featList):
+        for feat in featList:
+            newFeat = QgsFeature(self.flagFields)
+            for field in feat.fields():
+                if self.flagFields.indexOf(field.name()) >= 0:
+                    newFeat[field.name()] = feat[field.name()]
+            newFeat.setGeometry(feat.geometry())
+            self.flagSink.addFeature(newFeat, QgsFeatureSink.FastInsert)
+
+    def name(self):
+        """
+        Returns the algorithm name, used for identifying the algorithm. This
+        string should be fixed for the algorithm, and must not be localised.
+        The name should be unique within each provider. Names should contain
+        lowercase alphanumeric characters only and no spaces or other
+        formatting characters.
+        """
+        return "runalgorithmbytiles"
+
+    def displayName(self):
+        """
+        Returns the translated algorithm name, which should be used for any
+        user-visible display of the algorithm name.
+        """
+        return self.tr("Run Algorithm By Tiles")
+
+    def group(self):
+        """
+        Returns the name of the group this algorithm belongs to. This string
+        should be localised.
+        """
+        return self.tr("Model Helpers")
+
+    def groupId(self):
+        """
+        Returns the unique ID of the group this algorithm belongs to. This
+        string should be fixed for the algorithm, and must not be localised.
+        The group id should be unique within each provider. Group id should
+        contain lowercase alphanumeric characters only and no spaces or other
+        formatting characters.
+        """
+        return "DSGTools - Model Helpers"
+
+    def shortHelpString(self):
+        return self.tr(
+            "Runs a validation algorithm tile by tile. The tiled layer parameters "
+            "are extracted by the tile expanded by the halo and the flags are "
+            "kept only by the tile whose core contains their point on surface, "
+            "so that the merged output has no duplicates from the halo zones."
+        )
+
+    def tr(self, string):
+        return QCoreApplication.translate("RunAlgorithmByTilesAlgorithm", string)
+
+    def createInstance(self):
+        return RunAlgorithmByTilesAlgorithm()
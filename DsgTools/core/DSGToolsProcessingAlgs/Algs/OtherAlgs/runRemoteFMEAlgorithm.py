@@ -29,7 +29,6 @@ from qgis.core import (
     QgsProcessingAlgorithm,
     QgsProcessingException,
     QgsProcessingParameterDefinition,
-    QgsProcessingParameterType,
 )
 from qgis.PyQt.QtCore import QCoreApplication
 
@@ -278,30 +277,6 @@ class RunRemoteFMEAlgorithm(QgsProcessingAlgorithm):
         return RunRemoteFMEAlgorithm()
 
 
-class ParameterFMEManagerType(QgsProcessingParameterType):
-    def __init__(self):
-        super().__init__()
-
-    def create(self, name):
-        return ParameterFMEManager(name)
-
-    def metadata(self):
-        return {
-            "widget_wrapper": "DsgTools.gui.ProcessingUI.fmeManagerWrapper.FMEManagerWrapper"
-        }
-
-    def name(self):
-        return QCoreApplication.translate("Processing", "FME Manager Parameters")
-
-    def id(self):
-        return "fme_manager"
-
-    def description(self):
-        return QCoreApplication.translate(
-            "Processing", "FME Manager parameters. Used on Run Remote FME Workspace"
-        )
-
-
 class ParameterFMEManager(QgsProcessingParameterDefinition):
     def __init__(self, name, description=""):
         super().__init__(name, description)
@@ -36,10 +36,15 @@ from qgis.core import (
     QgsProcessingMultiStepFeedback,
 )
 
+from DsgTools.core.GeometricTools.postgisValidationHandler import (
+    PostgisValidationHandler,
+)
+
 
 class DetectNullGeometriesAlgorithm(QgsProcessingAlgorithm):
     INPUT_LAYERS = "INPUT_LAYERS"
     RUN_CHECK_ON_INPUT = "RUN_CHECK_ON_INPUT"
+    RUN_ON_SERVER = "RUN_ON_SERVER"
 
     def initAlgorithm(self, config=None):
         self.addParameter(
@@ -54,6 +59,13 @@ class DetectNullGeometriesAlgorithm(QgsProcessingAlgorithm):
                 defaultValue=True,
             )
         )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.RUN_ON_SERVER,
+                self.tr("Run the check on the PostGIS server when possible"),
+                defaultValue=True,
+            )
+        )
 
     def processAlgorithm(self, parameters, context, feedback):
         """
@@ -63,6 +75,7 @@ class DetectNullGeometriesAlgorithm(QgsProcessingAlgorithm):
         runCheckOnInput = self.parameterAsBool(
             parameters, self.RUN_CHECK_ON_INPUT, context
         )
+        runOnServer = self.parameterAsBool(parameters, self.RUN_ON_SERVER, context)
 
         if not inputLyrList:
             return {}
@@ -72,7 +85,11 @@ class DetectNullGeometriesAlgorithm(QgsProcessingAlgorithm):
         listSize = len(inputLyrList)
         stepSize = 100 / listSize if listSize else 0
 
-        def compute(lyr):
+        serverHandler = PostgisValidationHandler()
+
+        def compute(lyr, runOnServer=False):
+            if runOnServer:
+                return lyr.name(), serverHandler.hasNullOrEmptyGeometries(lyr)
             return lyr.name(), any(
                 feat.geometry().isNull() or feat.geometry().isEmpty()
                 for feat in lyr.getFeatures()
@@ -88,7 +105,13 @@ class DetectNullGeometriesAlgorithm(QgsProcessingAlgorithm):
             self.addRuleToLayer(lyr, feedback=feedback)
             self.createRuleVirtualField(lyr)
             if runCheckOnInput:
-                futures.add(pool.submit(compute, lyr))
+                futures.add(
+                    pool.submit(
+                        compute,
+                        lyr,
+                        runOnServer and serverHandler.canRunOnServer(lyr),
+                    )
+                )
             multiStepFeedback.setProgress(current * stepSize)
         if not runCheckOnInput:
             return {}
@@ -28,7 +28,6 @@ from qgis.core import (
     QgsWkbTypes,
     QgsFeatureSink,
     QgsProcessingException,
-    QgsProcessingParameterType,
     QgsProcessingParameterDefinition,
     QgsProcessingParameterFeatureSink,
 )
@@ -220,30 +219,6 @@ class EnforceSpatialRulesAlgorithm(ValidationAlgorithm):
         return {self.POINT_FLAGS: ptId, self.LINE_FLAGS: lId, self.POLYGON_FLAGS: polId}
 
 
-class ParameterSpatialRulesSetType(QgsProcessingParameterType):
-    def __init__(self):
-        super().__init__()
-
-    def create(self, name):
-        return ParameterSpatialRulesSet(name)
-
-    def metadata(self):
-        return {
-            "widget_wrapper": "DsgTools.gui.ProcessingUI.enforceSpatialRuleWrapper.EnforceSpatialRuleWrapper"
-        }
-
-    def name(self):
-        return QCoreApplication.translate("Processing", "Spatial Rules Set")
-
-    def id(self):
-        return "spatial_rules_set_type"
-
-    def description(self):
-        return QCoreApplication.translate(
-            "Processing", "Set of spatial rules. Used on Spatial Rules Checker."
-        )
-
-
 class ParameterSpatialRulesSet(QgsProcessingParameterDefinition):
     def __init__(self, name, description=""):
         super().__init__(name, description)
@@ -241,24 +241,25 @@ class ExtendLinesToGeographicBoundsAlgorithm(ValidationAlgorithm):
         originalFeaturesToUpdateDict = {
             feat["featid"]: feat for feat in inputLyr.getFeatures(expression)
         }
-        inputLyr.startEditing()
         editText = (
             "Extending lines from start points."
             if startPoint
             else "Extending lines from end points."
         )
-        inputLyr.beginEditCommand(editText)
+        geometryDict = dict()
         for current, feat in enumerate(extendedLines.getFeatures()):
             if multiStepFeedback.isCanceled():
                 return
-
-            inputLyr.changeGeometry(
-                originalFeaturesToUpdateDict[feat["featid"]].id(),
-                feat.geometry(),
-                skipDefaultValue=True,
-            )
+            geometryDict[
+                originalFeaturesToUpdateDict[feat["featid"]].id()
+            ] = feat.geometry()
             multiStepFeedback.setProgress(stepSize * current)
-        inputLyr.endEditCommand()
+        self.layerHandler.applyBulkEdits(
+            inputLyr,
+            geometryDict=geometryDict,
+            commandName=editText,
+            skipDefaultValue=True,
+        )
 
     def name(self):
         """
@@ -25,6 +25,7 @@ from collections import defaultdict
 from typing import Dict, Set, Tuple
 from PyQt5.QtCore import QCoreApplication
 from DsgTools.core.GeometricTools import graphHandler
+from DsgTools.core.GeometricTools.layerHandler import LayerHandler
 from qgis.PyQt.QtCore import QByteArray
 from qgis.core import (
     QgsProcessing,
@@ -507,8 +508,7 @@ class FixDrainageFlowAlgorithm(ValidationAlgorithm):
         if nEdges == 0:
             return
         stepSize = 100 / nEdges
-        networkLayer.startEditing()
-        networkLayer.beginEditCommand("Fixing drainage flow")
+        geometryDict = dict()
         for current, (p0, pn) in enumerate(DiG.edges):
             if feedback.isCanceled():
                 break
@@ -516,9 +516,14 @@ class FixDrainageFlowAlgorithm(ValidationAlgorithm):
             if nodeCompairFunc(p0, featid):
                 continue
             feat = self.flipLine(edgeDict, featid)
-            networkLayer.changeGeometry(featid, feat.geometry(), skipDefaultValue=True)
+            geometryDict[featid] = feat.geometry()
             feedback.setProgress(current * stepSize)
-        networkLayer.endEditCommand()
+        LayerHandler().applyBulkEdits(
+            networkLayer,
+            geometryDict=geometryDict,
+            commandName="Fixing drainage flow",
+            skipDefaultValue=True,
+        )
 
     def flipLine(self, edgeDict, edgeId):
         edgeFeat = edgeDict[edgeId]
@@ -20,7 +20,6 @@
  *                                                                         *
  ***************************************************************************/
 """
-from collections import defaultdict
 import itertools
 import json
 import gc
@@ -33,15 +32,21 @@ from qgis.core import (
     QgsProcessingException,
     QgsProcessingUtils,
     QgsProcessingContext,
-    QgsProcessingParameterType,
     QgsProcessingParameterVectorLayer,
     QgsProcessingParameterBoolean,
     QgsProcessingMultiStepFeedback,
     QgsProcessingParameterDefinition,
+    QgsFeatureRequest,
+    QgsGeometry,
     QgsWkbTypes,
 )
 
 from DsgTools.core.GeometricTools.layerHandler import LayerHandler
+from DsgTools.core.GeometricTools.snapIndex import (
+    PathGeometry,
+    SnapIndex,
+    suggestCellSize,
+)
 from ...algRunner import AlgRunner
 from .validationAlgorithm import ValidationAlgorithm
 
@@ -111,7 +116,6 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
             parameters, self.GEOGRAPHIC_BOUNDARY, context
         )
 
-        nSteps = 0
         for item in snapDictList:
             if (
                 geographicBoundaryLyr is not None
@@ -122,8 +126,9 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
                 )
             if item["snapLayerList"] is None:
                 item["snapLayerList"] = []
-            nSteps += len(item["snapLayerList"])
-        multiStepFeedback = QgsProcessingMultiStepFeedback(3 * nSteps + 4, feedback)
+        multiStepFeedback = QgsProcessingMultiStepFeedback(
+            3 * len(snapDictList) + 4, feedback
+        )
         currentStep = 0
         multiStepFeedback.setCurrentStep(currentStep)
         snapStructure = self.buildSnapStructure(
@@ -134,33 +139,51 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
             geographicBoundaryLyr=geographicBoundaryLyr,
         )
         currentStep += 1
+        multiStepFeedback.setCurrentStep(currentStep)
+        geometryDict = self.readGeometries(snapStructure, multiStepFeedback)
+        originalGeometryDict = {
+            lyrName: dict(featDict) for lyrName, featDict in geometryDict.items()
+        }
+        snapIndex = SnapIndex(
+            cellSize=suggestCellSize(
+                itertools.chain.from_iterable(
+                    featDict.values() for featDict in geometryDict.values()
+                ),
+                max((item["snap"] for item in snapDictList), default=0),
+            )
+        )
+        currentStep += 1
         if geographicBoundaryLyr is not None:
+            for feat in geographicBoundaryLyr.getFeatures(
+                QgsFeatureRequest().setNoAttributes()
+            ):
+                if feat.hasGeometry():
+                    snapIndex.addGeometry(
+                        (self.GEOGRAPHIC_BOUNDARY, feat.id()),
+                        PathGeometry.fromWkb(feat.geometry().asWkb()),
+                    )
+        for item in snapDictList:
             multiStepFeedback.setCurrentStep(currentStep)
-            auxGeoBounds = self.buildAuxGeographicBoundary(
-                geographicBoundaryLyr, context=context, feedback=multiStepFeedback
-            )
             currentStep += 1
-            for item in snapDictList:
-                multiStepFeedback.setCurrentStep(currentStep)
-                referenceLayerName = item["referenceLayer"]
-                multiStepFeedback.pushInfo(
-                    self.tr(f"Snapping {referenceLayerName} to geographic boundary.")
-                )
-                if referenceLayerName not in snapStructure:
-                    continue
-                snapStructure[referenceLayerName][
-                    "tempLayer"
-                ] = self.snapToReferenceAndUpdateSpatialIndex(
-                    inputLayer=snapStructure[referenceLayerName]["tempLayer"],
-                    referenceLayer=auxGeoBounds,
-                    tol=item["snap"],
-                    behavior=self.algRunner.MoveEndPointsOnlyPreferClosestPoint
-                    if snapStructure[referenceLayerName]["originalLayer"].geometryType()
-                    == QgsWkbTypes.LineGeometry
-                    else item["snap"],
-                    context=context,
-                    feedback=multiStepFeedback,
-                )
+            referenceLayerName = item["referenceLayer"]
+            if geographicBoundaryLyr is None or referenceLayerName not in snapStructure:
+                continue
+            multiStepFeedback.pushInfo(
+                self.tr(f"Snapping {referenceLayerName} to geographic boundary.")
+            )
+            self.snapLayerOnIndex(
+                snapIndex,
+                geometryDict,
+                lyrName=referenceLayerName,
+                referenceSet={self.GEOGRAPHIC_BOUNDARY},
+                tol=item["snap"],
+                mode=self.algRunner.MoveEndPointsOnlyPreferClosestPoint
+                if snapStructure[referenceLayerName]["originalLayer"].geometryType()
+                == QgsWkbTypes.LineGeometry
+                else item["mode"],
+                feedback=multiStepFeedback,
+                insertOnReference=False,
+            )
 
         for item in snapDictList:
             multiStepFeedback.setCurrentStep(currentStep)
@@ -171,34 +194,43 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
             multiStepFeedback.pushInfo(
                 self.tr(f"Performing snap internally on {referenceLayerName}.")
             )
-            snapStructure[referenceLayerName][
-                "tempLayer"
-            ] = self.snapToReferenceAndUpdateSpatialIndex(
-                inputLayer=snapStructure[referenceLayerName]["tempLayer"],
-                referenceLayer=snapStructure[referenceLayerName]["tempLayer"],
+            self.snapLayerOnIndex(
+                snapIndex,
+                geometryDict,
+                lyrName=referenceLayerName,
+                referenceSet={referenceLayerName},
                 tol=item["snap"],
-                behavior=item["mode"],
-                context=context,
+                mode=item["mode"],
                 feedback=multiStepFeedback,
+                addToIndex=True,
             )
             currentStep += 1
             multiStepFeedback.setCurrentStep(currentStep)
-            lyrList = [i for i in item["snapLayerList"] if i in snapStructure]
+            lyrList = [
+                i
+                for i in item["snapLayerList"]
+                if i in snapStructure and i != referenceLayerName
+            ]
+            currentStep += 1
             if lyrList == []:
                 continue
             multiStepFeedback.pushInfo(
                 self.tr(f"Starting snapping with reference layer {referenceLayerName}.")
             )
             self.snapLayersToReference(
+                snapIndex,
+                geometryDict,
                 refLyrName=referenceLayerName,
-                snapStructure=snapStructure,
                 lyrList=lyrList,
                 tol=item["snap"],
-                behavior=item["mode"],
-                context=context,
+                mode=item["mode"],
                 feedback=multiStepFeedback,
             )
-            currentStep += 1
+        multiStepFeedback.setCurrentStep(currentStep)
+        self.writeGeometries(
+            snapStructure, geometryDict, originalGeometryDict, multiStepFeedback
+        )
+        currentStep += 1
         multiStepFeedback.setCurrentStep(currentStep)
         self.updateOriginalLayers(
             snapStructure,
@@ -211,57 +243,135 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
         gc.collect()
         return {}
 
-    def buildAuxGeographicBoundary(self, geographicBoundary, context, feedback):
-        multiStepFeedback = QgsProcessingMultiStepFeedback(3, feedback)
-        multiStepFeedback.setCurrentStep(0)
-        lineBounds = self.algRunner.runPolygonsToLines(
-            inputLyr=geographicBoundary,
-            context=context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
-        multiStepFeedback.setCurrentStep(1)
-        explodedLines = self.algRunner.runExplodeLines(
-            inputLyr=lineBounds,
-            context=context,
-            feedback=multiStepFeedback,
-        )
-        multiStepFeedback.setCurrentStep(2)
-        self.algRunner.runCreateSpatialIndex(
-            explodedLines,
-            feedback=multiStepFeedback,
-            context=context,
-            is_child_algorithm=True,
-        )
-        return explodedLines
+    def readGeometries(self, snapStructure, feedback):
+        """
+        Reads the geometries of the temporary layers into memory.
+        :return: (dict) {layer name: {feature id: PathGeometry}}
+        """
+        geometryDict = dict()
+        nLayers = len(snapStructure)
+        if nLayers == 0:
+            return geometryDict
+        multiStepFeedback = QgsProcessingMultiStepFeedback(nLayers, feedback)
+        for current, (lyrName, auxDict) in enumerate(snapStructure.items()):
+            multiStepFeedback.setCurrentStep(current)
+            geometryDict[lyrName] = {
+                feat.id(): PathGeometry.fromWkb(feat.geometry().asWkb())
+                for feat in auxDict["tempLayer"].getFeatures(
+                    QgsFeatureRequest().setNoAttributes()
+                )
+                if feat.hasGeometry()
+            }
+        return geometryDict
+
+    def snapLayerOnIndex(
+        self,
+        snapIndex,
+        geometryDict,
+        lyrName,
+        referenceSet,
+        tol,
+        mode,
+        feedback,
+        addToIndex=False,
+        insertOnReference=True,
+    ):
+        """
+        Snaps each geometry of lyrName to the geometries of the layers of
+        referenceSet that are on snapIndex, in a single pass. Geometries of
+        lyrName that are on the index are taken out of it while they are
+        snapped, so that they never snap to themselves, and are put back
+        snapped.
+        :param snapIndex: (SnapIndex) reference index;
+        :param geometryDict: (dict) {layer name: {feature id: PathGeometry}},
+            updated with the snapped geometries;
+        :param lyrName: (str) name of the layer to be snapped;
+        :param referenceSet: (set) names of the reference layers;
+        :param tol: (float) snapping tolerance;
+        :param mode: (int) QgsGeometrySnapper.SnapMode;
+        :param feedback: (QgsFeedback) feedback;
+        :param addToIndex: (bool) whether the snapped geometries are added to
+            the index as they are snapped, which snaps the layer internally
+            when lyrName is on referenceSet;
+        :param insertOnReference: (bool) whether the vertices moved onto
+            reference segments are inserted on the reference geometries.
+        """
+        featDict = geometryDict[lyrName]
+        nFeats = len(featDict)
+        if nFeats == 0:
+            return
+        stepSize = 100 / nFeats
+        insertionList = []
+        for current, featid in enumerate(list(featDict.keys())):
+            if feedback.isCanceled():
+                return
+            key = (lyrName, featid)
+            isIndexed = key in snapIndex
+            if isIndexed:
+                snapIndex.removeGeometry(key)
+            snappedGeom, featInsertionList = snapIndex.snapGeometry(
+                featDict[featid], tol, mode, layers=referenceSet
+            )
+            featDict[featid] = snappedGeom
+            insertionList += featInsertionList
+            if isIndexed or addToIndex:
+                snapIndex.addGeometry(key, snappedGeom)
+            feedback.setProgress(current * stepSize)
+        if insertOnReference:
+            for (refLyrName, featid), geom in snapIndex.insertVertices(
+                insertionList
+            ).items():
+                geometryDict[refLyrName][featid] = geom
+        # the insertion list is consumed, so the ids may change
+        snapIndex.compact()
 
     def snapLayersToReference(
-        self, refLyrName, snapStructure, lyrList, tol, behavior, context, feedback
+        self, snapIndex, geometryDict, refLyrName, lyrList, tol, mode, feedback
     ):
         nSteps = len(lyrList)
         if nSteps == 0:
             return
         multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
-        refLyr = snapStructure[refLyrName]["tempLayer"]
         for current, lyrName in enumerate(lyrList):
             multiStepFeedback.setCurrentStep(current)
             if multiStepFeedback.isCanceled():
                 return
-            lyr = snapStructure[lyrName]["tempLayer"]
             multiStepFeedback.pushInfo(
                 self.tr(
                     "Snapping geometries from layer {input} to {reference} with snap {snap}..."
-                ).format(input=refLyrName, reference=lyrName, snap=tol)
+                ).format(input=lyrName, reference=refLyrName, snap=tol)
             )
-            snappedLyr = self.snapToReferenceAndUpdateSpatialIndex(
-                inputLayer=lyr,
-                referenceLayer=refLyr,
+            self.snapLayerOnIndex(
+                snapIndex,
+                geometryDict,
+                lyrName=lyrName,
+                referenceSet={refLyrName},
                 tol=tol,
-                behavior=behavior,
-                context=context,
+                mode=mode,
                 feedback=multiStepFeedback,
             )
-            snapStructure[lyrName]["tempLayer"] = snappedLyr
+
+    def writeGeometries(
+        self, snapStructure, geometryDict, originalGeometryDict, feedback
+    ):
+        """
+        Writes the changed geometries back to the temporary layers, in a
+        single provider call per layer.
+        """
+        nLayers = len(snapStructure)
+        if nLayers == 0:
+            return
+        multiStepFeedback = QgsProcessingMultiStepFeedback(nLayers, feedback)
+        for current, (lyrName, auxDict) in enumerate(snapStructure.items()):
+            multiStepFeedback.setCurrentStep(current)
+            geometryMap = dict()
+            for featid, geom in geometryDict[lyrName].items():
+                if geom is originalGeometryDict[lyrName][featid]:
+                    continue
+                geometryMap[featid] = QgsGeometry()
+                geometryMap[featid].fromWkb(geom.toWkb())
+            if geometryMap:
+                auxDict["tempLayer"].dataProvider().changeGeometryValues(geometryMap)
 
     def buildSnapStructure(
         self, snapDictList, onlySelected, context, feedback, geographicBoundaryLyr=None
@@ -270,7 +380,7 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
         nItems = len(snapDictList)
         if nItems == 0:
             return snapStructure
-        multiStepFeedback = QgsProcessingMultiStepFeedback(3 * nItems, feedback)
+        multiStepFeedback = QgsProcessingMultiStepFeedback(2 * nItems, feedback)
         currentStep = 0
         for item in snapDictList:
             multiStepFeedback.setCurrentStep(currentStep)
@@ -306,11 +416,6 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
                 insideLyr = auxLyr
                 outsideLyr = None
             currentStep += 1
-            multiStepFeedback.setCurrentStep(currentStep)
-            self.algRunner.runCreateSpatialIndex(
-                insideLyr, context, multiStepFeedback, is_child_algorithm=True
-            )
-            currentStep += 1
             snapStructure[item["referenceLayer"]] = {
                 "originalLayer": lyr,
                 "tempLayer": insideLyr,
@@ -320,64 +425,6 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
             }
         return snapStructure
 
-    def snapToReferenceAndUpdateSpatialIndex(
-        self, inputLayer, referenceLayer, tol, behavior, context, feedback
-    ):
-        nSteps = 2 if behavior not in [0, 1] else 4
-        multiStepFeedback = (
-            QgsProcessingMultiStepFeedback(nSteps, feedback)
-            if feedback is not None
-            else None
-        )
-        currentStep = 0
-        if multiStepFeedback is not None:
-            multiStepFeedback.setCurrentStep(currentStep)
-        snappedLyr = self.algRunner.runSnapGeometriesToLayer(
-            inputLayer=inputLayer,
-            referenceLayer=referenceLayer,
-            tol=tol,
-            behavior=behavior,
-            context=context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
-        currentStep += 1
-        if multiStepFeedback is not None:
-            multiStepFeedback.setCurrentStep(currentStep)
-        if behavior not in [0, 1]:
-            self.algRunner.runCreateSpatialIndex(
-                snappedLyr, context, multiStepFeedback, is_child_algorithm=True
-            )
-            return snappedLyr
-        primitiveDict = {
-            QgsWkbTypes.PointGeometry: [],
-            QgsWkbTypes.LineGeometry: [],
-            QgsWkbTypes.PolygonGeometry: [],
-        }
-        for lyrName in [snappedLyr, referenceLayer]:
-            lyr = (
-                self.layerFromProject(lyrName) if isinstance(lyrName, str) else lyrName
-            )
-            if lyr is None:
-                lyr = QgsProcessingUtils.mapLayerFromString(lyrName, context)
-            primitiveDict[lyr.geometryType()].append(lyr)
-        self.algRunner.runAddUnsharedVertexOnSharedEdges(
-            inputLinesList=primitiveDict[QgsWkbTypes.LineGeometry],
-            inputPolygonsList=primitiveDict[QgsWkbTypes.PolygonGeometry],
-            searchRadius=tol,
-            context=context,
-            feedback=multiStepFeedback,
-        )
-        for lyr in itertools.chain.from_iterable(list(primitiveDict.values())):
-            lyr.commitChanges()
-            currentStep += 1
-            if multiStepFeedback is not None:
-                multiStepFeedback.setCurrentStep(currentStep)
-            self.algRunner.runCreateSpatialIndex(
-                lyr, context, multiStepFeedback, is_child_algorithm=True
-            )
-        return snappedLyr
-
     def updateOriginalLayers(
         self, snapStructure, onlySelected, context, feedback, geographicBoundaryLyr=None
     ):
@@ -385,9 +432,7 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
         for current, (lyrName, auxDict) in enumerate(snapStructure.items()):
             multiStepFeedback.setCurrentStep(current)
             multiStepFeedback.pushInfo(self.tr(f"Updating changes on {lyrName}"))
-            tempLyr = QgsProcessingUtils.mapLayerFromString(
-                auxDict["tempLayer"], context
-            )
+            tempLyr = auxDict["tempLayer"]
             if geographicBoundaryLyr is None:
                 self.layerHandler.updateOriginalLayersFromUnifiedLayer(
                     [auxDict["originalLayer"]],
@@ -470,31 +515,6 @@ class HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(ValidationAlgorithm):
         return HierarchicalSnapLayerOnLayerAndUpdateAlgorithm()
 
 
-class ParameterSnapHierarchyType(QgsProcessingParameterType):
-    def __init__(self):
-        super().__init__()
-
-    def create(self, name):
-        return ParameterSnapHierarchy(name)  # mudar
-
-    def metadata(self):
-        return {
-            "widget_wrapper": "DsgTools.gui.ProcessingUI.snapHierarchyWrapper.SnapHierarchyWrapper"
-        }  # mudar
-
-    def name(self):
-        return QCoreApplication.translate("Processing", "Snap Hierarchy")
-
-    def id(self):
-        return "snap_hierarchy"
-
-    def description(self):
-        return QCoreApplication.translate(
-            "Processing",
-            "An hierarchical snapping type. Used in the Hierarchical Snap Layer on Layer algorithm.",
-        )
-
-
 class ParameterSnapHierarchy(QgsProcessingParameterDefinition):
     def __init__(self, name, description=""):
         super().__init__(name, description)
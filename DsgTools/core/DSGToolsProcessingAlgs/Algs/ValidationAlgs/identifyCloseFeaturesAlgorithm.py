@@ -32,7 +32,6 @@ from qgis.core import (
     QgsProperty,
     QgsProcessingMultiStepFeedback,
     QgsProcessingParameterFeatureSink,
-    QgsProcessingParameterType,
     QgsProcessingParameterDefinition,
 )
 
@@ -296,31 +295,6 @@ class IdentifyCloseFeaturesAlgorithm(ValidationAlgorithm):
         return IdentifyCloseFeaturesAlgorithm()
 
 
-class ParameterDistanceBetweenLayersType(QgsProcessingParameterType):
-    def __init__(self):
-        super().__init__()
-
-    def create(self, name):
-        return ParameterDistanceBetweenLayers(name)
-
-    def metadata(self):
-        return {
-            "widget_wrapper": "DsgTools.gui.ProcessingUI.distanceBetweenLayersWrapper.DistanceBetweenLayersWrapper"
-        }
-
-    def name(self):
-        return QCoreApplication.translate("Processing", "Distance Between Layers")
-
-    def id(self):
-        return "distance_between_layers"
-
-    def description(self):
-        return QCoreApplication.translate(
-            "Processing",
-            "Check minimum acceptable distance between features of chosen layers.",
-        )
-
-
 class ParameterDistanceBetweenLayers(QgsProcessingParameterDefinition):
     def __init__(self, name, description=""):
         super().__init__(name, description)
@@ -21,9 +21,12 @@
 """
 
 
+import numpy as np
 from PyQt5.QtCore import QCoreApplication
 from qgis.core import (
+    QgsFeatureRequest,
     QgsGeometry,
+    QgsPointXY,
     QgsProcessing,
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterFeatureSource,
@@ -60,82 +63,34 @@ class IdentifyDrainageAngleIssues(ValidationAlgorithm):
         lines = self.parameterAsVectorLayer(parameters, "INPUT", context)
         self.prepareFlagSink(parameters, lines, QgsWkbTypes.Point, context)
 
-        # Dictionary that stores azimuths entering and exiting the point
-        pointInAndOutDictionary = {}
-
-        # Iterate over lines setting the dictionary content:
         lineCount = lines.featureCount()
         if lineCount == 0:
             return {self.FLAGS: self.flag_id}
         multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
         multiStepFeedback.setCurrentStep(0)
         multiStepFeedback.setProgressText(self.tr("Evaluating line structure..."))
-        stepSize = 100 / lineCount
-
-        for current, line in enumerate(lines.getFeatures()):
-            if multiStepFeedback.isCanceled():
-                break
-            geom = list(line.geometry().vertices())
-            if len(geom) == 0:
-                continue
-            first_vertex = geom[0]
-            second_vertex = geom[1]
-            semilast_vertex = geom[-2]
-            last_vertex = geom[-1]
-
-            outgoing_azimuth = GeometryHandler.calcAzimuth(first_vertex, second_vertex)
-            incoming_azimuth = GeometryHandler.calcAzimuth(semilast_vertex, last_vertex)
-
-            if first_vertex.asWkt() not in pointInAndOutDictionary:
-                pointInAndOutDictionary[first_vertex.asWkt()] = {
-                    "incoming": [],
-                    "outgoing": [],
-                }
-
-            if last_vertex.asWkt() not in pointInAndOutDictionary:
-                pointInAndOutDictionary[last_vertex.asWkt()] = {
-                    "incoming": [],
-                    "outgoing": [],
-                }
-
-            pointInAndOutDictionary[first_vertex.asWkt()]["outgoing"].append(
-                outgoing_azimuth
-            )
-            pointInAndOutDictionary[last_vertex.asWkt()]["incoming"].append(
-                incoming_azimuth
-            )
-            multiStepFeedback.setProgress(current * stepSize)
-
+        endpointTable = GeometryHandler().getEndpointTable(
+            lines.getFeatures(QgsFeatureRequest().setNoAttributes()),
+            feedback=multiStepFeedback,
+        )
+        directionChange = endpointTable.getMaxDirectionChange()
+        flaggedNodes = np.flatnonzero(np.nan_to_num(directionChange) > 90)
         multiStepFeedback.setCurrentStep(1)
         multiStepFeedback.setProgressText(self.tr("Raising flags..."))
-        stepSize = 100 / len(pointInAndOutDictionary)
-        # Iterate over dictionary:
-        for current, (pointStr, inAndOutLists) in enumerate(
-            pointInAndOutDictionary.items()
-        ):
+        stepSize = 100 / len(flaggedNodes) if len(flaggedNodes) else 0
+        for current, nodeIdx in enumerate(flaggedNodes):
             if multiStepFeedback.isCanceled():
                 break
-            errorMsg = self.errorWhenCheckingInAndOut(inAndOutLists)
-            if errorMsg != "":
-                self.flagFeature(
-                    flagGeom=QgsGeometry.fromWkt(pointStr), flagText=self.tr(errorMsg)
-                )
+            self.flagFeature(
+                flagGeom=QgsGeometry.fromPointXY(
+                    QgsPointXY(*endpointTable.nodeXY[nodeIdx])
+                ),
+                flagText=self.tr("There is an unexpected sharp turn here."),
+            )
             multiStepFeedback.setProgress(current * stepSize)
 
         return {self.FLAGS: self.flag_id}
 
-    def errorWhenCheckingInAndOut(self, inAndOutLists):
-        azimuths_in = inAndOutLists["incoming"]
-        azimuths_out = inAndOutLists["outgoing"]
-
-        for azi_in in azimuths_in:
-            for azi_out in azimuths_out:
-                directionChange = self.deltaBetweenAzimuths(azi_in, azi_out)
-                if directionChange > 90:
-                    return "There is an unexpected sharp turn here."
-
-        return ""
-
     def name(self):
         """
         Returns the algorithm name, used for identifying the algorithm. This
@@ -181,15 +136,3 @@ class IdentifyDrainageAngleIssues(ValidationAlgorithm):
 
     def createInstance(self):
         return IdentifyDrainageAngleIssues()
-
-    @staticmethod
-    def deltaBetweenAzimuths(az1: float, az2: float) -> float:
-        delta_1 = az1 - az2
-        delta_2 = az2 - az1
-
-        if delta_1 < 0:
-            delta_1 += 360
-        if delta_2 < 0:
-            delta_2 += 360
-
-        return min(delta_1, delta_2)
@@ -21,9 +21,12 @@
 """
 
 
+import numpy as np
 from PyQt5.QtCore import QCoreApplication
 from qgis.core import (
+    QgsFeatureRequest,
     QgsGeometry,
+    QgsPointXY,
     QgsProcessing,
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterFeatureSource,
@@ -31,6 +34,8 @@ from qgis.core import (
     QgsProcessingMultiStepFeedback,
 )
 
+from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
 
@@ -59,56 +64,36 @@ class IdentifyDrainageFlowIssues(ValidationAlgorithm):
         lines = self.parameterAsVectorLayer(parameters, "INPUT", context)
         self.prepareFlagSink(parameters, lines, QgsWkbTypes.Point, context)
 
-        # Dictionary that indicates how many lines enter and how many lines exit a given point:
-        pointInAndOutDictionary = {}
-
-        # Iterate over lines setting the dictionary counters:
         lineCount = lines.featureCount()
         if lineCount == 0:
             return {self.FLAGS: self.flag_id}
         multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
         multiStepFeedback.setCurrentStep(0)
         multiStepFeedback.setProgressText(self.tr("Evaluating line structure..."))
-        stepSize = 100 / lineCount
-
-        for current, line in enumerate(lines.getFeatures()):
-            if multiStepFeedback.isCanceled():
-                break
-            geom = list(line.geometry().vertices())
-            if len(geom) == 0:
-                continue
-            first_vertex = geom[0]
-            last_vertex = geom[-1]
-
-            if first_vertex.asWkt() not in pointInAndOutDictionary:
-                pointInAndOutDictionary[first_vertex.asWkt()] = {
-                    "incoming": 0,
-                    "outgoing": 0,
-                }
-
-            if last_vertex.asWkt() not in pointInAndOutDictionary:
-                pointInAndOutDictionary[last_vertex.asWkt()] = {
-                    "incoming": 0,
-                    "outgoing": 0,
-                }
-
-            pointInAndOutDictionary[first_vertex.asWkt()]["outgoing"] += 1
-            pointInAndOutDictionary[last_vertex.asWkt()]["incoming"] += 1
-            multiStepFeedback.setProgress(current * stepSize)
-
+        endpointTable = GeometryHandler().getEndpointTable(
+            lines.getFeatures(QgsFeatureRequest().setNoAttributes()),
+            feedback=multiStepFeedback,
+        )
+        inDegree, outDegree = endpointTable.inDegree(), endpointTable.outDegree()
+        total = inDegree + outDegree
+        flaggedNodes = np.flatnonzero(
+            (total >= 4) | ((total > 1) & ((inDegree == 0) | (outDegree == 0)))
+        )
         multiStepFeedback.setCurrentStep(1)
         multiStepFeedback.setProgressText(self.tr("Raising flags..."))
-        stepSize = 100 / len(pointInAndOutDictionary)
-        # Iterate over dictionary:
-        for current, (pointStr, inAndOutCounters) in enumerate(
-            pointInAndOutDictionary.items()
-        ):
+        stepSize = 100 / len(flaggedNodes) if len(flaggedNodes) else 0
+        for current, nodeIdx in enumerate(flaggedNodes):
             if multiStepFeedback.isCanceled():
                 break
-            errorMsg = self.errorWhenCheckingInAndOut(inAndOutCounters)
+            errorMsg = self.errorWhenCheckingInAndOut(
+                {"incoming": inDegree[nodeIdx], "outgoing": outDegree[nodeIdx]}
+            )
             if errorMsg != "":
                 self.flagFeature(
-                    flagGeom=QgsGeometry.fromWkt(pointStr), flagText=self.tr(errorMsg)
+                    flagGeom=QgsGeometry.fromPointXY(
+                        QgsPointXY(*endpointTable.nodeXY[nodeIdx])
+                    ),
+                    flagText=self.tr(errorMsg),
                 )
             multiStepFeedback.setProgress(current * stepSize)
 
@@ -21,10 +21,9 @@
  ***************************************************************************/
 """
 
-import os
-import concurrent.futures
 from PyQt5.QtCore import QCoreApplication
 from qgis.core import (
+    QgsFeatureRequest,
     QgsProcessing,
     QgsProcessingException,
     QgsProcessingMultiStepFeedback,
@@ -33,11 +32,10 @@ from qgis.core import (
     QgsProcessingParameterFeatureSource,
     QgsGeometry,
     QgsWkbTypes,
-    QgsPoint,
 )
 
 from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
-from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+from DsgTools.core.GeometricTools import graphHandler
 
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
@@ -85,7 +83,7 @@ class IdentifyDrainageLoops(ValidationAlgorithm):
         self.prepareFlagSink(parameters, inputLyr, QgsWkbTypes.LineString, context)
 
         # Iterate over lines setting the dictionary counters:
-        nSteps = 6 if buildCache else 4
+        nSteps = 3 if buildCache else 1
         multiStepFeedback = QgsProcessingMultiStepFeedback(nSteps, feedback)
         currentStep = 0
         if buildCache:
@@ -104,108 +102,91 @@ class IdentifyDrainageLoops(ValidationAlgorithm):
             )
             currentStep += 1
 
-        multiStepFeedback.setProgressText(self.tr("Building loop area candidates..."))
         multiStepFeedback.setCurrentStep(currentStep)
-        polygonLyr = algRunner.runPolygonize(
-            inputLyr=inputLyr, context=context, feedback=multiStepFeedback
-        )
-        currentStep += 1
-
-        if polygonLyr.featureCount() == 0:
-            return {self.FLAGS: self.flag_id}
-
-        multiStepFeedback.setCurrentStep(currentStep)
-        mergedPolygons = algRunner.runDissolve(
-            inputLyr=polygonLyr, context=context, feedback=multiStepFeedback
-        )
-        currentStep += 1
-
-        multiStepFeedback.setCurrentStep(currentStep)
-        polygonLoops = algRunner.runMultipartToSingleParts(
-            inputLayer=mergedPolygons, context=context, feedback=multiStepFeedback
-        )
-        currentStep += 1
-        polygonCount = polygonLoops.featureCount()
-        if polygonCount == 0:
-            multiStepFeedback.setProgressText(
-                self.tr("Building loop area candidates...")
-            )
-            return {self.FLAGS: self.flag_id}
-
-        multiStepFeedback.setCurrentStep(currentStep)
-        self.searchLoops(nx, inputLyr, multiStepFeedback, polygonLoops, polygonCount)
+        self.searchLoops(nx, inputLyr, multiStepFeedback)
 
         return {self.FLAGS: self.flag_id}
 
-    def searchLoops(self, nx, inputLyr, feedback, polygonLoops, polygonCount):
-        geometryHandler = GeometryHandler()
-        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
-        stepSize = 100 / polygonCount
-        flagFeatLambda = lambda x: self.flagFeature(
-            flagGeom=x, flagText=self.tr("Loop on input drainages")
-        )
-        firstAndLastNode = lambda x: geometryHandler.getFirstAndLastNode(inputLyr, x)
+    def searchLoops(self, nx, inputLyr, feedback):
+        """
+        Builds a graph of the whole network keyed by the line endpoints and
+        flags each directed loop found on it.
+        """
+        multiStepFeedback = QgsProcessingMultiStepFeedback(3, feedback)
         multiStepFeedback.setCurrentStep(0)
-        multiStepFeedback.setProgressText(self.tr("Submitting tasks to thread"))
-
-        def evaluate(polygonFeature):
-            geom = polygonFeature.geometry()
-            geomEngine = QgsGeometry.createGeometryEngine(geom.constGet())
-            graph = nx.DiGraph()
-            for i, feat in enumerate(inputLyr.getFeatures()):
-                if not geomEngine.intersects(feat.geometry().constGet()):
-                    continue
-                p0, pn = firstAndLastNode(feat)
-                p0 = QgsGeometry.fromPointXY(p0)
-                pn = QgsGeometry.fromPointXY(pn)
-                if not geomEngine.intersects(
-                    p0.constGet()
-                ) or not geomEngine.intersects(pn.constGet()):
-                    continue
-                vertexList = list(feat.geometry().vertices())
-                for v1, v2 in zip(vertexList, vertexList[1:]):
-                    graph.add_edge(v1.asWkt(), v2.asWkt())
-            loopSet = self.findLoopsOnEdgeSet(nx, graph, feedback=multiStepFeedback)
-            return loopSet
-
-        pool = concurrent.futures.ThreadPoolExecutor(os.cpu_count() - 1)
-        futures = set()
-        for current, polygonFeature in enumerate(polygonLoops.getFeatures()):
-            if multiStepFeedback.isCanceled():
-                break
-            futures.add(pool.submit(evaluate, polygonFeature))
-            multiStepFeedback.setCurrentStep(current * stepSize)
+        multiStepFeedback.setProgressText(self.tr("Building network graph..."))
+        graph = self.buildEndpointGraph(nx, inputLyr, multiStepFeedback)
+        if multiStepFeedback.isCanceled() or graph.number_of_edges() == 0:
+            return
 
         multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.setProgressText(self.tr("Evaluating results"))
+        multiStepFeedback.setProgressText(self.tr("Searching loops..."))
+        loopList = graphHandler.find_directed_loops(
+            nx, graph, feedback=multiStepFeedback
+        )
+        if multiStepFeedback.isCanceled() or loopList == []:
+            return
 
-        for current, future in enumerate(concurrent.futures.as_completed(futures)):
+        multiStepFeedback.setCurrentStep(2)
+        multiStepFeedback.setProgressText(self.tr("Evaluating results"))
+        request = QgsFeatureRequest()
+        request.setFilterFids(list(set(featId for loop in loopList for featId in loop)))
+        request.setNoAttributes()
+        pointListDict = {
+            feat.id(): self.getLinePointList(feat.geometry())
+            for feat in inputLyr.getFeatures(request)
+        }
+        stepSize = 100 / len(loopList)
+        for current, loop in enumerate(loopList):
             if multiStepFeedback.isCanceled():
                 break
-            loopSet = future.result()
-            if loopSet != set():
-                list(map(flagFeatLambda, loopSet))
-            multiStepFeedback.setCurrentStep(current * stepSize)
-
-    def findLoopsOnEdgeSet(self, nx, graph, feedback):
-        # loops = nx.strongly_connected_components(graph)
-        loops = nx.simple_cycles(graph)
-        # loops = nx.kosaraju_strongly_connected_components(graph)
-        loopSet = set()
-        for loop in loops:
+            loopPointList = list(pointListDict[loop[0]])
+            for featId in loop[1:]:
+                loopPointList += pointListDict[featId][1:]
+            self.flagFeature(
+                flagGeom=QgsGeometry.fromPolylineXY(loopPointList),
+                flagText=self.tr("Loop on input drainages"),
+            )
+            multiStepFeedback.setProgress(current * stepSize)
+
+    def buildEndpointGraph(self, nx, inputLyr, feedback):
+        """
+        Builds a MultiDiGraph with one edge per line, from its first to its
+        last node, reading the layer once.
+        """
+        graph = nx.MultiDiGraph()
+        nodeDict = dict()
+        nFeats = inputLyr.featureCount()
+        if nFeats == 0:
+            return graph
+        stepSize = 100 / nFeats
+        request = QgsFeatureRequest()
+        request.setNoAttributes()
+        for current, feat in enumerate(inputLyr.getFeatures(request)):
             if feedback.isCanceled():
-                return loopSet
-            initialNode, *nodeList = loop
-            if nodeList == []:
+                break
+            pointList = self.getLinePointList(feat.geometry())
+            if len(pointList) < 2:
                 continue
-            pointFromWkt = lambda x: QgsPoint(QgsGeometry.fromWkt(x).asPoint())
-            loopGeom = QgsGeometry.fromPolyline(
-                [pointFromWkt(initialNode)]
-                + list(map(pointFromWkt, nodeList))
-                + [pointFromWkt(initialNode)]
+            firstNode, lastNode = (
+                nodeDict.setdefault((p.x(), p.y()), len(nodeDict))
+                for p in (pointList[0], pointList[-1])
             )
-            loopSet.add(loopGeom)
-        return loopSet
+            graph.add_edge(firstNode, lastNode, featid=feat.id())
+            feedback.setProgress(current * stepSize)
+        return graph
+
+    def getLinePointList(self, geom):
+        """
+        Returns the points of a single line. Multipart geometries with more
+        than one part are not lines of the network and return an empty list.
+        """
+        if geom.isNull():
+            return []
+        if not geom.isMultipart():
+            return geom.asPolyline()
+        lineList = geom.asMultiPolyline()
+        return lineList[0] if len(lineList) == 1 else []
 
     def name(self):
         """
@@ -20,6 +20,9 @@
  ***************************************************************************/
 """
 from DsgTools.core.GeometricTools.layerHandler import LayerHandler
+from DsgTools.core.GeometricTools.postgisValidationHandler import (
+    PostgisValidationHandler,
+)
 from qgis.core import (
     QgsProcessing,
     QgsProcessingException,
@@ -38,6 +41,7 @@ class IdentifyDuplicatedGeometriesAlgorithm(ValidationAlgorithm):
     FLAGS = "FLAGS"
     INPUT = "INPUT"
     SELECTED = "SELECTED"
+    RUN_ON_SERVER = "RUN_ON_SERVER"
 
     def initAlgorithm(self, config):
         """
@@ -57,6 +61,14 @@ class IdentifyDuplicatedGeometriesAlgorithm(ValidationAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.RUN_ON_SERVER,
+                self.tr("Run the check on the PostGIS server when possible"),
+                defaultValue=True,
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterFeatureSink(
                 self.FLAGS, self.tr("{0} Flags").format(self.displayName())
@@ -73,7 +85,20 @@ class IdentifyDuplicatedGeometriesAlgorithm(ValidationAlgorithm):
                 self.invalidSourceError(parameters, self.INPUT)
             )
         onlySelected = self.parameterAsBool(parameters, self.SELECTED, context)
+        runOnServer = self.parameterAsBool(parameters, self.RUN_ON_SERVER, context)
         self.prepareFlagSink(parameters, inputLyr, inputLyr.wkbType(), context)
+        serverHandler = PostgisValidationHandler()
+        if runOnServer and serverHandler.canRunOnServer(
+            inputLyr, onlySelected=onlySelected
+        ):
+            for idList, geom in serverHandler.getDuplicatedGeometryFlags(
+                inputLyr, feedback=feedback
+            ):
+                flagText = self.tr(
+                    "Features from layer {0} with ids=({1}) have the same set of attributes."
+                ).format(inputLyr.name(), ", ".join(map(str, idList)))
+                self.flagFeature(geom, flagText)
+            return {self.FLAGS: self.flag_id}
         # Compute the number of steps to display within the progress bar and
         # get features from source
         layerHandler = LayerHandler()
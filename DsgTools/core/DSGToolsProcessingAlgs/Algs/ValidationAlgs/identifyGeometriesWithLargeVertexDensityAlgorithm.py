@@ -20,10 +20,6 @@
  ***************************************************************************/
 """
 
-import os
-import concurrent.futures
-
-from collections import defaultdict
 from PyQt5.QtCore import QCoreApplication
 
 from qgis.core import (
@@ -35,11 +31,9 @@ from qgis.core import (
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterVectorLayer,
     QgsWkbTypes,
-    QgsProcessingFeatureSourceDefinition,
-    QgsFeatureRequest,
 )
 
-from ...algRunner import AlgRunner
+from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
 
@@ -84,7 +78,7 @@ class IdentifyGeometriesWithLargeVertexDensityAlgorithm(ValidationAlgorithm):
         """
         Here is where the processing itself takes place.
         """
-        algRunner = AlgRunner()
+        geometryHandler = GeometryHandler()
         inputLyr = self.parameterAsVectorLayer(parameters, self.INPUT, context)
         if inputLyr is None:
             raise QgsProcessingException(
@@ -92,43 +86,19 @@ class IdentifyGeometriesWithLargeVertexDensityAlgorithm(ValidationAlgorithm):
             )
         onlySelected = self.parameterAsBool(parameters, self.SELECTED, context)
         searchRadius = self.parameterAsDouble(parameters, self.SEARCH_RADIUS, context)
-        # output flag type is a polygon because the flag will be a circle with
-        # radius tol and center as the vertex
         self.prepareFlagSink(parameters, inputLyr, QgsWkbTypes.Point, context)
-        # Compute the number of steps to display within the progress bar and
-        # get features from source
-        multiStepFeedback = QgsProcessingMultiStepFeedback(5, feedback)
+        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
         multiStepFeedback.setCurrentStep(0)
-        multiStepFeedback.setProgressText(self.tr("Building aux structure..."))
-        usedInput = (
-            inputLyr
-            if not onlySelected
-            else QgsProcessingFeatureSourceDefinition(inputLyr.id(), True)
+        multiStepFeedback.setProgressText(self.tr("Searching close vertexes..."))
+        featureList, _ = self.getIteratorAndFeatureCount(
+            inputLyr, onlySelected=onlySelected
         )
-        incrementedLayer = algRunner.runAddAutoIncrementalField(
-            usedInput, context, feedback=multiStepFeedback
+        # vertices of each ring are compared on coordinate arrays, without
+        # building an intermediate vertex layer
+        flagDict = geometryHandler.getLargeVertexDensityDict(
+            featureList, searchRadius, feedback=multiStepFeedback
         )
         multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.setProgressText(self.tr("Extracting vertexes..."))
-        vertexLayer = algRunner.runExtractVertices(
-            inputLyr=incrementedLayer, context=context, feedback=multiStepFeedback
-        )
-        multiStepFeedback.setCurrentStep(2)
-        multiStepFeedback.setProgressText(
-            self.tr("Building spatial index on extracted vertexes...")
-        )
-        algRunner.runCreateSpatialIndex(
-            inputLyr=vertexLayer,
-            context=context,
-            feedback=multiStepFeedback,
-            is_child_algorithm=True,
-        )
-        multiStepFeedback.setCurrentStep(3)
-        multiStepFeedback.setProgressText(self.tr("Searching close vertexes..."))
-        flagDict = self.getCloseVertexes(
-            vertexLayer, searchRadius, feedback=multiStepFeedback
-        )
-        multiStepFeedback.setCurrentStep(4)
         multiStepFeedback.setProgressText(self.tr("Raising flags (if any)..."))
         self.raiseFlags(flagDict, feedback=multiStepFeedback)
 
@@ -139,80 +109,17 @@ class IdentifyGeometriesWithLargeVertexDensityAlgorithm(ValidationAlgorithm):
         if nFlags == 0:
             return
         size = 100 / nFlags
-        for current, (featId, flagGeomSet) in enumerate(flagDict.items()):
+        for current, (featId, flagGeomList) in enumerate(flagDict.items()):
             if feedback is not None and feedback.isCanceled():
                 break
-            if len(flagGeomSet) < 2:
-                feedback.setProgress(current * size)
-                continue
-            for flagGeom in flagGeomSet:
+            for flagGeom in flagGeomList:
                 self.flagFeature(
                     flagGeom=flagGeom,
-                    fromWkb=True,
                     flagText=f"Vertex from feature {featId} is too close to another vertex.",
                 )
             if feedback is not None:
                 feedback.setProgress(current * size)
 
-    def getCloseVertexes(self, vertexLayer, searchRadius, feedback=None):
-        flagDict = defaultdict(set)  # key: featid, value: set of vertexes
-        featCount = vertexLayer.featureCount()
-        if featCount == 0:
-            return flagDict
-        size = 100 / featCount
-        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
-        multiStepFeedback.setCurrentStep(0)
-        multiStepFeedback.setProgressText(self.tr("Submitting to thread"))
-
-        def compute(feat):
-            outputDict = defaultdict(set)
-            if feedback.isCanceled():
-                return None
-            geom = feat.geometry()
-            buffer = geom.buffer(searchRadius, -1)
-            bufferBB = buffer.boundingBox()
-            request = (
-                QgsFeatureRequest()
-                .setFilterExpression(f"featid = {feat['featid']}")
-                .setFilterRect(bufferBB)
-            )
-            if "vertex_part_ring" in feat:
-                request.setFilterExpression(
-                    f"vertex_part_ring = {feat['vertex_part_ring']}"
-                )
-            for candidateFeat in vertexLayer.getFeatures(request):
-                if candidateFeat.id() == feat.id():
-                    continue
-                candidateGeom = candidateFeat.geometry()
-                if candidateFeat.geometry().intersects(
-                    buffer
-                ) and not candidateGeom.equals(geom):
-                    outputDict[feat["featid"]].add(candidateGeom.asWkb())
-            return outputDict
-
-        pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() - 1)
-        futures = set()
-
-        for current, feat in enumerate(vertexLayer.getFeatures()):
-            if feedback is not None and feedback.isCanceled():
-                break
-            futures.add(pool.submit(compute, feat))
-            if multiStepFeedback is not None:
-                multiStepFeedback.setProgress(size * current)
-        multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.setProgressText(self.tr("Evaluating Results"))
-
-        for current, future in enumerate(concurrent.futures.as_completed(futures)):
-            if feedback.isCanceled():
-                return None
-            output = future.result()
-            if output is None:
-                continue
-            for featid, geomSet in output.items():
-                flagDict[featid] = flagDict[featid].union(geomSet)
-            multiStepFeedback.setProgress(size * current)
-        return flagDict
-
     def name(self):
         """
         Returns the algorithm name, used for identifying the algorithm. This
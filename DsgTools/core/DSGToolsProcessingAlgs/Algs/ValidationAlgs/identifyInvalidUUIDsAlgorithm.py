@@ -28,6 +28,7 @@ from qgis.core import (
     QgsProcessing,
     QgsProcessingParameterBoolean,
     QgsFeature,
+    QgsFeatureRequest,
     QgsGeometry,
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterMultipleLayers,
@@ -36,6 +37,8 @@ from qgis.core import (
 )
 from qgis.PyQt.QtCore import QCoreApplication, QVariant
 
+from DsgTools.core.GeometricTools.layerHandler import LayerHandler
+
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
 
@@ -45,6 +48,7 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
     INPUT_LAYERS = "INPUT_LAYERS"
     ATTRIBUTE_NAME = "ATTRIBUTE_NAME"
     CORRECT = "CORRECT"
+    WRITE_ON_PROVIDER = "WRITE_ON_PROVIDER"
     COMPARE_LAYER = "COMPARE_LAYER"
     OUTPUT = "OUTPUT"
 
@@ -69,6 +73,16 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
 
         self.addParameter(QgsProcessingParameterBoolean(self.CORRECT, self.tr("Fix?")))
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.WRITE_ON_PROVIDER,
+                self.tr(
+                    "Write fixes straight to the data source (faster, no undo, only on layers not being edited)"
+                ),
+                defaultValue=False,
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterBoolean(
                 self.COMPARE_LAYER, self.tr("Compare only within same layer?")
@@ -120,6 +134,9 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
         inputLyrList = self.parameterAsLayerList(parameters, self.INPUT_LAYERS, context)
         attributeName = self.parameterAsFile(parameters, self.ATTRIBUTE_NAME, context)
         correct = self.parameterAsBool(parameters, self.CORRECT, context)
+        writeOnProvider = self.parameterAsBool(
+            parameters, self.WRITE_ON_PROVIDER, context
+        )
         compare_layer = self.parameterAsBool(parameters, self.COMPARE_LAYER, context)
 
         output_dest_id = ""
@@ -130,44 +147,49 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
         for step, layer in enumerate(inputLyrList):
             layer_name = layer.name() if compare_layer else "single_layer"
             if not (layer_name in uuids):
-                uuids[layer_name] = []
+                uuids[layer_name] = set()
             attributeIndex = self.getAttributeIndex(attributeName, layer)
             if attributeIndex < 0:
                 continue
-            if correct:
-                layer.startEditing()
-            for feature in layer.getFeatures():
+            request = QgsFeatureRequest()
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([attributeIndex])
+            errorDict = dict()
+            for feature in layer.getFeatures(request):
                 if feedback.isCanceled():
                     return {self.OUTPUT: output_dest_id}
                 attributeValue = feature[attributeIndex]
                 isValidUuid = self.isValidUuid(attributeValue)
-                hasDuplicateValues = self.hasDuplicateValues(
+                # only valid uuids are stored, so null values (unhashable
+                # QVariant) never reach the set
+                hasDuplicateValues = isValidUuid and self.hasDuplicateValues(
                     attributeValue, uuids[layer_name]
                 )
                 if isValidUuid and not hasDuplicateValues:
-                    uuids[layer_name].append(attributeValue)
-                    continue
-                if correct:
-                    feature[attributeIndex] = str(uuid.uuid4())
-                    layer.updateFeature(feature)
+                    uuids[layer_name].add(attributeValue)
                     continue
-                [
-                    errors.append(
-                        {
-                            "geometry": self.getFlagGeometry(feature),
-                            "fields": {
-                                "erro": descr,
-                                "classe": layer.name(),
-                                "feature_id": feature.id(),
-                            },
-                        }
-                    )
+                errorDict[feature.id()] = [
+                    descr
                     for descr, hasError in [
                         ("uuid inválido", not isValidUuid),
                         ("uuid duplicado", hasDuplicateValues),
                     ]
                     if hasError
                 ]
+            if errorDict and correct:
+                newValueDict = dict()
+                for featId in errorDict:
+                    newUuid = str(uuid.uuid4())
+                    uuids[layer_name].add(newUuid)
+                    newValueDict[featId] = {attributeIndex: newUuid}
+                LayerHandler().applyBulkEdits(
+                    layer,
+                    attributeDict=newValueDict,
+                    commandName=self.tr("Fix invalid UUIDs"),
+                    preferProvider=writeOnProvider,
+                )
+            elif errorDict:
+                errors += self.getErrorList(layer, errorDict)
             feedback.setProgress(step * progressStep)
 
         crs = inputLyrList[0].sourceCrs()
@@ -181,6 +203,29 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
                 )
         return {self.OUTPUT: output_dest_id}
 
+    def getErrorList(self, layer, errorDict):
+        """
+        Fetches the geometries of the features with errors only.
+        :param layer: (QgsVectorLayer) input layer;
+        :param errorDict: (dict) feature id -> list of error descriptions;
+        :return: (list) errors as expected by createFlagFeature.
+        """
+        request = QgsFeatureRequest()
+        request.setFilterFids(list(errorDict.keys()))
+        request.setNoAttributes()
+        return [
+            {
+                "geometry": self.getFlagGeometry(feature),
+                "fields": {
+                    "erro": descr,
+                    "classe": layer.name(),
+                    "feature_id": feature.id(),
+                },
+            }
+            for feature in layer.getFeatures(request)
+            for descr in errorDict[feature.id()]
+        ]
+
     def getFlagWkbType(self):
         return QgsWkbTypes.Point
 
@@ -191,8 +236,8 @@ class IdentifyInvalidUUIDsAlgorithm(ValidationAlgorithm):
         sinkFields.append(QgsField("feature_id", QVariant.Int))
         return sinkFields
 
-    def hasDuplicateValues(self, value, valueList):
-        return value in valueList
+    def hasDuplicateValues(self, value, valueSet):
+        return value in valueSet
 
     def isValidUuid(self, uuidToTest, version=4):
         try:
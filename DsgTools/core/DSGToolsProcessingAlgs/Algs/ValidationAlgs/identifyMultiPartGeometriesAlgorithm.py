@@ -27,6 +27,9 @@ import processing
 import concurrent.futures
 from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
 from DsgTools.core.GeometricTools.layerHandler import LayerHandler
+from DsgTools.core.GeometricTools.postgisValidationHandler import (
+    PostgisValidationHandler,
+)
 from qgis.core import (
     QgsDataSourceUri,
     QgsFeature,
@@ -57,6 +60,7 @@ class IdentifyMultiPartGeometriesAlgorithm(ValidationAlgorithm):
     FLAGS = "FLAGS"
     INPUT = "INPUT"
     SELECTED = "SELECTED"
+    RUN_ON_SERVER = "RUN_ON_SERVER"
 
     def initAlgorithm(self, config):
         """
@@ -78,6 +82,14 @@ class IdentifyMultiPartGeometriesAlgorithm(ValidationAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.RUN_ON_SERVER,
+                self.tr("Run the check on the PostGIS server when possible"),
+                defaultValue=True,
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterFeatureSink(
                 self.FLAGS, self.tr("{0} Flags").format(self.displayName())
@@ -94,7 +106,15 @@ class IdentifyMultiPartGeometriesAlgorithm(ValidationAlgorithm):
                 self.invalidSourceError(parameters, self.INPUT)
             )
         onlySelected = self.parameterAsBool(parameters, self.SELECTED, context)
+        runOnServer = self.parameterAsBool(parameters, self.RUN_ON_SERVER, context)
         self.prepareFlagSink(parameters, inputLyr, inputLyr.wkbType(), context)
+        serverHandler = PostgisValidationHandler()
+        if runOnServer and serverHandler.canRunOnServer(
+            inputLyr, onlySelected=onlySelected
+        ):
+            for _, geom in serverHandler.getMultiPartFlags(inputLyr, feedback=feedback):
+                self.flagFeature(geom, flagText=self.tr("Geometry with multi part."))
+            return {self.FLAGS: self.flag_id}
         request = QgsFeatureRequest()
         if onlySelected:
             request.setFilterFids(inputLyr.selectedFeatureIds())
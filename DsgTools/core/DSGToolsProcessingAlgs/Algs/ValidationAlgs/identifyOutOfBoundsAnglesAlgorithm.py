@@ -88,21 +88,22 @@ class IdentifyOutOfBoundsAnglesAlgorithm(ValidationAlgorithm):
         self.prepareFlagSink(parameters, inputLyr, QgsWkbTypes.Point, context)
         # Compute the number of steps to display within the progress bar and
         # get features from source
-        featureList, total = self.getIteratorAndFeatureCount(
+        featureList, _ = self.getIteratorAndFeatureCount(
             inputLyr, onlySelected=onlySelected
         )
-
-        for current, feat in enumerate(featureList):
+        # the angles of every vertex are computed at once
+        outOfBoundsList = geometryHandler.getOutOfBoundsAngleList(
+            featureList, tol, feedback=feedback
+        )
+        total = 100.0 / len(outOfBoundsList) if outOfBoundsList else 0
+        for current, item in enumerate(outOfBoundsList):
             # Stop the algorithm if cancel button has been clicked
             if feedback.isCanceled():
                 break
-            outOfBoundsList = geometryHandler.getOutOfBoundsAngle(feat, tol)
-            if outOfBoundsList:
-                for item in outOfBoundsList:
-                    flagText = self.tr(
-                        "Feature from layer {0} with id={1} has angle of value {2} degrees, which is lesser than the tolerance of {3} degrees."
-                    ).format(inputLyr.name(), item["feat_id"], item["angle"], tol)
-                    self.flagFeature(item["geom"], flagText)
+            flagText = self.tr(
+                "Feature from layer {0} with id={1} has angle of value {2} degrees, which is lesser than the tolerance of {3} degrees."
+            ).format(inputLyr.name(), item["feat_id"], item["angle"], tol)
+            self.flagFeature(item["geom"], flagText)
             # Update the progress bar
             feedback.setProgress(int(current * total))
 
@@ -20,7 +20,10 @@
  *                                                                         *
  ***************************************************************************/
 """
+import numpy as np
+
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
+from DsgTools.core.GeometricTools.endpointTable import EndpointTable
 from DsgTools.core.DSGToolsProcessingAlgs.algRunner import AlgRunner
 from .validationAlgorithm import ValidationAlgorithm
 from PyQt5.QtCore import QCoreApplication
@@ -33,6 +36,7 @@ from qgis.core import (
     QgsProcessingParameterMultipleLayers,
     QgsProcessingMultiStepFeedback,
     QgsFeatureRequest,
+    QgsGeometry,
     QgsWkbTypes,
 )
 
@@ -46,6 +50,8 @@ class IdentifySmallFirstOrderDanglesAlgorithm(ValidationAlgorithm):
     POLYGONFILTERLAYERS = "POLYGONFILTERLAYERS"
     GEOGRAPHIC_BOUNDARY = "GEOGRAPHIC_BOUNDARY"
     FLAGS = "FLAGS"
+    # unmatched dangles listed on the warning
+    MAX_WARNING_POINTS = 20
 
     def initAlgorithm(self, config):
         """
@@ -133,7 +139,7 @@ class IdentifySmallFirstOrderDanglesAlgorithm(ValidationAlgorithm):
             return {self.FLAGS: self.flag_id}
         # Compute the number of steps to display within the progress bar and
         # get features from source
-        feedbackTotal = 2
+        feedbackTotal = 3
         multiStepFeedback = QgsProcessingMultiStepFeedback(feedbackTotal, feedback)
         multiStepFeedback.setCurrentStep(0)
         multiStepFeedback.setProgressText(self.tr("Getting Dangles..."))
@@ -149,36 +155,104 @@ class IdentifySmallFirstOrderDanglesAlgorithm(ValidationAlgorithm):
             geographicBoundsLyr=geographicBoundsLyr,
             feedback=multiStepFeedback,
         )
-
-        multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.setProgressText(self.tr("Raising flags..."))
         nDangles = dangleLyr.featureCount()
         if nDangles == 0:
             return {self.FLAGS: self.flag_id}
-        # currentValue = feedback.progress()
-        currentTotal = 100 / nDangles
-        for current, feat in enumerate(dangleLyr.getFeatures()):
+
+        multiStepFeedback.setCurrentStep(1)
+        multiStepFeedback.setProgressText(self.tr("Reading lines..."))
+        endpointTable, smallLineDict = self.readLines(
+            inputLyr, minLength, onlySelected, multiStepFeedback
+        )
+
+        multiStepFeedback.setCurrentStep(2)
+        multiStepFeedback.setProgressText(self.tr("Raising flags..."))
+        dangleXY = np.array(
+            [
+                (point.x(), point.y())
+                for point in (
+                    feat.geometry().vertexAt(0)
+                    for feat in dangleLyr.getFeatures(
+                        QgsFeatureRequest().setNoAttributes()
+                    )
+                )
+            ],
+            dtype=np.float64,
+        )
+        lineIndexes = endpointTable.findLines(dangleXY)
+        unmatched = lineIndexes < 0
+        if unmatched.any():
+            nUnmatched = int(unmatched.sum())
+            multiStepFeedback.pushWarning(
+                self.tr(
+                    "{0} dangles do not lie on a line endpoint of {1} and were ignored: {2}"
+                ).format(
+                    nUnmatched,
+                    inputLyr.name(),
+                    ", ".join(
+                        "({0}, {1})".format(x, y)
+                        for x, y in dangleXY[unmatched][: self.MAX_WARNING_POINTS]
+                    )
+                    + (", ..." if nUnmatched > self.MAX_WARNING_POINTS else ""),
+                )
+            )
+        # a small line dangling on both ends is flagged once
+        flagIndexes = [
+            i
+            for i in np.unique(endpointTable.featureIds[lineIndexes[~unmatched]])
+            if i in smallLineDict
+        ]
+        nFlags = len(flagIndexes)
+        for current, lineIndex in enumerate(flagIndexes):
             if multiStepFeedback.isCanceled():
                 break
-            dangleGeom = feat.geometry()
-            dangleBB = dangleGeom.boundingBox()
-            request = QgsFeatureRequest().setNoAttributes().setFilterRect(dangleBB)
-            lineGeometry = [
-                i.geometry()
-                for i in inputLyr.getFeatures(request)
-                if i.geometry().intersects(dangleGeom)
-            ][0]
-            if lineGeometry.length() > minLength:
-                continue
             self.flagFeature(
-                lineGeometry,
+                smallLineDict[lineIndex],
                 self.tr(
                     f"First order dangle on {inputLyr.name()} smaller than {minLength}"
                 ),
             )
-            multiStepFeedback.setProgress(current * currentTotal)
+            multiStepFeedback.setProgress(100 * (current + 1) / nFlags)
         return {self.FLAGS: self.flag_id}
 
+    def readLines(self, inputLyr, minLength, onlySelected, feedback):
+        """
+        Reads the endpoints of the input lines and measures them in a single
+        pass over the layer. Each part of a multi line is a row of the table,
+        since the dangles are searched on the boundary of every part.
+        :param inputLyr: (QgsVectorLayer) input lines;
+        :param minLength: (float) lines up to this length are kept;
+        :param onlySelected: (bool) whether only selected features are read;
+        :param feedback: (QgsFeedback) feedback;
+        :return: (tuple) (EndpointTable, dict) the endpoint table, whose
+            feature ids are the reading order of the lines, and the geometries
+            of the lines not longer than minLength, by their reading order.
+        """
+        request = QgsFeatureRequest().setNoAttributes()
+        iterator = (
+            inputLyr.getSelectedFeatures(request)
+            if onlySelected
+            else inputLyr.getFeatures(request)
+        )
+        nFeats = (
+            inputLyr.selectedFeatureCount() if onlySelected else inputLyr.featureCount()
+        )
+        stepSize = 100 / nFeats if nFeats else 0
+        wkbList, smallLineDict = [], dict()
+        for current, feat in enumerate(iterator):
+            if feedback.isCanceled():
+                break
+            geom = feat.geometry()
+            if geom.isNull() or geom.isEmpty():
+                continue
+            if QgsWkbTypes.isCurvedType(geom.wkbType()):
+                geom = QgsGeometry(geom.constGet().segmentize())
+            if geom.length() <= minLength:
+                smallLineDict[len(wkbList)] = geom
+            wkbList.append(bytes(geom.asWkb()))
+            feedback.setProgress(current * stepSize)
+        return EndpointTable.fromWkbList(wkbList, splitParts=True), smallLineDict
+
     def name(self):
         """
         Returns the algorithm name, used for identifying the algorithm. This
@@ -38,6 +38,10 @@ from qgis.core import (
     QgsWkbTypes,
 )
 
+from DsgTools.core.GeometricTools.postgisValidationHandler import (
+    PostgisValidationHandler,
+)
+
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
 
@@ -46,6 +50,7 @@ class IdentifySmallLinesAlgorithm(ValidationAlgorithm):
     FLAGS = "FLAGS"
     INPUT = "INPUT"
     SELECTED = "SELECTED"
+    RUN_ON_SERVER = "RUN_ON_SERVER"
     TOLERANCE = "TOLERANCE"
 
     def initAlgorithm(self, config):
@@ -64,6 +69,14 @@ class IdentifySmallLinesAlgorithm(ValidationAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.RUN_ON_SERVER,
+                self.tr("Run the check on the PostGIS server when possible"),
+                defaultValue=True,
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterNumber(
                 self.TOLERANCE,
@@ -91,8 +104,21 @@ class IdentifySmallLinesAlgorithm(ValidationAlgorithm):
                 self.invalidSourceError(parameters, self.INPUT)
             )
         onlySelected = self.parameterAsBool(parameters, self.SELECTED, context)
+        runOnServer = self.parameterAsBool(parameters, self.RUN_ON_SERVER, context)
         tol = self.parameterAsDouble(parameters, self.TOLERANCE, context)
         self.prepareFlagSink(parameters, inputLyr, inputLyr.wkbType(), context)
+        serverHandler = PostgisValidationHandler()
+        if runOnServer and serverHandler.canRunOnServer(
+            inputLyr, onlySelected=onlySelected
+        ):
+            for featid, length, geom in serverHandler.getSmallLineFlags(
+                inputLyr, tol, feedback=feedback
+            ):
+                flagText = self.tr(
+                    "Feature from layer {0} with id={1} has length of value {2:.10f}, which is lesser than the tolerance of {3} units."
+                ).format(inputLyr.name(), featid, length, tol)
+                self.flagFeature(geom, flagText)
+            return {self.FLAGS: self.flag_id}
         # Compute the number of steps to display within the progress bar and
         # get features from source
         featureList, total = self.getIteratorAndFeatureCount(
@@ -20,7 +20,6 @@
  *                                                                         *
  ***************************************************************************/
 """
-import math
 from PyQt5.QtCore import QCoreApplication
 
 from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
@@ -105,37 +104,27 @@ class IdentifyWrongBuildingAnglesAlgorithm(ValidationAlgorithm):
         self.prepareFlagSink(parameters, inputLyr, QgsWkbTypes.Point, context)
         # Compute the number of steps to display within the progress bar and
         # get features from source
-        featureList, total = self.getIteratorAndFeatureCount(
+        featureList, _ = self.getIteratorAndFeatureCount(
             inputLyr, onlySelected=onlySelected
         )
-
-        for current, feat in enumerate(featureList):
+        # the angles of every vertex are computed at once
+        outOfBoundsList = geometryHandler.getInvalidBuildingAngleList(
+            featureList, tol, ignoreCircles=ignoreCircles, feedback=feedback
+        )
+        total = 100.0 / len(outOfBoundsList) if outOfBoundsList else 0
+        for current, item in enumerate(outOfBoundsList):
             # Stop the algorithm if cancel button has been clicked
             if feedback.isCanceled():
                 break
-            if ignoreCircles and self.isCircle(feat.geometry()):
-                continue
-            outOfBoundsList = geometryHandler.getInvalidBuildingAngle(feat, tol)
-            if outOfBoundsList:
-                for item in outOfBoundsList:
-                    flagText = self.tr(
-                        "Feature from layer {name} with id={id} has invalid building angle ({angle})"
-                    ).format(
-                        name=inputLyr.name(), id=item["feat_id"], angle=item["angle"]
-                    )
-                    self.flagFeature(item["geom"], flagText)
+            flagText = self.tr(
+                "Feature from layer {name} with id={id} has invalid building angle ({angle})"
+            ).format(name=inputLyr.name(), id=item["feat_id"], angle=item["angle"])
+            self.flagFeature(item["geom"], flagText)
             # Update the progress bar
             feedback.setProgress(int(current * total))
 
         return {self.FLAGS: self.flag_id}
 
-    def isCircle(self, geom):
-        perimeter = geom.length()
-        area = geom.area()
-        if (perimeter * perimeter / (4 * math.pi)) / area < 1.1:
-            return True
-        return False
-
     def name(self):
         """
         Returns the algorithm name, used for identifying the algorithm. This
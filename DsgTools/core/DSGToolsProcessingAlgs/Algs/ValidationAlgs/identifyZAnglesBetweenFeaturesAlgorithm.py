@@ -20,20 +20,11 @@
  ***************************************************************************/
 """
 
-import math
-import concurrent.futures
-import os
-
 from PyQt5.QtCore import QCoreApplication, QVariant
 from qgis.core import (
     QgsFeature,
-    QgsFeatureRequest,
     QgsField,
     QgsFields,
-    QgsGeometry,
-    QgsGeometryUtils,
-    QgsPoint,
-    QgsPointXY,
     QgsProcessing,
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterFeatureSource,
@@ -43,6 +34,8 @@ from qgis.core import (
     QgsProcessingMultiStepFeedback,
 )
 
+from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+
 from .validationAlgorithm import ValidationAlgorithm
 from ..Help.algorithmHelpCreator import HTMLHelpCreator as help
 
@@ -130,237 +123,50 @@ class identifyZAnglesBetweenFeaturesAlgorithm(ValidationAlgorithm):
         return {self.OUTPUT: dest_id}
 
     def caseInternLine(self, lines, angle, feedback=None):
-        featsToAnalyse = []
-        lineCount = lines.featureCount()
-        if lineCount == 0:
-            return featsToAnalyse
-        total = 100 / lineCount
-        for current, feat in enumerate(lines.getFeatures()):
-            if feedback is not None and feedback.isCanceled():
-                break
-            vertices = feat.geometry().vertices()
-            v1 = next(vertices) if vertices.hasNext() else None
-            v2 = next(vertices) if vertices.hasNext() else None
-            v3 = next(vertices) if vertices.hasNext() else None
-            for v4 in vertices:
-                newFeat = (
-                    self.checkIntersectionAndCreateFeature4p(v1, v2, v3, v4, angle)
-                    if all((v1, v2, v3, v4))
-                    else None
-                )
-                if newFeat:
-                    newFeat.setAttribute("source", lines.sourceName())
-                    featsToAnalyse.append(newFeat)
-                v1, v2, v3 = v2, v3, v4
-            if feedback is not None:
-                feedback.setProgress(current * total)
-        return featsToAnalyse
+        return self.caseInternGeometry(lines, angle, feedback=feedback)
 
     def caseInternArea(self, areas, angle, feedback=None):
-        featsToAnalyse = []
-        areaCount = areas.featureCount()
-        if areaCount == 0:
-            return featsToAnalyse
-        total = 100 / areaCount
-        for current, feat in enumerate(areas.getFeatures()):
-            if feedback is not None and feedback.isCanceled():
-                break
-            geom = feat.geometry()
-            multiPolygons = (
-                geom.asMultiPolygon()[0] if geom.isMultipart() else geom.asPolygon()
-            )
-            for vertices in multiPolygons:
-                for i in range(len(vertices) - 3):
-                    v1, v2, v3, v4 = vertices[i : i + 4]
-                    newFeat = (
-                        self.checkIntersectionAndCreateFeature4p(v1, v2, v3, v4, angle)
-                        if all((v1, v2, v3, v4))
-                        else None
-                    )
-                    if newFeat:
-                        newFeat.setAttribute("source", areas.sourceName())
-                        featsToAnalyse.append(newFeat)
-                newFeat = self.checkIntersectionAndCreateFeature4p(
-                    vertices[-3], vertices[-2], vertices[-1], vertices[1], angle
-                )
-                if newFeat:
-                    featsToAnalyse.append(newFeat)
-            if feedback is not None:
-                feedback.setProgress(current * total)
-        return featsToAnalyse
-
-    def caseBetweenLines(self, lines, angle, feedback=None):
-        featsToAnalyse = []
-        lineCount = lines.featureCount()
-        if lineCount == 0:
-            return featsToAnalyse
-        total = 100 / lineCount
+        return self.caseInternGeometry(areas, angle, feedback=feedback)
 
-        def evaluateLine(feat1):
-            featsToAnalyse = []
-            if feedback is not None and feedback.isCanceled():
-                return []
-            gfeat1 = feat1.geometry()
-            request = QgsFeatureRequest().setFilterRect(gfeat1.boundingBox())
-            for j, feat2 in enumerate(lines.getFeatures(request)):
-                if i >= j:
-                    continue
-                gfeat2 = feat2.geometry()
-                if gfeat1.intersects(gfeat2):
-                    if len(list(gfeat1.vertices())) > 2:
-                        toAnalyse = self.checkIfIntersectionIsValid2g(
-                            gfeat1, gfeat2, angle
-                        )
-                        if isinstance(toAnalyse, tuple):
-                            toAnalyse = (x for x in toAnalyse if x)
-                            for feat in toAnalyse:
-                                feat.setAttribute("source", lines.sourceName())
-                                featsToAnalyse.append(feat)
-                        elif toAnalyse:
-                            toAnalyse.setAttribute("source", lines.sourceName())
-                            featsToAnalyse.append(toAnalyse)
-                    # Gets the case when the z angle is created by 3 feats (at least one has only two vertices)
-                    elif len(list(gfeat1.vertices())) == 2:
-                        request2 = QgsFeatureRequest().setFilterRect(
-                            gfeat2.boundingBox()
-                        )
-                        for k, feat3 in enumerate(lines.getFeatures(request2)):
-                            if any([(k > i), (k > j)]):
-                                continue
-                            gfeat3 = feat3.geometry()
-                            if not gfeat3.touches(gfeat1):
-                                toAnalyse = self.checkIfIntersectionIsValid3g(
-                                    gfeat1, gfeat2, gfeat3, angle
-                                )
-                                if isinstance(toAnalyse, tuple):
-                                    toAnalyse = (x for x in toAnalyse if x)
-                                    for feat in toAnalyse:
-                                        feat.setAttribute("source", lines.sourceName())
-                                        featsToAnalyse.append(feat)
-                                elif toAnalyse:
-                                    toAnalyse.setAttribute("source", lines.sourceName())
-                                    featsToAnalyse.append(toAnalyse)
-            return featsToAnalyse
+    def caseInternGeometry(self, source, angle, feedback=None):
+        """
+        Evaluates every sequence of four consecutive vertices of each
+        feature at once (see GeometryHandler.getZAngleList). Sequences do
+        not cross parts and go around polygon rings.
+        """
+        if source.featureCount() == 0:
+            return []
+        zAngleList = GeometryHandler().getZAngleList(
+            source.getFeatures(), angle, feedback=feedback
+        )
+        return self.buildFlagList(source, zAngleList, feedback=feedback)
 
-        futures = set()
-        pool = concurrent.futures.ThreadPoolExecutor(os.cpu_count() - 1)
-        multiStepFeedback = QgsProcessingMultiStepFeedback(2, feedback)
-        multiStepFeedback.setCurrentStep(0)
-        multiStepFeedback.pushInfo(self.tr("Submitting tasks to thread"))
-        for i, feat1 in enumerate(lines.getFeatures()):
-            futures.add(pool.submit(evaluateLine, feat1))
-        multiStepFeedback.setCurrentStep(1)
-        multiStepFeedback.pushInfo(self.tr("Evaluating tasks"))
-        concurrent.futures.wait(
-            futures, timeout=None, return_when=concurrent.futures.ALL_COMPLETED
+    def caseBetweenLines(self, lines, angle, feedback=None):
+        """
+        Evaluates at once every sequence of four consecutive vertices that
+        goes from a line into the line that starts where it ends (see
+        GeometryHandler.getZAngleBetweenLinesList).
+        """
+        if lines.featureCount() == 0:
+            return []
+        zAngleList = GeometryHandler().getZAngleBetweenLinesList(
+            lines.getFeatures(), angle, feedback=feedback
         )
-        for current, future in enumerate(concurrent.futures.as_completed(futures)):
+        return self.buildFlagList(lines, zAngleList, feedback=feedback)
+
+    def buildFlagList(self, source, zAngleList, feedback=None):
+        featsToAnalyse = []
+        total = 100 / len(zAngleList) if zAngleList else 0
+        for current, item in enumerate(zAngleList):
             if feedback is not None and feedback.isCanceled():
                 break
-            featsToAnalyse += future.result()
-            multiStepFeedback.setProgress(total * current)
-
-        return featsToAnalyse
-
-    def checkIntersectionAndCreateFeature4p(self, v1, v2, v3, v4, angle):
-        angle1 = QgsGeometryUtils.angleBetweenThreePoints(
-            v1.x(), v1.y(), v2.x(), v2.y(), v3.x(), v3.y()
-        )
-        angle2 = QgsGeometryUtils.angleBetweenThreePoints(
-            v2.x(), v2.y(), v3.x(), v3.y(), v4.x(), v4.y()
-        )
-        angle1 = math.degrees(angle1)
-        angle2 = math.degrees(angle2)
-        if (angle1 > angle and angle2 < 360 - angle) or (
-            angle1 < 360 - angle and angle2 > angle
-        ):
             newFeat = QgsFeature(self.fields)
-            if isinstance(v1, QgsPoint):
-                newFeat.setGeometry(QgsGeometry.fromPolyline([v1, v2, v3, v4]))
-            elif isinstance(v1, QgsPointXY):
-                newFeat.setGeometry(QgsGeometry.fromPolylineXY([v1, v2, v3, v4]))
-            return newFeat
-
-    def checkIfIntersectionIsValid2g(self, g1, g2, angle):
-        intersection = g1.intersection(g2)
-        if intersection.wkbType() != QgsWkbTypes.Point:
-            return False
-        intersection = intersection.asPoint()
-
-        _, g1VertexIdx, g1PreviousVertexIdx, g1NextVertexIdx, _ = g1.closestVertex(
-            intersection
-        )
-        _, g2VertexIdx, g2PreviousVertexIdx, g2NextVertexIdx, _ = g2.closestVertex(
-            intersection
-        )
-
-        vg1 = list(g1.vertices())
-        vg2 = list(g2.vertices())
-
-        # Intersections between beginning / end of v1 and v2
-        if g1NextVertexIdx == g2PreviousVertexIdx == -1:
-            feat = self.checkIntersectionAndCreateFeature4p(
-                vg1[g1PreviousVertexIdx - 1],
-                vg1[g1PreviousVertexIdx],
-                vg1[g1VertexIdx],
-                vg2[g2NextVertexIdx],
-                angle,
-            )
-            return feat
-
-        elif g2NextVertexIdx == g1PreviousVertexIdx == -1:
-            feat = self.checkIntersectionAndCreateFeature4p(
-                vg2[g2PreviousVertexIdx],
-                vg2[g2VertexIdx],
-                vg1[g1NextVertexIdx],
-                vg1[g1NextVertexIdx + 1],
-                angle,
-            )
-            return feat
-
-    def checkIfIntersectionIsValid3g(self, g1, g2, g3, angle):
-        inter12 = g1.intersection(g2)
-        inter23 = g2.intersection(g3)
-        if any(
-            (
-                inter12.wkbType() != QgsWkbTypes.Point,
-                inter23.wkbType() != QgsWkbTypes.Point,
-            )
-        ):
-            return False
-        inter12 = inter12.asPoint()
-        inter23 = inter23.asPoint()
-
-        _, g1VertexIdx, g1PreviousVertexIdx, g1NextVertexIdx, _ = g1.closestVertex(
-            inter12
-        )
-        _, g3VertexIdx, g3PreviousVertexIdx, g3NextVertexIdx, _ = g3.closestVertex(
-            inter23
-        )
-
-        vg1 = list(g1.vertices())
-        vg3 = list(g3.vertices())
-
-        # Intersections between beginning / end of v1 and v2
-        if g1NextVertexIdx == g3PreviousVertexIdx == -1:
-            feat = self.checkIntersectionAndCreateFeature4p(
-                vg1[g1PreviousVertexIdx],
-                vg1[g1VertexIdx],
-                vg3[g3VertexIdx],
-                vg3[g3NextVertexIdx],
-                angle,
-            )
-            return feat
-
-        elif g3NextVertexIdx == g1PreviousVertexIdx == -1:
-            feat = self.checkIntersectionAndCreateFeature4p(
-                vg3[g3PreviousVertexIdx],
-                vg3[g3VertexIdx],
-                vg1[g1VertexIdx],
-                vg1[g1NextVertexIdx],
-                angle,
-            )
-            return feat
+            newFeat.setGeometry(item["geom"])
+            newFeat.setAttribute("source", source.sourceName())
+            featsToAnalyse.append(newFeat)
+            if feedback is not None:
+                feedback.setProgress(current * total)
+        return featsToAnalyse
 
     def name(self):
         """
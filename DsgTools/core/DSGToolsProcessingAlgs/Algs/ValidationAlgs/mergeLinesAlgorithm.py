@@ -238,16 +238,12 @@ class MergeLinesAlgorithm(ValidationAlgorithm):
         multiStepFeedback.setCurrentStep(currentStep)
         multiStepFeedback.pushInfo(self.tr("Saving changes on input layer"))
 
-        def updateLambda(x):
-            return inputLyr.changeGeometry(x["featid"], x.geometry())
-
-        inputLyr.startEditing()
-        inputLyr.beginEditCommand(
-            f"Merging lines with same attribute set from {inputLyr.name()}"
+        layerHandler.applyBulkEdits(
+            inputLyr,
+            geometryDict={feat["featid"]: feat.geometry() for feat in outputFeatSet},
+            idsToDelete=idsToDeleteSet,
+            commandName=f"Merging lines with same attribute set from {inputLyr.name()}",
         )
-        list(map(updateLambda, outputFeatSet))
-        inputLyr.deleteFeatures(list(idsToDeleteSet))
-        inputLyr.endEditCommand()
 
         return {}
 
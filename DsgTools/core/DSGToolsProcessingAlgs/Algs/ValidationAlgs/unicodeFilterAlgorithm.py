@@ -9,16 +9,17 @@ from qgis.core import (
     QgsCoordinateReferenceSystem,
     QgsProcessingParameterMultipleLayers,
     QgsFeature,
+    QgsFeatureRequest,
     QgsProcessingMultiStepFeedback,
     QgsField,
     QgsFields,
     QgsWkbTypes,
-    NULL,
 )
 from qgis.utils import iface
 import csv
 import concurrent.futures
 import os
+import re
 
 
 class UnicodeFilterAlgorithm(QgsProcessingAlgorithm):
@@ -56,31 +57,41 @@ class UnicodeFilterAlgorithm(QgsProcessingAlgorithm):
         feedback.setProgressText("Verificando unicodes...")
         layerList = self.parameterAsLayerList(parameters, "INPUT_LAYER_LIST", context)
         whitelist = self.getWhitelist(self.getCsvFilePath())
+        invalidCharMatcher = self.buildInvalidCharMatcher(whitelist)
         flags = defaultdict(list)
 
         multiStepFeedback = QgsProcessingMultiStepFeedback(3, feedback)
         multiStepFeedback.setCurrentStep(0)
 
         def checkUnicode(layer):
-            featuresNotApproved = []
-            for feature in layer.getFeatures():
-                for attribute in feature.attributes():
-                    if attribute == NULL:
-                        continue
+            stringFieldIdxList = [
+                idx
+                for idx, field in enumerate(layer.fields())
+                if field.type() == QVariant.String
+            ]
+            if stringFieldIdxList == []:
+                return layer.geometryType(), []
+            request = QgsFeatureRequest()
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes(stringFieldIdxList)
+            flagIdList = []
+            for feature in layer.getFeatures(request):
+                if multiStepFeedback.isCanceled():
+                    return layer.geometryType(), []
+                for idx in stringFieldIdxList:
+                    attribute = feature[idx]
                     if not isinstance(attribute, str):
                         continue
-                    for char in attribute:
-                        if hex(ord(char))[2:].lower().rjust(4, "0") in whitelist:
-                            continue
-                        featuresNotApproved.append(feature)
-                        break
-                    else:
+                    if invalidCharMatcher.search(attribute) is None:
                         continue
+                    flagIdList.append(feature.id())
                     break
-                else:
-                    continue
-                break
-            return layer.geometryType(), featuresNotApproved
+            if flagIdList == []:
+                return layer.geometryType(), []
+            request = QgsFeatureRequest()
+            request.setFilterFids(flagIdList)
+            request.setNoAttributes()
+            return layer.geometryType(), list(layer.getFeatures(request))
 
         pool = concurrent.futures.ThreadPoolExecutor(os.cpu_count() - 1)
         futures = set()
@@ -161,6 +172,30 @@ class UnicodeFilterAlgorithm(QgsProcessingAlgorithm):
                 whitelist.append(row[0].lower())
         return whitelist
 
+    def buildInvalidCharMatcher(self, whitelist):
+        """
+        Compiles a regular expression that matches any character that is not
+        on the whitelist, so that whole values are checked at once.
+        :param whitelist: (list) hexadecimal code points (e.g. "00e1");
+        :return: (re.Pattern) compiled pattern.
+        """
+        codePointList = sorted(
+            set(int(code, 16) for code in whitelist if code.strip() != "")
+        )
+        rangeList = []
+        for codePoint in codePointList:
+            if rangeList and rangeList[-1][1] == codePoint - 1:
+                rangeList[-1][1] = codePoint
+            else:
+                rangeList.append([codePoint, codePoint])
+        charClass = "".join(
+            re.escape(chr(start))
+            if start == end
+            else "{0}-{1}".format(re.escape(chr(start)), re.escape(chr(end)))
+            for start, end in rangeList
+        )
+        return re.compile("[^{0}]".format(charClass) if charClass else "[\\s\\S]")
+
     def getCsvFilePath(self):
         return os.path.join(
             os.path.abspath(os.path.join(os.path.dirname(__file__))),
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Algorithm manifest used by DSGToolsProcessingAlgorithmProvider to register
+lightweight algorithm descriptors without importing the implementation
+modules.
+
+The manifest is generated by statically parsing the algorithm sources, so
+this module must not import qgis. After adding or renaming an algorithm,
+regenerate it with:
+    python DsgTools/core/DSGToolsProcessingAlgs/algorithmManifest.py
+"""
+
+import ast
+import importlib
+import json
+import os
+
+CURRENT_PATH = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = "DsgTools.core.DSGToolsProcessingAlgs"
+MANIFEST_PATH = os.path.join(CURRENT_PATH, "algorithmManifest.json")
+PROVIDER_PATH = os.path.join(CURRENT_PATH, "dsgtoolsProcessingAlgorithmProvider.py")
+MANIFEST_VERSION = 1
+METADATA_METHODS = ("name", "displayName", "group", "groupId")
+
+
+class AlgorithmDescriptor(object):
+    def __init__(
+        self,
+        path,
+        name=None,
+        displayName=None,
+        group=None,
+        groupId=None,
+        trContext=None,
+        flags=None,
+        inheritsFlags=True,
+        lazy=True,
+    ):
+        """
+        Describes a registered algorithm.
+        :param path: (str) class path relative to DSGToolsProcessingAlgs,
+            e.g. Algs.ValidationAlgs.identifyDanglesAlgorithm.IdentifyDanglesAlgorithm;
+        :param name: (str) algorithm name (id without provider prefix);
+        :param displayName: (str) untranslated display name;
+        :param group: (str) untranslated group name;
+        :param groupId: (str) group id;
+        :param trContext: (str) translation context used by the algorithm's tr;
+        :param flags: (list-of-str) QgsProcessingAlgorithm flag names added by
+            the algorithm;
+        :param inheritsFlags: (bool) whether flags are added to the default ones;
+        :param lazy: (bool) False when the metadata could not be statically
+            resolved and the algorithm must be imported at registration.
+        """
+        self.path = path
+        self.name = name
+        self.displayName = displayName
+        self.group = group
+        self.groupId = groupId
+        self.trContext = trContext
+        self.flags = flags or []
+        self.inheritsFlags = inheritsFlags
+        self.lazy = lazy
+        self._algorithmClass = None
+
+    @classmethod
+    def fromDict(cls, inputDict):
+        return cls(**inputDict)
+
+    def asDict(self):
+        if not self.lazy:
+            return {"path": self.path, "lazy": False}
+        return {
+            "path": self.path,
+            "name": self.name,
+            "displayName": self.displayName,
+            "group": self.group,
+            "groupId": self.groupId,
+            "trContext": self.trContext,
+            "flags": self.flags,
+            "inheritsFlags": self.inheritsFlags,
+        }
+
+    def moduleAndClassName(self):
+        modulePath, className = self.path.rsplit(".", 1)
+        return "{0}.{1}".format(PACKAGE, modulePath), className
+
+    def load(self):
+        """
+        Imports the implementation module and returns the algorithm class.
+        """
+        if self._algorithmClass is None:
+            moduleName, className = self.moduleAndClassName()
+            module = importlib.import_module(moduleName)
+            self._algorithmClass = getattr(module, className)
+        return self._algorithmClass
+
+    def isLoaded(self):
+        return self._algorithmClass is not None
+
+
+def loadManifest(manifestPath=None):
+    """
+    Reads the manifest.
+    :param manifestPath: (str) path to the manifest json;
+    :return: (dict) class path -> AlgorithmDescriptor. Empty when the
+        manifest is missing or was generated by an incompatible version.
+    """
+    manifestPath = MANIFEST_PATH if manifestPath is None else manifestPath
+    if not os.path.exists(manifestPath):
+        return dict()
+    with open(manifestPath, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        return dict()
+    return {
+        entry["path"]: AlgorithmDescriptor.fromDict(entry)
+        for entry in manifest["algorithms"]
+    }
+
+
+def getRegisteredAlgorithmPaths(providerPath=None):
+    """
+    Reads the ALGORITHMS list from the provider module without importing it.
+    """
+    providerPath = PROVIDER_PATH if providerPath is None else providerPath
+    with open(providerPath, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(getattr(t, "id", None) == "ALGORITHMS" for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError("ALGORITHMS list not found in {0}".format(providerPath))
+
+
+class AlgorithmSourceParser(object):
+    """
+    Extracts algorithm metadata from the sources. Methods that are not
+    defined on the class are searched on its base classes, following the
+    module's imports.
+    """
+
+    def __init__(self):
+        self.treeCache = dict()
+
+    def getModuleTree(self, moduleName):
+        if moduleName not in self.treeCache:
+            relativePath = moduleName.replace(PACKAGE + ".", "").split(".")
+            filePath = os.path.join(CURRENT_PATH, *relativePath) + ".py"
+            if not moduleName.startswith(PACKAGE) or not os.path.exists(filePath):
+                self.treeCache[moduleName] = None
+            else:
+                with open(filePath, "r", encoding="utf-8") as f:
+                    self.treeCache[moduleName] = ast.parse(f.read())
+        return self.treeCache[moduleName]
+
+    def findClass(self, moduleName, className):
+        """
+        Returns the class node and the module it was defined in.
+        """
+        tree = self.getModuleTree(moduleName)
+        if tree is None:
+            return None, None
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == className:
+                return node, moduleName
+        for node in tree.body:
+            if not isinstance(node, ast.ImportFrom):
+                continue
+            for alias in node.names:
+                if (alias.asname or alias.name) != className:
+                    continue
+                importedModule = self.resolveImport(moduleName, node)
+                return self.findClass(importedModule, alias.name)
+        return None, None
+
+    @staticmethod
+    def resolveImport(moduleName, node):
+        if node.level == 0:
+            return node.module
+        base = moduleName.split(".")[: -node.level]
+        return ".".join(base + ([node.module] if node.module else []))
+
+    def findMethod(self, moduleName, className, methodName):
+        classNode, definedIn = self.findClass(moduleName, className)
+        if classNode is None:
+            return None
+        for node in classNode.body:
+            if isinstance(node, ast.FunctionDef) and node.name == methodName:
+                return node
+        for base in classNode.bases:
+            if isinstance(base, ast.Name):
+                method = self.findMethod(definedIn, base.id, methodName)
+                if method is not None:
+                    return method
+        return None
+
+    @staticmethod
+    def getReturnValue(method):
+        returns = [n for n in method.body if isinstance(n, ast.Return)]
+        return returns[-1].value if returns else None
+
+    def getStringValue(self, method):
+        """
+        Resolves methods that return a literal or self.tr(literal).
+        """
+        if method is None:
+            return None
+        value = self.getReturnValue(method)
+        if isinstance(value, ast.Call) and getattr(value.func, "attr", None) == "tr":
+            value = value.args[0] if len(value.args) == 1 else None
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+        return None
+
+    def getTrContext(self, method):
+        if method is None:
+            return None
+        value = self.getReturnValue(method)
+        if (
+            isinstance(value, ast.Call)
+            and getattr(value.func, "attr", None) == "translate"
+            and value.args
+            and isinstance(value.args[0], ast.Constant)
+        ):
+            return value.args[0].value
+        return None
+
+    @staticmethod
+    def getFlags(method):
+        """
+        Returns the flag names or-ed by the method and whether super().flags()
+        is used. Returns None when the expression is not a plain or-chain.
+        """
+        if method is None:
+            return [], True
+        value = AlgorithmSourceParser.getReturnValue(method)
+        flags, inheritsFlags = [], False
+        operands = [value]
+        while operands:
+            operand = operands.pop()
+            if isinstance(operand, ast.BinOp) and isinstance(operand.op, ast.BitOr):
+                operands.extend([operand.right, operand.left])
+            elif isinstance(operand, ast.Attribute) and operand.attr.startswith("Flag"):
+                flags.append(operand.attr)
+            elif (
+                isinstance(operand, ast.Call)
+                and getattr(operand.func, "attr", None) == "flags"
+            ):
+                inheritsFlags = True
+            else:
+                return None
+        return sorted(flags), inheritsFlags
+
+    def buildDescriptor(self, path):
+        modulePath, className = path.rsplit(".", 1)
+        moduleName = "{0}.{1}".format(PACKAGE, modulePath)
+        values = {
+            methodName: self.getStringValue(
+                self.findMethod(moduleName, className, methodName)
+            )
+            for methodName in METADATA_METHODS
+        }
+        trContext = self.getTrContext(self.findMethod(moduleName, className, "tr"))
+        flags = self.getFlags(self.findMethod(moduleName, className, "flags"))
+        if any(v is None for v in values.values()) or flags is None:
+            return AlgorithmDescriptor(path, lazy=False)
+        return AlgorithmDescriptor(
+            path,
+            trContext=trContext or className,
+            flags=flags[0],
+            inheritsFlags=flags[1],
+            **values
+        )
+
+
+def generateManifest(manifestPath=None, providerPath=None):
+    """
+    Parses every algorithm registered by the provider and writes the manifest.
+    :return: (list-of-AlgorithmDescriptor) generated descriptors.
+    """
+    manifestPath = MANIFEST_PATH if manifestPath is None else manifestPath
+    parser = AlgorithmSourceParser()
+    descriptorList = [
+        parser.buildDescriptor(path)
+        for path in getRegisteredAlgorithmPaths(providerPath)
+    ]
+    with open(manifestPath, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": MANIFEST_VERSION,
+                "algorithms": [d.asDict() for d in descriptorList],
+            },
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+        f.write("\n")
+    return descriptorList
+
+
+if __name__ == "__main__":
+    descriptors = generateManifest()
+    print(
+        "{0} algorithms written to {1} ({2} eager).".format(
+            len(descriptors),
+            MANIFEST_PATH,
+            len([d for d in descriptors if not d.lazy]),
+        )
+    )
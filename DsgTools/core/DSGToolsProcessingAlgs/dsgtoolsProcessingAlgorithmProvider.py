@@ -21,498 +21,188 @@
  ***************************************************************************/
 """
 
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.DataManagementAlgs.clipAndCopyFeaturesBetweenDatabasesAlgorithm import (
-    ClipAndCopyFeaturesBetweenDatabasesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.EnvironmentSetterAlgs.genericSelectionToolParametersAlgorithm import (
-    GenericSelectionToolParametersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.EnvironmentSetterAlgs.rightAngleToolParametersAlgorithm import (
-    RightAngleToolParametersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.DataManagementAlgs.appendFeaturesToLayerAlgorithm import (
-    AppendFeaturesToLayerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.findSmallClosedLinesAlgorithm import (
-    FindSmallClosedLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.generalizeNetworkEdgesFromLengthAlgorithm import (
-    GeneralizeNetworkEdgesWithLengthAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.reclassifyGroupsOfPixelsToNearestNeighborAlgorithm import (
-    ReclassifyGroupsOfPixelsToNearestNeighborAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.reclassifyPixelsToNearestNeighborAlgorithm import (
-    ReclassifyAdjacentPixelsToNearestNeighborAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.runReclassifyPixelsWithSlidingWindow import (
-    ReclassifyGroupsOfPixelsToNearestNeighborWithSlidingWindowAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.setLineOrientation import (
-    SetLineOrientation,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.buildZipPackagesAlgorithm import (
-    BuildZipPackageAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.batchRunAlgorithmWithGeographicBoundsConstraint import (
-    BatchRunAlgorithmWithGeographicBoundsConstraint,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.createGridFromCoordinatesAlgorithm import (
-    CreateGridFromCoordinatesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.RasterAlgs.batchRasterPackagingForBDGEx import (
-    BatchRasterPackagingForBDGEx,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.fixSegmentErrorsBetweenLinesAlgorithm import (
-    FixSegmentErrorsBetweenLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySmallObjectsOnLayersAlgorithm import (
-    IdentifySmallObjectsOnLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyUncoveredStartAndEndPointsAlgorithm import (
-    IdentifyUncoveredStartAndEndPointsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyWaterBodyAndContourInconsistencies import (
-    IdentifyWaterBodyAndContourInconsistencies,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeDuplicateNodesAlgorithm import (
-    RemoveDuplicateVertexesAlgorithm,
-)
 from processing.core.ProcessingConfig import ProcessingConfig, Setting
 from PyQt5.QtCore import QCoreApplication
 from qgis.core import QgsApplication, QgsProcessingProvider
 from qgis.PyQt.QtGui import QIcon
 
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.EditingAlgs.createEditingGridAlgorithm import (
-    CreateEditingGridAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.EnvironmentSetterAlgs.setFreeHandToolParametersAlgorithm import (
-    SetFreeHandToolParametersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.donutHoleExtractorAlgorithm import (
-    DonutHoleExtractorAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.extractByDE9IM import (
-    ExtractByDE9IMAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.extractElevationPoints import (
-    ExtractElevationPoints,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.line2Multiline import (
-    Line2Multiline,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.reclassifyAdjecentPolygonsAlgorithm import (
-    ReclassifyAdjacentPolygonsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.selectByDE9IM import (
-    SelectByDE9IMAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeometricAlgs.smallHoleRemoverAlgorithm import (
-    SmallHoleRemoverAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.splitPolygonsAlgorithm import (
-    SplitPolygons,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.GeneralizationAlgs.splitPolygonsByGrid import (
-    SplitPolygonsByGrid,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.applyStylesFromDatabaseToLayersAlgorithm import (
-    ApplyStylesFromDatabaseToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignActionsToLayersAlgorithm import (
-    AssignActionsToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignAliasesToLayersAlgorithm import (
-    AssignAliasesToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignBoundingBoxFilterToLayersAlgorithm import (
-    AssignBoundingBoxFilterToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignConditionalStyleToLayersAlgorithm import (
-    AssignConditionalStyleToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignCustomFormAndFormatRulesToLayersAlgorithm import (
-    AssignCustomFormAndFormatRulesToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignDefaultFieldValueToLayersAlgorithm import (
-    AssignDefaultFieldValueToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignExpressionFieldToLayersAlgorithm import (
-    AssignExpressionFieldToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignFilterToLayersAlgorithm import (
-    AssignFilterToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignFormatRulesToLayersAlgorithm import (
-    AssignFormatRulesToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignMeasureColumnToLayersAlgorithm import (
-    AssignMeasureColumnToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.assignValueMapToLayersAlgorithm import (
-    AssignValueMapToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.buildJoinsOnLayersAlgorithm import (
-    BuildJoinsOnLayersAlgorithm,
+from DsgTools.core.DSGToolsProcessingAlgs.algorithmManifest import (
+    AlgorithmDescriptor,
+    loadManifest,
 )
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.groupLayersAlgorithm import (
-    GroupLayersAlgorithm,
+from DsgTools.core.DSGToolsProcessingAlgs.lazyProcessingAlgorithm import (
+    LazyProcessingAlgorithm,
 )
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.loadLayersFromPostgisAlgorithm import (
-    LoadLayersFromPostgisAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.loadNonSpatialLayersFromPostgreSQLAlgorithm import (
-    LoadNonSpatialLayersFromPostgreSQLAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.loadRasterLayerFromServerAlgorithm import (
-    LoadRasterLayerFromServerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.loadShapefileAlgorithm import (
-    LoadShapefileAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.lockAttributeEditingAlgorithm import (
-    LockAttributeEditingAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.matchAndApplyQmlStylesToLayersAlgorithm import (
-    MatchAndApplyQmlStylesToLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.removeEmptyLayers import (
-    RemoveEmptyLayers,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.setRemoveDuplicateNodePropertyOnLayers import (
-    SetRemoveDuplicateNodePropertyOnLayers,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.batchRunAlgorithm import (
-    BatchRunAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.convertLayer2LayerAlgorithm import (
-    ConvertLayer2LayerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.createFrameAlgorithm import (
-    CreateFrameAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.createFramesWithConstraintAlgorithm import (
-    CreateFramesWithConstraintAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.createReviewGridAlgorithm import (
-    CreateReviewGridAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.filterLayerListByGeometryType import (
-    FilterLayerListByGeometryType,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.selectFeaturesOnCurrentCanvas import (
-    SelectFeaturesOnCurrentCanvas,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.azimuthCalculationAlgorithm import (
-    AzimuthCalculationAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.addUnsharedVertexOnIntersectionsAlgorithm import (
-    AddUnsharedVertexOnIntersectionsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.addUnsharedVertexOnSharedEdgesAlgorithm import (
-    AddUnsharedVertexOnSharedEdgesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.extendLinesToGeographicBoundsAlgorithm import (
-    ExtendLinesToGeographicBoundsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.fixDrainageFlowAlgorithm import (
-    FixDrainageFlowAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.exportToMemoryLayer import (
-    ExportToMemoryLayer,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.fileInventoryAlgorithm import (
-    FileInventoryAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.filterLayerListByGeometryType import (
-    FilterLayerListByGeometryType,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.loadTrackerAlgorithm import (
-    LoadTrackerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.pecCalculatorAlgorithm import (
-    PecCalculatorAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.raiseFlagsAlgorithm import (
-    RaiseFlagsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.ruleStatisticsAlgorithm import (
-    RuleStatisticsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.runFMESAPAlgorithm import (
-    RunFMESAPAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.runRemoteFMEAlgorithm import (
+from DsgTools.core.DSGToolsProcessingAlgs.parameterTypes import (
+    ParameterDistanceBetweenLayersType,
     ParameterFMEManagerType,
-    RunRemoteFMEAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.selectFeaturesOnCurrentCanvas import (
-    SelectFeaturesOnCurrentCanvas,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.stringCsvToFirstLayerWithElementsAlgorithm import (
-    StringCsvToFirstLayerWithElementsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.stringCsvToLayerListAlgorithm import (
-    StringCsvToLayerListAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.updateRunwayAltitudeAlgorithm import (
-    UpdateRunwayAltitudeAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.validateTrackerAlgorithm import (
-    ValidateTrackerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.identifyDifferencesBetweenDatabaseModelsAlgorithm import (
-    IdentifyDifferencesBetweenDatabaseModelsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.addUnsharedVertexOnIntersectionsAlgorithm import (
-    AddUnsharedVertexOnIntersectionsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.addUnsharedVertexOnSharedEdgesAlgorithm import (
-    AddUnsharedVertexOnSharedEdgesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.adjustNetworkConnectivityAlgorithm import (
-    AdjustNetworkConnectivityAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.buildPolygonsFromCenterPointsAndBoundariesAlgorithm import (
-    BuildPolygonsFromCenterPointsAndBoundariesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.cleanGeometriesAlgorithm import (
-    CleanGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.deaggregateGeometriesAlgorithm import (
-    DeaggregatorAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.detectChangesGroupAlgorithm import (
-    DetectChangesBetweenGroups,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.detectNullGeometriesAlgorithm import (
-    DetectNullGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.dissolvePolygonsWithSameAttributesAlgorithm import (
-    DissolvePolygonsWithSameAttributesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.enforceAttributeRulesAlgorithm import (
-    EnforceAttributeRulesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.enforceSpatialRulesAlgorithm import (
-    EnforceSpatialRulesAlgorithm,
-    ParameterSpatialRulesSetType,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.extendLinesToGeographicBoundsAlgorithm import (
-    ExtendLinesToGeographicBoundsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.hierarchicalSnapLayerOnLayerAndUpdateAlgorithm import (
-    HierarchicalSnapLayerOnLayerAndUpdateAlgorithm,
     ParameterSnapHierarchyType,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyAndFixInvalidGeometriesAlgorithm import (
-    IdentifyAndFixInvalidGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyAnglesInInvalidRangeAlgorithm import (
-    IdentifyAnglesInInvalidRangeAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyAttributeChangesInLines import (
-    IdentifyAttributeChangesInLines,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyCountourStreamIntersectionAlgorithm import (
-    IdentifyCountourStreamIntersectionAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyCrossingLinesAlgorithm import (
-    IdentifyCrossingLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDanglesAlgorithm import (
-    IdentifyDanglesAlgorithm,
-)
-
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyCloseFeaturesAlgorithm import (
-    IdentifyCloseFeaturesAlgorithm,
-    ParameterDistanceBetweenLayersType,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDrainageAndContourInconsistencies import (
-    IdentifyDrainageAndContourInconsistencies,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDrainageAngleIssues import (
-    IdentifyDrainageAngleIssues,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDrainageFlowIssues import (
-    IdentifyDrainageFlowIssues,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDrainageFlowIssuesWithOtherHydrographicClassesAlgorithm import (
-    IdentifyDrainageFlowIssuesWithHydrographyElementsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDrainageLoops import (
-    IdentifyDrainageLoops,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedFeaturesAlgorithm import (
-    IdentifyDuplicatedFeaturesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedGeometriesAlgorithm import (
-    IdentifyDuplicatedGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedLinesBetweenLayersAlgorithm import (
-    IdentifyDuplicatedLinesBetweenLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedPointsBetweenLayersAlgorithm import (
-    IdentifyDuplicatedPointsBetweenLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedPolygonsBetweenLayersAlgorithm import (
-    IdentifyDuplicatedPolygonsBetweenLayersAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyDuplicatedVertexesAlgorithm import (
-    IdentifyDuplicatedVertexesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyIntertwinedLinesAlgorithm import (
-    IdentifyIntertwinedLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySegmentErrorsBetweenLinesAlgorithm import (
-    IdentifySegmentErrorsBetweenLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyGapsAlgorithm import (
-    IdentifyGapsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyGapsAndOverlapsInCoverageAlgorithm import (
-    IdentifyGapsAndOverlapsInCoverageAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyGeometriesWithLargeVertexDensityAlgorithm import (
-    IdentifyGeometriesWithLargeVertexDensityAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyInvalidUUIDsAlgorithm import (
-    IdentifyInvalidUUIDsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyMultiPartGeometriesAlgorithm import (
-    IdentifyMultiPartGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyMissingLineIntersectionsOnPoints import (
-    IdentifyMissingLineIntersectionsOnPoints,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyMissingLinesOnPolygonLineIntersections import (
-    IdentifyMissingLinesOnPolygonLineIntersections,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyMissingPointsOnLineIntersections import (
-    IdentifyMissingPointsOnLineIntersections,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyMissingPolygonLinesIntersectionsOnLines import (
-    IdentifyMissingPolygonLineIntersectionsOnLines,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyNetworkConstructionIssuesAlgorithm import (
-    IdentifyNetworkConstructionIssuesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyOutOfBoundsAnglesAlgorithm import (
-    IdentifyOutOfBoundsAnglesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyOutOfBoundsAnglesInCoverageAlgorithm import (
-    IdentifyOutOfBoundsAnglesInCoverageAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyOverlapsAlgorithm import (
-    IdentifyOverlapsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyPolygonSliverAlgorithm import (
-    IdentifyPolygonSliverAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyPolygonUndershoots import (
-    IdentifyPolygonUndershootsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySmallFirstOrderDangle import (
-    IdentifySmallFirstOrderDanglesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySmallHolesAlgorithm import (
-    IdentifySmallHolesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySmallLinesAlgorithm import (
-    IdentifySmallLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifySmallPolygonsAlgorithm import (
-    IdentifySmallPolygonsAlgorithm,
-)
-
-# from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.multipleOutputUnitTestAlgorithm import \
-#     MultipleOutputUnitTestAlgorithm
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyTerrainModelErrorsAlgorithm import (
-    IdentifyTerrainModelErrorsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyUnmergedLinesWithSameAttributeSetAlgorithm import (
-    IdentifyUnmergedLinesWithSameAttributeSetAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyUnsharedVertexOnIntersectionsAlgorithm import (
-    IdentifyUnsharedVertexOnIntersectionsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyUnsharedVertexOnSharedEdgesAlgorithm import (
-    IdentifyUnsharedVertexOnSharedEdgesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyVertexNearEdgesAlgorithm import (
-    IdentifyVertexNearEdgesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyWrongBuildingAnglesAlgorithm import (
-    IdentifyWrongBuildingAnglesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyZAnglesBetweenFeaturesAlgorithm import (
-    identifyZAnglesBetweenFeaturesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.lineOnLineOverlayerAlgorithm import (
-    LineOnLineOverlayerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.mergeLinesAlgorithm import (
-    MergeLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.overlayElementsWithAreasAlgorithm import (
-    OverlayElementsWithAreasAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeDuplicatedFeaturesAlgorithm import (
-    RemoveDuplicatedFeaturesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeDuplicatedGeometriesAlgorithm import (
-    RemoveDuplicatedGeometriesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeEmptyAndUpdateAlgorithm import (
-    RemoveEmptyAndUpdateAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeSmallLinesAlgorithm import (
-    RemoveSmallLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.removeSmallPolygonsAlgorithm import (
-    RemoveSmallPolygonsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.snapLayerOnLayerAndUpdateAlgorithm import (
-    SnapLayerOnLayerAndUpdateAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.snapToGridAndUpdateAlgorithm import (
-    SnapToGridAndUpdateAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.spellCheckerAlgorithm import (
-    SpellCheckerAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.streamOrder import (
-    StreamOrder,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.topologicalCleanAlgorithm import (
-    TopologicalCleanAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.topologicalCleanLinesAlgorithm import (
-    TopologicalCleanLinesAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.topologicalDouglasAreaSimplificationAlgorithm import (
-    TopologicalDouglasPeuckerAreaSimplificationAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.topologicalDouglasLineSimplificationAlgorithm import (
-    TopologicalDouglasPeuckerLineSimplificationAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.topologicalLineConnectivityAdjustmentAlgorithm import (
-    TopologicalLineConnectivityAdjustment,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.unbuildPolygonsAlgorithm import (
-    UnbuildPolygonsAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.unicodeFilterAlgorithm import (
-    UnicodeFilterAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.verifyAdjacentGeographicBoundaryDataAlgorithm import (
-    VerifyAdjacentGeographicBoundaryDataAlgorithm,
-)
-from DsgTools.core.DSGToolsProcessingAlgs.Algs.LayerManagementAlgs.loadThemesAlgorithm import (
-    LoadThemesAlgorithm,
+    ParameterSpatialRulesSetType,
 )
 
-# from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.singleOutputUnitTestAlgorithm import SingleOutputUnitTestAlgorithm
+# Registered algorithms, as class paths relative to this package. The
+# metadata of each one is read from algorithmManifest.json, which must be
+# regenerated whenever this list or an algorithm's name, group or flags change:
+#     python DsgTools/core/DSGToolsProcessingAlgs/algorithmManifest.py
+ALGORITHMS = [
+    "Algs.ValidationAlgs.deaggregateGeometriesAlgorithm.DeaggregatorAlgorithm",
+    "Algs.ValidationAlgs.identifySmallPolygonsAlgorithm.IdentifySmallPolygonsAlgorithm",
+    "Algs.ValidationAlgs.identifySmallLinesAlgorithm.IdentifySmallLinesAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedGeometriesAlgorithm.IdentifyDuplicatedGeometriesAlgorithm",
+    "Algs.ValidationAlgs.identifyOutOfBoundsAnglesAlgorithm.IdentifyOutOfBoundsAnglesAlgorithm",
+    "Algs.ValidationAlgs.identifyOutOfBoundsAnglesInCoverageAlgorithm.IdentifyOutOfBoundsAnglesInCoverageAlgorithm",
+    "Algs.ValidationAlgs.identifyOverlapsAlgorithm.IdentifyOverlapsAlgorithm",
+    "Algs.ValidationAlgs.identifyGapsAndOverlapsInCoverageAlgorithm.IdentifyGapsAndOverlapsInCoverageAlgorithm",
+    "Algs.ValidationAlgs.identifyDanglesAlgorithm.IdentifyDanglesAlgorithm",
+    "Algs.ValidationAlgs.identifyGapsAlgorithm.IdentifyGapsAlgorithm",
+    "Algs.GeometricAlgs.donutHoleExtractorAlgorithm.DonutHoleExtractorAlgorithm",
+    "Algs.ValidationAlgs.topologicalCleanAlgorithm.TopologicalCleanAlgorithm",
+    "Algs.ValidationAlgs.topologicalDouglasAreaSimplificationAlgorithm.TopologicalDouglasPeuckerAreaSimplificationAlgorithm",
+    "Algs.ValidationAlgs.topologicalDouglasLineSimplificationAlgorithm.TopologicalDouglasPeuckerLineSimplificationAlgorithm",
+    "Algs.ValidationAlgs.removeDuplicatedGeometriesAlgorithm.RemoveDuplicatedGeometriesAlgorithm",
+    "Algs.ValidationAlgs.removeSmallLinesAlgorithm.RemoveSmallLinesAlgorithm",
+    "Algs.ValidationAlgs.removeSmallPolygonsAlgorithm.RemoveSmallPolygonsAlgorithm",
+    "Algs.ValidationAlgs.cleanGeometriesAlgorithm.CleanGeometriesAlgorithm",
+    "Algs.ValidationAlgs.mergeLinesAlgorithm.MergeLinesAlgorithm",
+    "Algs.LayerManagementAlgs.assignExpressionFieldToLayersAlgorithm.AssignExpressionFieldToLayersAlgorithm",
+    "Algs.ValidationAlgs.topologicalCleanLinesAlgorithm.TopologicalCleanLinesAlgorithm",
+    "Algs.ValidationAlgs.snapLayerOnLayerAndUpdateAlgorithm.SnapLayerOnLayerAndUpdateAlgorithm",
+    "Algs.ValidationAlgs.lineOnLineOverlayerAlgorithm.LineOnLineOverlayerAlgorithm",
+    "Algs.ValidationAlgs.dissolvePolygonsWithSameAttributesAlgorithm.DissolvePolygonsWithSameAttributesAlgorithm",
+    "Algs.ValidationAlgs.snapToGridAndUpdateAlgorithm.SnapToGridAndUpdateAlgorithm",
+    "Algs.ValidationAlgs.removeEmptyAndUpdateAlgorithm.RemoveEmptyAndUpdateAlgorithm",
+    "Algs.OtherAlgs.convertLayer2LayerAlgorithm.ConvertLayer2LayerAlgorithm",
+    "Algs.ValidationAlgs.overlayElementsWithAreasAlgorithm.OverlayElementsWithAreasAlgorithm",
+    "Algs.LayerManagementAlgs.assignDefaultFieldValueToLayersAlgorithm.AssignDefaultFieldValueToLayersAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedFeaturesAlgorithm.IdentifyDuplicatedFeaturesAlgorithm",
+    "Algs.ValidationAlgs.adjustNetworkConnectivityAlgorithm.AdjustNetworkConnectivityAlgorithm",
+    "Algs.ValidationAlgs.removeDuplicatedFeaturesAlgorithm.RemoveDuplicatedFeaturesAlgorithm",
+    "Algs.ValidationAlgs.hierarchicalSnapLayerOnLayerAndUpdateAlgorithm.HierarchicalSnapLayerOnLayerAndUpdateAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedPolygonsBetweenLayersAlgorithm.IdentifyDuplicatedPolygonsBetweenLayersAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedLinesBetweenLayersAlgorithm.IdentifyDuplicatedLinesBetweenLayersAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedPointsBetweenLayersAlgorithm.IdentifyDuplicatedPointsBetweenLayersAlgorithm",
+    "Algs.OtherAlgs.runRemoteFMEAlgorithm.RunRemoteFMEAlgorithm",
+    "Algs.OtherAlgs.createFrameAlgorithm.CreateFrameAlgorithm",
+    "Algs.OtherAlgs.fileInventoryAlgorithm.FileInventoryAlgorithm",
+    "Algs.OtherAlgs.raiseFlagsAlgorithm.RaiseFlagsAlgorithm",
+    "Algs.ValidationAlgs.identifyAndFixInvalidGeometriesAlgorithm.IdentifyAndFixInvalidGeometriesAlgorithm",
+    "Algs.EditingAlgs.createEditingGridAlgorithm.CreateEditingGridAlgorithm",
+    "Algs.LayerManagementAlgs.assignFilterToLayersAlgorithm.AssignFilterToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.assignConditionalStyleToLayersAlgorithm.AssignConditionalStyleToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.assignBoundingBoxFilterToLayersAlgorithm.AssignBoundingBoxFilterToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.assignMeasureColumnToLayersAlgorithm.AssignMeasureColumnToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.lockAttributeEditingAlgorithm.LockAttributeEditingAlgorithm",
+    "Algs.LayerManagementAlgs.groupLayersAlgorithm.GroupLayersAlgorithm",
+    "Algs.ValidationAlgs.topologicalLineConnectivityAdjustmentAlgorithm.TopologicalLineConnectivityAdjustment",
+    "Algs.OtherAlgs.pecCalculatorAlgorithm.PecCalculatorAlgorithm",
+    "Algs.OtherAlgs.ruleStatisticsAlgorithm.RuleStatisticsAlgorithm",
+    "Algs.LayerManagementAlgs.matchAndApplyQmlStylesToLayersAlgorithm.MatchAndApplyQmlStylesToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.applyStylesFromDatabaseToLayersAlgorithm.ApplyStylesFromDatabaseToLayersAlgorithm",
+    # "Algs.OtherAlgs.singleOutputUnitTestAlgorithm.SingleOutputUnitTestAlgorithm",
+    "Algs.OtherAlgs.exportToMemoryLayer.ExportToMemoryLayer",
+    "Algs.LayerManagementAlgs.assignCustomFormAndFormatRulesToLayersAlgorithm.AssignCustomFormAndFormatRulesToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.assignValueMapToLayersAlgorithm.AssignValueMapToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.loadLayersFromPostgisAlgorithm.LoadLayersFromPostgisAlgorithm",
+    "Algs.LayerManagementAlgs.loadNonSpatialLayersFromPostgreSQLAlgorithm.LoadNonSpatialLayersFromPostgreSQLAlgorithm",
+    "Algs.LayerManagementAlgs.assignAliasesToLayersAlgorithm.AssignAliasesToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.assignActionsToLayersAlgorithm.AssignActionsToLayersAlgorithm",
+    "Algs.LayerManagementAlgs.buildJoinsOnLayersAlgorithm.BuildJoinsOnLayersAlgorithm",
+    "Algs.OtherAlgs.batchRunAlgorithm.BatchRunAlgorithm",
+    "Algs.OtherAlgs.stringCsvToLayerListAlgorithm.StringCsvToLayerListAlgorithm",
+    "Algs.ValidationAlgs.identifyWrongBuildingAnglesAlgorithm.IdentifyWrongBuildingAnglesAlgorithm",
+    "Algs.ValidationAlgs.identifyVertexNearEdgesAlgorithm.IdentifyVertexNearEdgesAlgorithm",
+    "Algs.ValidationAlgs.identifyUnsharedVertexOnSharedEdgesAlgorithm.IdentifyUnsharedVertexOnSharedEdgesAlgorithm",
+    "Algs.ValidationAlgs.enforceSpatialRulesAlgorithm.EnforceSpatialRulesAlgorithm",
+    "Algs.ValidationAlgs.unbuildPolygonsAlgorithm.UnbuildPolygonsAlgorithm",
+    "Algs.ValidationAlgs.identifyUnsharedVertexOnIntersectionsAlgorithm.IdentifyUnsharedVertexOnIntersectionsAlgorithm",
+    "Algs.EnvironmentSetterAlgs.setFreeHandToolParametersAlgorithm.SetFreeHandToolParametersAlgorithm",
+    "Algs.ValidationAlgs.buildPolygonsFromCenterPointsAndBoundariesAlgorithm.BuildPolygonsFromCenterPointsAndBoundariesAlgorithm",
+    # "Algs.OtherAlgs.multipleOutputUnitTestAlgorithm.MultipleOutputUnitTestAlgorithm",
+    "Algs.ValidationAlgs.identifyTerrainModelErrorsAlgorithm.IdentifyTerrainModelErrorsAlgorithm",
+    "Algs.OtherAlgs.createFramesWithConstraintAlgorithm.CreateFramesWithConstraintAlgorithm",
+    "Algs.ValidationAlgs.identifyAnglesInInvalidRangeAlgorithm.IdentifyAnglesInInvalidRangeAlgorithm",
+    "Algs.OtherAlgs.runFMESAPAlgorithm.RunFMESAPAlgorithm",
+    "Algs.ValidationAlgs.enforceAttributeRulesAlgorithm.EnforceAttributeRulesAlgorithm",
+    "Algs.ValidationAlgs.identifyPolygonSliverAlgorithm.IdentifyPolygonSliverAlgorithm",
+    "Algs.ValidationAlgs.identifyZAnglesBetweenFeaturesAlgorithm.identifyZAnglesBetweenFeaturesAlgorithm",
+    "Algs.ValidationAlgs.identifySmallHolesAlgorithm.IdentifySmallHolesAlgorithm",
+    "Algs.ValidationAlgs.identifyInvalidUUIDsAlgorithm.IdentifyInvalidUUIDsAlgorithm",
+    "Algs.LayerManagementAlgs.loadShapefileAlgorithm.LoadShapefileAlgorithm",
+    "Algs.ValidationAlgs.identifyCountourStreamIntersectionAlgorithm.IdentifyCountourStreamIntersectionAlgorithm",
+    "Algs.ValidationAlgs.spellCheckerAlgorithm.SpellCheckerAlgorithm",
+    "Algs.ValidationAlgs.unicodeFilterAlgorithm.UnicodeFilterAlgorithm",
+    "Algs.ValidationAlgs.identifyNetworkConstructionIssuesAlgorithm.IdentifyNetworkConstructionIssuesAlgorithm",
+    "Algs.ValidationAlgs.identifySmallFirstOrderDangle.IdentifySmallFirstOrderDanglesAlgorithm",
+    "Algs.LayerManagementAlgs.removeEmptyLayers.RemoveEmptyLayers",
+    "Algs.ValidationAlgs.identifyGeometriesWithLargeVertexDensityAlgorithm.IdentifyGeometriesWithLargeVertexDensityAlgorithm",
+    "Algs.LayerManagementAlgs.assignFormatRulesToLayersAlgorithm.AssignFormatRulesToLayersAlgorithm",
+    "Algs.ValidationAlgs.detectNullGeometriesAlgorithm.DetectNullGeometriesAlgorithm",
+    "Algs.ValidationAlgs.identifyDuplicatedVertexesAlgorithm.IdentifyDuplicatedVertexesAlgorithm",
+    "Algs.ValidationAlgs.identifyMultiPartGeometriesAlgorithm.IdentifyMultiPartGeometriesAlgorithm",
+    "Algs.ValidationAlgs.identifyPolygonUndershoots.IdentifyPolygonUndershootsAlgorithm",
+    "Algs.ValidationAlgs.identifyUnmergedLinesWithSameAttributeSetAlgorithm.IdentifyUnmergedLinesWithSameAttributeSetAlgorithm",
+    "Algs.OtherAlgs.stringCsvToFirstLayerWithElementsAlgorithm.StringCsvToFirstLayerWithElementsAlgorithm",
+    "Algs.ValidationAlgs.identifyDrainageFlowIssues.IdentifyDrainageFlowIssues",
+    "Algs.ValidationAlgs.identifyDrainageAngleIssues.IdentifyDrainageAngleIssues",
+    "Algs.LayerManagementAlgs.setRemoveDuplicateNodePropertyOnLayers.SetRemoveDuplicateNodePropertyOnLayers",
+    "Algs.ValidationAlgs.identifyDrainageLoops.IdentifyDrainageLoops",
+    "Algs.ValidationAlgs.identifyDrainageFlowIssuesWithOtherHydrographicClassesAlgorithm.IdentifyDrainageFlowIssuesWithHydrographyElementsAlgorithm",
+    "Algs.OtherAlgs.createReviewGridAlgorithm.CreateReviewGridAlgorithm",
+    "Algs.ValidationAlgs.extendLinesToGeographicBoundsAlgorithm.ExtendLinesToGeographicBoundsAlgorithm",
+    "Algs.ValidationAlgs.addUnsharedVertexOnIntersectionsAlgorithm.AddUnsharedVertexOnIntersectionsAlgorithm",
+    "Algs.ValidationAlgs.addUnsharedVertexOnSharedEdgesAlgorithm.AddUnsharedVertexOnSharedEdgesAlgorithm",
+    "Algs.OtherAlgs.selectFeaturesOnCurrentCanvas.SelectFeaturesOnCurrentCanvas",
+    "Algs.OtherAlgs.filterLayerListByGeometryType.FilterLayerListByGeometryType",
+    "Algs.GeometricAlgs.smallHoleRemoverAlgorithm.SmallHoleRemoverAlgorithm",
+    "Algs.GeneralizationAlgs.reclassifyAdjecentPolygonsAlgorithm.ReclassifyAdjacentPolygonsAlgorithm",
+    "Algs.ValidationAlgs.streamOrder.StreamOrder",
+    "Algs.GeneralizationAlgs.splitPolygonsAlgorithm.SplitPolygons",
+    "Algs.GeneralizationAlgs.splitPolygonsByGrid.SplitPolygonsByGrid",
+    "Algs.GeometricAlgs.selectByDE9IM.SelectByDE9IMAlgorithm",
+    "Algs.GeometricAlgs.extractByDE9IM.ExtractByDE9IMAlgorithm",
+    "Algs.GeometricAlgs.line2Multiline.Line2Multiline",
+    "Algs.ValidationAlgs.identifyDrainageAndContourInconsistencies.IdentifyDrainageAndContourInconsistencies",
+    "Algs.GeometricAlgs.extractElevationPoints.ExtractElevationPoints",
+    "Algs.OtherAlgs.loadTrackerAlgorithm.LoadTrackerAlgorithm",
+    "Algs.ValidationAlgs.identifySegmentErrorsBetweenLinesAlgorithm.IdentifySegmentErrorsBetweenLinesAlgorithm",
+    "Algs.OtherAlgs.validateTrackerAlgorithm.ValidateTrackerAlgorithm",
+    "Algs.OtherAlgs.updateRunwayAltitudeAlgorithm.UpdateRunwayAltitudeAlgorithm",
+    "Algs.LayerManagementAlgs.loadRasterLayerFromServerAlgorithm.LoadRasterLayerFromServerAlgorithm",
+    "Algs.ValidationAlgs.identifyIntertwinedLinesAlgorithm.IdentifyIntertwinedLinesAlgorithm",
+    "Algs.ValidationAlgs.identifyCrossingLinesAlgorithm.IdentifyCrossingLinesAlgorithm",
+    "Algs.ValidationAlgs.fixDrainageFlowAlgorithm.FixDrainageFlowAlgorithm",
+    "Algs.LayerManagementAlgs.loadThemesAlgorithm.LoadThemesAlgorithm",
+    "Algs.ValidationAlgs.identifyCloseFeaturesAlgorithm.IdentifyCloseFeaturesAlgorithm",
+    "Algs.ValidationAlgs.identifySmallObjectsOnLayersAlgorithm.IdentifySmallObjectsOnLayersAlgorithm",
+    "Algs.DataManagementAlgs.appendFeaturesToLayerAlgorithm.AppendFeaturesToLayerAlgorithm",
+    "Algs.EnvironmentSetterAlgs.rightAngleToolParametersAlgorithm.RightAngleToolParametersAlgorithm",
+    "Algs.EnvironmentSetterAlgs.genericSelectionToolParametersAlgorithm.GenericSelectionToolParametersAlgorithm",
+    "Algs.DataManagementAlgs.clipAndCopyFeaturesBetweenDatabasesAlgorithm.ClipAndCopyFeaturesBetweenDatabasesAlgorithm",
+    "Algs.ValidationAlgs.verifyAdjacentGeographicBoundaryDataAlgorithm.VerifyAdjacentGeographicBoundaryDataAlgorithm",
+    "Algs.ValidationAlgs.fixSegmentErrorsBetweenLinesAlgorithm.FixSegmentErrorsBetweenLinesAlgorithm",
+    "Algs.OtherAlgs.identifyDifferencesBetweenDatabaseModelsAlgorithm.IdentifyDifferencesBetweenDatabaseModelsAlgorithm",
+    "Algs.OtherAlgs.azimuthCalculationAlgorithm.AzimuthCalculationAlgorithm",
+    "Algs.ValidationAlgs.detectChangesGroupAlgorithm.DetectChangesBetweenGroups",
+    "Algs.ValidationAlgs.identifyWaterBodyAndContourInconsistencies.IdentifyWaterBodyAndContourInconsistencies",
+    "Algs.OtherAlgs.createGridFromCoordinatesAlgorithm.CreateGridFromCoordinatesAlgorithm",
+    "Algs.LayerManagementAlgs.buildZipPackagesAlgorithm.BuildZipPackageAlgorithm",
+    "Algs.GeneralizationAlgs.generalizeNetworkEdgesFromLengthAlgorithm.GeneralizeNetworkEdgesWithLengthAlgorithm",
+    "Algs.ValidationAlgs.removeDuplicateNodesAlgorithm.RemoveDuplicateVertexesAlgorithm",
+    "Algs.ValidationAlgs.identifyAttributeChangesInLines.IdentifyAttributeChangesInLines",
+    "Algs.OtherAlgs.batchRunAlgorithmWithGeographicBoundsConstraint.BatchRunAlgorithmWithGeographicBoundsConstraint",
+    "Algs.ValidationAlgs.identifyUncoveredStartAndEndPointsAlgorithm.IdentifyUncoveredStartAndEndPointsAlgorithm",
+    "Algs.GeneralizationAlgs.reclassifyPixelsToNearestNeighborAlgorithm.ReclassifyAdjacentPixelsToNearestNeighborAlgorithm",
+    "Algs.GeneralizationAlgs.reclassifyGroupsOfPixelsToNearestNeighborAlgorithm.ReclassifyGroupsOfPixelsToNearestNeighborAlgorithm",
+    "Algs.GeneralizationAlgs.runReclassifyPixelsWithSlidingWindow.ReclassifyGroupsOfPixelsToNearestNeighborWithSlidingWindowAlgorithm",
+    "Algs.GeneralizationAlgs.findSmallClosedLinesAlgorithm.FindSmallClosedLinesAlgorithm",
+    "Algs.GeometricAlgs.setLineOrientation.SetLineOrientation",
+    "Algs.ValidationAlgs.identifyMissingLineIntersectionsOnPoints.IdentifyMissingLineIntersectionsOnPoints",
+    "Algs.ValidationAlgs.identifyMissingLinesOnPolygonLineIntersections.IdentifyMissingLinesOnPolygonLineIntersections",
+    "Algs.ValidationAlgs.identifyMissingPointsOnLineIntersections.IdentifyMissingPointsOnLineIntersections",
+    "Algs.ValidationAlgs.identifyMissingPolygonLinesIntersectionsOnLines.IdentifyMissingPolygonLineIntersectionsOnLines",
+    "Algs.RasterAlgs.batchRasterPackagingForBDGEx.BatchRasterPackagingForBDGEx",
+    "Algs.OtherAlgs.runAlgorithmByTilesAlgorithm.RunAlgorithmByTilesAlgorithm",
+]
 
 
 class DSGToolsProcessingAlgorithmProvider(QgsProcessingProvider):
@@ -527,168 +217,31 @@ class DSGToolsProcessingAlgorithmProvider(QgsProcessingProvider):
         "Processing", "FME Manager Parameters"
     )
 
-    def __init__(self):
+    def __init__(self, lazy=None):
+        """
+        :param lazy: (bool) registers algorithm descriptors and only imports
+            each implementation on demand. When None, the provider setting is
+            used.
+        """
         super(DSGToolsProcessingAlgorithmProvider, self).__init__()
+        self.lazy = lazy
+
+    def isLazyLoadingActive(self):
+        if self.lazy is not None:
+            return self.lazy
+        setting = ProcessingConfig.getSetting("LAZY_LOADING_DSGTools")
+        return True if setting is None else bool(setting)
 
     def getAlgList(self):
-        algList = [
-            DeaggregatorAlgorithm(),
-            IdentifySmallPolygonsAlgorithm(),
-            IdentifySmallLinesAlgorithm(),
-            IdentifyDuplicatedGeometriesAlgorithm(),
-            IdentifyOutOfBoundsAnglesAlgorithm(),
-            IdentifyOutOfBoundsAnglesInCoverageAlgorithm(),
-            IdentifyOverlapsAlgorithm(),
-            IdentifyGapsAndOverlapsInCoverageAlgorithm(),
-            IdentifyDanglesAlgorithm(),
-            IdentifyGapsAlgorithm(),
-            DonutHoleExtractorAlgorithm(),
-            TopologicalCleanAlgorithm(),
-            TopologicalDouglasPeuckerAreaSimplificationAlgorithm(),
-            TopologicalDouglasPeuckerLineSimplificationAlgorithm(),
-            RemoveDuplicatedGeometriesAlgorithm(),
-            RemoveSmallLinesAlgorithm(),
-            RemoveSmallPolygonsAlgorithm(),
-            CleanGeometriesAlgorithm(),
-            MergeLinesAlgorithm(),
-            AssignExpressionFieldToLayersAlgorithm(),
-            TopologicalCleanLinesAlgorithm(),
-            SnapLayerOnLayerAndUpdateAlgorithm(),
-            LineOnLineOverlayerAlgorithm(),
-            DissolvePolygonsWithSameAttributesAlgorithm(),
-            SnapToGridAndUpdateAlgorithm(),
-            RemoveEmptyAndUpdateAlgorithm(),
-            ConvertLayer2LayerAlgorithm(),
-            OverlayElementsWithAreasAlgorithm(),
-            AssignDefaultFieldValueToLayersAlgorithm(),
-            IdentifyDuplicatedFeaturesAlgorithm(),
-            AdjustNetworkConnectivityAlgorithm(),
-            RemoveDuplicatedFeaturesAlgorithm(),
-            HierarchicalSnapLayerOnLayerAndUpdateAlgorithm(),
-            IdentifyDuplicatedPolygonsBetweenLayersAlgorithm(),
-            IdentifyDuplicatedLinesBetweenLayersAlgorithm(),
-            IdentifyDuplicatedPointsBetweenLayersAlgorithm(),
-            RunRemoteFMEAlgorithm(),
-            CreateFrameAlgorithm(),
-            FileInventoryAlgorithm(),
-            RaiseFlagsAlgorithm(),
-            IdentifyAndFixInvalidGeometriesAlgorithm(),
-            CreateEditingGridAlgorithm(),
-            AssignFilterToLayersAlgorithm(),
-            AssignConditionalStyleToLayersAlgorithm(),
-            AssignBoundingBoxFilterToLayersAlgorithm(),
-            AssignMeasureColumnToLayersAlgorithm(),
-            LockAttributeEditingAlgorithm(),
-            GroupLayersAlgorithm(),
-            TopologicalLineConnectivityAdjustment(),
-            PecCalculatorAlgorithm(),
-            RuleStatisticsAlgorithm(),
-            MatchAndApplyQmlStylesToLayersAlgorithm(),
-            ApplyStylesFromDatabaseToLayersAlgorithm(),
-            # SingleOutputUnitTestAlgorithm(),
-            ExportToMemoryLayer(),
-            AssignCustomFormAndFormatRulesToLayersAlgorithm(),
-            AssignValueMapToLayersAlgorithm(),
-            LoadLayersFromPostgisAlgorithm(),
-            LoadNonSpatialLayersFromPostgreSQLAlgorithm(),
-            AssignAliasesToLayersAlgorithm(),
-            AssignActionsToLayersAlgorithm(),
-            BuildJoinsOnLayersAlgorithm(),
-            BatchRunAlgorithm(),
-            StringCsvToLayerListAlgorithm(),
-            IdentifyWrongBuildingAnglesAlgorithm(),
-            IdentifyVertexNearEdgesAlgorithm(),
-            IdentifyUnsharedVertexOnSharedEdgesAlgorithm(),
-            EnforceSpatialRulesAlgorithm(),
-            UnbuildPolygonsAlgorithm(),
-            IdentifyUnsharedVertexOnIntersectionsAlgorithm(),
-            SetFreeHandToolParametersAlgorithm(),
-            BuildPolygonsFromCenterPointsAndBoundariesAlgorithm(),
-            # MultipleOutputUnitTestAlgorithm(),
-            IdentifyTerrainModelErrorsAlgorithm(),
-            CreateFramesWithConstraintAlgorithm(),
-            IdentifyAnglesInInvalidRangeAlgorithm(),
-            RunFMESAPAlgorithm(),
-            EnforceAttributeRulesAlgorithm(),
-            IdentifyPolygonSliverAlgorithm(),
-            identifyZAnglesBetweenFeaturesAlgorithm(),
-            IdentifySmallHolesAlgorithm(),
-            IdentifyInvalidUUIDsAlgorithm(),
-            LoadShapefileAlgorithm(),
-            IdentifyCountourStreamIntersectionAlgorithm(),
-            SpellCheckerAlgorithm(),
-            UnicodeFilterAlgorithm(),
-            IdentifyNetworkConstructionIssuesAlgorithm(),
-            IdentifySmallFirstOrderDanglesAlgorithm(),
-            RemoveEmptyLayers(),
-            IdentifyGeometriesWithLargeVertexDensityAlgorithm(),
-            AssignFormatRulesToLayersAlgorithm(),
-            DetectNullGeometriesAlgorithm(),
-            IdentifyDuplicatedVertexesAlgorithm(),
-            IdentifyMultiPartGeometriesAlgorithm(),
-            IdentifyPolygonUndershootsAlgorithm(),
-            IdentifyUnmergedLinesWithSameAttributeSetAlgorithm(),
-            StringCsvToFirstLayerWithElementsAlgorithm(),
-            IdentifyDrainageFlowIssues(),
-            IdentifyDrainageAngleIssues(),
-            SetRemoveDuplicateNodePropertyOnLayers(),
-            IdentifyDrainageLoops(),
-            IdentifyDrainageFlowIssuesWithHydrographyElementsAlgorithm(),
-            CreateReviewGridAlgorithm(),
-            ExtendLinesToGeographicBoundsAlgorithm(),
-            AddUnsharedVertexOnIntersectionsAlgorithm(),
-            AddUnsharedVertexOnSharedEdgesAlgorithm(),
-            SelectFeaturesOnCurrentCanvas(),
-            FilterLayerListByGeometryType(),
-            SmallHoleRemoverAlgorithm(),
-            ReclassifyAdjacentPolygonsAlgorithm(),
-            StreamOrder(),
-            SplitPolygons(),
-            SplitPolygonsByGrid(),
-            SelectByDE9IMAlgorithm(),
-            ExtractByDE9IMAlgorithm(),
-            Line2Multiline(),
-            IdentifyDrainageAndContourInconsistencies(),
-            ExtractElevationPoints(),
-            LoadTrackerAlgorithm(),
-            IdentifySegmentErrorsBetweenLinesAlgorithm(),
-            ValidateTrackerAlgorithm(),
-            UpdateRunwayAltitudeAlgorithm(),
-            LoadRasterLayerFromServerAlgorithm(),
-            IdentifyIntertwinedLinesAlgorithm(),
-            IdentifyCrossingLinesAlgorithm(),
-            FixDrainageFlowAlgorithm(),
-            LoadThemesAlgorithm(),
-            IdentifyCloseFeaturesAlgorithm(),
-            IdentifySmallObjectsOnLayersAlgorithm(),
-            AppendFeaturesToLayerAlgorithm(),
-            RightAngleToolParametersAlgorithm(),
-            GenericSelectionToolParametersAlgorithm(),
-            ClipAndCopyFeaturesBetweenDatabasesAlgorithm(),
-            VerifyAdjacentGeographicBoundaryDataAlgorithm(),
-            FixSegmentErrorsBetweenLinesAlgorithm(),
-            IdentifyDifferencesBetweenDatabaseModelsAlgorithm(),
-            AzimuthCalculationAlgorithm(),
-            DetectChangesBetweenGroups(),
-            IdentifyWaterBodyAndContourInconsistencies(),
-            CreateGridFromCoordinatesAlgorithm(),
-            BuildZipPackageAlgorithm(),
-            GeneralizeNetworkEdgesWithLengthAlgorithm(),
-            RemoveDuplicateVertexesAlgorithm(),
-            IdentifyAttributeChangesInLines(),
-            BatchRunAlgorithmWithGeographicBoundsConstraint(),
-            IdentifyUncoveredStartAndEndPointsAlgorithm(),
-            ReclassifyAdjacentPixelsToNearestNeighborAlgorithm(),
-            ReclassifyGroupsOfPixelsToNearestNeighborAlgorithm(),
-            ReclassifyGroupsOfPixelsToNearestNeighborWithSlidingWindowAlgorithm(),
-            FindSmallClosedLinesAlgorithm(),
-            SetLineOrientation(),
-            IdentifyMissingLineIntersectionsOnPoints(),
-            IdentifyMissingLinesOnPolygonLineIntersections(),
-            IdentifyMissingPointsOnLineIntersections(),
-            IdentifyMissingPolygonLineIntersectionsOnLines(),
-            BatchRasterPackagingForBDGEx(),
-        ]
+        lazy = self.isLazyLoadingActive()
+        manifest = loadManifest() if lazy else dict()
+        algList = []
+        for path in ALGORITHMS:
+            descriptor = manifest.get(path, AlgorithmDescriptor(path, lazy=False))
+            if descriptor.lazy:
+                algList.append(LazyProcessingAlgorithm(descriptor))
+            else:
+                algList.append(descriptor.load()())
         return algList
 
     def load(self):
@@ -697,6 +250,14 @@ class DSGToolsProcessingAlgorithmProvider(QgsProcessingProvider):
         ProcessingConfig.addSetting(
             Setting(self.name(), "ACTIVATE_DSGTools", "Activate", True)
         )
+        ProcessingConfig.addSetting(
+            Setting(
+                self.name(),
+                "LAZY_LOADING_DSGTools",
+                "Load algorithm implementations on demand",
+                True,
+            )
+        )
         ProcessingConfig.readSettings()
         self.parameterTypeSnapHierarchy = ParameterSnapHierarchyType()
         QgsApplication.instance().processingRegistry().addParameterType(
@@ -722,6 +283,7 @@ class DSGToolsProcessingAlgorithmProvider(QgsProcessingProvider):
         Removes setting when the plugin is unloaded.
         """
         ProcessingConfig.removeSetting("ACTIVATE_DSGTools")
+        ProcessingConfig.removeSetting("LAZY_LOADING_DSGTools")
         QgsApplication.instance().processingRegistry().removeParameterType(
             self.parameterTypeSnapHierarchy
         )
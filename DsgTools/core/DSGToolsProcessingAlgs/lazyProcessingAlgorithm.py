@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from functools import reduce
+
+from qgis.core import QgsProcessingAlgorithm
+from qgis.PyQt.QtCore import QCoreApplication
+
+
+class LazyProcessingAlgorithm(QgsProcessingAlgorithm):
+    """
+    Algorithm registered by the provider in place of the actual
+    implementation. It only carries the metadata needed by the toolbox
+    (name, group and flags) and imports the implementation module when an
+    instance is created or when its help or parameters are requested.
+    Instances returned by createInstance are the actual algorithm objects,
+    therefore execution never goes through this class.
+    """
+
+    def __init__(self, descriptor):
+        super(LazyProcessingAlgorithm, self).__init__()
+        self.descriptor = descriptor
+        self.implementation = None
+
+    def getImplementation(self):
+        """
+        Imports the implementation module and keeps an initialized instance,
+        used to answer help and parameter requests.
+        """
+        if self.implementation is None:
+            self.implementation = self.descriptor.load()()
+            self.implementation.initAlgorithm(dict())
+        return self.implementation
+
+    def hydrate(self):
+        """
+        Copies the parameter definitions of the implementation to this
+        registered copy. It happens on the first createInstance and when
+        the parameters are requested from Python (parameterDefinitions and
+        parameterDefinition are overridden), so that processing.algorithmHelp
+        sees the actual parameters. C++ code that reads the registered copy
+        only sees them after its first createInstance. Only the outputs of
+        destination parameters, created by addParameter, are registered;
+        outputs added with addOutput are known by the implementation alone,
+        which is the instance that runs.
+        """
+        if super(LazyProcessingAlgorithm, self).parameterDefinitions():
+            return
+        implementation = self.getImplementation()
+        for param in implementation.parameterDefinitions():
+            self.addParameter(param.clone())
+
+    def parameterDefinitions(self):
+        self.hydrate()
+        return super(LazyProcessingAlgorithm, self).parameterDefinitions()
+
+    def parameterDefinition(self, name):
+        self.hydrate()
+        return super(LazyProcessingAlgorithm, self).parameterDefinition(name)
+
+    def initAlgorithm(self, config=None):
+        # parameters are only loaded on demand, see hydrate
+        pass
+
+    def createInstance(self):
+        self.hydrate()
+        return self.descriptor.load()()
+
+    def name(self):
+        return self.descriptor.name
+
+    def displayName(self):
+        return self.tr(self.descriptor.displayName)
+
+    def group(self):
+        return self.tr(self.descriptor.group)
+
+    def groupId(self):
+        return self.descriptor.groupId
+
+    def tr(self, string):
+        return QCoreApplication.translate(self.descriptor.trContext, string)
+
+    def flags(self):
+        baseFlags = (
+            super(LazyProcessingAlgorithm, self).flags()
+            if self.descriptor.inheritsFlags
+            else QgsProcessingAlgorithm.Flags()
+        )
+        return reduce(
+            lambda x, y: x | getattr(QgsProcessingAlgorithm, y),
+            self.descriptor.flags,
+            baseFlags,
+        )
+
+    def shortHelpString(self):
+        return self.getImplementation().shortHelpString()
+
+    def helpUrl(self):
+        return self.getImplementation().helpUrl()
+
+    def checkParameterValues(self, parameters, context):
+        self.hydrate()
+        return self.getImplementation().checkParameterValues(parameters, context)
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # run() always executes on an instance built by createInstance
+        return self.getImplementation().processAlgorithm(parameters, context, feedback)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+"""
+Custom parameter types registered by the DSGTools provider. They are kept
+apart from their algorithms, so that registering them at plugin start does
+not import the algorithm modules; each parameter class is only imported
+when a parameter of its type is created.
+"""
+
+from qgis.core import QgsProcessingParameterType
+from qgis.PyQt.QtCore import QCoreApplication
+
+
+class ParameterFMEManagerType(QgsProcessingParameterType):
+    def __init__(self):
+        super().__init__()
+
+    def create(self, name):
+        from DsgTools.core.DSGToolsProcessingAlgs.Algs.OtherAlgs.runRemoteFMEAlgorithm import (
+            ParameterFMEManager,
+        )
+
+        return ParameterFMEManager(name)
+
+    def metadata(self):
+        return {
+            "widget_wrapper": "DsgTools.gui.ProcessingUI.fmeManagerWrapper.FMEManagerWrapper"
+        }
+
+    def name(self):
+        return QCoreApplication.translate("Processing", "FME Manager Parameters")
+
+    def id(self):
+        return "fme_manager"
+
+    def description(self):
+        return QCoreApplication.translate(
+            "Processing", "FME Manager parameters. Used on Run Remote FME Workspace"
+        )
+
+
+class ParameterSpatialRulesSetType(QgsProcessingParameterType):
+    def __init__(self):
+        super().__init__()
+
+    def create(self, name):
+        from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.enforceSpatialRulesAlgorithm import (
+            ParameterSpatialRulesSet,
+        )
+
+        return ParameterSpatialRulesSet(name)
+
+    def metadata(self):
+        return {
+            "widget_wrapper": "DsgTools.gui.ProcessingUI.enforceSpatialRuleWrapper.EnforceSpatialRuleWrapper"
+        }
+
+    def name(self):
+        return QCoreApplication.translate("Processing", "Spatial Rules Set")
+
+    def id(self):
+        return "spatial_rules_set_type"
+
+    def description(self):
+        return QCoreApplication.translate(
+            "Processing", "Set of spatial rules. Used on Spatial Rules Checker."
+        )
+
+
+class ParameterSnapHierarchyType(QgsProcessingParameterType):
+    def __init__(self):
+        super().__init__()
+
+    def create(self, name):
+        from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.hierarchicalSnapLayerOnLayerAndUpdateAlgorithm import (
+            ParameterSnapHierarchy,
+        )
+
+        return ParameterSnapHierarchy(name)
+
+    def metadata(self):
+        return {
+            "widget_wrapper": "DsgTools.gui.ProcessingUI.snapHierarchyWrapper.SnapHierarchyWrapper"
+        }
+
+    def name(self):
+        return QCoreApplication.translate("Processing", "Snap Hierarchy")
+
+    def id(self):
+        return "snap_hierarchy"
+
+    def description(self):
+        return QCoreApplication.translate(
+            "Processing",
+            "An hierarchical snapping type. Used in the Hierarchical Snap Layer on Layer algorithm.",
+        )
+
+
+class ParameterDistanceBetweenLayersType(QgsProcessingParameterType):
+    def __init__(self):
+        super().__init__()
+
+    def create(self, name):
+        from DsgTools.core.DSGToolsProcessingAlgs.Algs.ValidationAlgs.identifyCloseFeaturesAlgorithm import (
+            ParameterDistanceBetweenLayers,
+        )
+
+        return ParameterDistanceBetweenLayers(name)
+
+    def metadata(self):
+        return {
+            "widget_wrapper": "DsgTools.gui.ProcessingUI.distanceBetweenLayersWrapper.DistanceBetweenLayersWrapper"
+        }
+
+    def name(self):
+        return QCoreApplication.translate("Processing", "Distance Between Layers")
+
+    def id(self):
+        return "distance_between_layers"
+
+    def description(self):
+        return QCoreApplication.translate(
+            "Processing",
+            "Check minimum acceptable distance between features of chosen layers.",
+        )
@@ -31,9 +31,15 @@ from qgis.PyQt.QtCore import QSettings, pyqtSignal, QObject
 from ..DbFactory.dbFactory import DbFactory
 from ..DbFactory.abstractDb import AbstractDb
 from ....gui.CustomWidgets.BasicInterfaceWidgets.progressWidget import ProgressWidget
+from ...Utils.threadingTools import runBatch
 
 
 class DbCreator(QObject):
+    # whether batchCreateDb may create databases on worker threads, through
+    # getWorkerCreator, and how many at the same time
+    concurrentCreation = False
+    maxConcurrency = 4
+
     def __init__(self, createParam, parentWidget=None):
         super(DbCreator, self).__init__()
         self.dbFactory = DbFactory()
@@ -60,6 +66,18 @@ class DbCreator(QObject):
         # Abstract method.
         pass
 
+    def getWorkerCreator(self):
+        """
+        Returns a creator with its own connection, to be used by a single
+        worker thread on batchCreateDb. Must be implemented by the creators
+        that set concurrentCreation.
+        """
+        return None
+
+    def instantiateNewDb(self, dbName):
+        # Abstract method. Must be implemented when getWorkerCreator is.
+        pass
+
     def buildDatabaseName(self, dbBaseName, prefix=None, sufix=None):
         attrNameList = []
         if prefix:
@@ -79,9 +97,15 @@ class DbCreator(QObject):
         return dbNameList
 
     def batchCreateDb(self, dbNameList, srid, paramDict=dict()):
+        """
+        Creates the databases of dbNameList. The first one created is used
+        as template by the others which, when the driver provides worker
+        creators, are created concurrently.
+        """
         outputDbDict = dict()
         errorDict = dict()
         templateDb = None
+        progress = None
         if self.parentWidget:
             progress = ProgressWidget(
                 1,
@@ -90,29 +114,52 @@ class DbCreator(QObject):
                 parent=self.parentWidget,
             )
             progress.initBar()
-        for dbName in dbNameList:
+        remainingDbNameList = list(dbNameList)
+        while remainingDbNameList and not templateDb:
+            dbName = remainingDbNameList.pop(0)
             try:
-                if not templateDb:
-                    newDb = self.createDb(
-                        dbName,
-                        srid,
-                        paramDict=paramDict,
-                        parentWidget=self.parentWidget,
-                    )
-                    templateDb = dbName
-                else:
-                    paramDict["templateDb"] = templateDb
-                    newDb = self.createDb(
+                outputDbDict[dbName] = self.createDb(
+                    dbName, srid, paramDict=paramDict, parentWidget=self.parentWidget
+                )
+                templateDb = dbName
+            except Exception as e:
+                errorDict[dbName] = ":".join(e.args)
+            if progress:
+                progress.step()
+        if not remainingDbNameList:
+            return outputDbDict, errorDict
+        paramDict["templateDb"] = templateDb
+        if not self.concurrentCreation:
+            for dbName in remainingDbNameList:
+                try:
+                    outputDbDict[dbName] = self.createDb(
                         dbName, srid, paramDict, parentWidget=self.parentWidget
                     )
-                outputDbDict[dbName] = newDb
-            except Exception as e:
-                if dbName not in list(errorDict.keys()):
+                except Exception as e:
                     errorDict[dbName] = ":".join(e.args)
-                else:
-                    errorDict[dbName] += "\n" + ":".join(e.args)
-            if self.parentWidget:
-                progress.step()
+                if progress:
+                    progress.step()
+            return outputDbDict, errorDict
+
+        def createFromTemplate(dbName):
+            workerCreator = self.getWorkerCreator()
+            try:
+                newDb = workerCreator.createDb(dbName, srid, dict(paramDict))
+                newDb.db.close()
+            finally:
+                workerCreator.abstractDb.db.close()
+
+        successList, workerErrorDict = runBatch(
+            createFromTemplate,
+            remainingDbNameList,
+            max_concurrency=self.maxConcurrency,
+            callback=(lambda dbName, error: progress.step()) if progress else None,
+        )
+        errorDict.update(workerErrorDict)
+        # connections are opened again on this thread, since the worker ones
+        # cannot be used here
+        for dbName in successList:
+            outputDbDict[dbName] = self.instantiateNewDb(dbName)
         return outputDbDict, errorDict
 
     def createDbWithAutoIncrementingName(
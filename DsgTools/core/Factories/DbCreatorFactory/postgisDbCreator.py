@@ -27,9 +27,13 @@ from DsgTools.core.dsgEnums import DsgEnums
 
 
 class PostgisDbCreator(DbCreator):
-    def __init__(self, createParam, parentWidget=None):
+    concurrentCreation = True
+
+    def __init__(self, createParam, parentWidget=None, promptCredentials=True):
         super(self.__class__, self).__init__(createParam)
         self.parentWidget = parentWidget
+        # worker creators must not open credential dialogs
+        self.promptCredentials = promptCredentials
 
     def instantiateNewDb(self, dbName):
         host = self.abstractDb.db.hostName()
@@ -37,9 +41,29 @@ class PostgisDbCreator(DbCreator):
         user = self.abstractDb.db.userName()
         password = self.abstractDb.db.password()
         newDb = self.dbFactory.createDbFactory(DsgEnums.DriverPostGIS)
-        newDb.connectDatabaseWithParameters(host, port, dbName, user, password)
+        if self.promptCredentials:
+            newDb.connectDatabaseWithParameters(host, port, dbName, user, password)
+        else:
+            newDb.connectDatabaseWithoutPrompt(host, port, dbName, user, password)
         return newDb
 
+    def getWorkerCreator(self):
+        """
+        Returns a creator with its own connection to the server, so that
+        databases can be created from template concurrently. Its
+        connections raise on failure instead of asking for credentials.
+        """
+        serverDb = self.abstractDb.db
+        workerDb = self.dbFactory.createDbFactory(DsgEnums.DriverPostGIS)
+        workerDb.connectDatabaseWithoutPrompt(
+            serverDb.hostName(),
+            serverDb.port(),
+            serverDb.databaseName(),
+            serverDb.userName(),
+            serverDb.password(),
+        )
+        return PostgisDbCreator(workerDb, promptCredentials=False)
+
     def checkAndCreateTemplate(self, version):
         """
         checks and create an edgv template
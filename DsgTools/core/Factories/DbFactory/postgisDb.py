@@ -46,6 +46,10 @@ import time
 
 
 class PostgisDb(AbstractDb):
+    # layer loading metadata shared by every connection to the same database,
+    # see getLayerLoadingMetadata
+    layerLoadingMetadataCache = dict()
+
     def __init__(self):
         """
         Constructor
@@ -117,6 +121,22 @@ class PostgisDb(AbstractDb):
         if not self.testCredentials(host, port, database, user, password):
             self.getCredentials(host, port, user, database)
 
+    def connectDatabaseWithoutPrompt(self, host, port, database, user, password):
+        """
+        Connects to database with parameters already checked, raising an
+        exception instead of asking for credentials. To be used on worker
+        threads, where no dialog may be shown.
+        host: host IP
+        port: host port
+        database: database name
+        user: user name
+        password: user password
+        """
+        if not self.testCredentials(host, port, database, user, password):
+            raise Exception(
+                self.tr("Error opening database: ") + self.db.lastError().text()
+            )
+
     def getCredentials(self, host, port, user, database, timeout=100):
         conInfo = "host={0} port={1} dbname={2}".format(host, port, database)
         check = False
@@ -1122,6 +1142,7 @@ class PostgisDb(AbstractDb):
                 raise Exception(
                     self.tr("Problem dropping database: ") + query.lastError().text()
                 )
+            self.invalidateLayerLoadingMetadataCache(dbName=candidateName)
         else:
             raise Exception(
                 self.tr(
@@ -1162,6 +1183,7 @@ class PostgisDb(AbstractDb):
                         )
                 if useTransaction:
                     self.db.commit()
+                self.invalidateLayerLoadingMetadataCache()
 
     def getSqlViewFile(self):
         """
@@ -2240,6 +2262,7 @@ class PostgisDb(AbstractDb):
             result[key].append(newElement)
         if useTransaction:
             self.db.commit()
+        self.invalidateLayerLoadingMetadataCache()
         return result
 
     def createTempTable(self, tableName, geomColumnName, useTransaction=True):
@@ -2365,6 +2388,24 @@ class PostgisDb(AbstractDb):
                 f.close()
         return tempPath
 
+    def getStyleSet(self, styleName):
+        """
+        Gets every style stored with styleName in a single query.
+        :param styleName: (str) style name;
+        :return: (dict) table name -> qml (not parsed).
+        """
+        self.checkAndOpenDb()
+        sql = self.gen.getStyleSet(styleName)
+        query = QSqlQuery(sql, self.db)
+        if not query.isActive():
+            raise Exception(
+                self.tr("Problem getting styles from db: ") + query.lastError().text()
+            )
+        styleDict = dict()
+        while query.next():
+            styleDict[query.value(0)] = query.value(1)
+        return styleDict
+
     def importStyle(self, styleName, table_name, qml, tableSchema, useTransaction=True):
         self.checkAndOpenDb()
         if useTransaction:
@@ -2540,6 +2581,7 @@ class PostgisDb(AbstractDb):
             )
         if useTransaction:
             self.db.commit()
+        self.invalidateLayerLoadingMetadataCache()
 
     def getStructureDict2(self):
         """
@@ -2675,15 +2717,22 @@ class PostgisDb(AbstractDb):
                 self.tr("Problem getting geom schemas from db: ")
                 + query.lastError().text()
             )
-        geomDict = dict()
+        fkList = []
         while query.next():
             # parse done in parseFkQuery to make code cleaner.
-            (
-                tableName,
-                fkAttribute,
-                domainTable,
-                domainReferencedAttribute,
-            ) = self.parseFkQuery(query.value(0), query.value(1))
+            fkList.append(self.parseFkQuery(query.value(0), query.value(1)))
+        # all referenced domain tables are fetched at once instead of one
+        # query per foreign key column
+        domainRowsDict = self.getDomainRowsFromTableList(
+            list(set(fk[2] for fk in fkList))
+        )
+        geomDict = dict()
+        for (
+            tableName,
+            fkAttribute,
+            domainTable,
+            domainReferencedAttribute,
+        ) in fkList:
             if tableName not in list(geomDict.keys()):
                 geomDict[tableName] = dict()
             if "columns" not in list(geomDict[tableName].keys()):
@@ -2694,8 +2743,8 @@ class PostgisDb(AbstractDb):
             geomDict[tableName]["columns"][fkAttribute][
                 "refPk"
             ] = domainReferencedAttribute
-            values, otherKey = self.getLayerColumnDict(
-                domainReferencedAttribute, domainTable
+            values, otherKey = self.buildLayerColumnDict(
+                domainReferencedAttribute, domainRowsDict.get(domainTable, [])
             )
             geomDict[tableName]["columns"][fkAttribute]["values"] = values
             geomDict[tableName]["columns"][fkAttribute]["otherKey"] = otherKey
@@ -3270,10 +3319,21 @@ class PostgisDb(AbstractDb):
                 + ":"
                 + query.lastError().text()
             )
+        rowList = []
+        while query.next():
+            rowList.append(json.loads(query.value(0)))
+        return self.buildLayerColumnDict(refPk, rowList)
+
+    def buildLayerColumnDict(self, refPk, rowList):
+        """
+        Builds the {code: value} dict of a domain table from its rows.
+        :param refPk: (str) referenced key column;
+        :param rowList: (list-of-dict) domain table rows;
+        :return: (tuple) (domain dict, name of the value column)
+        """
         domainDict = dict()
         otherKey = None
-        while query.next():
-            aux = json.loads(query.value(0))
+        for aux in rowList:
             if not otherKey:
                 if "code_name" in list(aux.keys()):
                     otherKey = "code_name"
@@ -3282,6 +3342,27 @@ class PostgisDb(AbstractDb):
             domainDict[aux[refPk]] = aux[otherKey]
         return domainDict, otherKey
 
+    def getDomainRowsFromTableList(self, domainTableList):
+        """
+        Gets the rows of several domain tables in a single query.
+        :param domainTableList: (list-of-str) qualified domain table names;
+        :return: (dict) domain table name -> list of rows (dicts).
+        """
+        if not domainTableList:
+            return dict()
+        self.checkAndOpenDb()
+        sql = self.gen.getDomainCodeDictFromTableList(domainTableList)
+        query = QSqlQuery(sql, self.db)
+        if not query.isActive():
+            raise Exception(
+                self.tr("Problem getting domain values: ") + query.lastError().text()
+            )
+        domainRowsDict = dict()
+        while query.next():
+            rows = query.value(1)
+            domainRowsDict[query.value(0)] = json.loads(rows) if rows else []
+        return domainRowsDict
+
     def getGeomStructDict(self):
         """
         Returns dict in the following format:
@@ -3327,6 +3408,7 @@ class PostgisDb(AbstractDb):
             raise Exception(
                 self.tr("Problem creating from template: ") + query.lastError().text()
             )
+        self.invalidateLayerLoadingMetadataCache(dbName=dbName)
         self.checkAndCreateStyleTable()
         # this close is to allow creation from template
         self.db.close()
@@ -3422,6 +3504,7 @@ class PostgisDb(AbstractDb):
                 progress.step()
         if useTransaction:
             self.db.commit()
+        self.invalidateLayerLoadingMetadataCache()
         # this close is to allow creation from template
         if closeAfterUse:
             self.db.close()
@@ -3466,6 +3549,7 @@ class PostgisDb(AbstractDb):
             raise Exception(
                 self.tr("Problem creating database: ") + query.lastError().text()
             )
+        self.invalidateLayerLoadingMetadataCache(dbName=dbName)
 
     def getTemplateName(self, version):
         if version == "2.1.3":
@@ -3663,6 +3747,7 @@ class PostgisDb(AbstractDb):
                 )
         if useTransaction:
             self.db.commit()
+        self.invalidateLayerLoadingMetadataCache()
         self.alterSearchPath(version, useTransaction=useTransaction)
         self.setDbAsTemplate(version=version, useTransaction=useTransaction)
         self.createStyleTable(useTransaction=useTransaction)
@@ -4320,6 +4405,7 @@ class PostgisDb(AbstractDb):
                 )
             if useTransaction:
                 self.db.commit()
+            self.invalidateLayerLoadingMetadataCache()
 
     def getPostgisVersion(self):
         self.checkAndOpenDb()
@@ -4564,6 +4650,108 @@ class PostgisDb(AbstractDb):
         while query.next():
             return query.value(0)
 
+    def getCatalogSignature(self):
+        """
+        Gets a hash that changes whenever the database schema changes.
+        """
+        self.checkAndOpenDb()
+        sql = self.gen.getCatalogSignature()
+        query = QSqlQuery(sql, self.db)
+        if not query.isActive():
+            raise Exception(
+                self.tr("Problem getting catalog signature: ")
+                + query.lastError().text()
+            )
+        query.next()
+        return query.value(0)
+
+    def getLayerCatalog(self, tableList=None):
+        """
+        Gets the metadata needed to build layer providers for every geometric
+        table in a single query. Returns a dict like this:
+        {('schema', 'tableName', 'geometryColumn'): {
+            'schema': schema name,
+            'geometryColumn': geometry column,
+            'srid': srid,
+            'geometryType': geometry type (e.g. MULTIPOLYGON),
+            'coordDimension': number of coordinate dimensions,
+            'primaryKey': primary key column,
+            'estimatedCount': estimated number of rows,
+            'estimatedExtent': (xmin, ymin, xmax, ymax) or None
+            }
+        }
+        """
+        self.checkAndOpenDb()
+        sql = self.gen.getLayerCatalog(tableList=tableList)
+        query = QSqlQuery(sql, self.db)
+        if not query.isActive():
+            raise Exception(
+                self.tr("Problem getting layer catalog: ") + query.lastError().text()
+            )
+        catalog = dict()
+        while query.next():
+            aux = json.loads(query.value(0))
+            catalog[
+                (aux["table_schema"], aux["table_name"], aux["geometry_column"])
+            ] = {
+                "schema": aux["table_schema"],
+                "geometryColumn": aux["geometry_column"],
+                "srid": aux["srid"],
+                "geometryType": aux["geometry_type"],
+                "coordDimension": aux["coord_dimension"],
+                "primaryKey": aux["primary_key"],
+                "estimatedCount": aux["estimated_count"],
+                "estimatedExtent": self.parseBox2D(aux["estimated_extent"]),
+            }
+        return catalog
+
+    def parseBox2D(self, box):
+        """
+        Parses a postgis BOX(xmin ymin,xmax ymax) string.
+        :return: (tuple) (xmin, ymin, xmax, ymax) or None.
+        """
+        if not box:
+            return None
+        coords = box[box.index("(") + 1 : box.index(")")].replace(",", " ").split()
+        return tuple(float(i) for i in coords)
+
+    def getLayerLoadingMetadata(self, auxGeomDict, useCache=True):
+        """
+        Prefetches, with a few set-based queries, everything the layer
+        loaders need: the layer catalog (primary keys, geometry columns,
+        srids, geometry types and estimated extents), the domain dict and the
+        multi columns dict. Only the layer catalog is cached per database,
+        since it is rebuilt whenever the catalog signature changes; domain
+        values are table contents and are always read again.
+        :param auxGeomDict: (dict) geometry dict, as built by getGeomDict;
+        :param useCache: (bool) whether a cached catalog may be used;
+        :return: (dict) with the keys tables, domainDict and multiColumnsDict.
+        """
+        key = (self.db.hostName(), self.db.port(), self.db.databaseName())
+        signature = self.getCatalogSignature()
+        cached = PostgisDb.layerLoadingMetadataCache.get(key)
+        if not useCache or cached is None or cached["signature"] != signature:
+            cached = {"signature": signature, "tables": self.getLayerCatalog()}
+            PostgisDb.layerLoadingMetadataCache[key] = cached
+        return {
+            "tables": cached["tables"],
+            "domainDict": self.getDbDomainDict(auxGeomDict),
+            "multiColumnsDict": self.getMultiColumnsDict(),
+        }
+
+    def invalidateLayerLoadingMetadataCache(self, dbName=None):
+        """
+        Drops the cached layer catalog of a database. It is called by the
+        methods that change the database structure.
+        :param dbName: (str) database name, the current one when None.
+        """
+        key = (
+            self.db.hostName(),
+            self.db.port(),
+            self.db.databaseName() if dbName is None else dbName,
+        )
+        PostgisDb.layerLoadingMetadataCache.pop(key, None)
+
     def dropAllConections(self, dbName):
         """
         Terminates all database conections
@@ -38,6 +38,7 @@ from qgis.PyQt.Qt import QObject
 from qgis.PyQt.QtXml import QDomDocument
 
 from DsgTools.core.Utils.utils import Utils
+from .styleCache import StyleCache
 
 
 class EDGVLayerLoader(QObject):
@@ -49,6 +50,7 @@ class EDGVLayerLoader(QObject):
         self.uri = QgsDataSourceUri()
         self.iface = iface
         self.utils = Utils()
+        self.styleCache = StyleCache(self.abstractDb)
         self.logErrorDict = dict()
         self.errorLog = ""
         self.geomTypeDict = self.abstractDb.getGeomTypeDict(loadCentroids)
@@ -89,27 +91,17 @@ class EDGVLayerLoader(QObject):
     ):
         return None
 
-    def getStyle(self, stylePath, className):
-        if "db:" in stylePath["style"]:
-            return self.abstractDb.getStyle(
-                stylePath["style"].split(":")[-1], className
-            )
-        else:
-            return self.getStyleFromFile(stylePath["style"], className)
-
-    def getStyleFromFile(self, stylePath, className):
-        styleName = "{0}.qml".format(className)
-        if styleName.lower() in [f.lower() for f in os.listdir(stylePath)]:
-            qml = self.utils.parseStyle(os.path.join(stylePath, styleName))
-            # dsgtools have the right to write on its own directory
-            # a temporary file "temp.qml"
-            tempPath = os.path.join(stylePath, "temp.qml")
-            with open(tempPath, "w", encoding="utf-8") as f:
-                f.writelines(qml)
-                f.close()
-            return tempPath
-        else:
-            return None
+    def applyStyle(self, vlayer, stylePath, className):
+        """
+        Applies the style of the class from the style set in stylePath.
+        Styles are read once per style set and kept in memory.
+        :param vlayer: (QgsVectorLayer) layer to be styled;
+        :param stylePath: (dict) style path, with the key style being either
+            a folder or db:<style name>;
+        :param className: (str) class (table) name;
+        :return: (bool) whether a style was applied.
+        """
+        return self.styleCache.applyStyle(vlayer, stylePath, className)
 
     def prepareLoad(self):
         dbName = self.abstractDb.getDatabaseName()
@@ -245,12 +237,9 @@ class EDGVLayerLoader(QObject):
             QgsMessageLog.logMessage(":".join(e.args), "DSGTools Plugin", Qgis.Critical)
             return None
         if qmlType == "db":
-            tempPath = os.path.join(os.path.dirname(__file__), "temp.qml")
-            with open(tempPath, "w", encoding="utf-8") as f:
-                f.writelines(qmldir)
-                f.close()
-            vlayer.loadNamedStyle(tempPath, True)
-            os.remove(tempPath)
+            doc = QDomDocument("qgis")
+            doc.setContent(qmldir)
+            vlayer.importNamedStyle(doc)
         else:
             vlayerQml = os.path.join(qmldir, vlayer.name() + ".qml")
             # treat case of qml with multi
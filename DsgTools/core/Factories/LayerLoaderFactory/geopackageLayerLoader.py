@@ -75,9 +75,7 @@ class GeopackageLayerLoader(SpatialiteLayerLoader):
         vlayer = self.setDomainsAndRestrictionsWithQml(vlayer)
         vlayer = self.setMulti(vlayer, domLayerDict)
         if stylePath:
-            fullPath = self.getStyle(stylePath, tableName)
-            if fullPath:
-                vlayer.loadNamedStyle(fullPath, True)
+            self.applyStyle(vlayer, stylePath, tableName)
         parentNode.addLayer(vlayer)
         vlayer = self.createMeasureColumn(vlayer)
         return vlayer
@@ -31,7 +31,9 @@ from qgis.core import (
     QgsEditorWidgetSetup,
     QgsMessageLog,
     QgsProject,
+    QgsRectangle,
     QgsVectorLayer,
+    QgsWkbTypes,
 )
 
 # Qt imports
@@ -165,6 +167,9 @@ class PostGISLayerLoader(EDGVLayerLoader):
         """
         geomFilterList = [] if geomFilterList is None else geomFilterList
         self.iface.mapCanvas().freeze()  # done to speedup things
+        if stylePath is not None:
+            # styles are parsed while the layer metadata is fetched
+            self.styleCache.prepareInBackground(stylePath)
         layerList, isDictList = self.preLoadStep(inputList)
         # 2. Filter Layers:
         filteredLayerList = self.filterLayerList(
@@ -181,11 +186,11 @@ class PostGISLayerLoader(EDGVLayerLoader):
         dbNode = self.getDatabaseGroup(rootNode)
         # 3. Load Domains
         domLayerDict = self.loadDomains(filteredLayerList, dbNode, edgvVersion)
-        # 4. Get Aux dicts
-        domainDict = self.abstractDb.getDbDomainDict(self.geomDict)
-        constraintDict = self.abstractDb.getCheckConstraintDict()
-        multiColumnsDict = self.abstractDb.getMultiColumnsDict()
-        notNullDict = self.abstractDb.getNotNullDictV2()
+        # 4. Get Aux dicts (prefetched in a few queries and cached per database)
+        loadingMetadata = self.abstractDb.getLayerLoadingMetadata(self.geomDict)
+        domainDict = loadingMetadata["domainDict"]
+        multiColumnsDict = loadingMetadata["multiColumnsDict"]
+        layerCatalog = loadingMetadata["tables"]
         lyrDict = self.getLyrDict(filteredDictList, isEdgv=isEdgv)
         editingDict = self.abstractDb.getEditingDict() if loadEditingStructure else None
         if customForm:
@@ -222,6 +227,7 @@ class PostGISLayerLoader(EDGVLayerLoader):
                             edgvVersion=edgvVersion,
                             editingDict=editingDict,
                             customForm=customForm,
+                            layerCatalog=layerCatalog,
                         )
                         if vlayer is None:
                             continue
@@ -255,6 +261,7 @@ class PostGISLayerLoader(EDGVLayerLoader):
         isView=False,
         editingDict=None,
         customForm=False,
+        layerCatalog=None,
     ):
         """
         Loads a layer
@@ -263,23 +270,40 @@ class PostGISLayerLoader(EDGVLayerLoader):
         :param uniqueLoad: boolean to mark if the layer should only be loaded once
         :param stylePath: path to the styles used
         :param domLayerDict: domain dictionary
+        :param layerCatalog: prefetched table metadata (see
+            PostgisDb.getLayerCatalog). When the schema, table and geometry
+            column are in it, the provider is built without querying the
+            database for its metadata.
         :return:
         """
         lyrName, schema, geomColumn, tableName, srid = self.getParams(inputParam)
         lyr = self.checkLoaded(tableName)
         if uniqueLoad and lyr is not None:
             return lyr
+        catalogEntry = (
+            layerCatalog.get((schema, tableName, geomColumn))
+            if layerCatalog is not None
+            else None
+        )
         self.setDataSource(
             schema=schema,
             layer=tableName,
             geomColumn=geomColumn,
             sql="",
-            pkColumn=self.abstractDb.getPrimaryKeyColumn(
-                f'''"{schema}"."{tableName}"'''
-            ),
+            pkColumn=catalogEntry["primaryKey"]
+            if catalogEntry is not None
+            else self.abstractDb.getPrimaryKeyColumn(f'''"{schema}"."{tableName}"'''),
         )
-
-        vlayer = QgsVectorLayer(self.uri.uri(), tableName, self.provider)
+        self.setProviderMetadata(catalogEntry)
+        layerOptions = QgsVectorLayer.LayerOptions(
+            QgsProject.instance().transformContext()
+        )
+        # the crs is set right after, there is no need to validate it
+        layerOptions.skipCrsValidation = True
+        # styles are going to be replaced, avoid querying layer_styles
+        layerOptions.loadDefaultStyle = stylePath is None
+        vlayer = QgsVectorLayer(self.uri.uri(), tableName, self.provider, layerOptions)
+        self.resetProviderMetadata()
         QgsProject.instance().addMapLayer(vlayer, addToLegend=False)
         crs = QgsCoordinateReferenceSystem(
             int(srid), QgsCoordinateReferenceSystem.EpsgCrsId
@@ -291,6 +315,8 @@ class PostGISLayerLoader(EDGVLayerLoader):
                 vlayer.error().summary(), "DSGTools Plugin", Qgis.Critical
             )
         vlayer.setCrs(crs)
+        if catalogEntry is not None and catalogEntry["estimatedExtent"] is not None:
+            vlayer.setExtent(QgsRectangle(*catalogEntry["estimatedExtent"]))
         vlayer = (
             self.setDomainsAndRestrictionsWithQml(vlayer)
             if useQml
@@ -303,17 +329,47 @@ class PostGISLayerLoader(EDGVLayerLoader):
             )
         )
         if stylePath is not None:
-            fullPath = self.getStyle(stylePath, tableName)
-            if fullPath:
-                vlayer.loadNamedStyle(fullPath, True)
-                # remove qml temporary file
-                self.utils.deleteQml(fullPath)
-                # clear fullPath variable
-                del fullPath
+            self.applyStyle(vlayer, stylePath, tableName)
         vlayer = self.createMeasureColumn(vlayer)
         parentNode.addLayer(vlayer)
         return vlayer
 
+    def setProviderMetadata(self, catalogEntry):
+        """
+        Fills the uri with the metadata the postgres provider would otherwise
+        query for (srid and geometry type) and enables estimated metadata, so
+        that extents and feature counts come from table statistics.
+        :param catalogEntry: (dict) table entry from PostgisDb.getLayerCatalog.
+        """
+        if catalogEntry is None:
+            return
+        self.uri.setSrid(str(catalogEntry["srid"]))
+        wkbType = self.getCatalogWkbType(catalogEntry)
+        if wkbType != QgsWkbTypes.Unknown:
+            self.uri.setWkbType(wkbType)
+        self.uri.setUseEstimatedMetadata(True)
+
+    def getCatalogWkbType(self, catalogEntry):
+        """
+        geometry_columns.type has no Z suffix (e.g. MULTIPOLYGON on a
+        MultiPolygonZ table), the dimensions come from coord_dimension.
+        :param catalogEntry: (dict) table entry from PostgisDb.getLayerCatalog.
+        :return: (QgsWkbTypes.Type) geometry type, Unknown if it can not be
+            parsed.
+        """
+        geometryType = catalogEntry["geometryType"].upper()
+        coordDimension = catalogEntry["coordDimension"] or 2
+        if coordDimension == 4 and not geometryType.endswith("ZM"):
+            geometryType += "ZM"
+        elif coordDimension == 3 and not geometryType.endswith("M"):
+            geometryType += "Z"
+        return QgsWkbTypes.parseType(geometryType)
+
+    def resetProviderMetadata(self):
+        self.uri.setSrid("")
+        self.uri.setWkbType(QgsWkbTypes.Unknown)
+        self.uri.setUseEstimatedMetadata(False)
+
     def loadEditLayer(self, schema, tableName):
         """
         Parses database to check which is the referenced edit layer and loads it
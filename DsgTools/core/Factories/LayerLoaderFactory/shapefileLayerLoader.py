@@ -195,9 +195,7 @@ class ShapefileLayerLoader(EDGVLayerLoader):
         vlayer = self.setDomainsAndRestrictionsWithQml(vlayer)
         vlayer = self.setMulti(vlayer, domLayerDict)
         if stylePath:
-            fullPath = self.getStyle(stylePath, tableName)
-            if fullPath:
-                vlayer.loadNamedStyle(fullPath, True)
+            self.applyStyle(vlayer, stylePath, tableName)
         parentNode.addLayer(vlayer)
         if not vlayer.isValid():
             QgsMessageLog.logMessage(
@@ -286,9 +286,7 @@ class SpatialiteLayerLoader(EDGVLayerLoader):
         # vlayer = self.setMulti(vlayer, domLayerDict)
         self.setDomainMappingToLayer(vlayer, schema)
         if stylePath:
-            fullPath = self.getStyle(stylePath, tableName)
-            if fullPath:
-                vlayer.loadNamedStyle(fullPath, True)
+            self.applyStyle(vlayer, stylePath, tableName)
         parentNode.addLayer(vlayer)
         vlayer = self.createMeasureColumn(vlayer)
         return vlayer
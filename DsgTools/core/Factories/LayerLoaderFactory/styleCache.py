@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import os
+import threading
+
+from qgis.core import QgsApplication, QgsTask
+from qgis.PyQt.QtXml import QDomDocument
+
+from DsgTools.core.Utils.utils import Utils
+
+
+class StyleCache(object):
+    """
+    Keeps the styles of a style set (a folder of QML files or a style name
+    stored on the database) in memory, keyed by class name, so that layer
+    loaders can apply them without writing or reading temporary files.
+    A style set is read at once, either on first use or in background
+    through prepareInBackground.
+    """
+
+    def __init__(self, abstractDb):
+        self.abstractDb = abstractDb
+        self.utils = Utils()
+        # style set key -> {class name (lower case): parsed qml text}
+        self.qmlDict = dict()
+        # (style set key, class name) -> QDomDocument
+        self.documentDict = dict()
+        # style set key -> QgsTask being run
+        self.taskDict = dict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def getStyleSetKey(stylePath):
+        """
+        :param stylePath: (dict) style path as received by the layer loaders,
+            with the key style being either a folder or db:<style name>;
+        :return: (tuple) (source type, folder or style name).
+        """
+        style = stylePath["style"]
+        if "db:" in style:
+            return "db", style.split(":")[-1]
+        return "file", style
+
+    def isPrepared(self, stylePath):
+        return self.getStyleSetKey(stylePath) in self.qmlDict
+
+    def readStyleSet(self, styleSetKey):
+        """
+        Reads the raw qml of every style in the set.
+        :return: (dict) class name (lower case) -> raw qml (text or file path)
+        """
+        sourceType, source = styleSetKey
+        if sourceType == "db":
+            return {
+                className.lower(): qml
+                for className, qml in self.abstractDb.getStyleSet(source).items()
+            }
+        if not os.path.isdir(source):
+            return dict()
+        return {
+            os.path.splitext(fileName)[0].lower(): os.path.join(source, fileName)
+            for fileName in os.listdir(source)
+            if fileName.lower().endswith(".qml") and fileName.lower() != "temp.qml"
+        }
+
+    def parseStyleSet(self, styleSetKey, rawQmlDict):
+        """
+        Parses the raw styles and stores them on the cache. It does not
+        touch the database nor qgis objects, therefore it is safe to run it
+        on a background thread.
+        """
+        qmlDict = dict()
+        for className, rawQml in rawQmlDict.items():
+            if not rawQml:
+                continue
+            try:
+                qmlDict[className] = self.utils.parseStyle(rawQml)
+            except Exception:
+                continue
+        with self.lock:
+            self.qmlDict[styleSetKey] = qmlDict
+        return True
+
+    def prepare(self, stylePath):
+        """
+        Reads and parses the whole style set, if it is not cached yet.
+        :param stylePath: (dict) style path as received by the layer loaders.
+        """
+        styleSetKey = self.getStyleSetKey(stylePath)
+        if styleSetKey in self.taskDict:
+            self.taskDict.pop(styleSetKey).waitForFinished(0)
+        if styleSetKey in self.qmlDict:
+            return
+        self.parseStyleSet(styleSetKey, self.readStyleSet(styleSetKey))
+
+    def prepareInBackground(self, stylePath):
+        """
+        Parses the style set on a QgsTask, so that it is ready by the time
+        the first layer is styled. Database styles are fetched before the
+        task is started, since the connection belongs to the current thread.
+        :param stylePath: (dict) style path as received by the layer loaders;
+        :return: (QgsTask) started task or None, if already prepared.
+        """
+        styleSetKey = self.getStyleSetKey(stylePath)
+        if styleSetKey in self.qmlDict or styleSetKey in self.taskDict:
+            return self.taskDict.get(styleSetKey)
+        rawQmlDict = self.readStyleSet(styleSetKey) if styleSetKey[0] == "db" else None
+
+        def run(task):
+            return self.parseStyleSet(
+                styleSetKey,
+                rawQmlDict
+                if rawQmlDict is not None
+                else self.readStyleSet(styleSetKey),
+            )
+
+        task = QgsTask.fromFunction(
+            "DSGTools: preparing styles", run, flags=QgsTask.Silent
+        )
+        self.taskDict[styleSetKey] = task
+        QgsApplication.taskManager().addTask(task)
+        return task
+
+    def getStyleDocument(self, stylePath, className):
+        """
+        Returns the style of the class as a QDomDocument.
+        :param stylePath: (dict) style path as received by the layer loaders;
+        :param className: (str) class (table) name;
+        :return: (QDomDocument) style document or None if the set has no
+            style for this class.
+        """
+        self.prepare(stylePath)
+        styleSetKey = self.getStyleSetKey(stylePath)
+        documentKey = (styleSetKey, className.lower())
+        if documentKey not in self.documentDict:
+            qml = self.qmlDict[styleSetKey].get(className.lower())
+            if qml is None:
+                return None
+            doc = QDomDocument("qgis")
+            if not doc.setContent(qml)[0]:
+                return None
+            self.documentDict[documentKey] = doc
+        return self.documentDict[documentKey]
+
+    def applyStyle(self, lyr, stylePath, className):
+        """
+        Applies the cached style of the class to the layer.
+        :param lyr: (QgsVectorLayer) layer to be styled;
+        :param stylePath: (dict) style path as received by the layer loaders;
+        :param className: (str) class (table) name;
+        :return: (bool) whether a style was applied.
+        """
+        doc = self.getStyleDocument(stylePath, className)
+        if doc is None:
+            return False
+        return lyr.importNamedStyle(doc)[0]
+
+    def clear(self):
+        for task in self.taskDict.values():
+            task.waitForFinished(0)
+        self.taskDict = dict()
+        self.qmlDict = dict()
+        self.documentDict = dict()
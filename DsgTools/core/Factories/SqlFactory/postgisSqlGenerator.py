@@ -1227,6 +1227,12 @@ class PostGISSqlGenerator(SqlGenerator):
         )
         return sql
 
+    def getStyleSet(self, styleName):
+        sql = """SELECT f_table_name, styleqml from public.layer_styles where (stylename = '{0}' or stylename like '{0}/%') and f_table_catalog = current_database()""".format(
+            styleName
+        )
+        return sql
+
     def updateStyle(self, styleName, table_name, parsedQml, tableSchema):
         sql = """UPDATE public.layer_styles SET styleqml = '{0}', update_time = now() where f_table_name = '{1}' and description = '{2}'""".format(
             parsedQml.replace("'", "''"), table_name, styleName
@@ -2012,6 +2018,90 @@ class PostGISSqlGenerator(SqlGenerator):
         )
         return sql
 
+    def getCatalogSignature(self):
+        """
+        Hash of the user relations, their columns and types and their
+        constraints. It changes whenever a table, view, column or constraint
+        is created, altered (e.g. a geometry column type) or dropped, and is
+        used to invalidate cached catalog metadata.
+        """
+        sql = """select md5(coalesce(string_agg(a.item, ',' order by a.item), '')) from (
+                select c.oid::text || ':' || c.relname || ':' || c.relnatts as item
+                    from pg_class c join pg_namespace n on n.oid = c.relnamespace
+                    where c.relkind in ('r', 'v', 'm', 'p', 'f')
+                    and n.nspname not in ('pg_catalog', 'information_schema')
+                    and n.nspname not like 'pg_toast%'
+                union all
+                select att.attrelid::text || ':' || att.attnum || ':' || att.attname
+                    || ':' || att.atttypid::text || ':' || att.atttypmod as item
+                    from pg_attribute att
+                    join pg_class c on c.oid = att.attrelid
+                    join pg_namespace n on n.oid = c.relnamespace
+                    where c.relkind in ('r', 'v', 'm', 'p', 'f')
+                    and att.attnum > 0 and not att.attisdropped
+                    and n.nspname not in ('pg_catalog', 'information_schema')
+                    and n.nspname not like 'pg_toast%'
+                union all
+                select con.oid::text || ':' || con.conname as item
+                    from pg_constraint con join pg_namespace n on n.oid = con.connamespace
+                    where n.nspname not in ('pg_catalog', 'information_schema')
+            ) as a
+        """
+        return sql
+
+    def getLayerCatalog(self, tableList=None):
+        """
+        Gets, in a single query, the geometry column, srid, geometry type,
+        primary key, estimated row count and estimated extent of every
+        geometric table (optionally filtered by tableList).
+        The extent is only estimated when the geometry column has statistics,
+        since ST_EstimatedExtent fails on tables that were never analyzed.
+        """
+        tableClause = (
+            "and gc.f_table_name in ({0})".format(
+                ",".join("'{0}'".format(i) for i in tableList)
+            )
+            if tableList
+            else "and gc.f_table_schema not in ('views', 'topology')"
+        )
+        sql = """select row_to_json(a) from (
+                select gc.f_table_schema as table_schema, gc.f_table_name as table_name,
+                    gc.f_geometry_column as geometry_column, gc.srid, gc.type as geometry_type,
+                    gc.coord_dimension,
+                    (select att.attname from pg_index i
+                        join pg_attribute att on att.attrelid = i.indrelid and att.attnum = any(i.indkey)
+                        where i.indrelid = c.oid and i.indisprimary limit 1) as primary_key,
+                    c.reltuples::bigint as estimated_count,
+                    case when exists (
+                        select 1 from pg_stats s
+                        where s.schemaname = gc.f_table_schema and s.tablename = gc.f_table_name
+                        and s.attname = gc.f_geometry_column
+                    ) then public.st_estimatedextent(
+                        gc.f_table_schema::text, gc.f_table_name::text, gc.f_geometry_column::text
+                    )::text end as estimated_extent
+                from public.geometry_columns gc
+                join pg_namespace n on n.nspname = gc.f_table_schema
+                join pg_class c on c.relnamespace = n.oid and c.relname = gc.f_table_name
+                where true {table_clause}
+            ) as a
+        """.format(
+            table_clause=tableClause
+        )
+        return sql
+
+    def getDomainCodeDictFromTableList(self, domainTableList):
+        """
+        Fetches the rows of several domain tables in one query, one json
+        array per table.
+        """
+        sql = " union all ".join(
+            """select '{escaped}', (select json_agg(row_to_json(a)) from {table} as a)""".format(
+                escaped=table.replace("'", "''"), table=table
+            )
+            for table in domainTableList
+        )
+        return sql
+
     def getGeometryTablesCount(self):
         sql = """select count(*) from public.geometry_columns"""
         return sql
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import struct
+
+import numpy as np
+
+from .vertexArrays import WKB_LINESTRING, WKB_MULTI_TYPES, WkbReader, azimuths
+
+# coordinates closer than this are already the same double on projected and
+# geographic coordinates, therefore the default keeps nodes exact
+DEFAULT_TOLERANCE = 1e-9
+
+
+class EndpointTable(object):
+    """
+    Endpoints of a set of lines and the nodes they connect, stored in
+    arrays:
+        - startXY, endXY: (n, 2) coordinates of the first and last vertices;
+        - startAzimuth: azimuth of the first segment, leaving startXY;
+        - endAzimuth: azimuth of the last segment, entering endXY;
+        - startNode, endNode: node index of each endpoint. Endpoints are
+          merged into nodes by their coordinates quantized to tolerance;
+        - nodeXY: (m, 2) coordinates of each node;
+        - featureIds: feature id of each line.
+    Azimuths are in degrees, clockwise from the north, in [0, 360). Only the
+    first and last two vertices of each line are read from the WKB.
+    """
+
+    def __init__(
+        self,
+        featureIds,
+        startXY,
+        endXY,
+        startAzimuth,
+        endAzimuth,
+        tolerance=DEFAULT_TOLERANCE,
+    ):
+        self.featureIds = np.asarray(featureIds, dtype=np.int64)
+        self.startXY = np.asarray(startXY, dtype=np.float64).reshape(-1, 2)
+        self.endXY = np.asarray(endXY, dtype=np.float64).reshape(-1, 2)
+        self.startAzimuth = np.asarray(startAzimuth, dtype=np.float64)
+        self.endAzimuth = np.asarray(endAzimuth, dtype=np.float64)
+        self.tolerance = tolerance
+        self.buildNodes()
+
+    @classmethod
+    def fromWkbList(
+        cls, wkbList, featureIds=None, tolerance=DEFAULT_TOLERANCE, splitParts=False
+    ):
+        """
+        Parses a list of line WKB (ISO or EWKB, 2D, Z, M or ZM). Multi lines
+        start on their first part and end on their last one, unless
+        splitParts is set. Lines with less than two vertices are skipped.
+        :param wkbList: (list-of-bytes) geometries;
+        :param featureIds: (list-of-int) feature id of each geometry. When not
+            given, the position on wkbList is used;
+        :param tolerance: (float) size of the grid endpoints are snapped to
+            when they are merged into nodes;
+        :param splitParts: (bool) whether each part of a multi line becomes a
+            line of its own, with the feature id of its geometry;
+        :return: (EndpointTable)
+        """
+        reader = EndpointReader()
+        idList, coordList = [], []
+        for featureIndex, wkb in enumerate(wkbList):
+            if splitParts:
+                partCoordList = reader.readParts(wkb)
+            else:
+                coords = reader.read(wkb)
+                partCoordList = [] if coords is None else [coords]
+            featureId = featureIndex if featureIds is None else featureIds[featureIndex]
+            idList.extend([featureId] * len(partCoordList))
+            coordList.extend(partCoordList)
+        coords = (
+            np.array(coordList, dtype=np.float64)
+            if coordList
+            else np.empty((0, 4, 2), dtype=np.float64)
+        )
+        return cls(
+            featureIds=idList,
+            startXY=coords[:, 0],
+            endXY=coords[:, 3],
+            startAzimuth=np.mod(azimuths(coords[:, 0], coords[:, 1]), 360.0),
+            endAzimuth=np.mod(azimuths(coords[:, 2], coords[:, 3]), 360.0),
+            tolerance=tolerance,
+        )
+
+    def buildNodes(self):
+        nLines = len(self.featureIds)
+        xy = np.concatenate([self.startXY, self.endXY])
+        if nLines == 0:
+            self.nodeXY = np.empty((0, 2), dtype=np.float64)
+            self.startNode = self.endNode = np.empty(0, dtype=np.int64)
+            return
+        keys = np.round(xy / self.tolerance).astype(np.int64)
+        _, firstIndex, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        self.nodeXY = xy[firstIndex]
+        self.startNode = inverse[:nLines]
+        self.endNode = inverse[nLines:]
+
+    def __len__(self):
+        return len(self.featureIds)
+
+    def nodeCount(self):
+        return len(self.nodeXY)
+
+    def inDegree(self):
+        """
+        :return: (np.array) number of lines ending on each node.
+        """
+        return np.bincount(self.endNode, minlength=self.nodeCount())
+
+    def outDegree(self):
+        """
+        :return: (np.array) number of lines starting on each node.
+        """
+        return np.bincount(self.startNode, minlength=self.nodeCount())
+
+    def findLines(self, points):
+        """
+        Finds, for each point, a line that starts or ends on it. Points are
+        merged into nodes with the tolerance of the table.
+        :param points: (np.array) (n, 2) coordinates;
+        :return: (np.array) index of the line of each point, the lowest one
+            when there are several, or -1 for points not on an endpoint.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.nodeCount() == 0:
+            return np.full(len(points), -1, dtype=np.int64)
+        nodeDict = {
+            key: node
+            for node, key in enumerate(
+                map(
+                    tuple,
+                    np.round(self.nodeXY / self.tolerance).astype(np.int64).tolist(),
+                )
+            )
+        }
+        pointNodes = np.array(
+            [
+                nodeDict.get(key, -1)
+                for key in map(
+                    tuple, np.round(points / self.tolerance).astype(np.int64).tolist()
+                )
+            ],
+            dtype=np.int64,
+        )
+        nodeLine = np.full(self.nodeCount(), len(self), dtype=np.int64)
+        lineIndexes = np.arange(len(self), dtype=np.int64)
+        np.minimum.at(nodeLine, self.startNode, lineIndexes)
+        np.minimum.at(nodeLine, self.endNode, lineIndexes)
+        return np.where(pointNodes >= 0, nodeLine[pointNodes], -1)
+
+    def getInOutPairs(self):
+        """
+        Pairs every line that ends on a node with every line that starts on
+        the same node.
+        :return: (tuple) arrays (inLine, outLine) of line indexes.
+        """
+        inDegree = self.inDegree()
+        inOrder = np.argsort(self.endNode, kind="stable")
+        inStart = np.zeros(self.nodeCount() + 1, dtype=np.int64)
+        np.cumsum(inDegree, out=inStart[1:])
+        pairCount = inDegree[self.startNode]
+        outLine = np.repeat(np.arange(len(self), dtype=np.int64), pairCount)
+        groupStart = np.repeat(np.cumsum(pairCount) - pairCount, pairCount)
+        rank = np.arange(len(outLine), dtype=np.int64) - groupStart
+        inLine = inOrder[inStart[self.startNode[outLine]] + rank]
+        return inLine, outLine
+
+    def getMaxDirectionChange(self):
+        """
+        Computes, for each node, the largest change of direction between a
+        line that enters it and a line that leaves it.
+        :return: (np.array) angles in degrees, in [0, 180], nan on nodes
+            without both incoming and outgoing lines.
+        """
+        inLine, outLine = self.getInOutPairs()
+        delta = np.abs(self.endAzimuth[inLine] - self.startAzimuth[outLine])
+        delta = np.minimum(delta, 360.0 - delta)
+        maxDelta = np.full(self.nodeCount(), -np.inf)
+        np.maximum.at(maxDelta, self.startNode[outLine], delta)
+        maxDelta[np.isneginf(maxDelta)] = np.nan
+        return maxDelta
+
+
+class EndpointReader(WkbReader):
+    """
+    Reads only the first two and the last two vertices of line WKB.
+    """
+
+    def read(self, wkb):
+        """
+        :return: (np.array) (4, 2) array with the first, second, second to
+            last and last vertices, or None if the line has less than two
+            vertices.
+        """
+        partList = self.readPartList(wkb)
+        if partList == [] or (len(partList) == 1 and len(partList[0][0]) < 2):
+            return None
+        head, tail = partList[0][0], partList[-1][1]
+        if len(head) < 2:
+            head = np.vstack([head, partList[1][0][0]])
+        if len(tail) < 2:
+            tail = np.vstack([partList[-2][1][-1], tail])
+        return np.vstack([head[:2], tail[-2:]])
+
+    def readParts(self, wkb):
+        """
+        :return: (list-of-np.array) one (4, 2) array, as returned by read, for
+            each part with at least two vertices.
+        """
+        return [
+            np.vstack([head[:2], tail[-2:]])
+            for head, tail, _ in self.readPartList(wkb)
+            if len(head) >= 2
+        ]
+
+    def readPartList(self, wkb):
+        """
+        :return: (list-of-tuple) readPart results of the non empty parts.
+        """
+        wkb = bytes(wkb)
+        endian, wkbType, dimension, pos = self.readHeader(wkb, 0)
+        if wkbType == WKB_LINESTRING:
+            partList = [self.readPart(wkb, pos, endian, dimension)]
+        elif wkbType in WKB_MULTI_TYPES:
+            (nParts,) = struct.unpack_from(endian + "I", wkb, pos)
+            pos += 4
+            partList = []
+            for _ in range(nParts):
+                endian, wkbType, dimension, pos = self.readHeader(wkb, pos)
+                if wkbType != WKB_LINESTRING:
+                    raise ValueError(
+                        "Unsupported WKB geometry type: {0}".format(wkbType)
+                    )
+                part = self.readPart(wkb, pos, endian, dimension)
+                pos = part[-1]
+                partList.append(part)
+        else:
+            raise ValueError("Unsupported WKB geometry type: {0}".format(wkbType))
+        return [part for part in partList if part[0] is not None]
+
+    def readPart(self, wkb, pos, endian, dimension):
+        """
+        :return: (tuple) (head, tail, end), head and tail being up to two
+            vertices from each end of the line, or None if the line is empty,
+            and end the position after the line.
+        """
+        (nPoints,) = struct.unpack_from(endian + "I", wkb, pos)
+        pos += 4
+        end = pos + 8 * nPoints * dimension
+        if nPoints == 0:
+            return None, None, end
+        count = min(nPoints, 2)
+
+        def readVertices(offset):
+            return np.frombuffer(
+                wkb, dtype=endian + "f8", count=count * dimension, offset=offset
+            ).reshape(count, dimension)[:, :2]
+
+        return (
+            readVertices(pos),
+            readVertices(end - 8 * count * dimension),
+            end,
+        )
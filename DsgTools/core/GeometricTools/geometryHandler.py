@@ -25,6 +25,7 @@ from __future__ import absolute_import
 import math
 import numpy as np
 from builtins import range
+from collections import defaultdict
 from functools import partial
 from itertools import combinations
 
@@ -36,6 +37,7 @@ from qgis.core import (
     QgsPoint,
     QgsPointXY,
     QgsProject,
+    QgsRectangle,
     QgsVectorLayer,
     QgsWkbTypes,
     QgsDistanceArea,
@@ -43,6 +45,14 @@ from qgis.core import (
 )
 from qgis.PyQt.Qt import QObject
 
+from .endpointTable import DEFAULT_TOLERANCE, EndpointTable
+from .vertexArrays import (
+    POLYGON_RING,
+    VertexArrays,
+    anglesBetweenThreePoints,
+    isClose,
+)
+
 geometry_creation_dict = {
     QgsWkbTypes.Point: lambda x: QgsGeometry.fromPointXY(x),
     QgsWkbTypes.MultiPoint: lambda x: QgsGeometry.fromMultiPointXY(x),
@@ -417,6 +427,279 @@ class GeometryHandler(QObject):
                 )
         return segmentDict
 
+    def getVertexArrays(self, featureIterable, feedback=None):
+        """
+        Reads the vertices of the features into contiguous arrays (see
+        VertexArrays). Curved geometries are segmentized.
+        :param featureIterable: (iterable-of-QgsFeature) features to be read;
+        :param feedback: (QgsFeedback) used to cancel the reading;
+        :return: (VertexArrays) vertex arrays.
+        """
+        wkbList, featureIdList = [], []
+        for feat in featureIterable:
+            if feedback is not None and feedback.isCanceled():
+                break
+            geom = feat.geometry()
+            if geom.isNull() or geom.isEmpty():
+                continue
+            if QgsWkbTypes.isCurvedType(geom.wkbType()):
+                geom = QgsGeometry(geom.constGet().segmentize())
+            wkbList.append(bytes(geom.asWkb()))
+            featureIdList.append(feat.id())
+        return VertexArrays.fromWkbList(wkbList, featureIdList)
+
+    def getEndpointTable(self, featureIterable, tolerance=None, feedback=None):
+        """
+        Reads the endpoints of the lines and the azimuths of their first and
+        last segments into arrays (see EndpointTable). Curved geometries are
+        segmentized.
+        :param featureIterable: (iterable-of-QgsFeature) line features;
+        :param tolerance: (float) size of the grid endpoints are snapped to
+            when they are merged into nodes;
+        :param feedback: (QgsFeedback) used to cancel the reading;
+        :return: (EndpointTable) endpoint table.
+        """
+        wkbList, featureIdList = [], []
+        for feat in featureIterable:
+            if feedback is not None and feedback.isCanceled():
+                break
+            geom = feat.geometry()
+            if geom.isNull() or geom.isEmpty():
+                continue
+            if QgsWkbTypes.isCurvedType(geom.wkbType()):
+                geom = QgsGeometry(geom.constGet().segmentize())
+            wkbList.append(bytes(geom.asWkb()))
+            featureIdList.append(feat.id())
+        return EndpointTable.fromWkbList(
+            wkbList,
+            featureIdList,
+            tolerance=DEFAULT_TOLERANCE if tolerance is None else tolerance,
+        )
+
+    def splitPolygonByCells(self, geom, cellBoxes, feedback=None):
+        """
+        Intersects a polygon with a set of rectangular cells on a single
+        prepared geometry engine. Cells inside the polygon are returned as
+        they are and only the cells crossing its boundary are clipped.
+        :param geom: (QgsGeometry) polygon geometry;
+        :param cellBoxes: (iterable) (xmin, ymin, xmax, ymax) of each cell;
+        :param feedback: (QgsFeedback) used to cancel the split;
+        :return: (list) non empty polygon pieces, as QgsGeometry.
+        """
+        engine = QgsGeometry.createGeometryEngine(geom.constGet())
+        engine.prepareGeometry()
+        pieceList = []
+        for box in cellBoxes:
+            if feedback is not None and feedback.isCanceled():
+                break
+            cellGeom = QgsGeometry.fromRect(QgsRectangle(*box))
+            if not engine.intersects(cellGeom.constGet()):
+                continue
+            if engine.contains(cellGeom.constGet()):
+                pieceList.append(cellGeom)
+                continue
+            piece = QgsGeometry(engine.intersection(cellGeom.constGet()))
+            if piece.isNull() or piece.isEmpty():
+                continue
+            if piece.type() != QgsWkbTypes.PolygonGeometry:
+                piece = QgsGeometry.collectGeometry(
+                    [
+                        part
+                        for part in piece.asGeometryCollection()
+                        if part.type() == QgsWkbTypes.PolygonGeometry
+                    ]
+                )
+                if piece.isNull() or piece.isEmpty():
+                    continue
+            pieceList.append(piece)
+        return pieceList
+
+    def getOutOfBoundsAngleList(
+        self,
+        featureIterable,
+        angle,
+        exactAngleMatch=False,
+        angTol=0.1,
+        invalidRange=None,
+        feedback=None,
+    ):
+        """
+        Vectorized version of getOutOfBoundsAngle over a set of features.
+        Vertex angles of every feature are computed at once from their
+        coordinate arrays.
+        :param featureIterable: (iterable-of-QgsFeature) features to be checked;
+        :param angle: (float) minimum angle, in degrees;
+        :param exactAngleMatch: (bool) if True, polygon vertices are flagged
+            when their angle is not angle (within angTol);
+        :param angTol: (float) angle tolerance used with exactAngleMatch;
+        :param invalidRange: (tuple) (min, max) range of invalid angles;
+        :param feedback: (QgsFeedback) used to cancel the vertex reading;
+        :return: (list-of-dict) dicts with the keys angle, feat_id and geom.
+        """
+        return self.getOutOfBoundsAngleListFromArrays(
+            self.getVertexArrays(featureIterable, feedback=feedback),
+            angle,
+            exactAngleMatch=exactAngleMatch,
+            angTol=angTol,
+            invalidRange=invalidRange,
+        )
+
+    def getOutOfBoundsAngleListFromArrays(
+        self,
+        vertexArrays,
+        angle,
+        exactAngleMatch=False,
+        angTol=0.1,
+        invalidRange=None,
+        ignoredFeatures=None,
+    ):
+        """
+        Same as getOutOfBoundsAngleList, over already read vertex arrays.
+        :param ignoredFeatures: (np.array) boolean mask over
+            vertexArrays.featureIds of features that must not be flagged.
+        """
+        vertexIndexes, angles, rings = vertexArrays.vertexAngles()
+        isPolygon = vertexArrays.ringType[rings] == POLYGON_RING
+        outOfBounds = (
+            np.where(
+                isPolygon,
+                ~isClose(angles, angle, absTol=angTol),
+                angles < angle,
+            )
+            if exactAngleMatch
+            else angles < angle
+        )
+        if invalidRange is not None:
+            minAngle, maxAngle = invalidRange
+            outOfBounds |= (angles >= minAngle) & (angles <= maxAngle)
+        if ignoredFeatures is not None:
+            outOfBounds &= ~ignoredFeatures[vertexArrays.ringFeature[rings]]
+        vertexIndexes, angles = vertexIndexes[outOfBounds], angles[outOfBounds]
+        featIds = vertexArrays.vertexFeatureIds(vertexIndexes)
+        return [
+            {
+                "angle": float(vertexAngle),
+                "feat_id": int(featId),
+                "geom": QgsGeometry.fromPointXY(QgsPointXY(x, y)),
+            }
+            for vertexAngle, featId, (x, y) in zip(
+                angles, featIds, vertexArrays.xy[vertexIndexes]
+            )
+        ]
+
+    def getInvalidBuildingAngleList(
+        self, featureIterable, angTol, ignoreCircles=False, feedback=None
+    ):
+        """
+        Vectorized version of getInvalidBuildingAngle over a set of features.
+        :param ignoreCircles: (bool) if True, features whose isoperimetric
+            ratio is close to the one of a circle are not flagged.
+        """
+        vertexArrays = self.getVertexArrays(featureIterable, feedback=feedback)
+        ignoredFeatures = None
+        if ignoreCircles:
+            perimeters = vertexArrays.featureLengths()
+            areas = vertexArrays.featureAreas()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ignoredFeatures = (areas > 0) & (
+                    perimeters * perimeters / (4 * math.pi) / areas < 1.1
+                )
+        return self.getOutOfBoundsAngleListFromArrays(
+            vertexArrays,
+            90,
+            exactAngleMatch=True,
+            angTol=angTol,
+            ignoredFeatures=ignoredFeatures,
+        )
+
+    def getZAngleList(self, featureIterable, angle, feedback=None):
+        """
+        Finds z shapes inside each feature: sequences of four consecutive
+        vertices whose two turns are both sharper than angle (see
+        getZAngleDictList). Windows do not cross parts and go around polygon
+        rings.
+        :param featureIterable: (iterable-of-QgsFeature) features to be checked;
+        :param angle: (float) angle, in degrees;
+        :param feedback: (QgsFeedback) used to cancel the vertex reading;
+        :return: (list-of-dict) dicts with the keys feat_id and geom (line
+            built with the four vertices).
+        """
+        vertexArrays = self.getVertexArrays(featureIterable, feedback=feedback)
+        return self.getZAngleDictList(
+            vertexArrays, vertexArrays.getWindowIndexes(4), angle
+        )
+
+    def getZAngleBetweenLinesList(
+        self, featureIterable, angle, tolerance=None, feedback=None
+    ):
+        """
+        Finds z shapes formed across lines: sequences of four consecutive
+        vertices that go from a line into the one that starts where it ends
+        (see VertexArrays.getJunctionWindowIndexes).
+        :param featureIterable: (iterable-of-QgsFeature) line features;
+        :param angle: (float) angle, in degrees;
+        :param tolerance: (float) size of the grid endpoints are snapped to
+            when they are compared;
+        :param feedback: (QgsFeedback) used to cancel the vertex reading;
+        :return: (list-of-dict) dicts with the keys feat_id (feature of the
+            first vertex) and geom (line built with the four vertices).
+        """
+        vertexArrays = self.getVertexArrays(featureIterable, feedback=feedback)
+        windows = vertexArrays.getJunctionWindowIndexes(
+            DEFAULT_TOLERANCE if tolerance is None else tolerance
+        )
+        return self.getZAngleDictList(vertexArrays, windows, angle)
+
+    def getZAngleDictList(self, vertexArrays, windows, angle):
+        """
+        Keeps the windows of four vertices whose turns, measured with
+        anglesBetweenThreePoints, satisfy (angle1 > angle and angle2 < 360 -
+        angle) or (angle1 < 360 - angle and angle2 > angle).
+        :param vertexArrays: (VertexArrays) vertices;
+        :param windows: (np.array) (k, 4) vertex indexes;
+        :param angle: (float) angle, in degrees;
+        :return: (list-of-dict) dicts with the keys feat_id and geom.
+        """
+        p1, p2, p3, p4 = (vertexArrays.xy[windows[:, i]] for i in range(4))
+        angle1 = anglesBetweenThreePoints(p1, p2, p3)
+        angle2 = anglesBetweenThreePoints(p2, p3, p4)
+        isZ = ((angle1 > angle) & (angle2 < 360 - angle)) | (
+            (angle1 < 360 - angle) & (angle2 > angle)
+        )
+        windows = windows[isZ]
+        featIds = vertexArrays.vertexFeatureIds(windows[:, 0])
+        return [
+            {
+                "feat_id": int(featId),
+                "geom": QgsGeometry.fromPolylineXY(
+                    [QgsPointXY(x, y) for x, y in vertexArrays.xy[window]]
+                ),
+            }
+            for featId, window in zip(featIds, windows)
+        ]
+
+    def getLargeVertexDensityDict(self, featureIterable, searchRadius, feedback=None):
+        """
+        Finds vertices that have another vertex of the same ring closer than
+        searchRadius.
+        :param featureIterable: (iterable-of-QgsFeature) features to be checked;
+        :param searchRadius: (float) search radius;
+        :param feedback: (QgsFeedback) used to cancel the vertex reading;
+        :return: (dict) feature id -> list of flagged vertices (QgsGeometry).
+        """
+        vertexArrays = self.getVertexArrays(featureIterable, feedback=feedback)
+        firstVertexes, secondVertexes = vertexArrays.findCloseVertexPairs(searchRadius)
+        flaggedVertexes = np.concatenate([firstVertexes, secondVertexes])
+        featIds = vertexArrays.vertexFeatureIds(flaggedVertexes)
+        flagDict = defaultdict(list)
+        flaggedSet = set()
+        for featId, (x, y) in zip(featIds, vertexArrays.xy[flaggedVertexes]):
+            if (featId, x, y) in flaggedSet:
+                continue
+            flaggedSet.add((featId, x, y))
+            flagDict[int(featId)].append(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+        return flagDict
+
     def handleGeometry(self, geom, parameterDict={}, coordinateTransformer=None):
         outputList = []
         for geom in self.adjustGeometry(geom, parameterDict):
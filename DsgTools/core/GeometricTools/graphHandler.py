@@ -34,6 +34,7 @@ from qgis.core import (
     QgsVectorLayer,
     QgsFeedback,
     QgsProcessingContext,
+    QgsSpatialIndex,
     QgsWkbTypes,
 )
 
@@ -228,22 +229,56 @@ def buildAuxStructures(
         By default, the function uses the Well-Known Binary (WKB) representation for node geometries.
         If the useWkt parameter is set to True, the function will use Well-Known Text (WKT) representation instead.
     """
+    return buildAuxStructuresFromFeatures(
+        nx,
+        nodeFeatures=nodesLayer.getFeatures(),
+        edgeFeatures=edgesLayer.getFeatures(),
+        nodeCount=nodesLayer.featureCount(),
+        feedback=feedback,
+        graphType=graphType,
+        useWkt=useWkt,
+        computeNodeLayerIdDict=computeNodeLayerIdDict,
+        addEdgeLength=addEdgeLength,
+    )
+
+
+def buildAuxStructuresFromFeatures(
+    nx: Any,
+    nodeFeatures: Iterable[QgsFeature],
+    edgeFeatures: Iterable[QgsFeature],
+    nodeCount: int,
+    feedback: Optional[QgsFeedback] = None,
+    graphType: Optional[GraphType] = 0,
+    useWkt: Optional[bool] = False,
+    computeNodeLayerIdDict: Optional[bool] = False,
+    addEdgeLength: Optional[bool] = False,
+):
+    """
+    Same as buildAuxStructures, but reads the nodes and the edges from
+    feature iterables, so that features already loaded in memory (e.g. the
+    features of a region of a partition) can be used without building
+    layers.
+
+    Args:
+        nodeFeatures: Node features, with the featid, vertex_pos and nfeatid fields.
+        edgeFeatures: Edge features, with the featid field.
+        nodeCount: Number of node features, used to report progress.
+    """
     multiStepFeedback = (
         QgsProcessingMultiStepFeedback(3, feedback) if feedback is not None else None
     )
     if multiStepFeedback is not None:
         multiStepFeedback.setCurrentStep(0)
-    edgeDict = {feat["featid"]: feat for feat in edgesLayer.getFeatures()}
+    edgeDict = {feat["featid"]: feat for feat in edgeFeatures}
     if multiStepFeedback is not None:
         multiStepFeedback.setCurrentStep(1)
     nodeDict = defaultdict(list)
     nodeIdDict = defaultdict(list)
-    nodeCount = nodesLayer.featureCount()
-    stepSize = 100 / nodeCount
+    stepSize = 100 / nodeCount if nodeCount else 0
     auxId = 0
     hashDict = defaultdict(lambda: [[], []])
     nodeLayerIdDict = dict()
-    for current, nodeFeat in enumerate(nodesLayer.getFeatures()):
+    for current, nodeFeat in enumerate(nodeFeatures):
         if multiStepFeedback is not None and multiStepFeedback.isCanceled():
             break
         geom = nodeFeat.geometry()
@@ -1242,6 +1277,74 @@ def find_constraint_points(
     return constraintSet
 
 
+def get_in_and_out_nodes_outside_geometry(
+    nodeDict: Dict[QByteArray, int],
+    nodeFeatures: Iterable[QgsFeature],
+    boundsGeom: QgsGeometry,
+    feedback: Optional[QgsFeedback] = None,
+) -> Tuple[Set[int], Set[int]]:
+    """
+    Same as getInAndOutNodesOnGeographicBounds, but tests node features
+    already loaded in memory against a single bounds geometry, without
+    building intermediate layers.
+
+    Returns:
+        A tuple (fixedInNodeSet, fixedOutNodeSet) with the ids of the first
+        and last nodes that are disjoint from boundsGeom.
+    """
+    engine = QgsGeometry.createGeometryEngine(boundsGeom.constGet())
+    engine.prepareGeometry()
+    fixedInNodeSet, fixedOutNodeSet = set(), set()
+    for nodeFeat in nodeFeatures:
+        if feedback is not None and feedback.isCanceled():
+            break
+        geom = nodeFeat.geometry()
+        if engine.intersects(geom.constGet()):
+            continue
+        selectedSet = fixedInNodeSet if nodeFeat["vertex_pos"] == 0 else fixedOutNodeSet
+        selectedSet.add(nodeDict[geom.asWkb()])
+    return fixedInNodeSet, fixedOutNodeSet
+
+
+def find_constraint_points_from_features(
+    nodeFeatures: Iterable[QgsFeature],
+    constraintGeoms: Iterable[QgsGeometry],
+    nodeDict: Dict[QByteArray, int],
+    nodeLayerIdDict: Dict[int, Dict[int, QByteArray]],
+    feedback: Optional[QgsFeedback] = None,
+) -> Set[int]:
+    """
+    Same as find_constraint_points without buffer, but relates node features
+    and constraint geometries already loaded in memory using a spatial index
+    built over the nodes. Point constraints must be equal to the node, while
+    line and polygon constraints must intersect it.
+    """
+    nodeIndex = QgsSpatialIndex()
+    nodeGeomDict = dict()
+    for nodeFeat in nodeFeatures:
+        geom = nodeFeat.geometry()
+        nodeGeomDict[nodeFeat["nfeatid"]] = geom
+        nodeIndex.addFeature(nodeFeat["nfeatid"], geom.boundingBox())
+    constraintSet = set()
+    for constraintGeom in constraintGeoms:
+        if feedback is not None and feedback.isCanceled():
+            break
+        candidateList = nodeIndex.intersects(constraintGeom.boundingBox())
+        if candidateList == []:
+            continue
+        isPoint = constraintGeom.type() == QgsWkbTypes.PointGeometry
+        engine = QgsGeometry.createGeometryEngine(constraintGeom.constGet())
+        engine.prepareGeometry()
+        for nfeatid in candidateList:
+            nodeGeom = nodeGeomDict[nfeatid]
+            if isPoint and not constraintGeom.isGeosEqual(nodeGeom):
+                continue
+            if not isPoint and not engine.intersects(nodeGeom.constGet()):
+                continue
+            constraintSet.add(nodeDict[nodeLayerIdDict[nfeatid]])
+    return constraintSet
+
+
 def generalize_edges_according_to_degrees(
     G,
     constraintSet: Set[int],
@@ -1324,3 +1427,125 @@ def find_small_closed_line_groups(
         if feedback is not None:
             feedback.setProgress(current * stepSize)
     return idsToRemove
+
+
+def find_directed_loops(
+    nx,
+    G,
+    idField: Optional[str] = "featid",
+    feedback: Optional[QgsFeedback] = None,
+) -> List[List[int]]:
+    """
+    Finds the directed loops of a network whose edges are the lines of a
+    layer, keyed by their first and last nodes.
+
+    Args:
+        nx: NetworkX library instance or module.
+        G: A MultiDiGraph with one edge per line, from its first to its last node.
+        idField: Name of the edge attribute with the feature id.
+        feedback: An optional object for providing feedback during processing.
+
+    Returns:
+        A list of loops, each one being the list of the ids of its lines in
+        flow order.
+
+    Notes:
+        Every loop lies inside a single strongly connected component, so the
+        components are computed first, in linear time, and the cycles are only
+        searched on the components with more than one node or with a self loop.
+        Parallel lines between the same pair of nodes give one loop each.
+    """
+    loopList = []
+    componentList = [
+        component
+        for component in nx.strongly_connected_components(G)
+        if len(component) > 1 or any(G.has_edge(n, n) for n in component)
+    ]
+    nComponents = len(componentList)
+    if nComponents == 0:
+        return loopList
+    stepSize = 100 / nComponents
+    for current, component in enumerate(componentList):
+        if feedback is not None and feedback.isCanceled():
+            break
+        subGraph = G.subgraph(component)
+        for cycle in nx.simple_cycles(subGraph):
+            if feedback is not None and feedback.isCanceled():
+                break
+            pairs = list(zip(cycle, cycle[1:] + cycle[:1]))
+            for idTuple in product(
+                *(
+                    [data[idField] for data in G.get_edge_data(a, b).values()]
+                    for a, b in pairs
+                )
+            ):
+                loopList.append(list(idTuple))
+        if feedback is not None:
+            feedback.setProgress(current * stepSize)
+    return loopList
+
+
+def buildPolygonAdjacencyGraph(
+    nx,
+    featDict: Dict[int, QgsFeature],
+    candidateIdSet: Set[int],
+    feedback: Optional[QgsFeedback] = None,
+) -> Any:
+    """
+    Builds the adjacency graph of the candidate polygons.
+
+    Args:
+        nx: NetworkX library instance or module.
+        featDict: A dictionary mapping feature id to polygon feature, with
+                  every polygon that may be adjacent to a candidate.
+        candidateIdSet: The ids of the polygons whose neighbours are searched.
+        feedback: An optional object for providing feedback during processing.
+
+    Returns:
+        An undirected graph with an edge between each candidate and each
+        polygon whose boundary shares a stretch with it. The edge attribute
+        length holds the length of the neighbour boundary that lies on the
+        candidate.
+
+    Notes:
+        A single in-memory spatial index of featDict is used. The boundary of
+        each polygon is computed at most once.
+    """
+    G = nx.Graph()
+    nCandidates = len(candidateIdSet)
+    if nCandidates == 0:
+        return G
+    spatialIndex = QgsSpatialIndex()
+    for featId, feat in featDict.items():
+        if feat.hasGeometry():
+            spatialIndex.addFeature(featId, feat.geometry().boundingBox())
+    boundaryDict = dict()
+
+    def getBoundary(featId):
+        if featId not in boundaryDict:
+            boundaryDict[featId] = featDict[featId].geometry().constGet().boundary()
+        return boundaryDict[featId]
+
+    stepSize = 100 / nCandidates
+    for current, featId in enumerate(candidateIdSet):
+        if feedback is not None and feedback.isCanceled():
+            break
+        geom = featDict[featId].geometry()
+        if geom.isEmpty():
+            continue
+        geomEngine = QgsGeometry.createGeometryEngine(geom.constGet())
+        geomEngine.prepareGeometry()
+        for candidateId in spatialIndex.intersects(geom.boundingBox()):
+            if candidateId == featId or G.has_edge(featId, candidateId):
+                continue
+            candidateGeom = featDict[candidateId].geometry()
+            if not geomEngine.intersects(candidateGeom.constGet()):
+                continue
+            sharedBoundary = geomEngine.intersection(getBoundary(candidateId))
+            length = sharedBoundary.length() if sharedBoundary is not None else 0
+            if length <= 0:
+                continue
+            G.add_edge(featId, candidateId, length=length)
+        if feedback is not None:
+            feedback.setProgress(current * stepSize)
+    return G
@@ -490,9 +490,8 @@ class LayerHandler(QObject):
         nSteps = len(inputDict)
         if nSteps == 0 or feedback.isCanceled():
             return
-        lyr.startEditing()
-        lyr.beginEditCommand("Updating layer {0}".format(lyr.name()))
         localTotal = 100 / len(inputDict) if inputDict else 0
+        geometryDict = dict()
         futures = set()
         pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() - 1)
         multiStepFeedback = (
@@ -530,7 +529,6 @@ class LayerHandler(QObject):
             multiStepFeedback.pushInfo(self.tr("Submitting tasks to thread..."))
         for current, (id_, featDict) in enumerate(inputDict.items()):
             if multiStepFeedback is not None and multiStepFeedback.isCanceled():
-                lyr.endEditCommand()
                 pool.shutdown(wait=False)
                 return
             futures.add(pool.submit(evaluate, id_, featDict))
@@ -539,17 +537,13 @@ class LayerHandler(QObject):
         if multiStepFeedback is not None:
             multiStepFeedback.setCurrentStep(1)
             multiStepFeedback.pushInfo(self.tr("Evaluating results..."))
-        changeGeometryLambda = lambda x: lyr.changeGeometry(
-            x[0], x[1], skipDefaultValue=True
-        )
         concurrent.futures.wait(futures, return_when=concurrent.futures.ALL_COMPLETED)
         for current, future in enumerate(concurrent.futures.as_completed(futures)):
             if multiStepFeedback is not None and multiStepFeedback.isCanceled():
-                lyr.endEditCommand()
                 pool.shutdown(wait=False)
                 return
             deletedIds, addedFeatures, geometriesToChange = future.result()
-            list(map(changeGeometryLambda, geometriesToChange))
+            geometryDict.update(geometriesToChange)
             featuresToAdd = featuresToAdd.union(addedFeatures)
             idsToRemove = idsToRemove.union(deletedIds)
             if current % 1000 == 0 and multiStepFeedback is not None:
@@ -558,10 +552,134 @@ class LayerHandler(QObject):
                 )
             if multiStepFeedback is not None:
                 multiStepFeedback.setProgress(localTotal * current)
-        lyr.addFeatures(list(featuresToAdd))
-        if not keepFeatures:
-            lyr.deleteFeatures(list(idsToRemove))
+        self.applyBulkEdits(
+            lyr,
+            geometryDict=geometryDict,
+            featuresToAdd=featuresToAdd,
+            idsToDelete=idsToRemove if not keepFeatures else None,
+            commandName="Updating layer {0}".format(lyr.name()),
+            skipDefaultValue=True,
+        )
+
+    def applyBulkEdits(
+        self,
+        lyr,
+        geometryDict=None,
+        attributeDict=None,
+        featuresToAdd=None,
+        idsToDelete=None,
+        commandName=None,
+        preferProvider=False,
+        skipDefaultValue=False,
+    ):
+        """
+        Applies a batch of changes to lyr at once. By default the changes go
+        to the edit buffer as a single edit command: each feature is still
+        changed on its own, as undo needs one buffered change per feature,
+        but the whole batch is undone in one step and is sent to the provider
+        with one batch call per kind of change on commit. When preferProvider
+        is True and lyr is not being edited, the changes are written straight
+        to the provider with batch calls, which skips the buffer memory but
+        leaves nothing to undo. The calls (changes, additions, deletions) are
+        not wrapped in a transaction, so a failing call leaves the previous
+        ones written. Callers should only ask for it when they would commit
+        the changes anyway.
+        :param lyr: (QgsVectorLayer) layer to be updated;
+        :param geometryDict: (dict) feature id -> new QgsGeometry;
+        :param attributeDict: (dict) feature id -> {attribute index: value};
+        :param featuresToAdd: (iterable) QgsFeatures to be added;
+        :param idsToDelete: (iterable) ids of the features to be deleted;
+        :param commandName: (str) name of the edit command;
+        :param preferProvider: (bool) whether changes are written on the
+            provider when lyr is not being edited;
+        :param skipDefaultValue: (bool) whether default values on update are
+            not evaluated for geometry changes on the edit buffer;
+        :return: (bool) True if the changes were written on the provider.
+        """
+        geometryDict = dict() if geometryDict is None else geometryDict
+        attributeDict = dict() if attributeDict is None else attributeDict
+        featuresToAdd = [] if featuresToAdd is None else list(featuresToAdd)
+        idsToDelete = [] if idsToDelete is None else list(idsToDelete)
+        if not (geometryDict or attributeDict or featuresToAdd or idsToDelete):
+            return False
+        if preferProvider and not lyr.isEditable():
+            if self.applyBulkEditsOnProvider(
+                lyr, geometryDict, attributeDict, featuresToAdd, idsToDelete
+            ):
+                return True
+        lyr.startEditing()
+        lyr.beginEditCommand(
+            commandName
+            if commandName is not None
+            else self.tr("Updating layer {0}").format(lyr.name())
+        )
+        try:
+            for featId, geom in geometryDict.items():
+                lyr.changeGeometry(featId, geom, skipDefaultValue=skipDefaultValue)
+            for featId, attrMap in attributeDict.items():
+                lyr.changeAttributeValues(featId, attrMap)
+            if featuresToAdd:
+                lyr.addFeatures(featuresToAdd)
+            if idsToDelete:
+                lyr.deleteFeatures(idsToDelete)
+        except Exception:
+            lyr.destroyEditCommand()
+            raise
         lyr.endEditCommand()
+        return False
+
+    def applyBulkEditsOnProvider(
+        self, lyr, geometryDict, attributeDict, featuresToAdd, idsToDelete
+    ):
+        """
+        Writes the changes with provider batch calls, if the provider
+        supports every kind of change requested. Each call is written on
+        its own: an exception raised by a later call does not revert the
+        earlier ones.
+        :return: (bool) True if the changes were written.
+        """
+        provider = lyr.dataProvider()
+        capabilities = provider.capabilities()
+        for isRequested, capability in (
+            (geometryDict, QgsVectorDataProvider.ChangeGeometries),
+            (attributeDict, QgsVectorDataProvider.ChangeAttributeValues),
+            (featuresToAdd, QgsVectorDataProvider.AddFeatures),
+            (idsToDelete, QgsVectorDataProvider.DeleteFeatures),
+        ):
+            if isRequested and not capabilities & capability:
+                return False
+        # joined and virtual fields are only known by the layer
+        providerFieldCount = provider.fields().count()
+        if (featuresToAdd and lyr.fields().count() != providerFieldCount) or any(
+            idx >= providerFieldCount
+            for attrMap in attributeDict.values()
+            for idx in attrMap
+        ):
+            return False
+        if geometryDict or attributeDict:
+            if not provider.changeFeatures(attributeDict, geometryDict):
+                raise Exception(
+                    self.tr("Error updating features of layer {0}: {1}").format(
+                        lyr.name(), "; ".join(provider.errors())
+                    )
+                )
+        if featuresToAdd:
+            ok, _ = provider.addFeatures(featuresToAdd)
+            if not ok:
+                raise Exception(
+                    self.tr("Error adding features to layer {0}: {1}").format(
+                        lyr.name(), "; ".join(provider.errors())
+                    )
+                )
+        if idsToDelete and not provider.deleteFeatures(idsToDelete):
+            raise Exception(
+                self.tr("Error deleting features of layer {0}: {1}").format(
+                    lyr.name(), "; ".join(provider.errors())
+                )
+            )
+        lyr.reload()
+        lyr.triggerRepaint()
+        return True
 
     def mergeLinesOnLayer(
         self,
@@ -1212,8 +1330,7 @@ class LayerHandler(QObject):
             return
         size = 100 / featCount
         deleteSet = set()
-        inputLyr.startEditing()
-        inputLyr.beginEditCommand("Snapping Features")
+        geometryDict = dict()
 
         def evaluate(feat):
             if feedback is not None and feedback.isCanceled():
@@ -1257,11 +1374,15 @@ class LayerHandler(QObject):
                 deleteSet.add(result)
                 continue
             featid, outputGeom = result
-            inputLyr.changeGeometry(featid, outputGeom)
+            geometryDict[featid] = outputGeom
             if multiStepFeedback is not None:
                 multiStepFeedback.setProgress(size * current)
-        inputLyr.deleteFeatures(list(deleteSet))
-        inputLyr.endEditCommand()
+        self.applyBulkEdits(
+            inputLyr,
+            geometryDict=geometryDict,
+            idsToDelete=deleteSet,
+            commandName="Snapping Features",
+        )
 
     def getContourLineOutOfThreshold(
         self, contourLyr, terrainPolygonLyr, threshold, refLyr=None, feedback=None
@@ -3148,6 +3269,81 @@ class LayerHandler(QObject):
                 feedback.setProgress(current * stepSize)
         return layerList
 
+    def buildFeatureCache(self, layer, feedback=None):
+        """
+        Reads the layer once, keeping its features in memory along with a
+        spatial index of their bounding boxes.
+        :param layer: (QgsVectorLayer) input layer;
+        :param feedback: (QgsFeedback) optional feedback;
+        :return: (tuple) (featDict, spatialIndex), featDict maps feature ids
+            to QgsFeature.
+        """
+        featDict = dict()
+        spatialIndex = QgsSpatialIndex()
+        nFeats = layer.featureCount()
+        stepSize = 100 / nFeats if nFeats else 0
+        for current, feat in enumerate(layer.getFeatures()):
+            if feedback is not None and feedback.isCanceled():
+                break
+            featDict[feat.id()] = feat
+            if feat.hasGeometry():
+                spatialIndex.addFeature(feat.id(), feat.geometry().boundingBox())
+            if feedback is not None:
+                feedback.setProgress(current * stepSize)
+        return featDict, spatialIndex
+
+    def buildRegionPartition(self, regionLayer, layerDict, feedback=None):
+        """
+        Partitions the input layers by the features of regionLayer without
+        copying them. Each input is read and indexed once, and each region
+        gets a view with the ids of the features that intersect it, so that
+        regional workers read the shared features instead of extracting a
+        layer for each region and input.
+        :param regionLayer: (QgsVectorLayer) layer whose features are the
+            regions;
+        :param layerDict: (dict) {key: QgsVectorLayer} of the inputs;
+        :param feedback: (QgsFeedback) optional feedback;
+        :return: (tuple) (featureCacheDict, viewList), featureCacheDict maps
+            each key to {feature id: QgsFeature} and viewList has a dict
+            {"region": QgsFeature, key: set of feature ids} for each region.
+        """
+        multiStepFeedback = (
+            QgsProcessingMultiStepFeedback(len(layerDict) + 1, feedback)
+            if feedback is not None
+            else None
+        )
+        featureCacheDict, indexDict = dict(), dict()
+        for currentStep, (key, layer) in enumerate(layerDict.items()):
+            if multiStepFeedback is not None:
+                if multiStepFeedback.isCanceled():
+                    return featureCacheDict, []
+                multiStepFeedback.setCurrentStep(currentStep)
+            featureCacheDict[key], indexDict[key] = self.buildFeatureCache(
+                layer, feedback=multiStepFeedback
+            )
+        if multiStepFeedback is not None:
+            multiStepFeedback.setCurrentStep(len(layerDict))
+        viewList = []
+        nRegions = regionLayer.featureCount()
+        stepSize = 100 / nRegions if nRegions else 0
+        for current, regionFeat in enumerate(regionLayer.getFeatures()):
+            if multiStepFeedback is not None and multiStepFeedback.isCanceled():
+                break
+            regionGeom = regionFeat.geometry()
+            engine = QgsGeometry.createGeometryEngine(regionGeom.constGet())
+            engine.prepareGeometry()
+            view = {"region": regionFeat}
+            for key, featDict in featureCacheDict.items():
+                view[key] = set(
+                    featId
+                    for featId in indexDict[key].intersects(regionGeom.boundingBox())
+                    if engine.intersects(featDict[featId].geometry().constGet())
+                )
+            viewList.append(view)
+            if multiStepFeedback is not None:
+                multiStepFeedback.setProgress(current * stepSize)
+        return featureCacheDict, viewList
+
     def createMemoryLayerWithFeature(self, layer, feat, context=None, isSource=False):
         context = QgsProcessingContext() if context is None else context
         crs = layer.crs() if not isSource else layer.sourceCrs()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+"""
+Pure geometry kernel of the polygon split by grid: grid spacing and cells
+of a bounding box and nearest point queries, computed on arrays.
+
+This module does not depend on qgis, so that it can be tested on its own.
+"""
+import math
+
+import numpy as np
+
+# size of the distance matrices computed at once by findNearestIndexes
+MAX_DISTANCE_MATRIX_SIZE = 2**22
+
+
+def getGridSpacing(extent, xDistance, yDistance):
+    """
+    Spacing of the grid used to split a polygon. Polygons narrower than the
+    distances are split into cells of half their smaller side.
+    :param extent: (tuple) (xmin, ymin, xmax, ymax) of the polygon;
+    :param xDistance: (float) horizontal distance between grid lines;
+    :param yDistance: (float) vertical distance between grid lines;
+    :return: (tuple) (xSpacing, ySpacing).
+    """
+    xmin, ymin, xmax, ymax = extent
+    width, height = abs(xmax - xmin), abs(ymax - ymin)
+    halfSide = min(width / 2, height / 2)
+    return (
+        xDistance if width > xDistance else halfSide,
+        yDistance if height > yDistance else halfSide,
+    )
+
+
+def getGridCells(extent, xSpacing, ySpacing):
+    """
+    Cells of a regular grid that covers extent, from its top left corner,
+    as the create grid algorithm builds them. The last row and column may
+    go past the extent.
+    :param extent: (tuple) (xmin, ymin, xmax, ymax);
+    :param xSpacing: (float) cell width;
+    :param ySpacing: (float) cell height;
+    :return: (np.array) (n, 4) array of (xmin, ymin, xmax, ymax) cells,
+        ordered by row, then by column.
+    """
+    if xSpacing <= 0 or ySpacing <= 0:
+        raise ValueError("Grid spacing must be positive.")
+    xmin, ymin, xmax, ymax = extent
+    nCols = max(1, int(math.ceil((xmax - xmin) / xSpacing)))
+    nRows = max(1, int(math.ceil((ymax - ymin) / ySpacing)))
+    left = np.tile(xmin + xSpacing * np.arange(nCols), nRows)
+    top = np.repeat(ymax - ySpacing * np.arange(nRows), nCols)
+    return np.column_stack([left, top - ySpacing, left + xSpacing, top])
+
+
+def findNearestIndexes(points, candidates):
+    """
+    :param points: (np.array) (n, 2) query points;
+    :param candidates: (np.array) (m, 2) candidate points, m > 0;
+    :return: (np.array) index of the candidate nearest to each point, the
+        lowest one on ties.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    candidates = np.asarray(candidates, dtype=np.float64).reshape(-1, 2)
+    nearest = np.empty(len(points), dtype=np.int64)
+    chunkSize = max(1, MAX_DISTANCE_MATRIX_SIZE // max(1, len(candidates)))
+    for start in range(0, len(points), chunkSize):
+        delta = points[start : start + chunkSize, np.newaxis, :] - candidates
+        nearest[start : start + chunkSize] = np.argmin(
+            np.einsum("ijk,ijk->ij", delta, delta), axis=1
+        )
+    return nearest
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import math
+
+from qgis.core import (
+    QgsDataSourceUri,
+    QgsGeometry,
+    QgsProviderConnectionException,
+    QgsProviderRegistry,
+)
+from qgis.PyQt.Qt import QObject, QVariant
+
+from DsgTools.core.Utils.threadingTools import concurrently
+
+
+class PostgisValidationHandler(QObject):
+    """
+    Runs geometry validations of PostGIS layers as set based SQL on the
+    server, so that only the flagged ids and geometries are transferred.
+    Tables larger than chunkSize are split into primary key ranges that are
+    queried in parallel, each on its own connection.
+    """
+
+    def __init__(self, maxConcurrency=4, chunkSize=100000, parent=None):
+        super(PostgisValidationHandler, self).__init__(parent)
+        self.maxConcurrency = maxConcurrency
+        self.chunkSize = chunkSize
+
+    def canRunOnServer(self, lyr, onlySelected=False):
+        """
+        Server side checks only see what is stored on the database, therefore
+        they are used only on whole PostGIS layers without pending edits and
+        with a single integer primary key.
+        :param lyr: (QgsVectorLayer) input layer;
+        :param onlySelected: (bool) whether only selected features are checked;
+        :return: (bool)
+        """
+        if onlySelected or lyr is None or lyr.providerType() != "postgres":
+            return False
+        if lyr.isModified():
+            return False
+        uri = QgsDataSourceUri(lyr.source())
+        keyColumn = uri.keyColumn().strip('"')
+        if "," in keyColumn or uri.geometryColumn() == "" or uri.table() == "":
+            return False
+        keyIdx = lyr.fields().indexFromName(keyColumn)
+        return keyIdx >= 0 and lyr.fields().at(keyIdx).type() in (
+            QVariant.Int,
+            QVariant.LongLong,
+        )
+
+    @staticmethod
+    def quoteIdentifier(name):
+        return '"{0}"'.format(name.replace('"', '""'))
+
+    def getTableInfo(self, lyr):
+        """
+        :return: (dict) quoted table, geometry and key identifiers, the layer
+            subset string and its connection uri.
+        """
+        uri = QgsDataSourceUri(lyr.source())
+        return {
+            "uri": uri.uri(False),
+            "table": "{0}.{1}".format(
+                self.quoteIdentifier(uri.schema() or "public"),
+                self.quoteIdentifier(uri.table()),
+            ),
+            "geom": self.quoteIdentifier(uri.geometryColumn()),
+            "key": self.quoteIdentifier(uri.keyColumn().strip('"')),
+            "subset": lyr.subsetString(),
+        }
+
+    def executeSql(self, connectionUri, sql):
+        """
+        Runs sql on a new provider connection, so that it may be called from
+        worker threads.
+        """
+        try:
+            connection = (
+                QgsProviderRegistry.instance()
+                .providerMetadata("postgres")
+                .createConnection(connectionUri, {})
+            )
+            return connection.executeSql(sql)
+        except QgsProviderConnectionException as e:
+            raise Exception(self.tr("Problem running validation on server: ") + str(e))
+
+    def getWhereClause(self, tableInfo, predicate, keyRange=None):
+        clauseList = [predicate]
+        if tableInfo["subset"]:
+            clauseList.append("({0})".format(tableInfo["subset"]))
+        if keyRange is not None:
+            clauseList.append(
+                "{0} >= {1} and {0} < {2}".format(tableInfo["key"], *keyRange)
+            )
+        return " and ".join(clauseList)
+
+    def getKeyRanges(self, tableInfo):
+        """
+        Splits the primary key domain of the layer rows into ranges of about
+        chunkSize rows each.
+        :return: (list) list of (start, end) tuples, end being exclusive.
+        """
+        sql = (
+            "select min({key}), max({key}), count(*) from {table} where {where}".format(
+                key=tableInfo["key"],
+                table=tableInfo["table"],
+                where=self.getWhereClause(tableInfo, "true"),
+            )
+        )
+        rowList = self.executeSql(tableInfo["uri"], sql)
+        if not rowList or rowList[0][2] in (None, 0):
+            return []
+        minKey, maxKey, count = (int(value) for value in rowList[0])
+        nChunks = max(
+            1, min(int(math.ceil(count / self.chunkSize)), maxKey - minKey + 1)
+        )
+        step = int(math.ceil((maxKey - minKey + 1) / nChunks))
+        return [
+            (start, min(start + step, maxKey + 1))
+            for start in range(minKey, maxKey + 1, step)
+        ]
+
+    def runRowCheck(self, lyr, selectSql, predicate, feedback=None):
+        """
+        Runs a check that evaluates each row on its own, splitting the table
+        into key ranges queried concurrently.
+        :param lyr: (QgsVectorLayer) PostGIS layer;
+        :param selectSql: (str) select list, formatted with the keys of
+            getTableInfo;
+        :param predicate: (str) condition of the flagged rows, formatted with
+            the keys of getTableInfo;
+        :param feedback: (QgsFeedback) optional feedback;
+        :return: (list) rows of every range.
+        """
+        tableInfo = self.getTableInfo(lyr)
+        predicate = predicate.format(**tableInfo)
+        keyRangeList = self.getKeyRanges(tableInfo)
+        if keyRangeList == []:
+            return []
+
+        def query(keyRange):
+            if feedback is not None and feedback.isCanceled():
+                return []
+            sql = "select {select} from {table} where {where}".format(
+                select=selectSql.format(**tableInfo),
+                table=tableInfo["table"],
+                where=self.getWhereClause(tableInfo, predicate, keyRange),
+            )
+            return self.executeSql(tableInfo["uri"], sql)
+
+        rowList = []
+        nRanges = len(keyRangeList)
+        for current, rangeRowList in enumerate(
+            concurrently(
+                query,
+                keyRangeList,
+                max_concurrency=self.maxConcurrency,
+                feedback=feedback,
+            )
+        ):
+            rowList += rangeRowList
+            if feedback is not None:
+                feedback.setProgress(100 * (current + 1) / nRanges)
+        return rowList
+
+    @staticmethod
+    def geometryFromHex(wkbHex):
+        geom = QgsGeometry()
+        if wkbHex:
+            geom.fromWkb(bytes.fromhex(wkbHex))
+        return geom
+
+    def getMeasureFlags(self, lyr, measureFunction, tol, feedback=None):
+        """
+        :return: (list) list of (featid, measure, QgsGeometry) of the features
+            whose measure is lesser than tol. Null geometries are measured as
+            zero, as on the client side checks.
+        """
+        measure = "coalesce({0}({{geom}}), 0)".format(measureFunction)
+        rowList = self.runRowCheck(
+            lyr,
+            "{{key}}, {0}, encode(ST_AsBinary({{geom}}), 'hex')".format(measure),
+            "{0} < {1!r}".format(measure, float(tol)),
+            feedback=feedback,
+        )
+        return [
+            (featid, value, self.geometryFromHex(wkbHex))
+            for featid, value, wkbHex in sorted(rowList, key=lambda x: x[0])
+        ]
+
+    def getSmallLineFlags(self, lyr, tol, feedback=None):
+        return self.getMeasureFlags(lyr, "ST_Length", tol, feedback=feedback)
+
+    def getSmallPolygonFlags(self, lyr, tol, feedback=None):
+        return self.getMeasureFlags(lyr, "ST_Area", tol, feedback=feedback)
+
+    def getMultiPartFlags(self, lyr, feedback=None):
+        """
+        :return: (list) list of (featid, QgsGeometry) of multipart features.
+        """
+        rowList = self.runRowCheck(
+            lyr,
+            "{key}, encode(ST_AsBinary({geom}), 'hex')",
+            "ST_NumGeometries({geom}) > 1",
+            feedback=feedback,
+        )
+        return [
+            (featid, self.geometryFromHex(wkbHex))
+            for featid, wkbHex in sorted(rowList, key=lambda x: x[0])
+        ]
+
+    def getDuplicatedGeometryFlags(self, lyr, feedback=None):
+        """
+        Groups the features whose geometries are topologically equal. Each
+        group is led by its lowest key, that is found in a single self join
+        filtered by the spatial index.
+        :return: (list) list of (id list, QgsGeometry of the first feature).
+        """
+        tableInfo = self.getTableInfo(lyr)
+        subset = " and ({0})".format(tableInfo["subset"]) if tableInfo["subset"] else ""
+        sql = """with t as (
+            select {key} as featid, {geom} as geom from {table}
+            where {geom} is not null{subset}
+        ),
+        pairs as (
+            select min(a.featid) as leader, b.featid as member from t a
+            join t b on a.geom && b.geom and a.featid < b.featid
+            and ST_Equals(a.geom, b.geom)
+            group by b.featid
+        ),
+        groups as (
+            select leader, string_agg(member::text, ',' order by member) as members
+            from pairs group by leader
+        )
+        select groups.leader, groups.members, encode(ST_AsBinary(t.geom), 'hex')
+        from groups join t on t.featid = groups.leader
+        order by groups.leader""".format(
+            subset=subset, **tableInfo
+        )
+        if feedback is not None and feedback.isCanceled():
+            return []
+        return [
+            (
+                [leader] + [int(i) for i in memberCsv.split(",")],
+                self.geometryFromHex(wkbHex),
+            )
+            for leader, memberCsv, wkbHex in self.executeSql(tableInfo["uri"], sql)
+        ]
+
+    def hasNullOrEmptyGeometries(self, lyr):
+        tableInfo = self.getTableInfo(lyr)
+        sql = "select exists(select 1 from {table} where {where})".format(
+            table=tableInfo["table"],
+            where=self.getWhereClause(
+                tableInfo,
+                "({geom} is null or ST_IsEmpty({geom}))".format(**tableInfo),
+            ),
+        )
+        rowList = self.executeSql(tableInfo["uri"], sql)
+        return bool(rowList and rowList[0][0])
@@ -19,8 +19,9 @@
  *                                                                         *
  ***************************************************************************/
 """
+from collections import OrderedDict
 from itertools import product
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from DsgTools.core.GeometricTools.layerHandler import LayerHandler
@@ -35,12 +36,14 @@ from qgis.core import (
     QgsFields,
     QgsGeometry,
     QgsPoint,
+    QgsPointXY,
     QgsProcessingUtils,
     QgsProject,
     QgsRasterLayer,
     QgsVectorFileWriter,
     QgsVectorLayer,
     QgsProcessingContext,
+    QgsRaster,
 )
 
 
@@ -397,3 +400,155 @@ def polygonizeFromNumpyArray(npRaster, ds):
         context=QgsProcessingContext(),
     )
     return outputLyr
+
+
+class RasterBlockSampler(object):
+    """
+    Samples raster values on many points at once. The points are grouped by
+    the raster block they fall in and each block is read only once with
+    GDAL, so the cost depends on the number of blocks touched instead of on
+    the number of points. Blocks may be kept in memory between calls
+    (maxCachedBlocks), which helps tools that sample around the cursor.
+    """
+
+    def __init__(
+        self,
+        inputRaster: Union[str, QgsRasterLayer],
+        blockSize: int = 256,
+        maxCachedBlocks: int = 0,
+    ):
+        self.source = (
+            inputRaster.dataProvider().dataSourceUri()
+            if isinstance(inputRaster, QgsRasterLayer)
+            else inputRaster
+        )
+        try:
+            self.ds = gdal.Open(self.source)
+        except RuntimeError:
+            # raised instead of returning None when gdal.UseExceptions() was
+            # called elsewhere in the process (e.g. by the image tools)
+            self.ds = None
+        self.maxCachedBlocks = maxCachedBlocks
+        self.blockCache = OrderedDict()
+        if self.ds is None:
+            return
+        self.width, self.height = self.ds.RasterXSize, self.ds.RasterYSize
+        self.bandCount = self.ds.RasterCount
+        self.inverseTransform = ~getCoordinateTransform(self.ds)
+        # reads use the natural block of the first band, enlarged to at least
+        # blockSize so that striped rasters are not read one line at a time
+        naturalWidth, naturalHeight = self.ds.GetRasterBand(1).GetBlockSize()
+        self.blockWidth = min(max(naturalWidth, blockSize), self.width)
+        self.blockHeight = min(max(naturalHeight, blockSize), self.height)
+        self.nBlockCols = -(-self.width // self.blockWidth)
+
+    def isValid(self) -> bool:
+        return self.ds is not None and self.bandCount > 0
+
+    def getPixelIndexes(self, xyArray: np.array) -> Tuple[np.array, np.array]:
+        """
+        Converts terrain coordinates, on the raster crs, to pixel indexes.
+        :param xyArray: (np.array) array of shape (n, 2) with x, y coordinates;
+        :return: (tuple) arrays of column and row indexes.
+        """
+        t = self.inverseTransform
+        x, y = xyArray[:, 0], xyArray[:, 1]
+        cols = np.floor(t.a * x + t.b * y + t.c).astype(np.int64)
+        rows = np.floor(t.d * x + t.e * y + t.f).astype(np.int64)
+        return cols, rows
+
+    def readBlock(self, bandNumber: int, blockRow: int, blockCol: int) -> np.array:
+        key = (bandNumber, blockRow, blockCol)
+        if key in self.blockCache:
+            self.blockCache.move_to_end(key)
+            return self.blockCache[key]
+        xOff, yOff = blockCol * self.blockWidth, blockRow * self.blockHeight
+        band = self.ds.GetRasterBand(bandNumber)
+        block = band.ReadAsArray(
+            xOff,
+            yOff,
+            min(self.blockWidth, self.width - xOff),
+            min(self.blockHeight, self.height - yOff),
+        ).astype(float)
+        nodataValue = band.GetNoDataValue()
+        if nodataValue is not None:
+            block[block == nodataValue] = np.nan
+        block = block * (band.GetScale() or 1.0) + (band.GetOffset() or 0.0)
+        if self.maxCachedBlocks > 0:
+            self.blockCache[key] = block
+            if len(self.blockCache) > self.maxCachedBlocks:
+                self.blockCache.popitem(last=False)
+        return block
+
+    def sample(self, xyArray: np.array, bandList: List[int] = None) -> np.array:
+        """
+        Samples the raster on each point.
+        :param xyArray: (np.array) array of shape (n, 2) with the point
+            coordinates on the raster crs;
+        :param bandList: (list) band numbers to be sampled, all bands if None;
+        :return: (np.array) array of shape (n, number of bands) with the
+            pixel values. Nodata and points outside the raster are nan.
+        """
+        bandList = list(range(1, self.bandCount + 1)) if bandList is None else bandList
+        xyArray = np.asarray(xyArray, dtype=float).reshape(-1, 2)
+        values = np.full((xyArray.shape[0], len(bandList)), np.nan)
+        if not self.isValid() or xyArray.shape[0] == 0:
+            return values
+        cols, rows = self.getPixelIndexes(xyArray)
+        (pointIndexes,) = np.nonzero(
+            (cols >= 0) & (cols < self.width) & (rows >= 0) & (rows < self.height)
+        )
+        if pointIndexes.size == 0:
+            return values
+        cols, rows = cols[pointIndexes], rows[pointIndexes]
+        blockRows, blockCols = rows // self.blockHeight, cols // self.blockWidth
+        blockIds = blockRows * self.nBlockCols + blockCols
+        order = np.argsort(blockIds, kind="stable")
+        sortedIds = blockIds[order]
+        boundaries = np.flatnonzero(np.diff(sortedIds)) + 1
+        for group in np.split(order, boundaries):
+            blockRow, blockCol = int(blockRows[group[0]]), int(blockCols[group[0]])
+            localRows = rows[group] - blockRow * self.blockHeight
+            localCols = cols[group] - blockCol * self.blockWidth
+            for i, bandNumber in enumerate(bandList):
+                block = self.readBlock(bandNumber, blockRow, blockCol)
+                values[pointIndexes[group], i] = block[localRows, localCols]
+        return values
+
+
+def samplePixelValuesFromPointList(
+    rasterLayer: QgsRasterLayer,
+    pointList: List[QgsPointXY],
+    bandList: List[int] = None,
+    sampler: Optional[RasterBlockSampler] = None,
+) -> List[List[Optional[float]]]:
+    """
+    Returns the pixel values of each point (on the raster crs). Rasters that
+    GDAL cannot open (e.g. web services) are sampled through the provider
+    identify, one point at a time.
+    :param rasterLayer: (QgsRasterLayer) raster to be sampled;
+    :param pointList: (list-of-QgsPointXY) points on the raster crs;
+    :param bandList: (list) band numbers to be sampled, all bands if None;
+    :param sampler: (RasterBlockSampler) sampler to be reused, if any;
+    :return: (list) list of band values for each point, with None for nodata.
+    """
+    sampler = RasterBlockSampler(rasterLayer) if sampler is None else sampler
+    if not sampler.isValid():
+        outputList = []
+        for point in pointList:
+            identifyResult = rasterLayer.dataProvider().identify(
+                point, QgsRaster.IdentifyFormatValue
+            )
+            resultDict = identifyResult.results() if identifyResult.isValid() else {}
+            bandNumbers = (
+                range(1, rasterLayer.bandCount() + 1) if bandList is None else bandList
+            )
+            outputList.append([resultDict.get(band) for band in bandNumbers])
+        return outputList
+    values = sampler.sample(
+        np.array([(point.x(), point.y()) for point in pointList], dtype=float),
+        bandList=bandList,
+    )
+    return [
+        [None if np.isnan(value) else float(value) for value in row] for row in values
+    ]
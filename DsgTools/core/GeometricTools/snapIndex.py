@@ -0,0 +1,582 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+"""
+Incremental snapping engine. Reference geometries are kept in a single
+in-memory index of vertices and segments that grows as layers are
+processed, and each geometry is snapped to it in one pass: its vertices
+are moved to the reference within tolerance, the reference vertices that
+lie on its segments are inserted on it and the vertices moved onto the
+reference segments are inserted on the reference, so that both share the
+same vertices afterwards.
+
+Snap modes follow QgsGeometrySnapper.SnapMode.
+
+This module does not depend on qgis, geometries are read from and written
+to WKB.
+"""
+import math
+import struct
+from collections import defaultdict
+
+import numpy as np
+
+from .vertexArrays import WKB_LINESTRING, WKB_POINT, WKB_POLYGON
+
+PREFER_NODES = 0
+PREFER_CLOSEST = 1
+PREFER_NODES_NO_EXTRA_VERTICES = 2
+PREFER_CLOSEST_NO_EXTRA_VERTICES = 3
+END_POINT_PREFER_NODES = 4
+END_POINT_PREFER_CLOSEST = 5
+END_POINT_TO_END_POINT = 6
+EXTRA_VERTICES_MODES = (PREFER_NODES, PREFER_CLOSEST)
+PREFER_NODES_MODES = (
+    PREFER_NODES,
+    PREFER_NODES_NO_EXTRA_VERTICES,
+    END_POINT_PREFER_NODES,
+)
+END_POINT_MODES = (
+    END_POINT_PREFER_NODES,
+    END_POINT_PREFER_CLOSEST,
+    END_POINT_TO_END_POINT,
+)
+
+
+class PathGeometry(object):
+    """
+    Editable point, line or polygon geometry, single or multi part. parts is
+    a list of parts, each one a list of (n, d) float arrays: the point, the
+    line or the polygon rings, the latter keeping their closing vertex. The
+    first two columns are x and y, the others are z and m, when present.
+    """
+
+    def __init__(self, geometryType, isMulti, hasZ, hasM, parts):
+        self.geometryType = geometryType
+        self.isMulti = isMulti
+        self.hasZ = hasZ
+        self.hasM = hasM
+        self.parts = parts
+
+    @property
+    def dimension(self):
+        return 2 + self.hasZ + self.hasM
+
+    @staticmethod
+    def readHeader(wkb, pos):
+        endian = "<" if wkb[pos] == 1 else ">"
+        (wkbType,) = struct.unpack_from(endian + "I", wkb, pos + 1)
+        pos += 5
+        hasZ = bool(wkbType & 0x80000000)
+        hasM = bool(wkbType & 0x40000000)
+        if wkbType & 0x20000000:
+            # EWKB srid
+            pos += 4
+        flavour, wkbType = divmod(wkbType & 0x0FFFFFFF, 1000)
+        return (
+            endian,
+            wkbType,
+            hasZ or flavour in (1, 3),
+            hasM or flavour in (2, 3),
+            pos,
+        )
+
+    @classmethod
+    def fromWkb(cls, wkb):
+        """
+        Parses ISO or EWKB points, lines and polygons and their multi types.
+        :param wkb: (bytes) geometry;
+        :return: (PathGeometry)
+        """
+        wkb = bytes(wkb)
+        endian, wkbType, hasZ, hasM, pos = cls.readHeader(wkb, 0)
+        dimension = 2 + hasZ + hasM
+        if wkbType in (WKB_POINT, WKB_LINESTRING, WKB_POLYGON):
+            part, _ = cls.readPart(wkb, pos, endian, wkbType, dimension)
+            return cls(wkbType, False, hasZ, hasM, [part])
+        if wkbType - 3 not in (WKB_POINT, WKB_LINESTRING, WKB_POLYGON):
+            raise ValueError("Unsupported WKB geometry type: {0}".format(wkbType))
+        (nParts,) = struct.unpack_from(endian + "I", wkb, pos)
+        pos += 4
+        parts = []
+        for _ in range(nParts):
+            endian, partType, _, _, pos = cls.readHeader(wkb, pos)
+            part, pos = cls.readPart(wkb, pos, endian, partType, dimension)
+            parts.append(part)
+        return cls(wkbType - 3, True, hasZ, hasM, parts)
+
+    @staticmethod
+    def readPart(wkb, pos, endian, wkbType, dimension):
+        def readCoords(pos, nPoints):
+            coords = (
+                np.frombuffer(
+                    wkb, dtype=endian + "f8", count=nPoints * dimension, offset=pos
+                )
+                .reshape(nPoints, dimension)
+                .astype(np.float64)
+            )
+            return coords, pos + 8 * nPoints * dimension
+
+        if wkbType == WKB_POINT:
+            coords, pos = readCoords(pos, 1)
+            return [coords], pos
+        nRings = 1
+        if wkbType == WKB_POLYGON:
+            (nRings,) = struct.unpack_from(endian + "I", wkb, pos)
+            pos += 4
+        part = []
+        for _ in range(nRings):
+            (nPoints,) = struct.unpack_from(endian + "I", wkb, pos)
+            coords, pos = readCoords(pos + 4, nPoints)
+            part.append(coords)
+        return part, pos
+
+    def packHeader(self, wkbType):
+        return struct.pack("<BI", 1, wkbType + 1000 * self.hasZ + 2000 * self.hasM)
+
+    def packPart(self, part):
+        if self.geometryType == WKB_POINT:
+            return np.ascontiguousarray(part[0], dtype="<f8").tobytes()
+        chunks = (
+            [struct.pack("<I", len(part))] if self.geometryType == WKB_POLYGON else []
+        )
+        for coords in part:
+            chunks.append(struct.pack("<I", len(coords)))
+            chunks.append(np.ascontiguousarray(coords, dtype="<f8").tobytes())
+        return b"".join(chunks)
+
+    def toWkb(self):
+        """
+        :return: (bytes) little endian ISO WKB of the geometry.
+        """
+        if not self.isMulti:
+            return self.packHeader(self.geometryType) + self.packPart(self.parts[0])
+        chunks = [
+            self.packHeader(self.geometryType + 3),
+            struct.pack("<I", len(self.parts)),
+        ]
+        for part in self.parts:
+            chunks.append(self.packHeader(self.geometryType))
+            chunks.append(self.packPart(part))
+        return b"".join(chunks)
+
+    def isClosed(self):
+        return self.geometryType == WKB_POLYGON
+
+    def minimumPathSize(self):
+        return {WKB_POINT: 1, WKB_LINESTRING: 2, WKB_POLYGON: 4}[self.geometryType]
+
+
+def suggestCellSize(geometryList, tolerance):
+    """
+    Grid cells are made about as large as the typical segment, so that each
+    segment is hashed into a few cells, and never smaller than the snapping
+    tolerance, so that each query visits at most four cells.
+    :param geometryList: (iterable) PathGeometry objects;
+    :param tolerance: (float) largest snapping tolerance;
+    :return: (float) cell size.
+    """
+    lengthList = [
+        np.hypot(*np.diff(coords[:, :2], axis=0).T)
+        for geom in geometryList
+        for part in geom.parts
+        for coords in part
+        if len(coords) > 1
+    ]
+    median = float(np.median(np.concatenate(lengthList))) if lengthList else 0.0
+    cellSize = max(4 * tolerance, median)
+    return cellSize if cellSize > 0 else 1.0
+
+
+def removeRepeatedVertices(coords):
+    """
+    :return: (np.array) coords without consecutive vertices on the same
+        position.
+    """
+    if len(coords) < 2:
+        return coords
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = np.any(coords[1:, :2] != coords[:-1, :2], axis=1)
+    return coords[keep]
+
+
+class SnapIndex(object):
+    """
+    Growing index of the vertices and segments of reference geometries.
+    Geometries are stored by key, a (layer, id) tuple, so that snapping may
+    be restricted to some layers. Vertices and segments are hashed on a
+    regular grid of side cellSize, therefore adding or snapping a geometry
+    costs time proportional to its vertex count and not to the size of the
+    index.
+    """
+
+    def __init__(self, cellSize):
+        self.cellSize = float(cellSize)
+        self.geometries = dict()
+        self.keyEntries = dict()
+        # vertices are (x, y, key, isEndPoint) and segments are
+        # (x1, y1, x2, y2, key, part, ring, vertex); removed entries are set
+        # to None and are skipped by the queries until compact is called.
+        self.vertices = []
+        self.segments = []
+        self.nRemovedVertices = 0
+        self.nRemovedSegments = 0
+        self.vertexCells = defaultdict(list)
+        self.segmentCells = defaultdict(list)
+
+    def __contains__(self, key):
+        return key in self.geometries
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def getCells(self, xmin, ymin, xmax, ymax):
+        cellSize = self.cellSize
+        for i in range(
+            int(math.floor(xmin / cellSize)), int(math.floor(xmax / cellSize)) + 1
+        ):
+            for j in range(
+                int(math.floor(ymin / cellSize)), int(math.floor(ymax / cellSize)) + 1
+            ):
+                yield i, j
+
+    def addGeometry(self, key, geom):
+        """
+        Adds (or replaces) the geometry of key on the index.
+        :param key: (tuple) (layer, id) of the geometry;
+        :param geom: (PathGeometry) geometry.
+        """
+        if key in self.geometries:
+            self.removeGeometry(key)
+        self.geometries[key] = geom
+        vertexIds, segmentIds = [], []
+        isLine = geom.geometryType == WKB_LINESTRING
+        for partIndex, part in enumerate(geom.parts):
+            for ringIndex, coords in enumerate(part):
+                xyList = coords[:, :2].tolist()
+                n = len(xyList)
+                for i in range(n - 1 if geom.isClosed() else n):
+                    x, y = xyList[i]
+                    if math.isnan(x) or math.isnan(y):
+                        continue
+                    vertexIds.append(len(self.vertices))
+                    self.vertices.append((x, y, key, isLine and i in (0, n - 1)))
+                    self.vertexCells[next(self.getCells(x, y, x, y))].append(
+                        vertexIds[-1]
+                    )
+                for i in range(n - 1):
+                    (x1, y1), (x2, y2) = xyList[i], xyList[i + 1]
+                    segmentIds.append(len(self.segments))
+                    self.segments.append((x1, y1, x2, y2, key, partIndex, ringIndex, i))
+                    for cell in self.getCells(
+                        min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+                    ):
+                        self.segmentCells[cell].append(segmentIds[-1])
+        self.keyEntries[key] = (vertexIds, segmentIds)
+
+    def removeGeometry(self, key):
+        vertexIds, segmentIds = self.keyEntries.pop(key)
+        for vertexId in vertexIds:
+            self.vertices[vertexId] = None
+        for segmentId in segmentIds:
+            self.segments[segmentId] = None
+        self.nRemovedVertices += len(vertexIds)
+        self.nRemovedSegments += len(segmentIds)
+        return self.geometries.pop(key)
+
+    def compact(self, minRemovedRatio=0.5):
+        """
+        Drops the removed vertices and segments once they are at least
+        minRemovedRatio of the entries, keeping the order of the others. The
+        ids of the remaining entries change, therefore it must not be called
+        while insertion lists returned by snapGeometry are still to be given
+        to insertVertices.
+        :param minRemovedRatio: (float) ratio of removed entries that
+            triggers the compaction, 0 to always compact;
+        :return: (bool) True if the index was compacted.
+        """
+        nEntries = len(self.vertices) + len(self.segments)
+        nRemoved = self.nRemovedVertices + self.nRemovedSegments
+        if nRemoved == 0 or nRemoved < minRemovedRatio * nEntries:
+            return False
+        vertexIdMap, self.vertices = self.compactEntries(self.vertices)
+        segmentIdMap, self.segments = self.compactEntries(self.segments)
+        self.keyEntries = {
+            key: (
+                [vertexIdMap[i] for i in vertexIds],
+                [segmentIdMap[i] for i in segmentIds],
+            )
+            for key, (vertexIds, segmentIds) in self.keyEntries.items()
+        }
+        self.vertexCells = self.compactCells(self.vertexCells, vertexIdMap)
+        self.segmentCells = self.compactCells(self.segmentCells, segmentIdMap)
+        self.nRemovedVertices = 0
+        self.nRemovedSegments = 0
+        return True
+
+    @staticmethod
+    def compactEntries(entryList):
+        """
+        :return: (tuple) list mapping each old id to its new one (-1 for the
+            removed entries) and the list of the remaining entries.
+        """
+        idMap, remaining = [], []
+        for entry in entryList:
+            idMap.append(-1 if entry is None else len(remaining))
+            if entry is not None:
+                remaining.append(entry)
+        return idMap, remaining
+
+    @staticmethod
+    def compactCells(cellDict, idMap):
+        compacted = defaultdict(list)
+        for cell, idList in cellDict.items():
+            newIdList = [idMap[i] for i in idList if idMap[i] >= 0]
+            if newIdList:
+                compacted[cell] = newIdList
+        return compacted
+
+    def iterVertices(self, xmin, ymin, xmax, ymax, layers):
+        visited = set()
+        for cell in self.getCells(xmin, ymin, xmax, ymax):
+            for vertexId in self.vertexCells.get(cell, ()):
+                vertex = self.vertices[vertexId]
+                if vertex is None or vertexId in visited:
+                    continue
+                visited.add(vertexId)
+                if layers is None or vertex[2][0] in layers:
+                    yield vertexId, vertex
+
+    def iterSegments(self, xmin, ymin, xmax, ymax, layers):
+        visited = set()
+        for cell in self.getCells(xmin, ymin, xmax, ymax):
+            for segmentId in self.segmentCells.get(cell, ()):
+                segment = self.segments[segmentId]
+                if segment is None or segmentId in visited:
+                    continue
+                visited.add(segmentId)
+                if layers is None or segment[4][0] in layers:
+                    yield segmentId, segment
+
+    @staticmethod
+    def projectOnSegment(x, y, x1, y1, x2, y2):
+        """
+        :return: (tuple) (t, px, py), px and py being the closest point of the
+            segment to (x, y) and t its parameter along the segment.
+        """
+        dx, dy = x2 - x1, y2 - y1
+        length2 = dx * dx + dy * dy
+        if length2 == 0:
+            return 0.0, x1, y1
+        t = min(1.0, max(0.0, ((x - x1) * dx + (y - y1) * dy) / length2))
+        return t, x1 + t * dx, y1 + t * dy
+
+    def findClosestVertex(self, x, y, tol, layers=None, endPointsOnly=False):
+        """
+        :return: (tuple) (squared distance, x, y) of the closest vertex within
+            tol, or None.
+        """
+        best = None
+        for _, (vx, vy, _, isEndPoint) in self.iterVertices(
+            x - tol, y - tol, x + tol, y + tol, layers
+        ):
+            if endPointsOnly and not isEndPoint:
+                continue
+            distance2 = (vx - x) ** 2 + (vy - y) ** 2
+            if distance2 <= tol * tol and (best is None or distance2 < best[0]):
+                best = (distance2, vx, vy)
+        return best
+
+    def findClosestSegmentPoint(self, x, y, tol, layers=None):
+        """
+        :return: (tuple) (squared distance, x, y, segment id) of the closest
+            point on a segment within tol, or None.
+        """
+        best = None
+        for segmentId, segment in self.iterSegments(
+            x - tol, y - tol, x + tol, y + tol, layers
+        ):
+            _, px, py = self.projectOnSegment(x, y, *segment[:4])
+            distance2 = (px - x) ** 2 + (py - y) ** 2
+            if distance2 <= tol * tol and (best is None or distance2 < best[0]):
+                best = (distance2, px, py, segmentId)
+        return best
+
+    def findVerticesOnSegment(self, x1, y1, x2, y2, tol, layers=None):
+        """
+        :return: (list) sorted list of (t, x, y) of the distinct vertices
+            within tol of the inner part of the segment, that are farther
+            than tol from its end points.
+        """
+        found = dict()
+        for _, (vx, vy, _, _) in self.iterVertices(
+            min(x1, x2) - tol,
+            min(y1, y2) - tol,
+            max(x1, x2) + tol,
+            max(y1, y2) + tol,
+            layers,
+        ):
+            if (vx, vy) in found:
+                continue
+            if (vx - x1) ** 2 + (vy - y1) ** 2 <= tol * tol or (vx - x2) ** 2 + (
+                vy - y2
+            ) ** 2 <= tol * tol:
+                continue
+            t, px, py = self.projectOnSegment(vx, vy, x1, y1, x2, y2)
+            if 0 < t < 1 and (px - vx) ** 2 + (py - vy) ** 2 <= tol * tol:
+                found[(vx, vy)] = t
+        return sorted((t, vx, vy) for (vx, vy), t in found.items())
+
+    def snapVertex(self, x, y, tol, mode, layers=None):
+        """
+        :return: (tuple) (x, y, segment id) of the snapped position, the
+            segment id being None when snapped to a vertex, or None if there
+            is nothing within tol.
+        """
+        vertex = self.findClosestVertex(
+            x, y, tol, layers=layers, endPointsOnly=mode == END_POINT_TO_END_POINT
+        )
+        if vertex is not None and mode in PREFER_NODES_MODES + (
+            END_POINT_TO_END_POINT,
+        ):
+            return vertex[1], vertex[2], None
+        if mode == END_POINT_TO_END_POINT:
+            return None
+        segmentPoint = self.findClosestSegmentPoint(x, y, tol, layers=layers)
+        if segmentPoint is None or (
+            vertex is not None and vertex[0] <= segmentPoint[0]
+        ):
+            return None if vertex is None else (vertex[1], vertex[2], None)
+        return segmentPoint[1:]
+
+    def snapPath(self, coords, tol, mode, layers, isClosed, insertionList):
+        n = len(coords)
+        snapped = coords.copy()
+        if mode in END_POINT_MODES:
+            vertexIndexes = sorted({0, n - 1})
+        else:
+            vertexIndexes = range(n - 1 if isClosed else n)
+        for i in vertexIndexes:
+            x, y = snapped[i, 0], snapped[i, 1]
+            if math.isnan(x) or math.isnan(y):
+                continue
+            result = self.snapVertex(x, y, tol, mode, layers=layers)
+            if result is None:
+                continue
+            snapped[i, 0], snapped[i, 1], segmentId = result
+            if segmentId is not None and mode in EXTRA_VERTICES_MODES:
+                insertionList.append((segmentId, snapped[i, 0], snapped[i, 1]))
+        if isClosed:
+            snapped[-1, :2] = snapped[0, :2]
+        if mode in EXTRA_VERTICES_MODES and n > 1:
+            rowList = [snapped[0]]
+            for a, b in zip(snapped[:-1], snapped[1:]):
+                for t, vx, vy in self.findVerticesOnSegment(
+                    a[0], a[1], b[0], b[1], tol, layers=layers
+                ):
+                    row = a + t * (b - a)
+                    row[0], row[1] = vx, vy
+                    rowList.append(row)
+                rowList.append(b)
+            snapped = np.array(rowList)
+        return removeRepeatedVertices(snapped)
+
+    def snapGeometry(self, geom, tol, mode, layers=None):
+        """
+        Snaps geom to the geometries of the index, as QgsGeometrySnapper does.
+        End point modes only change lines. Paths that would collapse are kept
+        unchanged.
+        :param geom: (PathGeometry) geometry to be snapped. It is not changed;
+        :param tol: (float) snapping tolerance;
+        :param mode: (int) QgsGeometrySnapper.SnapMode;
+        :param layers: (set) layers of the reference geometries, None for all;
+        :return: (tuple) (snapped geometry, insertion list). The snapped
+            geometry is geom itself if nothing changed. The insertion list
+            holds the vertices that were moved onto reference segments, to be
+            given to insertVertices.
+        """
+        insertionList = []
+        if mode in END_POINT_MODES and geom.geometryType != WKB_LINESTRING:
+            return geom, insertionList
+        changed = False
+        partList = []
+        for part in geom.parts:
+            pathList = []
+            for coords in part:
+                snapped = self.snapPath(
+                    coords, tol, mode, layers, geom.isClosed(), insertionList
+                )
+                if len(snapped) < min(len(coords), geom.minimumPathSize()):
+                    snapped = coords
+                changed = changed or not np.array_equal(snapped, coords, equal_nan=True)
+                pathList.append(snapped)
+            partList.append(pathList)
+        if not changed:
+            return geom, insertionList
+        return (
+            PathGeometry(
+                geom.geometryType, geom.isMulti, geom.hasZ, geom.hasM, partList
+            ),
+            insertionList,
+        )
+
+    def insertVertices(self, insertionList):
+        """
+        Inserts vertices on the segments of the reference geometries, which
+        are updated on the index.
+        :param insertionList: (list) (segment id, x, y) tuples;
+        :return: (dict) new geometry of each changed key.
+        """
+        keyInsertions = defaultdict(lambda: defaultdict(set))
+        for segmentId, x, y in insertionList:
+            segment = self.segments[segmentId]
+            if segment is None:
+                continue
+            x1, y1, x2, y2, key, partIndex, ringIndex, vertexIndex = segment
+            if (x, y) in ((x1, y1), (x2, y2)):
+                continue
+            t, _, _ = self.projectOnSegment(x, y, x1, y1, x2, y2)
+            keyInsertions[key][(partIndex, ringIndex)].add((vertexIndex, t, x, y))
+        updatedDict = dict()
+        for key, pathInsertions in keyInsertions.items():
+            geom = self.geometries[key]
+            partList = [list(part) for part in geom.parts]
+            for (partIndex, ringIndex), insertionSet in pathInsertions.items():
+                coords = partList[partIndex][ringIndex]
+                pieceList, start = [], 0
+                for vertexIndex, t, x, y in sorted(insertionSet):
+                    pieceList.append(coords[start : vertexIndex + 1])
+                    start = vertexIndex + 1
+                    row = coords[vertexIndex] + t * (
+                        coords[vertexIndex + 1] - coords[vertexIndex]
+                    )
+                    row[0], row[1] = x, y
+                    pieceList.append(row[np.newaxis, :])
+                pieceList.append(coords[start:])
+                partList[partIndex][ringIndex] = removeRepeatedVertices(
+                    np.concatenate(pieceList)
+                )
+            updatedDict[key] = PathGeometry(
+                geom.geometryType, geom.isMulti, geom.hasZ, geom.hasM, partList
+            )
+            self.addGeometry(key, updatedDict[key])
+        return updatedDict
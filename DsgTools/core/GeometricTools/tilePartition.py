@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+"""
+Partition of an extent into rectangular tiles, used to run an algorithm
+tile by tile. Each tile is processed with its inputs extracted from the
+core box expanded by a halo, so that features near the tile border still
+see their neighbours. Every flag is then kept only by the tile that owns its
+representative point, which removes the copies found on the halo zones.
+
+This module does not depend on qgis, so that it can be tested on its own.
+"""
+import math
+from typing import Iterable, Tuple
+
+import numpy as np
+
+
+class TilePartition(object):
+    """
+    Set of non overlapping core boxes (xmin, ymin, xmax, ymax) and the halo
+    used to expand them. Borders closer than tolerance are taken as the
+    same, so that boxes computed with floating point arithmetic still share
+    their borders.
+    """
+
+    def __init__(
+        self,
+        coreBoxes: Iterable[Tuple[float, float, float, float]],
+        halo=0.0,
+        tolerance=None,
+    ):
+        self.coreBoxes = np.asarray(coreBoxes, dtype=float).reshape(-1, 4)
+        self.halo = float(halo)
+        self.tolerance = (
+            self.getDefaultTolerance() if tolerance is None else float(tolerance)
+        )
+        self.closedRight, self.closedTop = self.getOuterBorderMasks()
+
+    def getDefaultTolerance(self):
+        """
+        :return: (float) tolerance relative to the magnitude of the
+            coordinates, a few orders above the double precision.
+        """
+        if self.coreBoxes.size == 0:
+            return 1e-9
+        return 1e-9 * max(1.0, float(np.abs(self.coreBoxes).max()))
+
+    def getOuterBorderMasks(self):
+        """
+        Finds the tiles whose right (top) border is not shared with a
+        neighbour, so that points on it still have an owner.
+        :return: (tuple) boolean arrays (closedRight, closedTop).
+        """
+        xmin, ymin, xmax, ymax = self.coreBoxes.T
+        tol = self.tolerance
+        overlapsY = (ymin[None, :] < ymax[:, None] - tol) & (
+            ymax[None, :] > ymin[:, None] + tol
+        )
+        overlapsX = (xmin[None, :] < xmax[:, None] - tol) & (
+            xmax[None, :] > xmin[:, None] + tol
+        )
+        hasRight = ((np.abs(xmin[None, :] - xmax[:, None]) <= tol) & overlapsY).any(
+            axis=1
+        )
+        hasTop = ((np.abs(ymin[None, :] - ymax[:, None]) <= tol) & overlapsX).any(
+            axis=1
+        )
+        return ~hasRight, ~hasTop
+
+    @classmethod
+    def fromRegularGrid(cls, extent, tileSize, halo=0.0):
+        """
+        Builds a partition of extent into square tiles of side tileSize. The
+        last row and column are trimmed to the extent.
+        :param extent: (tuple) (xmin, ymin, xmax, ymax);
+        :param tileSize: (float) tile side, in map units;
+        :param halo: (float) distance the tiles are expanded by;
+        :return: (TilePartition) partition ordered by row, then by column.
+        """
+        if tileSize <= 0:
+            raise ValueError("Tile size must be positive.")
+        xmin, ymin, xmax, ymax = extent
+        nCols = max(1, int(math.ceil((xmax - xmin) / tileSize)))
+        nRows = max(1, int(math.ceil((ymax - ymin) / tileSize)))
+        xs = np.minimum(xmin + tileSize * np.arange(nCols + 1), xmax)
+        ys = np.minimum(ymin + tileSize * np.arange(nRows + 1), ymax)
+        xs[-1], ys[-1] = xmax, ymax
+        boxList = [
+            (xs[col], ys[row], xs[col + 1], ys[row + 1])
+            for row in range(nRows)
+            for col in range(nCols)
+        ]
+        return cls(boxList, halo=halo)
+
+    def __len__(self):
+        return self.coreBoxes.shape[0]
+
+    def getCoreBox(self, tileIndex):
+        return tuple(self.coreBoxes[tileIndex])
+
+    def getExpandedBox(self, tileIndex):
+        xmin, ymin, xmax, ymax = self.coreBoxes[tileIndex]
+        return (
+            xmin - self.halo,
+            ymin - self.halo,
+            xmax + self.halo,
+            ymax + self.halo,
+        )
+
+    def getOwnerIndexes(self, points, chunkSize=4096, nearest=False):
+        """
+        Returns the index of the tile that owns each point. Core boxes are
+        half open, [xmin, xmax) x [ymin, ymax), so that a point on a shared
+        border belongs to a single tile, while the top and right borders
+        that are not shared with another tile are closed.
+        :param points: (np.array) array of shape (n, 2);
+        :param chunkSize: (int) number of points tested at once;
+        :param nearest: (bool) whether points outside every tile are owned by
+            the nearest tile;
+        :return: (np.array) tile indexes, -1 for points outside every tile
+            when nearest is False.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        owners = np.full(points.shape[0], -1, dtype=np.int64)
+        if len(self) == 0:
+            return owners
+        xmin, ymin, xmax, ymax = self.coreBoxes.T
+        for start in range(0, points.shape[0], chunkSize):
+            x = points[start : start + chunkSize, 0][:, None]
+            y = points[start : start + chunkSize, 1][:, None]
+            inside = (
+                (x >= xmin)
+                & (y >= ymin)
+                & ((x < xmax) | (self.closedRight & (x <= xmax + self.tolerance)))
+                & ((y < ymax) | (self.closedTop & (y <= ymax + self.tolerance)))
+            )
+            chunkOwners = np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+            if nearest and (chunkOwners < 0).any():
+                outside = chunkOwners < 0
+                dx = np.maximum(np.maximum(xmin - x[outside], 0), x[outside] - xmax)
+                dy = np.maximum(np.maximum(ymin - y[outside], 0), y[outside] - ymax)
+                chunkOwners[outside] = (dx * dx + dy * dy).argmin(axis=1)
+            owners[start : start + chunkSize] = chunkOwners
+        return owners
+
+    def getOwnedMask(self, tileIndex, points):
+        """
+        Points outside every tile, such as flags found on the halo beyond the
+        partition extent, are owned by the nearest tile, so that each point
+        is kept exactly once.
+        :return: (np.array) boolean mask of the points owned by tileIndex.
+        """
+        return self.getOwnerIndexes(points, nearest=True) == tileIndex
+
+    def isWithinExpandedBox(self, tileIndex, bboxes):
+        """
+        Tells which bounding boxes lie strictly inside the expanded box of the
+        tile. Results of checks that depend on the neighbourhood (e.g. gaps)
+        that reach the halo border may be incomplete and can be discarded
+        with this mask.
+        :param bboxes: (np.array) array of shape (n, 4) with
+            (xmin, ymin, xmax, ymax);
+        :return: (np.array) boolean mask.
+        """
+        bboxes = np.asarray(bboxes, dtype=float).reshape(-1, 4)
+        exmin, eymin, exmax, eymax = self.getExpandedBox(tileIndex)
+        return (
+            (bboxes[:, 0] > exmin)
+            & (bboxes[:, 1] > eymin)
+            & (bboxes[:, 2] < exmax)
+            & (bboxes[:, 3] < eymax)
+        )
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import struct
+
+import numpy as np
+
+POINT_RING, LINE_RING, POLYGON_RING = 0, 1, 2
+
+WKB_POINT = 1
+WKB_LINESTRING = 2
+WKB_POLYGON = 3
+WKB_MULTI_TYPES = (4, 5, 6, 7)
+
+
+class VertexArrays(object):
+    """
+    Vertices of a set of features stored in contiguous arrays.
+    Every point, line or polygon ring is stored as a ring:
+        - xy: (n, 2) float array with the coordinates of every vertex.
+          Polygon rings keep their closing vertex;
+        - ringOffsets: (r + 1) int array, vertices of ring i are
+          xy[ringOffsets[i]:ringOffsets[i + 1]];
+        - ringType: POINT_RING, LINE_RING or POLYGON_RING;
+        - ringFeature: index of the ring's feature on featureIds;
+        - ringPart: part number of the ring inside its feature;
+        - ringIndex: 0 for exterior rings, lines and points, 1.. for holes;
+        - featureIds: feature id of each parsed geometry.
+    This module does not import qgis, geometries are read from their WKB.
+    """
+
+    def __init__(
+        self, xy, ringOffsets, ringType, ringFeature, ringPart, ringIndex, featureIds
+    ):
+        self.xy = xy
+        self.ringOffsets = ringOffsets
+        self.ringType = ringType
+        self.ringFeature = ringFeature
+        self.ringPart = ringPart
+        self.ringIndex = ringIndex
+        self.featureIds = featureIds
+
+    @classmethod
+    def fromWkbList(cls, wkbList, featureIds=None):
+        """
+        Parses a list of WKB (ISO or EWKB, 2D, Z, M or ZM). Curved geometries
+        must be segmentized beforehand.
+        :param wkbList: (list-of-bytes) geometries;
+        :param featureIds: (list-of-int) feature id of each geometry. When not
+            given, the position on wkbList is used;
+        :return: (VertexArrays)
+        """
+        reader = WkbReader()
+        for featureIndex, wkb in enumerate(wkbList):
+            reader.read(wkb, featureIndex)
+        featureIds = (
+            np.arange(len(wkbList), dtype=np.int64)
+            if featureIds is None
+            else np.asarray(featureIds, dtype=np.int64)
+        )
+        return reader.build(featureIds)
+
+    def ringCount(self):
+        return len(self.ringType)
+
+    def ringSizes(self):
+        return np.diff(self.ringOffsets)
+
+    def vertexRing(self):
+        """
+        Returns the ring index of every vertex.
+        """
+        return np.repeat(np.arange(self.ringCount()), self.ringSizes())
+
+    def vertexFeatureIds(self, vertexIndexes):
+        """
+        Returns the feature id of each vertex in vertexIndexes.
+        """
+        rings = np.searchsorted(self.ringOffsets, vertexIndexes, side="right") - 1
+        return self.featureIds[self.ringFeature[rings]]
+
+    def getWindowIndexes(self, windowSize):
+        """
+        Builds the indexes of every sequence of windowSize consecutive
+        vertices. Windows go around polygon rings (the closing vertex is not
+        repeated) and stop at the end of lines.
+        :param windowSize: (int) number of vertices on each window;
+        :return: (np.array) (k, windowSize) vertex indexes.
+        """
+        sizes = self.ringSizes()
+        isPolygon = self.ringType == POLYGON_RING
+        # polygon rings are stored closed, the last vertex is the first one
+        uniqueSizes = np.where(isPolygon, sizes - 1, sizes)
+        windowCount = np.where(
+            isPolygon,
+            np.where(uniqueSizes >= windowSize, uniqueSizes, 0),
+            np.maximum(uniqueSizes - windowSize + 1, 0),
+        )
+        windowCount[self.ringType == POINT_RING] = 0
+        if windowCount.sum() == 0:
+            return np.empty((0, windowSize), dtype=np.int64)
+        windowRing = np.repeat(np.arange(self.ringCount()), windowCount)
+        firstWindow = np.cumsum(windowCount) - windowCount
+        localStart = np.arange(windowCount.sum()) - np.repeat(firstWindow, windowCount)
+        local = localStart[:, None] + np.arange(windowSize)[None, :]
+        ringLength = uniqueSizes[windowRing][:, None]
+        local = np.where(isPolygon[windowRing][:, None], local % ringLength, local)
+        return self.ringOffsets[windowRing][:, None] + local
+
+    def getJunctionWindowIndexes(self, tolerance):
+        """
+        Builds the indexes of every sequence of four consecutive vertices
+        that goes from a line into the line that starts where it ends,
+        following the digitizing direction: the junction vertex is the
+        second or third one, or a two vertex line joins the first and last
+        segments. Sequences inside a single line are left to
+        getWindowIndexes.
+        :param tolerance: (float) size of the grid endpoints are snapped to
+            when they are compared;
+        :return: (np.array) (k, 4) vertex indexes.
+        """
+        sizes = self.ringSizes()
+        lineRings = np.flatnonzero((self.ringType == LINE_RING) & (sizes >= 2))
+        empty = np.empty((0, 4), dtype=np.int64)
+        if len(lineRings) == 0:
+            return empty
+        startIdx = self.ringOffsets[lineRings]
+        endIdx = self.ringOffsets[lineRings + 1] - 1
+        lineSizes = sizes[lineRings]
+        keys = np.round(
+            np.concatenate([self.xy[startIdx], self.xy[endIdx]]) / tolerance
+        ).astype(np.int64)
+        _, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        startNode, endNode = inverse[: len(lineRings)], inverse[len(lineRings) :]
+        outLine, inLine = joinSorted(startNode, endNode)
+        isPair = inLine != outLine
+        inLine, outLine = inLine[isPair], outLine[isPair]
+        windowList = []
+        # junction on the third vertex
+        mask = lineSizes[inLine] >= 3
+        a, b = inLine[mask], outLine[mask]
+        windowList.append(
+            np.column_stack([endIdx[a] - 2, endIdx[a] - 1, endIdx[a], startIdx[b] + 1])
+        )
+        # junction on the second vertex
+        mask = lineSizes[outLine] >= 3
+        a, b = inLine[mask], outLine[mask]
+        windowList.append(
+            np.column_stack(
+                [endIdx[a] - 1, endIdx[a], startIdx[b] + 1, startIdx[b] + 2]
+            )
+        )
+        # a two vertex line between two junctions
+        mask = lineSizes[outLine] == 2
+        firstPair, secondPair = joinSorted(inLine, outLine[mask])
+        a, b = inLine[mask][secondPair], outLine[mask][secondPair]
+        c = outLine[firstPair]
+        windowList.append(
+            np.column_stack([endIdx[a] - 1, endIdx[a], endIdx[b], startIdx[c] + 1])
+        )
+        windows = np.concatenate(windowList).astype(np.int64)
+        return windows if len(windows) else empty
+
+    def vertexAngles(self):
+        """
+        Computes the angle at every vertex that has a previous and a next
+        vertex (all polygon ring vertices and inner line vertices), using
+        the same convention as GeometryHandler.getOutOfBoundsAngle: the
+        difference of azimuths to the previous and next vertices, folded to
+        [0, 180].
+        :return: (tuple) (vertex indexes, angles in degrees, ring of each
+            vertex).
+        """
+        windows = self.getWindowIndexes(3)
+        previous, vertex, following = windows.T
+        angles = np.fmod(
+            azimuths(self.xy[vertex], self.xy[previous])
+            - azimuths(self.xy[vertex], self.xy[following])
+            + 360,
+            360,
+        )
+        angles = np.where(angles > 180, 360 - angles, angles)
+        rings = np.searchsorted(self.ringOffsets, vertex, side="right") - 1
+        return vertex, angles, rings
+
+    def segmentLengths(self):
+        """
+        Returns the length of every segment and the ring it belongs to.
+        """
+        vertexRing = self.vertexRing()
+        sameRing = vertexRing[1:] == vertexRing[:-1]
+        deltas = self.xy[1:][sameRing] - self.xy[:-1][sameRing]
+        return np.hypot(deltas[:, 0], deltas[:, 1]), vertexRing[:-1][sameRing]
+
+    def featureLengths(self):
+        """
+        Returns the length (perimeter for polygons) of each feature.
+        """
+        lengths, rings = self.segmentLengths()
+        return np.bincount(
+            self.ringFeature[rings], weights=lengths, minlength=len(self.featureIds)
+        )
+
+    def ringAreas(self):
+        """
+        Returns the absolute area of each ring (0 for points and lines).
+        """
+        vertexRing = self.vertexRing()
+        sameRing = vertexRing[1:] == vertexRing[:-1]
+        # coordinates relative to the first vertex of the ring, for precision
+        xy = self.xy - self.xy[self.ringOffsets[:-1][vertexRing]]
+        x0, y0 = xy[:-1][sameRing].T
+        x1, y1 = xy[1:][sameRing].T
+        signedAreas = np.bincount(
+            vertexRing[:-1][sameRing],
+            weights=x0 * y1 - x1 * y0,
+            minlength=self.ringCount(),
+        )
+        return np.where(self.ringType == POLYGON_RING, np.abs(signedAreas) / 2, 0.0)
+
+    def featureAreas(self):
+        """
+        Returns the area of each feature, with holes subtracted.
+        """
+        ringAreas = self.ringAreas()
+        ringAreas = np.where(self.ringIndex == 0, ringAreas, -ringAreas)
+        return np.bincount(
+            self.ringFeature, weights=ringAreas, minlength=len(self.featureIds)
+        )
+
+    def findCloseVertexPairs(self, searchRadius):
+        """
+        Finds pairs of distinct vertices of the same ring that are closer
+        than searchRadius. The closing vertex of polygon rings is ignored and
+        coincident vertices are not paired.
+        Vertices are sorted by ring and x, so that each vertex is only
+        compared to the following ones while their x difference is within
+        the radius.
+        :param searchRadius: (float) search radius;
+        :return: (tuple) (array of first vertexes, array of second vertexes).
+        """
+        vertexRing = self.vertexRing()
+        vertexIndexes = np.arange(len(vertexRing))
+        isClosing = np.zeros(len(vertexRing), dtype=bool)
+        polygonRings = np.nonzero(self.ringType == POLYGON_RING)[0]
+        isClosing[self.ringOffsets[polygonRings + 1] - 1] = True
+        vertexIndexes = vertexIndexes[~isClosing]
+        order = vertexIndexes[
+            np.lexsort((self.xy[vertexIndexes, 0], vertexRing[vertexIndexes]))
+        ]
+        rings, x, y = vertexRing[order], self.xy[order, 0], self.xy[order, 1]
+        firstList, secondList = [], []
+        active, offset = np.arange(len(order) - 1), 1
+        squaredRadius = searchRadius * searchRadius
+        while active.size > 0:
+            candidates = active + offset
+            inRange = candidates < len(order)
+            active, candidates = active[inRange], candidates[inRange]
+            inRange = (rings[candidates] == rings[active]) & (
+                x[candidates] - x[active] <= searchRadius
+            )
+            active, candidates = active[inRange], candidates[inRange]
+            squaredDistance = (x[candidates] - x[active]) ** 2 + (
+                y[candidates] - y[active]
+            ) ** 2
+            isClose = (squaredDistance <= squaredRadius) & (squaredDistance > 0)
+            firstList.append(order[active[isClose]])
+            secondList.append(order[candidates[isClose]])
+            offset += 1
+        if not firstList:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(firstList), np.concatenate(secondList)
+
+
+class WkbReader(object):
+    """
+    Accumulates the vertices of WKB geometries into VertexArrays.
+    """
+
+    def __init__(self):
+        self.coordList = []
+        self.ringType = []
+        self.ringFeature = []
+        self.ringPart = []
+        self.ringIndex = []
+
+    def read(self, wkb, featureIndex):
+        wkb = bytes(wkb)
+        self.readGeometry(wkb, 0, featureIndex, None)
+
+    def addRing(self, coords, ringType, featureIndex, part, ringIndex):
+        self.coordList.append(coords)
+        self.ringType.append(ringType)
+        self.ringFeature.append(featureIndex)
+        self.ringPart.append(part)
+        self.ringIndex.append(ringIndex)
+
+    def readHeader(self, wkb, pos):
+        endian = "<" if wkb[pos] == 1 else ">"
+        (wkbType,) = struct.unpack_from(endian + "I", wkb, pos + 1)
+        pos += 5
+        hasZ = bool(wkbType & 0x80000000)
+        hasM = bool(wkbType & 0x40000000)
+        if wkbType & 0x20000000:
+            # EWKB srid
+            pos += 4
+        wkbType &= 0x0FFFFFFF
+        flavour, wkbType = divmod(wkbType, 1000)
+        hasZ = hasZ or flavour in (1, 3)
+        hasM = hasM or flavour in (2, 3)
+        return endian, wkbType, 2 + hasZ + hasM, pos
+
+    def readCoords(self, wkb, pos, endian, dimension):
+        (nPoints,) = struct.unpack_from(endian + "I", wkb, pos)
+        pos += 4
+        coords = np.frombuffer(
+            wkb, dtype=endian + "f8", count=nPoints * dimension, offset=pos
+        ).reshape(nPoints, dimension)[:, :2]
+        return coords, pos + 8 * nPoints * dimension
+
+    def readGeometry(self, wkb, pos, featureIndex, part):
+        endian, wkbType, dimension, pos = self.readHeader(wkb, pos)
+        currentPart = 0 if part is None else part
+        if wkbType == WKB_POINT:
+            coords = np.frombuffer(
+                wkb, dtype=endian + "f8", count=dimension, offset=pos
+            )[:2].reshape(1, 2)
+            if not np.isnan(coords).any():
+                self.addRing(coords, POINT_RING, featureIndex, currentPart, 0)
+            return pos + 8 * dimension
+        if wkbType == WKB_LINESTRING:
+            coords, pos = self.readCoords(wkb, pos, endian, dimension)
+            if len(coords) > 0:
+                self.addRing(coords, LINE_RING, featureIndex, currentPart, 0)
+            return pos
+        if wkbType == WKB_POLYGON:
+            (nRings,) = struct.unpack_from(endian + "I", wkb, pos)
+            pos += 4
+            for ringIndex in range(nRings):
+                coords, pos = self.readCoords(wkb, pos, endian, dimension)
+                if len(coords) > 0:
+                    self.addRing(
+                        coords, POLYGON_RING, featureIndex, currentPart, ringIndex
+                    )
+            return pos
+        if wkbType in WKB_MULTI_TYPES:
+            (nParts,) = struct.unpack_from(endian + "I", wkb, pos)
+            pos += 4
+            for i in range(nParts):
+                pos = self.readGeometry(
+                    wkb, pos, featureIndex, i if part is None else part
+                )
+            return pos
+        raise ValueError("Unsupported WKB geometry type: {0}".format(wkbType))
+
+    def build(self, featureIds):
+        sizes = np.array([len(c) for c in self.coordList], dtype=np.int64)
+        ringOffsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=ringOffsets[1:])
+        return VertexArrays(
+            xy=np.concatenate(self.coordList).astype(np.float64)
+            if self.coordList
+            else np.empty((0, 2), dtype=np.float64),
+            ringOffsets=ringOffsets,
+            ringType=np.array(self.ringType, dtype=np.int8),
+            ringFeature=np.array(self.ringFeature, dtype=np.int64),
+            ringPart=np.array(self.ringPart, dtype=np.int64),
+            ringIndex=np.array(self.ringIndex, dtype=np.int64),
+            featureIds=featureIds,
+        )
+
+
+def joinSorted(keys, queries):
+    """
+    Pairs every query with every key of the same value.
+    :param keys: (np.array) int values;
+    :param queries: (np.array) int values;
+    :return: (tuple) arrays (keyIndexes, queryIndexes) of the matching
+        positions.
+    """
+    order = np.argsort(keys, kind="stable")
+    sortedKeys = keys[order]
+    low = np.searchsorted(sortedKeys, queries, side="left")
+    counts = np.searchsorted(sortedKeys, queries, side="right") - low
+    queryIndexes = np.repeat(np.arange(len(queries), dtype=np.int64), counts)
+    rank = np.arange(counts.sum(), dtype=np.int64) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return order[np.repeat(low, counts) + rank], queryIndexes
+
+
+def azimuths(origin, destination):
+    """
+    Vectorized QgsPointXY.azimuth: angle, in degrees, between the north and
+    the segment from origin to destination.
+    """
+    delta = destination - origin
+    return np.degrees(np.arctan2(delta[:, 0], delta[:, 1]))
+
+
+def anglesBetweenThreePoints(p1, p2, p3):
+    """
+    Vectorized QgsGeometryUtils.angleBetweenThreePoints, in degrees [0, 360):
+    the direction from p2 to p1 minus the direction from p2 to p3.
+    """
+    angles = np.arctan2(p1[:, 1] - p2[:, 1], p1[:, 0] - p2[:, 0]) - np.arctan2(
+        p3[:, 1] - p2[:, 1], p3[:, 0] - p2[:, 0]
+    )
+    return np.degrees(np.mod(angles, 2 * np.pi))
+
+
+def isClose(values, reference, relTol=1e-09, absTol=0.0):
+    """
+    Vectorized GeometryHandler.isclose.
+    """
+    return np.abs(values - reference) <= np.maximum(
+        relTol * np.maximum(np.abs(values), abs(reference)), absTol
+    )
@@ -29,6 +29,7 @@ import codecs, os, json, binascii
 # DSG Tools imports
 from DsgTools.core.Factories.DbFactory.dbFactory import DbFactory
 from DsgTools.core.Utils.utils import Utils
+from DsgTools.core.Utils.threadingTools import runBatch
 from DsgTools.core.dsgEnums import DsgEnums
 
 # qgis.PyQt imports
@@ -40,6 +41,9 @@ class GenericDbManager(QObject):
     This class manages the permissions on dsgtools databases.
     """
 
+    # maximum number of databases handled at the same time by installSetting
+    maxConcurrency = 4
+
     def __init__(self, serverAbstractDb, dbDict, edgvVersion, parentWidget=None):
         super(GenericDbManager, self).__init__()
         self.parentWidget = parentWidget
@@ -82,6 +86,25 @@ class GenericDbManager(QObject):
             abstractDb = self.dbDict[dbName]
         return abstractDb
 
+    def connectWorkerDbs(self, dbName, serverParams):
+        """
+        Opens new connections to dbName and to dsgtools_admindb, to be used
+        by a single worker thread, since a connection can only be used by
+        the thread that opened it. Failing to connect raises instead of
+        asking for credentials.
+        :param dbName: (str) database name;
+        :param serverParams: (tuple) (host, port, user, password);
+        :return: (tuple) (abstractDb, adminDb).
+        """
+        host, port, user, password = serverParams
+        abstractDb = DbFactory().createDbFactory(DsgEnums.DriverPostGIS)
+        abstractDb.connectDatabaseWithoutPrompt(host, port, dbName, user, password)
+        adminDb = DbFactory().createDbFactory(DsgEnums.DriverPostGIS)
+        adminDb.connectDatabaseWithoutPrompt(
+            host, port, "dsgtools_admindb", user, password
+        )
+        return abstractDb, adminDb
+
     def instantiateAdminDb(self, serverAbstractDb):
         """
         Instantiates dsgtools_admindb in the same server as serverAbstractDb.
@@ -304,52 +327,66 @@ class GenericDbManager(QObject):
         self.createSetting(configName, edgvVersion, newJsonDict)
         return self.installSetting(configName, dbNameList=dbList)
 
-    def installSetting(self, configName, dbNameList=[]):
+    def installSetting(self, configName, dbNameList=[], feedback=None):
         """
         Generic install. Can be reimplenented in child methods.
+        Databases are handled concurrently (at most maxConcurrency at a
+        time), each worker with its own connections to the database and to
+        dsgtools_admindb.
         """
-        errorDict = dict()
         settingType = self.getManagerType()
         if dbNameList == []:
             dbNameList = list(self.dbDict.keys())
-        successList = []
         configEdgvVersion = self.getSettingVersion(configName)
-        for dbName in dbNameList:
-            abstractDb = self.instantiateAbstractDb(dbName)
-            edgvVersion = abstractDb.getDatabaseVersion()
-            if edgvVersion != configEdgvVersion:
-                errorDict[dbName] = self.tr("Database version missmatch.")
-                continue
-            recDict = self.adminDb.getRecordFromAdminDb(
-                settingType, configName, edgvVersion
-            )
-            try:
-                if not abstractDb.checkIfExistsConfigTable(settingType):
-                    abstractDb.createPropertyTable(settingType, useTransaction=True)
-            except Exception as e:
-                errorDict[dbName] = ":".join(e.args)
-                continue
+        serverParams = self.serverAbstractDb.getParamsFromConectedDb()
+
+        def install(dbName):
+            abstractDb, adminDb = self.connectWorkerDbs(dbName, serverParams)
             try:
-                abstractDb.db.transaction()
-                self.adminDb.db.transaction()
-                self.materializeIntoDatabase(
-                    abstractDb, recDict
-                )  # step done when property management involves changing database structure
-                abstractDb.insertRecordInsidePropertyTable(
-                    settingType, recDict, edgvVersion
+                self.installSettingOnDb(
+                    abstractDb, adminDb, settingType, configName, configEdgvVersion
                 )
-                dbOid = abstractDb.getDbOID()
-                self.adminDb.insertInstalledRecordIntoAdminDb(
-                    settingType, recDict, dbOid
-                )
-                abstractDb.db.commit()
-                self.adminDb.db.commit()
-            except Exception as e:
-                abstractDb.db.rollback()
-                self.adminDb.db.rollback()
-                errorDict[dbName] = ":".join(e.args)
-            successList.append(dbName)
-        return (successList, errorDict)
+            finally:
+                abstractDb.db.close()
+                adminDb.db.close()
+
+        return runBatch(
+            install,
+            dbNameList,
+            max_concurrency=self.maxConcurrency,
+            feedback=feedback,
+        )
+
+    def installSettingOnDb(
+        self, abstractDb, adminDb, settingType, configName, configEdgvVersion
+    ):
+        """
+        Installs configName on abstractDb and registers it on adminDb. Raises
+        an exception on failure.
+        """
+        edgvVersion = abstractDb.getDatabaseVersion()
+        if edgvVersion != configEdgvVersion:
+            raise Exception(self.tr("Database version missmatch."))
+        recDict = adminDb.getRecordFromAdminDb(settingType, configName, edgvVersion)
+        if not abstractDb.checkIfExistsConfigTable(settingType):
+            abstractDb.createPropertyTable(settingType, useTransaction=True)
+        try:
+            abstractDb.db.transaction()
+            adminDb.db.transaction()
+            self.materializeIntoDatabase(
+                abstractDb, recDict
+            )  # step done when property management involves changing database structure
+            abstractDb.insertRecordInsidePropertyTable(
+                settingType, recDict, edgvVersion
+            )
+            dbOid = abstractDb.getDbOID()
+            adminDb.insertInstalledRecordIntoAdminDb(settingType, recDict, dbOid)
+            abstractDb.db.commit()
+            adminDb.db.commit()
+        except Exception as e:
+            abstractDb.db.rollback()
+            adminDb.db.rollback()
+            raise e
 
     def deleteSetting(self, configName, dbNameList=[]):
         """
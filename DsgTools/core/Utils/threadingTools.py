@@ -63,3 +63,44 @@ def concurrently(handler, inputs, *, max_concurrency=5, feedback=None):
             for input in itertools.islice(handler_inputs, len(done)):
                 fut = executor.submit(handler, input)
                 futures[fut] = input
+
+
+def runBatch(handler, inputs, *, max_concurrency=4, feedback=None, callback=None):
+    """
+    Runs ``handler`` on each value of ``inputs`` with at most
+    ``max_concurrency`` calls at the same time, as concurrently does, but
+    errors are collected per input instead of being raised.
+
+    ``handler`` runs on a worker thread, therefore it must open and close
+    its own database connections.
+
+    ``callback``, if given, is called on the calling thread as each input
+    finishes, with (input, errorMessage), errorMessage being None on success.
+
+    Returns (successList, errorDict), errorDict being {input: errorMessage}.
+    Inputs that were not run because ``feedback`` was canceled are reported
+    on errorDict as well.
+    """
+    inputList = list(inputs)
+
+    def run(input):
+        try:
+            handler(input)
+            return input, None
+        except Exception as e:
+            return input, ":".join(str(arg) for arg in e.args) or repr(e)
+
+    successList, errorDict = [], dict()
+    for input, errorMessage in concurrently(
+        run, inputList, max_concurrency=max_concurrency, feedback=feedback
+    ):
+        if errorMessage is None:
+            successList.append(input)
+        else:
+            errorDict[input] = errorMessage
+        if callback is not None:
+            callback(input, errorMessage)
+    for input in inputList:
+        if input not in errorDict and input not in successList:
+            errorDict[input] = "Operation canceled."
+    return successList, errorDict
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+"""
+Builds zip packages of delivery folders. Files are streamed into the
+archive in chunks while their checksums are computed, so that large rasters
+are never fully loaded in memory, and formats that are already compressed
+are stored instead of deflated. zlib and hashlib release the GIL, therefore
+several packages can be built at the same time on worker threads.
+
+This module does not depend on qgis, so that it can be tested on its own.
+"""
+import hashlib
+import json
+import os
+import time
+import zipfile
+from pathlib import Path
+
+from DsgTools.core.Utils.threadingTools import concurrently
+
+ALREADY_COMPRESSED_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".ecw",
+        ".gz",
+        ".jp2",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".rar",
+        ".sid",
+        ".tif",
+        ".tiff",
+        ".zip",
+    }
+)
+IGNORED_NAMES = (".DS_Store", "__MACOSX")
+CHUNK_SIZE = 1024 * 1024
+
+
+def getPackageFileList(folderPath):
+    """
+    :param folderPath: (Path) folder to be packaged;
+    :return: (list) sorted list of the files inside folderPath, recursively,
+        without the system files added by macOS.
+    """
+    return sorted(
+        item
+        for item in Path(folderPath).rglob("*")
+        if item.is_file() and not any(name in item.parts for name in IGNORED_NAMES)
+    )
+
+
+def getFileChecksum(filePath, chunkSize=CHUNK_SIZE):
+    checksum = hashlib.sha256()
+    with open(filePath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunkSize), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def setCompressLevel(zipInfo, compressLevel):
+    """
+    ZipFile.open ignores the compresslevel of the archive when it is given a
+    ZipInfo, therefore the level is set on each entry.
+    """
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        # python >= 3.13
+        zipInfo.compress_level = compressLevel
+    else:
+        zipInfo._compresslevel = compressLevel
+
+
+def buildZipPackage(
+    folderPath,
+    zipPath,
+    storeCompressedFormats=True,
+    compressLevel=6,
+    chunkSize=CHUNK_SIZE,
+    feedback=None,
+):
+    """
+    Writes the files of folderPath into zipPath, under a folder named after
+    the stem of folderPath (its name without the last suffix, the layout
+    produced by the package algorithm before it used this module). The archive is written to a temporary file that is renamed
+    only when complete, so that a canceled or failed run does not leave a
+    truncated package behind.
+    :param folderPath: (str or Path) folder to be packaged;
+    :param zipPath: (str or Path) output zip file;
+    :param storeCompressedFormats: (bool) whether files whose suffix is in
+        ALREADY_COMPRESSED_SUFFIXES are stored instead of deflated;
+    :param compressLevel: (int) deflate level, from 0 to 9;
+    :param chunkSize: (int) size of the chunks that are read at once;
+    :param feedback: (QgsFeedback) optional feedback, checked between chunks;
+    :return: (dict) manifest entry of the package, or None if canceled.
+    """
+    folderPath, zipPath = Path(folderPath), Path(zipPath)
+    partialPath = zipPath.with_name(zipPath.name + ".part")
+    start = time.perf_counter()
+    fileEntryList = []
+    inputSize = 0
+    try:
+        with zipfile.ZipFile(
+            partialPath, "w", zipfile.ZIP_DEFLATED, compresslevel=compressLevel
+        ) as zf:
+            for filePath in getPackageFileList(folderPath):
+                isStored = (
+                    storeCompressedFormats
+                    and filePath.suffix.lower() in ALREADY_COMPRESSED_SUFFIXES
+                )
+                zipInfo = zipfile.ZipInfo.from_file(
+                    filePath,
+                    arcname=str(
+                        Path(folderPath.stem) / filePath.relative_to(folderPath)
+                    ),
+                )
+                zipInfo.compress_type = (
+                    zipfile.ZIP_STORED if isStored else zipfile.ZIP_DEFLATED
+                )
+                setCompressLevel(zipInfo, None if isStored else compressLevel)
+                checksum = hashlib.sha256()
+                with open(filePath, "rb") as src, zf.open(
+                    zipInfo, "w", force_zip64=True
+                ) as dst:
+                    for chunk in iter(lambda: src.read(chunkSize), b""):
+                        if feedback is not None and feedback.isCanceled():
+                            raise InterruptedError
+                        checksum.update(chunk)
+                        dst.write(chunk)
+                fileSize = filePath.stat().st_size
+                inputSize += fileSize
+                fileEntryList.append(
+                    {
+                        "name": zipInfo.filename,
+                        "size": fileSize,
+                        "sha256": checksum.hexdigest(),
+                        "stored": isStored,
+                    }
+                )
+        os.replace(partialPath, zipPath)
+    except InterruptedError:
+        partialPath.unlink()
+        return None
+    except BaseException:
+        if partialPath.exists():
+            partialPath.unlink()
+        raise
+    elapsed = time.perf_counter() - start
+    return {
+        "package": zipPath.name,
+        "size": zipPath.stat().st_size,
+        "sha256": getFileChecksum(zipPath, chunkSize=chunkSize),
+        "input_size": inputSize,
+        "elapsed_seconds": elapsed,
+        "throughput_mb_per_second": inputSize / (1024 * 1024) / elapsed
+        if elapsed > 0
+        else None,
+        "files": fileEntryList,
+    }
+
+
+def buildZipPackages(
+    packageList,
+    maxConcurrency=1,
+    storeCompressedFormats=True,
+    compressLevel=6,
+    feedback=None,
+):
+    """
+    Builds the packages of packageList with at most maxConcurrency packages
+    being compressed at the same time.
+    :param packageList: (list) list of (folderPath, zipPath) tuples;
+    :param maxConcurrency: (int) maximum number of packages built at once;
+    :param storeCompressedFormats: (bool) see buildZipPackage;
+    :param compressLevel: (int) see buildZipPackage;
+    :param feedback: (QgsFeedback) optional feedback;
+    :return: (generator) manifest entries, as the packages are completed.
+    """
+
+    def build(package):
+        folderPath, zipPath = package
+        if feedback is not None and feedback.isCanceled():
+            return None
+        return buildZipPackage(
+            folderPath,
+            zipPath,
+            storeCompressedFormats=storeCompressedFormats,
+            compressLevel=compressLevel,
+            feedback=feedback,
+        )
+
+    for entry in concurrently(
+        build, packageList, max_concurrency=maxConcurrency, feedback=feedback
+    ):
+        if entry is not None:
+            yield entry
+
+
+def writeManifest(manifestPath, entryList):
+    """
+    Writes the manifest of the packages, sorted by package name, as json.
+    """
+    with open(manifestPath, "w", encoding="utf-8") as f:
+        json.dump(
+            {"packages": sorted(entryList, key=lambda x: x["package"])},
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
@@ -33,6 +33,7 @@ from qgis.gui import (
 )
 from qgis import core
 from qgis.core import (
+    QgsCoordinateTransform,
     QgsPointXY,
     QgsRectangle,
     QgsVectorLayer,
@@ -52,6 +53,10 @@ from qgis.PyQt.QtWidgets import QMenu, QApplication
 
 from qgis.PyQt.QtCore import Qt
 from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+from DsgTools.core.GeometricTools.rasterHandler import (
+    RasterBlockSampler,
+    samplePixelValuesFromPointList,
+)
 
 
 class AssignBandValueTool(QgsMapTool):
@@ -69,6 +74,9 @@ class AssignBandValueTool(QgsMapTool):
         self.qgsMapToolEmitPoint = QgsMapToolEmitPoint(self.canvas)
         self.geometryHandler = GeometryHandler(iface)
         self.rasterLayer = rasterLayer
+        # keeps the last read raster blocks, so that clicks and rectangles
+        # over the same area do not read the raster again
+        self.sampler = RasterBlockSampler(rasterLayer, maxCachedBlocks=16)
         self.setRubberbandParameters()
         self.reset()
         self.auxList = []
@@ -302,6 +310,11 @@ class AssignBandValueTool(QgsMapTool):
         mousePosGeom = QgsGeometry.fromPointXY(mousePos)
         return self.getPixelValueFromPoint(mousePosGeom, rasterLayer), mousePosGeom
 
+    def formatPixelValue(self, value):
+        if not value:
+            return value
+        return int(value) if self.decimals == 0 else round(value, self.decimals)
+
     def getPixelValueFromPoint(self, mousePosGeom, rasterLayer, fromCanvas=True):
         """ """
         rasterCrs = rasterLayer.crs()
@@ -320,24 +333,43 @@ class AssignBandValueTool(QgsMapTool):
             else mousePosGeom.asPoint()
         )
         # identify pixel(s) information
-        i = rasterLayer.dataProvider().identify(mousePos, QgsRaster.IdentifyFormatValue)
-        if i.isValid():
-            value = list(i.results().values())[0]
-            if value:
-                value = (
-                    int(value) if self.decimals == 0 else round(value, self.decimals)
-                )
-            return value
-        else:
-            return None
+        (valueList,) = samplePixelValuesFromPointList(
+            rasterLayer, [mousePos], bandList=[1], sampler=self.getSampler(rasterLayer)
+        )
+        return self.formatPixelValue(valueList[0])
+
+    def getSampler(self, rasterLayer):
+        return self.sampler if rasterLayer == self.rasterLayer else None
 
     def getPixelValueFromPointDict(self, pointDict, rasterLayer):
         """
         pointDict = {'pointId':QgsGeometry}
 
         returns {'pointId': value}
+        All points are reprojected with the same transform and sampled at
+        once, reading each raster block a single time.
         """
+        layerCrs = self.canvas.currentLayer().crs()
+        coordinateTransformer = QgsCoordinateTransform(
+            layerCrs, rasterLayer.crs(), QgsProject.instance()
+        )
+        keyList, pointList = [], []
+        for key, geom in pointDict.items():
+            geom = QgsGeometry(geom)
+            self.geometryHandler.reprojectFeature(
+                geom=geom,
+                referenceCrs=rasterLayer.crs(),
+                destinationCrs=layerCrs,
+                coordinateTransformer=coordinateTransformer,
+            )
+            keyList.append(key)
+            pointList.append(
+                geom.asMultiPoint()[0] if geom.isMultipart() else geom.asPoint()
+            )
+        valueListList = samplePixelValuesFromPointList(
+            rasterLayer, pointList, bandList=[1], sampler=self.getSampler(rasterLayer)
+        )
         return {
-            key: self.getPixelValueFromPoint(value, rasterLayer, fromCanvas=False)
-            for key, value in pointDict.items()
-        }  # no python3 eh items()
+            key: self.formatPixelValue(valueList[0])
+            for key, valueList in zip(keyList, valueListList)
+        }
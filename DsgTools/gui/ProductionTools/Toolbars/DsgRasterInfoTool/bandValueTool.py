@@ -29,6 +29,10 @@ from qgis.PyQt.QtCore import QTimer
 from qgis.PyQt.QtWidgets import QToolTip
 
 from .....core.GeometricTools.geometryHandler import GeometryHandler
+from .....core.GeometricTools.rasterHandler import (
+    RasterBlockSampler,
+    samplePixelValuesFromPointList,
+)
 
 
 class BandValueTool(QgsMapTool):
@@ -57,6 +61,8 @@ class BandValueTool(QgsMapTool):
         self.timerMapTips.timeout.connect(self.showToolTip)
         self.activated = False
         self.canvasCrs = self.canvas.mapRenderer().destinationCrs()
+        self.sampler = None
+        self.samplerKey = None
 
     def setAction(self, action):
         """ """
@@ -98,14 +104,21 @@ class BandValueTool(QgsMapTool):
         self.geometryHandler.reprojectFeature(mousePosGeom, rasterCrs, self.canvasCrs)
         mousePos = mousePosGeom.asPoint()
         # identify pixel(s) information
-        i = rasterLayer.dataProvider().identify(mousePos, QgsRaster.IdentifyFormatValue)
-        if i.isValid():
-            text = ", ".join(
-                ["{0:g}".format(r) for r in list(i.results().values()) if r is not None]
-            )
-        else:
-            text = ""
-        return text
+        (valueList,) = samplePixelValuesFromPointList(
+            rasterLayer, [mousePos], sampler=self.getSampler(rasterLayer)
+        )
+        return ", ".join(["{0:g}".format(r) for r in valueList if r is not None])
+
+    def getSampler(self, rasterLayer):
+        """
+        Returns the block sampler of the raster, keeping the blocks around the
+        cursor in memory while the same raster is hovered.
+        """
+        key = (rasterLayer.id(), rasterLayer.source())
+        if self.samplerKey != key:
+            self.sampler = RasterBlockSampler(rasterLayer, maxCachedBlocks=9)
+            self.samplerKey = key
+        return self.sampler
 
     def showToolTip(self):
         """ """
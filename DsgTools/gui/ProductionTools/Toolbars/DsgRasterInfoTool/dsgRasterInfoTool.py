@@ -42,6 +42,10 @@ from DsgTools.gui.ProductionTools.Toolbars.DsgRasterInfoTool.bandValueTool impor
     BandValueTool,
 )
 from DsgTools.core.GeometricTools.geometryHandler import GeometryHandler
+from DsgTools.core.GeometricTools.rasterHandler import (
+    RasterBlockSampler,
+    samplePixelValuesFromPointList,
+)
 from DsgTools.gui.ProductionTools.Toolbars.DsgRasterInfoTool.assignBandValueTool import (
     AssignBandValueTool,
 )
@@ -75,6 +79,8 @@ class DsgRasterInfoTool(QWidget, Ui_DsgRasterInfoTool):
             )
         )
         self.assignBandValueTool = None
+        self.sampler = None
+        self.samplerKey = None
         self.parent = parent
         self.splitter.hide()
         self.iface = iface
@@ -315,14 +321,21 @@ class DsgRasterInfoTool(QWidget, Ui_DsgRasterInfoTool):
         self.geometryHandler.reprojectFeature(mousePosGeom, rasterCrs, canvasCrs)
         mousePos = mousePosGeom.asPoint()
         # identify pixel(s) information
-        i = rasterLayer.dataProvider().identify(mousePos, QgsRaster.IdentifyFormatValue)
-        if i.isValid():
-            text = ", ".join(
-                ["{0:g}".format(r) for r in list(i.results().values()) if r is not None]
-            )
-        else:
-            text = ""
-        return text
+        (valueList,) = samplePixelValuesFromPointList(
+            rasterLayer, [mousePos], sampler=self.getSampler(rasterLayer)
+        )
+        return ", ".join(["{0:g}".format(r) for r in valueList if r is not None])
+
+    def getSampler(self, rasterLayer):
+        """
+        Returns the block sampler of the raster, keeping the blocks around the
+        cursor in memory while the same raster is hovered.
+        """
+        key = (rasterLayer.id(), rasterLayer.source())
+        if self.samplerKey != key:
+            self.sampler = RasterBlockSampler(rasterLayer, maxCachedBlocks=9)
+            self.samplerKey = key
+        return self.sampler
 
     def showToolTip(self, qgsPoint):
         """ """
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+from bisect import bisect_left
+from heapq import merge
+
+from qgis.core import (
+    QgsExpression,
+    QgsExpressionContext,
+    QgsExpressionContextUtils,
+    QgsFeatureRequest,
+)
+from qgis.PyQt.QtCore import QObject, QVariant
+
+
+class OrderKey(object):
+    """
+    Sort key that reproduces the order used by the feature request built by
+    FeatureIdCursor: sort value (nulls last), then feature id, both in the
+    same direction.
+    """
+
+    __slots__ = ("isNull", "value", "fid", "ascending")
+
+    def __init__(self, value, fid, ascending):
+        self.isNull = value is None or (isinstance(value, QVariant) and value.isNull())
+        self.value = value
+        self.fid = fid
+        self.ascending = ascending
+
+    def __lt__(self, other):
+        if self.isNull != other.isNull:
+            return other.isNull
+        if not self.isNull and self.value != other.value:
+            try:
+                return (self.value < other.value) == self.ascending
+            except TypeError:
+                return (str(self.value) < str(other.value)) == self.ascending
+        return (self.fid < other.fid) == self.ascending
+
+
+class FeatureIdCursor(QObject):
+    """
+    Ordered list of the feature ids of a layer that match a filter
+    expression, sorted by an optional field and by feature id. The list is
+    built with a single request and kept up to date from the layer edit
+    signals, so that moving between features does not query the layer.
+    Edited ids are only queued by the signals and merged in a single pass
+    on the next use of the cursor, so that bulk edits (field calculator,
+    paste, deleting a selection) do not pay one list update per feature.
+    Committing or rolling back edits marks the cursor to be rebuilt on its
+    next use, since provider ids replace the temporary ones.
+    """
+
+    def __init__(self, layer, filterExpression="", sortField=None, ascending=True):
+        super(FeatureIdCursor, self).__init__()
+        self.layer = layer
+        self.filterExpression = filterExpression
+        self.sortField = sortField
+        self.ascending = ascending
+        self.idList = []
+        self.keyList = []
+        self.positionDict = None
+        # ids added, deleted or changed since the last merge
+        self.pendingIdSet = set()
+        self.currentIndex = 0
+        # last position stored on the tool state by the inspect tool
+        self.syncedIndex = None
+        self.isDirty = True
+        self.expression = QgsExpression(filterExpression) if filterExpression else None
+        self.expressionContext = QgsExpressionContext(
+            QgsExpressionContextUtils.globalProjectLayerScopes(layer)
+        )
+        if self.expression is not None:
+            self.expression.prepare(self.expressionContext)
+        self.connectSignals()
+
+    def getKey(self):
+        return self.filterExpression, self.sortField, self.ascending
+
+    def connectSignals(self):
+        self.layer.featureAdded.connect(self.onFeatureAdded)
+        self.layer.featuresDeleted.connect(self.onFeaturesDeleted)
+        self.layer.attributeValueChanged.connect(self.onAttributeValueChanged)
+        self.layer.geometryChanged.connect(self.onGeometryChanged)
+        self.layer.afterCommitChanges.connect(self.setDirty)
+        self.layer.afterRollBack.connect(self.setDirty)
+        self.layer.subsetStringChanged.connect(self.setDirty)
+        self.layer.dataSourceChanged.connect(self.setDirty)
+
+    def disconnectSignals(self):
+        for signal, slot in (
+            (self.layer.featureAdded, self.onFeatureAdded),
+            (self.layer.featuresDeleted, self.onFeaturesDeleted),
+            (self.layer.attributeValueChanged, self.onAttributeValueChanged),
+            (self.layer.geometryChanged, self.onGeometryChanged),
+            (self.layer.afterCommitChanges, self.setDirty),
+            (self.layer.afterRollBack, self.setDirty),
+            (self.layer.subsetStringChanged, self.setDirty),
+            (self.layer.dataSourceChanged, self.setDirty),
+        ):
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+
+    def setDirty(self, *args):
+        self.isDirty = True
+        self.pendingIdSet.clear()
+
+    def getRequest(self):
+        request = QgsFeatureRequest()
+        if self.expression is None or not self.expression.needsGeometry():
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+        if self.expression is not None:
+            request.setFilterExpression(self.filterExpression)
+        clauseList = []
+        if self.sortField is not None:
+            clauseList.append(
+                QgsFeatureRequest.OrderByClause(self.sortField, self.ascending, False)
+            )
+        clauseList.append(
+            QgsFeatureRequest.OrderByClause("$id", ascending=self.ascending)
+        )
+        request.setOrderBy(QgsFeatureRequest.OrderBy(clauseList))
+        return request
+
+    def getOrderKey(self, feature):
+        value = feature[self.sortField] if self.sortField is not None else None
+        return OrderKey(value, feature.id(), self.ascending)
+
+    def build(self):
+        """
+        Runs the ordered request and stores the ids and sort keys. The
+        current position is kept on the same feature, when it still exists.
+        """
+        currentId = self.currentId()
+        self.idList, self.keyList = [], []
+        for feature in self.layer.getFeatures(self.getRequest()):
+            self.idList.append(feature.id())
+            self.keyList.append(self.getOrderKey(feature))
+        self.positionDict = None
+        self.pendingIdSet.clear()
+        self.isDirty = False
+        self.currentIndex = (
+            self.indexOf(currentId)
+            if currentId is not None and self.indexOf(currentId) is not None
+            else 0
+        )
+
+    def mergePending(self):
+        """
+        Applies the queued edits in O(n + k log k): drops the edited ids from
+        the list, fetches the ones that still exist with a single request and
+        merges those that match the filter back in order. When the current
+        feature is gone, the cursor moves to the feature that took its place.
+        """
+        pendingIdSet, self.pendingIdSet = self.pendingIdSet, set()
+        currentId = self.currentId()
+        currentKey = self.keyList[self.currentIndex] if currentId is not None else None
+        keptList = [
+            (key, fid)
+            for key, fid in zip(self.keyList, self.idList)
+            if fid not in pendingIdSet
+        ]
+        request = QgsFeatureRequest().setFilterFids(list(pendingIdSet))
+        if self.expression is None or not self.expression.needsGeometry():
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+        insertedList = sorted(
+            (
+                (self.getOrderKey(feature), feature.id())
+                for feature in self.layer.getFeatures(request)
+                if self.accepts(feature)
+            ),
+            key=lambda item: item[0],
+        )
+        mergedList = list(merge(keptList, insertedList, key=lambda item: item[0]))
+        self.keyList = [key for key, _ in mergedList]
+        self.idList = [fid for _, fid in mergedList]
+        self.positionDict = None
+        if currentKey is None or not self.idList:
+            self.currentIndex = 0
+            return
+        index = self.indexOf(currentId)
+        if index is None:
+            index = min(bisect_left(self.keyList, currentKey), len(self.idList) - 1)
+        self.currentIndex = index
+
+    def ensureBuilt(self):
+        if self.isDirty:
+            self.build()
+        elif self.pendingIdSet:
+            self.mergePending()
+
+    def __len__(self):
+        self.ensureBuilt()
+        return len(self.idList)
+
+    def currentId(self):
+        if self.currentIndex >= len(self.idList):
+            return None
+        return self.idList[self.currentIndex]
+
+    def indexOf(self, featId):
+        """
+        Returns the position of featId on the ordered list or None.
+        """
+        self.ensureBuilt()
+        if self.positionDict is None:
+            self.positionDict = {fid: i for i, fid in enumerate(self.idList)}
+        return self.positionDict.get(featId)
+
+    def moveTo(self, index):
+        """
+        Sets the current position, wrapping around the list ends.
+        :param index: (int) new position;
+        :return: (int) current feature id or None, if the list is empty.
+        """
+        self.ensureBuilt()
+        if not self.idList:
+            return None
+        self.currentIndex = index % len(self.idList)
+        return self.idList[self.currentIndex]
+
+    def move(self, step):
+        """
+        Moves the cursor step positions (negative values move backwards).
+        """
+        self.ensureBuilt()
+        return self.moveTo(self.currentIndex + step)
+
+    def accepts(self, feature):
+        if self.expression is None:
+            return True
+        self.expressionContext.setFeature(feature)
+        return bool(self.expression.evaluate(self.expressionContext))
+
+    def update(self, featId):
+        """
+        Queues a feature to have its filter and sort key re-evaluated.
+        """
+        if not self.isDirty:
+            self.pendingIdSet.add(featId)
+
+    def onFeatureAdded(self, featId):
+        self.update(featId)
+
+    def onFeaturesDeleted(self, featIdList):
+        if not self.isDirty:
+            self.pendingIdSet.update(featIdList)
+
+    def onAttributeValueChanged(self, featId, idx, value):
+        if self.expression is None and self.sortField is None:
+            return
+        self.update(featId)
+
+    def onGeometryChanged(self, featId, geometry):
+        if self.expression is not None and self.expression.needsGeometry():
+            self.update(featId)
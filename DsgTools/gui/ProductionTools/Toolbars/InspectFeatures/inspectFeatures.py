@@ -39,6 +39,7 @@ from qgis.core import (
 )
 from qgis.gui import QgsMessageBar
 
+from .featureIdCursor import FeatureIdCursor
 from .inspectFeatures_ui import Ui_Form
 
 # FORM_CLASS, _ = uic.loadUiType(os.path.join(
@@ -81,6 +82,10 @@ class InspectFeatures(QWidget, Ui_Form):
         self.enableScale()
         self.canvas = self.iface.mapCanvas()
         self.allLayers = {}
+        # layer id -> FeatureIdCursor
+        self.cursorDict = {}
+        # ids of the layers whose willBeDeleted signal is already connected
+        self.watchedLayerIdSet = set()
         # self.idxChanged.connect(self.setNewId)
         self.setToolTip("")
         icon_path = ":/plugins/DsgTools/icons/inspectFeatures.png"
@@ -206,8 +211,10 @@ class InspectFeatures(QWidget, Ui_Form):
             oldIndex = self.allLayers[lyrId]
             if oldIndex == 0:
                 return
-            featIdList = self.getFeatIdList(currentLayer)
-            if oldIndex not in featIdList:
+            cursor = self.getFeatureIdCursor(currentLayer)
+            if cursor is None:
+                return
+            if cursor.indexOf(oldIndex) is None:
                 oldIndex = 0
             zoom = (
                 self.mScaleWidget.scale()
@@ -217,18 +224,24 @@ class InspectFeatures(QWidget, Ui_Form):
             if oldIndex == newId:
                 # self.iface.messageBar().pushMessage(self.tr('Warning!'), self.tr('Selected id does not exist in layer {0}. Returned to previous id.').format(lyrName), level=Qgis.Warning, duration=2)
                 return
-            try:
-                index = featIdList.index(newId)
+            index = cursor.indexOf(newId)
+            if index is not None:
                 self.allLayers[lyrId] = index
                 self.makeZoom(zoom, currentLayer, newId)
-                self.idSpinBox.setSuffix(f" ({index + 1}/{len(featIdList)})")
-            except:
+                self.idSpinBox.setSuffix(f" ({index + 1}/{len(cursor)})")
+            else:
                 # self.iface.messageBar().pushMessage(self.tr('Warning!'), self.tr('Selected id does not exist in layer {0}. Returned to previous id.').format(lyrName), level=Qgis.Warning, duration=2)
                 self.idSpinBox.setValue(oldIndex)
                 self.makeZoom(zoom, currentLayer, oldIndex)
 
-    def getFeatIdList(self, currentLayer):
-        # getting all features ids
+    def getFeatureIdCursor(self, currentLayer):
+        """
+        Returns the cursor over the ordered feature ids of currentLayer for
+        the current filter and sort options. The cursor is reused while
+        these options do not change and follows the layer edits.
+        :param currentLayer: (QgsVectorLayer) layer being inspected;
+        :return: (FeatureIdCursor) cursor or None, if the filter is invalid.
+        """
         if (
             self.mFieldExpressionWidget.currentText() != ""
             and not self.mFieldExpressionWidget.isValidExpression()
@@ -239,29 +252,41 @@ class InspectFeatures(QWidget, Ui_Form):
                 level=Qgis.Warning,
                 duration=2,
             )
-            return []
-        request = QgsFeatureRequest()
-        request.setFlags(QgsFeatureRequest.NoGeometry)
-        if self.mFieldExpressionWidget.currentText() != "":
-            request.setFilterExpression(self.mFieldExpressionWidget.asExpression())
-        clauseList = []
-        if self.sortPushButton.isChecked():
-            # order by some attribute
-            clause = QgsFeatureRequest.OrderByClause(
-                self.mFieldComboBox.currentField(),
-                self.ascRadioButton.isChecked(),
-                False,
-            )
-            clauseList.append(clause)
-        clauseId = QgsFeatureRequest.OrderByClause(
-            "$id", ascending=self.ascRadioButton.isChecked()
+            return None
+        filterExpression = (
+            self.mFieldExpressionWidget.asExpression()
+            if self.mFieldExpressionWidget.currentText() != ""
+            else ""
+        )
+        sortField = (
+            self.mFieldComboBox.currentField()
+            if self.sortPushButton.isChecked()
+            else None
         )
-        clauseList.append(clauseId)
-        orderby = QgsFeatureRequest.OrderBy(clauseList)
-        request.setOrderBy(orderby)
-        featIdList = [i.id() for i in currentLayer.getFeatures(request)]
-        # sort is faster than sorted (but sort is just available for lists)
-        return featIdList
+        key = (filterExpression, sortField, self.ascRadioButton.isChecked())
+        lyrId = currentLayer.id()
+        cursor = self.cursorDict.get(lyrId)
+        if cursor is not None and cursor.getKey() == key:
+            return cursor
+        if cursor is not None:
+            cursor.disconnectSignals()
+        if lyrId not in self.watchedLayerIdSet:
+            self.watchedLayerIdSet.add(lyrId)
+            currentLayer.willBeDeleted.connect(
+                lambda lyrId=lyrId: self.onLayerWillBeDeleted(lyrId)
+            )
+        cursor = FeatureIdCursor(currentLayer, *key)
+        self.cursorDict[lyrId] = cursor
+        return cursor
+
+    def removeFeatureIdCursor(self, lyrId):
+        cursor = self.cursorDict.pop(lyrId, None)
+        if cursor is not None:
+            cursor.disconnectSignals()
+
+    def onLayerWillBeDeleted(self, lyrId):
+        self.watchedLayerIdSet.discard(lyrId)
+        self.removeFeatureIdCursor(lyrId)
 
     def iterateFeature(self, method):
         """
@@ -277,9 +302,12 @@ class InspectFeatures(QWidget, Ui_Form):
             else self.zoomPercentageSpinBox.value()
         )
 
-        featIdList = self.getFeatIdList(currentLayer)
+        cursor = self.getFeatureIdCursor(currentLayer)
+        if cursor is None:
+            return
+        nFeatures = len(cursor)
 
-        if not currentLayer or len(featIdList) == 0:
+        if not currentLayer or nFeatures == 0:
             self.errorMessage()
             return
 
@@ -289,12 +317,15 @@ class InspectFeatures(QWidget, Ui_Form):
             self.allLayers[lyrName] = 0
             first = True
 
-        # getting the current index
-        index = self.allLayers[lyrName]
+        # getting the current index. The cursor position follows the layer
+        # edits, unless the stored index was changed elsewhere.
+        if cursor.syncedIndex != self.allLayers[lyrName]:
+            cursor.moveTo(self.allLayers[lyrName])
+        index = cursor.currentIndex
 
         # getting max and min ids
         # this was made because the list is already sorted, there's no need to calculate max and min
-        maxIndex = len(featIdList) - 1
+        maxIndex = nFeatures - 1
         minIndex = 0
 
         self.idSpinBox.setMaximum(maxIndex)
@@ -303,11 +334,11 @@ class InspectFeatures(QWidget, Ui_Form):
         # getting the new index
         if not first:
             index = method(index, maxIndex, minIndex)
-        self.idSpinBox.setSuffix(" ({0}/{1})".format(index + 1, len(featIdList)))
-        self.allLayers[lyrName] = index
+        self.idSpinBox.setSuffix(" ({0}/{1})".format(index + 1, nFeatures))
 
         # getting the new feature id
-        id = featIdList[index]
+        id = cursor.moveTo(index)
+        self.allLayers[lyrName] = cursor.syncedIndex = index
 
         # adjustin the spin box value
         # self.idxChanged.emit(id)
@@ -476,6 +507,8 @@ class InspectFeatures(QWidget, Ui_Form):
         self.mFieldExpressionWidget.setExpression("")
 
     def unload(self):
+        for lyrId in list(self.cursorDict.keys()):
+            self.removeFeatureIdCursor(lyrId)
         try:
             self.iface.unregisterMainWindowAction(self.activateToolAction)
         except:
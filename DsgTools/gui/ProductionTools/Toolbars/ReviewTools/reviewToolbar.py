@@ -40,6 +40,7 @@ from qgis.PyQt.QtCore import QSettings, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QWidget
 
+from .reviewVisitQueue import ReviewVisitQueue
 from .review_ui import Ui_ReviewToolbar
 
 
@@ -102,6 +103,7 @@ class ReviewToolbar(QWidget, Ui_ReviewToolbar):
         self.mMapLayerComboBox.setAllowEmptyLayer(True)
         self.mMapLayerComboBox.setCurrentIndex(0)
         self.currentTile = None
+        self.visitQueue = None
         self.originalValueList = self.getValueListFromQsettings()
 
     def add_action(
@@ -269,24 +271,28 @@ class ReviewToolbar(QWidget, Ui_ReviewToolbar):
         else:
             self.splitter.hide()
 
-    @pyqtSlot(bool)
-    def on_previousTileButton_clicked(self) -> None:
+    def getVisitQueue(self) -> Optional[ReviewVisitQueue]:
+        """
+        Returns the queue of unvisited tiles of the current layer, building
+        it when the layer or the rank and visited fields change.
+        """
         layer = self.mMapLayerComboBox.currentLayer()
         if layer is None:
-            return
+            return None
         rankField = self.rankFieldComboBox.currentField()
-        if rankField is None:
-            return
         visitedField = self.visitedFieldComboBox.currentField()
-        if visitedField is None:
-            return
-        request = self.getFeatureRequest(
-            rankField, expression=f"{visitedField} = False", ascending=True
-        )
-        featDict = {feat.id(): feat for feat in layer.getFeatures(request)}
-        featIdList = sorted(featDict.keys(), reverse=False)
-        nFeats = len(featDict)
-        if nFeats == 0:
+        if not rankField or not visitedField:
+            return None
+        key = (layer.id(), rankField, visitedField)
+        if self.visitQueue is not None and self.visitQueue.getKey() == key:
+            return self.visitQueue
+        if self.visitQueue is not None:
+            self.visitQueue.disconnectSignals()
+        self.visitQueue = ReviewVisitQueue(layer, rankField, visitedField)
+        return self.visitQueue
+
+    def goToTile(self, featId: Optional[int]) -> None:
+        if featId is None:
             self.iface.messageBar().pushMessage(
                 title=self.tr("Info!"),
                 text=self.tr("All tiles already visited!"),
@@ -294,50 +300,36 @@ class ReviewToolbar(QWidget, Ui_ReviewToolbar):
                 duration=2,
             )
             return
-        currentIdx = (
-            featIdList.index(self.currentTile) if self.currentTile in featIdList else 0
-        )
-        nextFeature = featDict[featIdList[(currentIdx - 1)]]
+        nextFeature = self.mMapLayerComboBox.currentLayer().getFeature(featId)
         if self.zoomComboBox.currentIndex() == ReviewToolbar.ZoomToNext:
             self.zoomToFeature(nextFeature)
         else:
             self.panToFeature(nextFeature)
-        self.currentTile = nextFeature.id()
+        self.currentTile = featId
 
     @pyqtSlot(bool)
-    def on_nextTileButton_clicked(self) -> None:
-        layer = self.mMapLayerComboBox.currentLayer()
-        if layer is None:
-            return
-        rankField = self.rankFieldComboBox.currentField()
-        if rankField is None:
-            return
-        visitedField = self.visitedFieldComboBox.currentField()
-        if visitedField is None:
+    def on_previousTileButton_clicked(self) -> None:
+        visitQueue = self.getVisitQueue()
+        if visitQueue is None:
             return
-        request = self.getFeatureRequest(
-            rankField, expression=f"{visitedField} = False", ascending=True
+        rank = (
+            visitQueue.getRank(self.currentTile)
+            if visitQueue.contains(self.currentTile)
+            else None
         )
-        featDict = {feat.id(): feat for feat in layer.getFeatures(request)}
-        featIdList = sorted(featDict.keys(), reverse=False)
-        nFeats = len(featDict)
-        if nFeats == 0:
-            self.iface.messageBar().pushMessage(
-                title=self.tr("Info!"),
-                text=self.tr("All tiles already visited!"),
-                level=Qgis.Info,
-                duration=2,
-            )
+        self.goToTile(visitQueue.getPrevious(rank))
+
+    @pyqtSlot(bool)
+    def on_nextTileButton_clicked(self) -> None:
+        visitQueue = self.getVisitQueue()
+        if visitQueue is None:
             return
-        currentIdx = (
-            featIdList.index(self.currentTile) if self.currentTile in featIdList else -1
+        rank = (
+            visitQueue.getRank(self.currentTile)
+            if visitQueue.contains(self.currentTile)
+            else None
         )
-        nextFeature = featDict[featIdList[(currentIdx + 1) % nFeats]]
-        if self.zoomComboBox.currentIndex() == ReviewToolbar.ZoomToNext:
-            self.zoomToFeature(nextFeature)
-        else:
-            self.panToFeature(nextFeature)
-        self.currentTile = nextFeature.id()
+        self.goToTile(visitQueue.getNext(rank))
 
     @pyqtSlot(bool)
     def on_resetPushButton_clicked(self) -> None:
@@ -449,34 +441,19 @@ class ReviewToolbar(QWidget, Ui_ReviewToolbar):
         layer.setReadOnly(True)
 
     def getNextFeature(self, currentFeature, forward=True) -> QgsFeature:
-        layer = self.mMapLayerComboBox.currentLayer()
-        if layer is None:
-            return
-        rankField = self.rankFieldComboBox.currentField()
-        if rankField is None:
+        visitQueue = self.getVisitQueue()
+        if visitQueue is None:
             return
-        visitedField = self.visitedFieldComboBox.currentField()
-        if visitedField is None:
-            return
-        # we first try to get the next local feature
-        if currentFeature is not None:
-            expression = (
-                f"{visitedField} = False and {rankField} > {currentFeature[rankField]} "
-                if forward
-                else f"{visitedField} = False and {rankField} < {currentFeature[rankField]} "
-            )
-            request = self.getFeatureRequest(rankField, expression=expression, limit=1)
-            nextFeat = next(layer.getFeatures(request), None)
-            if nextFeat is not None:
-                return nextFeat
-        # if there is no next local feature, we search globally, but this search can also return None
-        request = self.getFeatureRequest(
-            rankField,
-            expression=f"{visitedField} = False",
-            ascending=True if forward else False,
-            limit=1,
+        rank = (
+            currentFeature[visitQueue.rankField] if currentFeature is not None else None
         )
-        return next(layer.getFeatures(request), None)
+        rank = rank if isinstance(rank, int) else None
+        # the next local tile is searched first. If there is none, the queue
+        # goes back to its start, which can also return None
+        featId = visitQueue.getNext(rank) if forward else visitQueue.getPrevious(rank)
+        if featId is None:
+            return None
+        return self.mMapLayerComboBox.currentLayer().getFeature(featId)
 
     def getFeatureRequest(
         self,
@@ -586,6 +563,9 @@ class ReviewToolbar(QWidget, Ui_ReviewToolbar):
 
     def unload(self) -> None:
         self.restoreOriginalValueList()
+        if self.visitQueue is not None:
+            self.visitQueue.disconnectSignals()
+            self.visitQueue = None
         try:
             self.iface.unregisterMainWindowAction(self.applyPushButtonAction)
         except:
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from qgis.core import QgsFeatureRequest, QgsVectorLayer
+from qgis.PyQt.QtCore import QObject
+
+
+class ReviewVisitQueue(QObject):
+    """
+    Rank ordered queue of the unvisited cells of a review grid. It is built
+    with a single request and kept current from the layer attribute changes,
+    so that finding the next or previous cell does not query the layer.
+    """
+
+    def __init__(self, layer: QgsVectorLayer, rankField: str, visitedField: str):
+        super(ReviewVisitQueue, self).__init__()
+        self.layer = layer
+        self.rankField = rankField
+        self.visitedField = visitedField
+        self.rankDict = dict()  # feature id -> rank, for every cell
+        self.rankList = []  # ranks of the unvisited cells, sorted
+        self.idList = []  # feature ids aligned with rankList
+        self.isDirty = True
+        self.layer.attributeValueChanged.connect(self.onAttributeValueChanged)
+        self.layer.featureAdded.connect(self.setDirty)
+        self.layer.featuresDeleted.connect(self.setDirty)
+        self.layer.afterRollBack.connect(self.setDirty)
+        self.layer.subsetStringChanged.connect(self.setDirty)
+
+    def disconnectSignals(self) -> None:
+        for signal, slot in (
+            (self.layer.attributeValueChanged, self.onAttributeValueChanged),
+            (self.layer.featureAdded, self.setDirty),
+            (self.layer.featuresDeleted, self.setDirty),
+            (self.layer.afterRollBack, self.setDirty),
+            (self.layer.subsetStringChanged, self.setDirty),
+        ):
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+
+    def getKey(self):
+        return self.layer.id(), self.rankField, self.visitedField
+
+    def setDirty(self, *args) -> None:
+        self.isDirty = True
+
+    def build(self) -> None:
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes(
+            [self.rankField, self.visitedField], self.layer.fields()
+        )
+        self.rankDict = dict()
+        unvisitedList = []
+        for feat in self.layer.getFeatures(request):
+            rank = feat[self.rankField]
+            if rank is None or not isinstance(rank, int):
+                continue
+            self.rankDict[feat.id()] = rank
+            # same as the expression "visited = False", nulls are skipped
+            if feat[self.visitedField] is False:
+                unvisitedList.append((rank, feat.id()))
+        unvisitedList.sort()
+        self.rankList = [rank for rank, _ in unvisitedList]
+        self.idList = [featId for _, featId in unvisitedList]
+        self.isDirty = False
+
+    def ensureBuilt(self) -> None:
+        if self.isDirty:
+            self.build()
+
+    def __len__(self) -> int:
+        self.ensureBuilt()
+        return len(self.idList)
+
+    def contains(self, featId: int) -> bool:
+        self.ensureBuilt()
+        rank = self.rankDict.get(featId)
+        if rank is None:
+            return False
+        idx = bisect_left(self.rankList, rank)
+        return idx < len(self.idList) and self.idList[idx] == featId
+
+    def getRank(self, featId: int) -> Optional[int]:
+        self.ensureBuilt()
+        return self.rankDict.get(featId)
+
+    def setVisited(self, featId: int, visited: bool) -> None:
+        rank = self.rankDict.get(featId)
+        if rank is None:
+            return
+        idx = bisect_left(self.rankList, rank)
+        isQueued = idx < len(self.idList) and self.idList[idx] == featId
+        if visited and isQueued:
+            del self.rankList[idx]
+            del self.idList[idx]
+        elif not visited and not isQueued:
+            self.rankList.insert(idx, rank)
+            self.idList.insert(idx, featId)
+
+    def onAttributeValueChanged(self, featId: int, idx: int, value) -> None:
+        if self.isDirty:
+            return
+        fieldName = self.layer.fields().at(idx).name()
+        if fieldName == self.visitedField:
+            self.setVisited(featId, value is not False)
+        elif fieldName == self.rankField:
+            self.isDirty = True
+
+    def getNext(self, rank: Optional[int] = None) -> Optional[int]:
+        """
+        Returns the id of the first unvisited cell ranked after rank, going
+        back to the first cell when there is none. Returns None if every cell
+        was visited.
+        """
+        self.ensureBuilt()
+        if not self.idList:
+            return None
+        idx = 0 if rank is None else bisect_right(self.rankList, rank)
+        return self.idList[idx % len(self.idList)]
+
+    def getPrevious(self, rank: Optional[int] = None) -> Optional[int]:
+        """
+        Returns the id of the last unvisited cell ranked before rank, going
+        to the last cell when there is none. Returns None if every cell was
+        visited.
+        """
+        self.ensureBuilt()
+        if not self.idList:
+            return None
+        idx = len(self.idList) if rank is None else bisect_left(self.rankList, rank)
+        return self.idList[(idx - 1) % len(self.idList)]
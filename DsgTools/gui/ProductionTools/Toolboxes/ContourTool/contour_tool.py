@@ -37,35 +37,121 @@ from DsgTools.gui.ProductionTools.Toolboxes.ContourTool.contour_value import (
 
 
 class ContourTool(object):
+    """
+    Keeps the features of the reference layer (geometries and attributes)
+    and their spatial index in memory. The cache follows the layer edits, so
+    that finding the contours crossed by a line does not query the provider.
+    """
+
+    def __init__(self):
+        self.first_value = None
+        self.reference = None
+        self.index = QgsSpatialIndex()
+        self.featureDict = dict()
+        self.isDirty = True
+
     def updateReference(self, referenceLayer):
         """
         Updates the reference layer and updates the spatial index
         """
         self.first_value = None
+        self.disconnectSignals()
         self.reference = referenceLayer
+        self.connectSignals()
         self.populateIndex()
 
+    def getSignalList(self):
+        return [
+            (self.reference.featureAdded, self.onFeatureAdded),
+            (self.reference.featuresDeleted, self.onFeaturesDeleted),
+            (self.reference.geometryChanged, self.onGeometryChanged),
+            (self.reference.attributeValueChanged, self.onAttributeValueChanged),
+            (self.reference.afterCommitChanges, self.setDirty),
+            (self.reference.afterRollBack, self.setDirty),
+            (self.reference.updatedFields, self.setDirty),
+            (self.reference.subsetStringChanged, self.setDirty),
+            (self.reference.dataSourceChanged, self.setDirty),
+            (self.reference.willBeDeleted, self.disconnectSignals),
+        ]
+
+    def connectSignals(self):
+        for signal, slot in self.getSignalList():
+            signal.connect(slot)
+
+    def disconnectSignals(self):
+        if self.reference is None:
+            return
+        for signal, slot in self.getSignalList():
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+
+    def setDirty(self, *args):
+        """
+        Commits replace the temporary ids of added features and field changes
+        shift the attribute indexes, so the cache is rebuilt on its next use.
+        """
+        self.isDirty = True
+
     def populateIndex(self):
         """
         Populates the spatial index
         """
         # spatial index
         self.index = QgsSpatialIndex()
+        self.featureDict = dict()
         for feat in self.reference.getFeatures():
-            self.index.addFeature(feat)
+            self.addToCache(feat)
+        self.isDirty = False
+
+    def addToCache(self, feat):
+        if not feat.hasGeometry():
+            return
+        self.featureDict[feat.id()] = feat
+        self.index.addFeature(feat)
+
+    def removeFromCache(self, featId):
+        feat = self.featureDict.pop(featId, None)
+        if feat is not None:
+            self.index.deleteFeature(feat)
+        return feat
+
+    def onFeatureAdded(self, featId):
+        if self.isDirty:
+            return
+        self.removeFromCache(featId)
+        self.addToCache(self.reference.getFeature(featId))
+
+    def onFeaturesDeleted(self, featIdList):
+        if self.isDirty:
+            return
+        for featId in featIdList:
+            self.removeFromCache(featId)
+
+    def onGeometryChanged(self, featId, geom):
+        if self.isDirty:
+            return
+        feat = self.removeFromCache(featId)
+        if feat is None:
+            feat = self.reference.getFeature(featId)
+        feat.setGeometry(geom)
+        self.addToCache(feat)
+
+    def onAttributeValueChanged(self, featId, idx, value):
+        if self.isDirty or featId not in self.featureDict:
+            return
+        self.featureDict[featId].setAttribute(idx, value)
 
     def getCandidates(self, bbox):
         """
         Gets candidates using the spatial index to speedup the process
         """
+        if self.isDirty:
+            self.populateIndex()
         # features that might satisfy the query
         ids = self.index.intersects(bbox)
-        candidates = []
-        for id in ids:
-            candidates.append(
-                next(self.reference.getFeatures(QgsFeatureRequest().setFilterFid(id)))
-            )
-        return candidates
+        return [self.featureDict[id] for id in ids if id in self.featureDict]
 
     def getFeatures(self, geom):
         """
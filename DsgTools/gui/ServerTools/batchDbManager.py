@@ -25,7 +25,7 @@ from builtins import range
 import os
 from os.path import expanduser
 
-from qgis.core import QgsMessageLog, Qgis
+from qgis.core import QgsFeedback, QgsMessageLog, Qgis
 
 # Qt imports
 from qgis.PyQt import QtWidgets, uic
@@ -36,12 +36,14 @@ from qgis.PyQt.QtWidgets import (
     QMenu,
     QApplication,
     QFileDialog,
+    QProgressDialog,
 )
 from qgis.PyQt.QtGui import QCursor
 from qgis.PyQt.QtSql import QSqlDatabase, QSqlQuery
 
 # DSGTools imports
 from DsgTools.core.Utils.utils import Utils
+from DsgTools.core.Utils.threadingTools import runBatch
 from DsgTools.core.Factories.SqlFactory.sqlGeneratorFactory import SqlGeneratorFactory
 from DsgTools.gui.ServerTools.viewServers import ViewServers
 from DsgTools.core.Factories.DbFactory.dbFactory import DbFactory
@@ -59,6 +61,8 @@ FORM_CLASS, _ = uic.loadUiType(
 
 class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
     EDGV213, EDGV_FTer_2a_Ed, Non_EDGV = list(range(3))
+    # maximum number of databases handled at the same time by batch operations
+    maxConcurrency = 4
 
     def __init__(self, parent=None):
         """Constructor."""
@@ -150,10 +154,9 @@ class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
     def getSelectedDbList(self):
         return self.dbsCustomSelector.toLs
 
-    def instantiateAbstractDbs(self, instantiateTemplates=False):
-        dbsDict = dict()
+    def getDbNameList(self, instantiateTemplates=False):
         selectedDbNameList = self.getSelectedDbList()
-        selectedDbNameList = (
+        return (
             list(
                 set(
                     selectedDbNameList
@@ -168,6 +171,10 @@ class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
             if instantiateTemplates
             else selectedDbNameList
         )
+
+    def instantiateAbstractDbs(self, instantiateTemplates=False):
+        dbsDict = dict()
+        selectedDbNameList = self.getDbNameList(instantiateTemplates)
         for dbName in selectedDbNameList:
             localDb = self.dbFactory.createDbFactory(DsgEnums.DriverPostGIS)
             localDb.connectDatabaseWithParameters(
@@ -180,6 +187,67 @@ class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
             dbsDict[dbName] = localDb
         return dbsDict
 
+    def connectWorkerDb(self, dbName=None):
+        """
+        Opens a new connection to dbName (or to the server database, if
+        dbName is None). Batch operations run on worker threads and a
+        connection can only be used by the thread that opened it. Failing to
+        connect raises, so that it is reported on the database result.
+        """
+        serverDb = self.serverWidget.abstractDb.db
+        workerDb = self.dbFactory.createDbFactory(DsgEnums.DriverPostGIS)
+        workerDb.connectDatabaseWithoutPrompt(
+            serverDb.hostName(),
+            serverDb.port(),
+            serverDb.databaseName() if dbName is None else dbName,
+            serverDb.userName(),
+            serverDb.password(),
+        )
+        return workerDb
+
+    def runBatch(self, handler, dbNameList, labelText):
+        """
+        Runs handler(dbName) for each database on a bounded pool of workers,
+        each one with its own connections. Results are logged as each
+        database finishes and the progress dialog allows canceling the
+        databases not yet started.
+        :param handler: (function) operation on a single database;
+        :param dbNameList: (list) database names;
+        :param labelText: (str) progress dialog text;
+        :return: (tuple) (successList, exceptionDict).
+        """
+        progress = QProgressDialog(
+            labelText, self.tr("Cancel"), 0, len(dbNameList), self
+        )
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        feedback = QgsFeedback()
+        progress.canceled.connect(feedback.cancel)
+        finishedList = []
+
+        def logResult(dbName, errorMessage):
+            finishedList.append(dbName)
+            progress.setValue(len(finishedList))
+            if errorMessage is None:
+                msg = self.tr("Operation complete for database {0}.").format(dbName)
+                QgsMessageLog.logMessage(msg, "DSGTools Plugin", Qgis.Info)
+            else:
+                msg = self.tr("Error for database {0}: {1}").format(
+                    dbName, errorMessage
+                )
+                QgsMessageLog.logMessage(msg, "DSGTools Plugin", Qgis.Critical)
+            QApplication.processEvents()
+
+        successList, exceptionDict = runBatch(
+            handler,
+            dbNameList,
+            max_concurrency=self.maxConcurrency,
+            feedback=feedback,
+            callback=logResult,
+        )
+        progress.close()
+        return successList, exceptionDict
+
     def closeAbstractDbs(self, dbsDict):
         exceptionDict = dict()
         for dbName in list(dbsDict.keys()):
@@ -269,38 +337,38 @@ class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
             == QMessageBox.Cancel
         ):
             return successList, exceptionDict
-        dbsDict = self.instantiateAbstractDbs(instantiateTemplates=True)
-        self.closeAbstractDbs(dbsDict)
-        for dbName in dbsDict:
+
+        def upgradePostgis(dbName):
+            serverDb = self.connectWorkerDb()
             try:
-                if self.serverWidget.abstractDb.checkIfTemplate(dbName):
-                    self.serverWidget.abstractDb.setDbAsTemplate(
-                        dbName=dbName, setTemplate=False
-                    )
-                    dbsDict[dbName].upgradePostgis()
-                    self.serverWidget.abstractDb.setDbAsTemplate(
-                        dbName=dbName, setTemplate=True
-                    )
-                    successList.append(dbName)
-                else:
-                    dbsDict[dbName].upgradePostgis()
-                    successList.append(dbName)
-            except Exception as e:
-                exceptionDict[dbName] = ":".join(e.args)
-        return successList, exceptionDict
+                isTemplate = serverDb.checkIfTemplate(dbName)
+                if isTemplate:
+                    serverDb.setDbAsTemplate(dbName=dbName, setTemplate=False)
+                workerDb = self.connectWorkerDb(dbName)
+                try:
+                    workerDb.upgradePostgis()
+                finally:
+                    workerDb.db.close()
+                if isTemplate:
+                    serverDb.setDbAsTemplate(dbName=dbName, setTemplate=True)
+            finally:
+                serverDb.db.close()
+
+        return self.runBatch(
+            upgradePostgis,
+            self.getDbNameList(instantiateTemplates=True),
+            self.tr("Upgrading PostGIS..."),
+        )
 
     def batchDropDbs(self, dbList):
-        exceptionDict = dict()
-        successList = []
-        dbsDict = self.instantiateAbstractDbs()
-        self.closeAbstractDbs(dbsDict)
-        for dbName in dbList:
+        def dropDatabase(dbName):
+            serverDb = self.connectWorkerDb()
             try:
-                self.serverWidget.abstractDb.dropDatabase(dbName)
-                successList.append(dbName)
-            except Exception as e:
-                exceptionDict[dbName] = ":".join(e.args)
-        return successList, exceptionDict
+                serverDb.dropDatabase(dbName)
+            finally:
+                serverDb.db.close()
+
+        return self.runBatch(dropDatabase, dbList, self.tr("Dropping databases..."))
 
     @pyqtSlot(bool)
     def on_importStylesPushButton_clicked(self):
@@ -364,23 +432,23 @@ class BatchDbManager(QtWidgets.QDialog, FORM_CLASS):
         return styleList
 
     def batchImportStyles(self, dbsDict, styleDir, styleList, version):
-        exceptionDict = dict()
-        successList = []
-        for dbName in list(dbsDict.keys()):
-            for style in styleList:
-                try:
-                    dbsDict[dbName].importStylesIntoDb(style)
-                    successList.append(dbName)
-                except Exception as e:
-                    errors = []
-                    for arg in e.args:
-                        if isinstance(arg, str):
-                            s = "{}".format(arg.encode("utf-8"))
-                        else:
-                            s = str(arg)
-                        errors.append(s)
-                    exceptionDict[dbName] = ":".join(errors)
-        return successList, exceptionDict
+        def importStyles(dbName):
+            workerDb = self.connectWorkerDb(dbName)
+            errors = []
+            try:
+                for style in styleList:
+                    try:
+                        workerDb.importStylesIntoDb(style)
+                    except Exception as e:
+                        errors += [str(arg) for arg in e.args]
+            finally:
+                workerDb.db.close()
+            if errors:
+                raise Exception(":".join(errors))
+
+        return self.runBatch(
+            importStyles, list(dbsDict.keys()), self.tr("Importing styles...")
+        )
 
     def getStyleDir(self, versionList):
         if (
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Headless benchmark harness for DSGTools processing algorithms.
+
+Benchmarks are described in benchmarks.yaml. Each entry names an algorithm,
+the synthetic datasets it consumes and the scales it must be run on. The
+runner records wall time and memory for every (algorithm, scale) pair and
+compares them against a stored baseline, flagging regressions.
+
+Usage (inside the testing container of .docker/docker-compose.yml, where the
+repository's tests/ directory is mounted at /tests_directory/tests):
+    cd /tests_directory && python3 -m tests.benchmarks.benchmarkRunner --scales 1000 10000
+    cd /tests_directory && python3 -m tests.benchmarks.benchmarkRunner --update-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+from qgis.core import (
+    QgsApplication,
+    QgsProcessingContext,
+    QgsProcessingFeedback,
+    QgsProject,
+)
+from qgis.analysis import QgsNativeAlgorithms
+from qgis.testing import start_app
+
+from DsgTools.tests.benchmarks import syntheticDatasets
+
+CURRENT_PATH = os.path.dirname(__file__)
+DEFAULT_DEFINITION_FILE = os.path.join(CURRENT_PATH, "benchmarks.yaml")
+DEFAULT_BASELINE_FILE = os.path.join(CURRENT_PATH, "baseline.json")
+DEFAULT_TIME_TOLERANCE = 1.25
+DEFAULT_MEMORY_TOLERANCE = 1.25
+
+
+def initializeProcessing():
+    """
+    Starts a headless QGIS application and registers the native and the
+    DSGTools processing providers.
+    """
+    start_app()
+    from processing.core.Processing import Processing
+    from DsgTools.core.DSGToolsProcessingAlgs.dsgtoolsProcessingAlgorithmProvider import (
+        DSGToolsProcessingAlgorithmProvider,
+    )
+
+    Processing.initialize()
+    registry = QgsApplication.processingRegistry()
+    if registry.providerById("native") is None:
+        registry.addProvider(QgsNativeAlgorithms())
+    if registry.providerById("dsgtools") is None:
+        registry.addProvider(DSGToolsProcessingAlgorithmProvider())
+
+
+def getMaxRssKb():
+    """
+    Returns the peak resident set size of the process in kilobytes.
+    """
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return maxRss / 1024 if platform.system() == "Darwin" else maxRss
+
+
+class BenchmarkRunner(object):
+    def __init__(
+        self,
+        definitionFile=None,
+        baselineFile=None,
+        timeTolerance=DEFAULT_TIME_TOLERANCE,
+        memoryTolerance=DEFAULT_MEMORY_TOLERANCE,
+        seed=0,
+    ):
+        self.definitionFile = definitionFile or DEFAULT_DEFINITION_FILE
+        self.baselineFile = baselineFile or DEFAULT_BASELINE_FILE
+        self.timeTolerance = timeTolerance
+        self.memoryTolerance = memoryTolerance
+        self.seed = seed
+        self.workingFolder = tempfile.mkdtemp(prefix="dsgtools_benchmark_")
+        self.datasetCache = dict()
+        with open(self.definitionFile, "r") as stream:
+            self.definitions = yaml.load(stream, Loader=yaml.SafeLoader)
+
+    def cleanup(self):
+        QgsProject.instance().clear()
+        self.datasetCache.clear()
+        shutil.rmtree(self.workingFolder, ignore_errors=True)
+
+    def getDataset(self, datasetType, scale):
+        """
+        Builds (or retrieves from cache) a synthetic dataset. Datasets are
+        added to the project so that algorithms can reference them by id.
+        :param datasetType: (str) one of network, buildings, coverage or
+            contours;
+        :param scale: (int) dataset size;
+        :return: (dict) parameter name suffix -> layer id.
+        """
+        key = (datasetType, scale)
+        if key in self.datasetCache:
+            return self.datasetCache[key]
+        if datasetType == "contours":
+            contours, dtm, frame = syntheticDatasets.generateContoursAndDtm(
+                self.workingFolder, scale, seed=self.seed
+            )
+            layers = {"contours": contours, "dtm": dtm, "frame": frame}
+        else:
+            generator = syntheticDatasets.GENERATORS[datasetType]
+            layers = {datasetType: generator(scale, seed=self.seed)}
+        QgsProject.instance().addMapLayers(list(layers.values()), False)
+        self.datasetCache[key] = {name: lyr.id() for name, lyr in layers.items()}
+        return self.datasetCache[key]
+
+    def buildParameters(self, definition, scale):
+        """
+        Replaces the dataset references (strings such as @network) in the
+        definition's params by the ids of the generated layers.
+        """
+        datasetIds = dict()
+        for datasetType in definition["datasets"]:
+            datasetIds.update(self.getDataset(datasetType, scale))
+
+        def resolve(value):
+            if isinstance(value, str) and value.startswith("@"):
+                return datasetIds[value[1:]]
+            if isinstance(value, list):
+                return [resolve(i) for i in value]
+            return value
+
+        parameters = {k: resolve(v) for k, v in definition["params"].items()}
+        for output in definition.get("outputs", []):
+            parameters[output] = "TEMPORARY_OUTPUT"
+        return parameters
+
+    def runAlgorithm(self, algorithmId, parameters, traceMemory=False):
+        """
+        Runs an algorithm once, measuring wall time and, optionally, the
+        python heap peak. Memory tracing slows python code down, therefore
+        timed runs are never traced.
+        :return: (dict) measurements.
+        """
+        alg = QgsApplication.processingRegistry().createAlgorithmById(algorithmId)
+        if alg is None:
+            raise ValueError("Algorithm {0} not found".format(algorithmId))
+        context = QgsProcessingContext()
+        context.setProject(QgsProject.instance())
+        feedback = QgsProcessingFeedback()
+        rssBefore = getMaxRssKb()
+        if traceMemory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        _, ok = alg.run(parameters, context, feedback)
+        elapsed = time.perf_counter() - start
+        pythonPeak = 0
+        if traceMemory:
+            _, pythonPeak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return {
+            "ok": bool(ok),
+            "time": elapsed,
+            "memory_kb": pythonPeak / 1024,
+            "rss_growth_kb": max(0, getMaxRssKb() - rssBefore),
+        }
+
+    def run(self, scales=None, nameFilter=None, repetitions=1, feedback=None):
+        """
+        Runs every benchmark definition on each scale.
+        :param scales: (list-of-int) overrides the scales from the definitions;
+        :param nameFilter: (str) only runs benchmarks whose name contains it;
+        :param repetitions: (int) number of runs; the fastest one is kept;
+        :return: (dict) benchmark name -> scale -> measurements.
+        """
+        results = dict()
+        for definition in self.definitions["benchmarks"]:
+            name = definition["name"]
+            if nameFilter is not None and nameFilter not in name:
+                continue
+            for scale in scales or definition["scales"]:
+                parameters = self.buildParameters(definition, scale)
+                runs = [
+                    self.runAlgorithm(definition["algorithm"], parameters)
+                    for _ in range(repetitions)
+                ]
+                best = min(runs, key=lambda x: x["time"])
+                traced = self.runAlgorithm(
+                    definition["algorithm"], parameters, traceMemory=True
+                )
+                best["ok"] = best["ok"] and traced["ok"]
+                best["memory_kb"] = traced["memory_kb"]
+                results.setdefault(name, dict())[str(scale)] = best
+                if feedback is not None:
+                    feedback(name, scale, best)
+        return results
+
+    def loadBaseline(self):
+        if not os.path.exists(self.baselineFile):
+            return dict()
+        with open(self.baselineFile, "r") as f:
+            return json.load(f).get("results", dict())
+
+    def saveBaseline(self, results):
+        baseline = self.loadBaseline()
+        for name, scaleDict in results.items():
+            baseline.setdefault(name, dict()).update(scaleDict)
+        with open(self.baselineFile, "w") as f:
+            json.dump(
+                {
+                    "machine": platform.node(),
+                    "qgis_version": self.getQgisVersion(),
+                    "results": baseline,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    @staticmethod
+    def getQgisVersion():
+        from qgis.core import Qgis
+
+        return Qgis.QGIS_VERSION
+
+    def compareWithBaseline(self, results, baseline=None):
+        """
+        Compares results against the baseline.
+        :return: (list-of-dict) one entry per regression found.
+        """
+        baseline = self.loadBaseline() if baseline is None else baseline
+        regressions = []
+        for name, scaleDict in results.items():
+            for scale, measurement in scaleDict.items():
+                reference = baseline.get(name, dict()).get(scale)
+                if reference is None:
+                    continue
+                if not measurement["ok"]:
+                    regressions.append(
+                        {"name": name, "scale": scale, "metric": "ok", "ratio": None}
+                    )
+                    continue
+                for metric, tolerance in (
+                    ("time", self.timeTolerance),
+                    ("memory_kb", self.memoryTolerance),
+                ):
+                    if not reference.get(metric):
+                        continue
+                    ratio = measurement[metric] / reference[metric]
+                    if ratio > tolerance:
+                        regressions.append(
+                            {
+                                "name": name,
+                                "scale": scale,
+                                "metric": metric,
+                                "ratio": ratio,
+                                "baseline": reference[metric],
+                                "current": measurement[metric],
+                            }
+                        )
+        return regressions
+
+
+def printMeasurement(name, scale, measurement):
+    print(
+        "{name:<50} {scale:>8} {time:>10.3f}s {memory:>12.0f}kB {status}".format(
+            name=name,
+            scale=scale,
+            time=measurement["time"],
+            memory=measurement["memory_kb"],
+            status="OK" if measurement["ok"] else "FAILED",
+        )
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Runs the DSGTools processing benchmark suite."
+    )
+    parser.add_argument("--definitions", default=DEFAULT_DEFINITION_FILE)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE)
+    parser.add_argument("--scales", nargs="+", type=int, default=None)
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--repetitions", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE
+    )
+    parser.add_argument("--output", default=None, help="writes results as json")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        print(
+            "No baseline found at {0}; run with --update-baseline first.".format(
+                args.baseline
+            )
+        )
+        return 1
+    initializeProcessing()
+    runner = BenchmarkRunner(
+        definitionFile=args.definitions,
+        baselineFile=args.baseline,
+        timeTolerance=args.time_tolerance,
+        memoryTolerance=args.memory_tolerance,
+        seed=args.seed,
+    )
+    try:
+        results = runner.run(
+            scales=args.scales,
+            nameFilter=args.filter,
+            repetitions=args.repetitions,
+            feedback=printMeasurement,
+        )
+    finally:
+        runner.cleanup()
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.update_baseline:
+        runner.saveBaseline(results)
+        return 0
+    regressions = runner.compareWithBaseline(results)
+    for regression in regressions:
+        print(
+            "REGRESSION {name} [{scale}] {metric}: {ratio}".format(
+                name=regression["name"],
+                scale=regression["scale"],
+                metric=regression["metric"],
+                ratio="failed"
+                if regression["ratio"] is None
+                else "{0:.2f}x baseline".format(regression["ratio"]),
+            )
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Measures the time taken to import and register the DSGTools processing
+provider with lazy algorithm loading on and off. Each measurement runs on a
+fresh interpreter so that module imports are not cached between modes.
+
+Usage:
+    python -m DsgTools.tests.benchmarks.providerStartupBenchmark --repetitions 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MEASUREMENT_SCRIPT = """
+import json, sys, time
+from qgis.core import QgsApplication
+from qgis.testing import start_app
+start_app()
+from processing.core.Processing import Processing
+Processing.initialize()
+nModules = len(sys.modules)
+start = time.perf_counter()
+from DsgTools.core.DSGToolsProcessingAlgs.dsgtoolsProcessingAlgorithmProvider import (
+    DSGToolsProcessingAlgorithmProvider,
+)
+provider = DSGToolsProcessingAlgorithmProvider(lazy={lazy})
+QgsApplication.processingRegistry().addProvider(provider)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "time": elapsed,
+    "algorithms": len(provider.algorithms()),
+    "imported_modules": len(sys.modules) - nModules,
+}}))
+"""
+
+
+def measure(lazy):
+    output = subprocess.run(
+        [sys.executable, "-c", MEASUREMENT_SCRIPT.format(lazy=lazy)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compares DSGTools provider start-up with and without lazy loading."
+    )
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args(argv)
+    for lazy in (False, True):
+        runs = [measure(lazy) for _ in range(args.repetitions)]
+        print(
+            "{mode:<6} median {time:.3f}s, {algs} algorithms, {modules} modules imported".format(
+                mode="lazy" if lazy else "eager",
+                time=statistics.median(i["time"] for i in runs),
+                algs=runs[0]["algorithms"],
+                modules=runs[0]["imported_modules"],
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
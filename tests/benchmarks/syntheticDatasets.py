@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Reproducible synthetic datasets used by the processing benchmark suite.
+Every generator receives a size (roughly the number of generated features)
+and a seed, so that two runs with the same arguments build exactly the same
+geometries.
+"""
+
+import math
+import os
+import random
+
+import numpy as np
+from osgeo import gdal, ogr, osr
+from qgis.core import (
+    QgsFeature,
+    QgsField,
+    QgsGeometry,
+    QgsPointXY,
+    QgsRasterLayer,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QVariant
+
+DEFAULT_EPSG = 31982
+DEFAULT_ORIGIN = (500000.0, 7500000.0)
+
+
+def createMemoryLayer(geometryType, name, fields=None, epsg=DEFAULT_EPSG):
+    """
+    Creates an empty memory layer.
+    :param geometryType: (str) memory provider geometry type (e.g. LineString);
+    :param name: (str) layer name;
+    :param fields: (list-of-QgsField) fields to be added to the layer;
+    :param epsg: (int) layer's EPSG code.
+    :return: (QgsVectorLayer) memory layer.
+    """
+    layer = QgsVectorLayer(
+        "{0}?crs=EPSG:{1}".format(geometryType, epsg), name, "memory"
+    )
+    provider = layer.dataProvider()
+    provider.addAttributes([QgsField("id", QVariant.Int)] + list(fields or []))
+    layer.updateFields()
+    return layer
+
+
+def addGeometries(layer, geometries, attributes=None):
+    """
+    Adds a list of geometries to layer through a single provider call.
+    :param layer: (QgsVectorLayer) target layer;
+    :param geometries: (list-of-QgsGeometry) geometries to be added;
+    :param attributes: (list-of-list) extra attribute values, one list per geometry.
+    :return: (QgsVectorLayer) the populated layer.
+    """
+    featList = []
+    for idx, geom in enumerate(geometries):
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(geom)
+        extra = attributes[idx] if attributes is not None else []
+        feat.setAttributes([idx + 1] + list(extra))
+        featList.append(feat)
+    layer.dataProvider().addFeatures(featList)
+    layer.updateExtents()
+    return layer
+
+
+def _jitter(rng, amplitude):
+    return rng.uniform(-amplitude, amplitude)
+
+
+def generateNetwork(size, seed=0, spacing=100.0, danglingRatio=0.05):
+    """
+    Builds a lattice-like line network (e.g. drainages or roads) with about
+    size edges. Each edge has jittered intermediate vertices and a fraction
+    of the edges is dropped in order to create dangles.
+    :param size: (int) approximate number of edges;
+    :param seed: (int) random seed;
+    :param spacing: (float) distance between lattice nodes;
+    :param danglingRatio: (float) ratio of edges removed from the lattice.
+    :return: (QgsVectorLayer) line memory layer.
+    """
+    rng = random.Random(seed)
+    n = max(2, int(math.ceil(math.sqrt(size / 2.0))) + 1)
+    x0, y0 = DEFAULT_ORIGIN
+    nodes = {
+        (i, j): (
+            x0 + i * spacing + _jitter(rng, spacing * 0.2),
+            y0 + j * spacing + _jitter(rng, spacing * 0.2),
+        )
+        for i in range(n)
+        for j in range(n)
+    }
+    geometries = []
+    for (i, j), start in nodes.items():
+        for neighbour in ((i + 1, j), (i, j + 1)):
+            if neighbour not in nodes or rng.random() < danglingRatio:
+                continue
+            end = nodes[neighbour]
+            nVertexes = rng.randint(1, 6)
+            points = [QgsPointXY(*start)]
+            for k in range(1, nVertexes + 1):
+                t = k / (nVertexes + 1)
+                points.append(
+                    QgsPointXY(
+                        start[0]
+                        + t * (end[0] - start[0])
+                        + _jitter(rng, spacing * 0.05),
+                        start[1]
+                        + t * (end[1] - start[1])
+                        + _jitter(rng, spacing * 0.05),
+                    )
+                )
+            points.append(QgsPointXY(*end))
+            geometries.append(QgsGeometry.fromPolylineXY(points))
+            if len(geometries) >= size:
+                break
+        if len(geometries) >= size:
+            break
+    layer = createMemoryLayer("LineString", "synthetic_network")
+    return addGeometries(layer, geometries)
+
+
+def generateBuildings(size, seed=0, wrongAngleRatio=0.1, spacing=40.0):
+    """
+    Builds rotated rectangular building footprints. A fraction of them has
+    one vertex displaced so that the right angle constraint is violated.
+    :param size: (int) number of buildings;
+    :param seed: (int) random seed;
+    :param wrongAngleRatio: (float) ratio of buildings with a displaced vertex;
+    :param spacing: (float) distance between building centroids.
+    :return: (QgsVectorLayer) polygon memory layer.
+    """
+    rng = random.Random(seed)
+    n = max(1, int(math.ceil(math.sqrt(size))))
+    x0, y0 = DEFAULT_ORIGIN
+    geometries = []
+    for idx in range(size):
+        cx = x0 + (idx % n) * spacing
+        cy = y0 + (idx // n) * spacing
+        width = rng.uniform(6.0, spacing * 0.4)
+        height = rng.uniform(6.0, spacing * 0.4)
+        angle = rng.uniform(0, math.pi)
+        cosA, sinA = math.cos(angle), math.sin(angle)
+        corners = [
+            (-width / 2, -height / 2),
+            (width / 2, -height / 2),
+            (width / 2, height / 2),
+            (-width / 2, height / 2),
+        ]
+        points = [
+            QgsPointXY(cx + dx * cosA - dy * sinA, cy + dx * sinA + dy * cosA)
+            for dx, dy in corners
+        ]
+        if rng.random() < wrongAngleRatio:
+            displaced = rng.randrange(4)
+            points[displaced] = QgsPointXY(
+                points[displaced].x() + _jitter(rng, 2.0),
+                points[displaced].y() + _jitter(rng, 2.0),
+            )
+        geometries.append(QgsGeometry.fromPolygonXY([points + [points[0]]]))
+    layer = createMemoryLayer("Polygon", "synthetic_buildings")
+    return addGeometries(layer, geometries)
+
+
+def generateCoverage(size, seed=0, spacing=250.0, errorRatio=0.02):
+    """
+    Builds a polygon coverage (e.g. land cover) from a grid whose interior
+    vertices are jittered and shared by the adjacent cells. A fraction of the
+    cells is scaled around its centroid, producing gaps and overlaps.
+    :param size: (int) approximate number of polygons;
+    :param seed: (int) random seed;
+    :param spacing: (float) grid cell size;
+    :param errorRatio: (float) ratio of cells with gaps or overlaps.
+    :return: (QgsVectorLayer) polygon memory layer.
+    """
+    rng = random.Random(seed)
+    n = max(1, int(math.ceil(math.sqrt(size))))
+    x0, y0 = DEFAULT_ORIGIN
+    vertexes = {}
+    for i in range(n + 1):
+        for j in range(n + 1):
+            isBorder = i in (0, n) or j in (0, n)
+            amplitude = 0 if isBorder else spacing * 0.3
+            vertexes[(i, j)] = (
+                x0 + i * spacing + _jitter(rng, amplitude),
+                y0 + j * spacing + _jitter(rng, amplitude),
+            )
+    geometries = []
+    for i in range(n):
+        for j in range(n):
+            ring = [
+                QgsPointXY(*vertexes[key])
+                for key in ((i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1), (i, j))
+            ]
+            geom = QgsGeometry.fromPolygonXY([ring])
+            if rng.random() < errorRatio:
+                centroid = geom.centroid().asPoint()
+                factor = rng.choice([0.95, 1.05])
+                geom = QgsGeometry.fromPolygonXY(
+                    [
+                        [
+                            QgsPointXY(
+                                centroid.x() + (p.x() - centroid.x()) * factor,
+                                centroid.y() + (p.y() - centroid.y()) * factor,
+                            )
+                            for p in ring
+                        ]
+                    ]
+                )
+            geometries.append(geom)
+    layer = createMemoryLayer("Polygon", "synthetic_coverage")
+    return addGeometries(layer, geometries)
+
+
+def generateDtm(outputPath, size, seed=0, resolution=10.0, nHills=8):
+    """
+    Writes a smooth synthetic terrain model made of gaussian hills as a
+    GeoTIFF file.
+    :param outputPath: (str) path of the GeoTIFF to be written;
+    :param size: (int) number of rows and columns of the raster;
+    :param seed: (int) random seed;
+    :param resolution: (float) pixel size;
+    :param nHills: (int) number of gaussian hills.
+    :return: (QgsRasterLayer) the written raster.
+    """
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:size, 0:size].astype(np.float64)
+    npArray = np.full((size, size), 100.0)
+    for _ in range(nHills):
+        cx, cy = rng.uniform(0, size, 2)
+        sigma = rng.uniform(size / 12.0, size / 4.0)
+        height = rng.uniform(50.0, 400.0)
+        npArray += height * np.exp(
+            -((xx - cx) ** 2 + (yy - cy) ** 2) / (2 * sigma**2)
+        )
+    x0, y0 = DEFAULT_ORIGIN
+    driver = gdal.GetDriverByName("GTiff")
+    ds = driver.Create(outputPath, size, size, 1, gdal.GDT_Float32)
+    ds.SetGeoTransform((x0, resolution, 0, y0 + size * resolution, 0, -resolution))
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(DEFAULT_EPSG)
+    ds.SetProjection(srs.ExportToWkt())
+    band = ds.GetRasterBand(1)
+    band.WriteArray(npArray)
+    band.FlushCache()
+    ds = None
+    return QgsRasterLayer(outputPath, "synthetic_dtm")
+
+
+def generateContoursAndDtm(outputFolder, size, seed=0, interval=10.0):
+    """
+    Builds a synthetic terrain model and its contour lines.
+    :param outputFolder: (str) folder where the raster and the contours are written;
+    :param size: (int) number of rows and columns of the terrain model;
+    :param seed: (int) random seed;
+    :param interval: (float) contour interval.
+    :return: (tuple) (QgsVectorLayer contours, QgsRasterLayer dtm,
+        QgsVectorLayer frame)
+    """
+    dtmPath = os.path.join(outputFolder, "synthetic_dtm_{0}_{1}.tif".format(size, seed))
+    contourPath = os.path.join(
+        outputFolder, "synthetic_contours_{0}_{1}.gpkg".format(size, seed)
+    )
+    dtm = generateDtm(dtmPath, size, seed=seed)
+    rasterDs = gdal.Open(dtmPath)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(DEFAULT_EPSG)
+    vectorDs = ogr.GetDriverByName("GPKG").CreateDataSource(contourPath)
+    contourLayer = vectorDs.CreateLayer("contours", srs, ogr.wkbLineString)
+    contourLayer.CreateField(ogr.FieldDefn("id", ogr.OFTInteger))
+    contourLayer.CreateField(ogr.FieldDefn("cota", ogr.OFTReal))
+    gdal.ContourGenerate(
+        rasterDs.GetRasterBand(1), interval, 0, [], 0, 0, contourLayer, 0, 1
+    )
+    vectorDs = None
+    rasterDs = None
+    contours = QgsVectorLayer(
+        "{0}|layername=contours".format(contourPath), "synthetic_contours", "ogr"
+    )
+    frame = createMemoryLayer("Polygon", "synthetic_frame")
+    addGeometries(frame, [QgsGeometry.fromRect(dtm.extent())])
+    return contours, dtm, frame
+
+
+GENERATORS = {
+    "network": generateNetwork,
+    "buildings": generateBuildings,
+    "coverage": generateCoverage,
+}
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from DsgTools.core.DSGToolsProcessingAlgs.algorithmManifest import (
+    generateManifest,
+    getRegisteredAlgorithmPaths,
+    loadManifest,
+)
+from DsgTools.core.DSGToolsProcessingAlgs.lazyProcessingAlgorithm import (
+    LazyProcessingAlgorithm,
+)
+
+
+class AlgorithmManifestTestCase(unittest.TestCase):
+    def test_manifest_is_up_to_date(self):
+        committed = loadManifest()
+        with tempfile.TemporaryDirectory() as tmpDir:
+            manifestPath = os.path.join(tmpDir, "manifest.json")
+            generateManifest(manifestPath=manifestPath)
+            generated = loadManifest(manifestPath)
+        self.assertEqual(
+            {k: v.asDict() for k, v in committed.items()},
+            {k: v.asDict() for k, v in generated.items()},
+            "algorithmManifest.json is outdated, regenerate it.",
+        )
+
+    def test_manifest_covers_registered_algorithms(self):
+        manifest = loadManifest()
+        self.assertCountEqual(manifest.keys(), getRegisteredAlgorithmPaths())
+
+    def test_descriptor_loads_class_with_same_name(self):
+        for path, descriptor in loadManifest().items():
+            if not descriptor.lazy:
+                continue
+            with self.subTest(path=path):
+                self.assertEqual(descriptor.load()().name(), descriptor.name)
+
+    def test_lazy_algorithm_exposes_parameters(self):
+        for path, descriptor in loadManifest().items():
+            if not descriptor.lazy:
+                continue
+            with self.subTest(path=path):
+                implementation = descriptor.load()()
+                implementation.initAlgorithm(dict())
+                expected = [p.name() for p in implementation.parameterDefinitions()]
+                # before any createInstance, the stub loads them on request
+                lazyAlg = LazyProcessingAlgorithm(descriptor)
+                self.assertEqual(
+                    [p.name() for p in lazyAlg.parameterDefinitions()], expected
+                )
+                for name in expected:
+                    self.assertIsNotNone(lazyAlg.parameterDefinition(name))
+                # hydrating again, as createInstance does, adds no duplicates
+                lazyAlg.createInstance()
+                self.assertEqual(
+                    [p.name() for p in lazyAlg.parameterDefinitions()], expected
+                )
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(AlgorithmManifestTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
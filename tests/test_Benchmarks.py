@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Smoke tests for the benchmark suite. The full benchmark is only run when the
+DSGTOOLS_RUN_BENCHMARKS environment variable is set, since it takes minutes.
+"""
+
+import os
+import sys
+
+from qgis.testing import unittest
+
+from DsgTools.tests.benchmarks import syntheticDatasets
+from DsgTools.tests.benchmarks.benchmarkRunner import (
+    BenchmarkRunner,
+    initializeProcessing,
+)
+
+
+class SyntheticDatasetsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initializeProcessing()
+
+    def assertSameGeometries(self, lyr1, lyr2):
+        self.assertEqual(lyr1.featureCount(), lyr2.featureCount())
+        for feat1, feat2 in zip(lyr1.getFeatures(), lyr2.getFeatures()):
+            self.assertTrue(feat1.geometry().equals(feat2.geometry()))
+
+    def test_generators_are_reproducible(self):
+        for name, generator in syntheticDatasets.GENERATORS.items():
+            with self.subTest(generator=name):
+                lyr1 = generator(200, seed=42)
+                lyr2 = generator(200, seed=42)
+                self.assertGreater(lyr1.featureCount(), 0)
+                self.assertSameGeometries(lyr1, lyr2)
+
+    def test_compare_with_baseline(self):
+        runner = BenchmarkRunner(timeTolerance=1.5)
+        baseline = {"alg": {"10": {"ok": True, "time": 1.0, "memory_kb": 100}}}
+        results = {"alg": {"10": {"ok": True, "time": 2.0, "memory_kb": 90}}}
+        regressions = runner.compareWithBaseline(results, baseline=baseline)
+        runner.cleanup()
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["metric"], "time")
+
+    @unittest.skipUnless(
+        os.environ.get("DSGTOOLS_RUN_BENCHMARKS"), "benchmarks are opt-in"
+    )
+    def test_benchmarks_have_no_regressions(self):
+        runner = BenchmarkRunner()
+        try:
+            self.assertTrue(
+                os.path.exists(runner.baselineFile),
+                "no benchmark baseline, run benchmarkRunner with --update-baseline",
+            )
+            results = runner.run(scales=[1000])
+        finally:
+            runner.cleanup()
+        for name, scaleDict in results.items():
+            for measurement in scaleDict.values():
+                self.assertTrue(measurement["ok"], name)
+        self.assertEqual(runner.compareWithBaseline(results), [])
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(SyntheticDatasetsTest, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
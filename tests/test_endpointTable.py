@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import struct
+import sys
+import unittest
+
+import numpy as np
+
+from DsgTools.core.GeometricTools.endpointTable import EndpointTable
+
+
+def lineStringWkb(coords, wkbType=2):
+    dimension = 3 if wkbType == 1002 else 2
+    return struct.pack("<BII", 1, wkbType, len(coords)) + b"".join(
+        struct.pack("<" + "d" * dimension, *(tuple(c) + (0.0,) * (dimension - 2)))
+        for c in coords
+    )
+
+
+def multiLineStringWkb(lines):
+    return struct.pack("<BII", 1, 5, len(lines)) + b"".join(
+        lineStringWkb(line) for line in lines
+    )
+
+
+class EndpointTableTestCase(unittest.TestCase):
+    def setUp(self):
+        # two lines reach (0, 2), one goes straight on and the other turns back
+        self.endpointTable = EndpointTable.fromWkbList(
+            [
+                lineStringWkb([(0, 0), (0, 1), (0, 2)]),
+                lineStringWkb([(0, 2), (1, 3)], wkbType=1002),
+                lineStringWkb([(0, 2), (-1, 1)]),
+                multiLineStringWkb([[(5, 5), (6, 6)], [(7, 7), (0, 0)]]),
+                lineStringWkb([(9, 9)]),
+            ],
+            [10, 11, 12, 13, 14],
+        )
+
+    def test_nodes_and_degrees(self):
+        table = self.endpointTable
+        # the single vertex line is skipped
+        self.assertEqual(table.featureIds.tolist(), [10, 11, 12, 13])
+        self.assertEqual(table.nodeCount(), 5)
+        node = {tuple(xy): i for i, xy in enumerate(table.nodeXY.tolist())}
+        self.assertEqual(table.outDegree()[node[(0.0, 2.0)]], 2)
+        self.assertEqual(table.inDegree()[node[(0.0, 2.0)]], 1)
+        self.assertEqual(table.inDegree()[node[(0.0, 0.0)]], 1)
+        self.assertEqual(table.startAzimuth.tolist(), [0.0, 45.0, 225.0, 45.0])
+        self.assertEqual(table.endAzimuth.tolist(), [0.0, 45.0, 225.0, 225.0])
+
+    def test_direction_change(self):
+        table = self.endpointTable
+        node = {tuple(xy): i for i, xy in enumerate(table.nodeXY.tolist())}
+        directionChange = table.getMaxDirectionChange()
+        self.assertAlmostEqual(directionChange[node[(0.0, 2.0)]], 135.0)
+        self.assertAlmostEqual(directionChange[node[(0.0, 0.0)]], 135.0)
+        self.assertTrue(np.isnan(directionChange[node[(5.0, 5.0)]]))
+
+    def test_tolerance_merges_close_endpoints(self):
+        table = EndpointTable.fromWkbList(
+            [
+                lineStringWkb([(0, 0), (1, 0)]),
+                lineStringWkb([(1.0004, 0), (2, 0)]),
+            ],
+            tolerance=1e-3,
+        )
+        self.assertEqual(table.nodeCount(), 3)
+        self.assertEqual(table.endNode[0], table.startNode[1])
+
+    def test_find_lines(self):
+        lineIndexes = self.endpointTable.findLines([(0, 2), (1, 3), (7, 7), (3, 3)])
+        self.assertEqual(lineIndexes.tolist(), [0, 1, -1, -1])
+
+    def test_split_parts(self):
+        table = EndpointTable.fromWkbList(
+            [
+                lineStringWkb([(0, 0), (0, 1)]),
+                multiLineStringWkb([[(5, 5), (6, 6)], [(9, 9)], [(7, 7), (0, 0)]]),
+            ],
+            splitParts=True,
+        )
+        self.assertEqual(table.featureIds.tolist(), [0, 1, 1])
+        self.assertEqual(table.endAzimuth.tolist(), [0.0, 45.0, 225.0])
+        lineIndexes = table.findLines([(6, 6), (7, 7), (9, 9)])
+        self.assertEqual(lineIndexes.tolist(), [1, 2, -1])
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(EndpointTableTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
@@ -27,6 +27,7 @@ import networkx as nx
 from DsgTools.core.GeometricTools.graphHandler import (
     fetch_connected_nodes,
     buildAuxFlowGraph,
+    find_directed_loops,
 )
 
 
@@ -347,10 +348,28 @@ class BuildAuxFlowGraphTestCase(unittest.TestCase):
         self.assertEqual(set(expectedG.adj), set(outputG.adj))
 
 
+class FindDirectedLoopsTestCase(unittest.TestCase):
+    def test_find_directed_loops(self):
+        G = nx.MultiDiGraph()
+        edges_list = [(1, 2), (2, 3), (3, 1), (2, 3), (3, 4), (5, 5), (4, 6)]
+        for featid, (a, b) in enumerate(edges_list):
+            G.add_edge(a, b, featid=featid)
+        result = find_directed_loops(nx, G)
+        self.assertCountEqual(map(sorted, result), [[0, 1, 2], [0, 2, 3], [5]])
+
+    def test_find_directed_loops_on_acyclic_graph(self):
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, featid=0)
+        G.add_edge(1, 2, featid=1)
+        G.add_edge(2, 3, featid=2)
+        self.assertEqual(find_directed_loops(nx, G), [])
+
+
 def run_all(filterString=None):
     """Default function that is called by the runner if nothing else is specified"""
     filterString = "test_" if filterString is None else filterString
     suite = unittest.TestSuite()
     suite.addTests(unittest.makeSuite(FetchConnectedNodesTestCase, filterString))
     suite.addTests(unittest.makeSuite(BuildAuxFlowGraphTestCase, filterString))
+    suite.addTests(unittest.makeSuite(FindDirectedLoopsTestCase, filterString))
     unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
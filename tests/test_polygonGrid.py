@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import sys
+import unittest
+
+import numpy as np
+
+from DsgTools.core.GeometricTools.polygonGrid import (
+    findNearestIndexes,
+    getGridCells,
+    getGridSpacing,
+)
+
+
+class PolygonGridTestCase(unittest.TestCase):
+    def test_grid_spacing_and_cells(self):
+        self.assertEqual(getGridSpacing((0, 0, 10, 4), 3, 6), (3, 2))
+        cells = getGridCells((0, 0, 10, 4), 3, 2)
+        self.assertEqual(cells.shape, (8, 4))
+        self.assertEqual(cells[0].tolist(), [0, 2, 3, 4])
+        self.assertEqual(cells[-1].tolist(), [9, 0, 12, 2])
+        with self.assertRaises(ValueError):
+            getGridCells((0, 0, 1, 1), 0, 1)
+
+    def test_nearest_indexes(self):
+        candidates = np.array([(0, 0), (10, 0), (0, 10), (10, 0)])
+        nearest = findNearestIndexes([(1, 1), (9, 1), (4, 9), (5, 0)], candidates)
+        self.assertEqual(nearest.tolist(), [0, 1, 2, 0])
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(PolygonGridTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+"""
+Tests of the server side validations. The SQL builders run against a stubbed
+executeSql, while the parity tests compare the server and the client paths of
+each algorithm on a PostGIS database, given as a connection string on the
+DSGTOOLS_TEST_PG_URI environment variable (set on the docker test env).
+"""
+
+import os
+import sys
+
+import processing
+from qgis.core import (
+    QgsDataSourceUri,
+    QgsProcessingContext,
+    QgsProcessingFeedback,
+    QgsProviderRegistry,
+    QgsVectorLayer,
+)
+from qgis.testing import unittest
+
+from DsgTools.core.GeometricTools.postgisValidationHandler import (
+    PostgisValidationHandler,
+)
+
+PG_URI = os.environ.get("DSGTOOLS_TEST_PG_URI", "")
+PARITY_SCHEMA = "dsgtools_parity"
+
+
+class StubbedPostgisValidationHandler(PostgisValidationHandler):
+    """
+    Answers every query with the rows returned by rowsFunction, recording the
+    executed statements.
+    """
+
+    def __init__(self, rowsFunction, tableInfo=None, **kwargs):
+        super(StubbedPostgisValidationHandler, self).__init__(**kwargs)
+        self.rowsFunction = rowsFunction
+        self.tableInfo = tableInfo
+        self.sqlList = []
+
+    def executeSql(self, connectionUri, sql):
+        self.sqlList.append(sql)
+        return self.rowsFunction(sql)
+
+    def getTableInfo(self, lyr):
+        return self.tableInfo
+
+
+def buildTableInfo(subset=""):
+    return {
+        "uri": "dbname='test'",
+        "table": '"public"."road"',
+        "geom": '"geom"',
+        "key": '"id"',
+        "subset": subset,
+    }
+
+
+class PostgisValidationHandlerTester(unittest.TestCase):
+    def test_getWhereClause(self):
+        handler = StubbedPostgisValidationHandler(lambda sql: [])
+        self.assertEqual(handler.getWhereClause(buildTableInfo(), "true"), "true")
+        self.assertEqual(
+            handler.getWhereClause(buildTableInfo("kind = 1"), "true"),
+            "true and (kind = 1)",
+        )
+        self.assertEqual(
+            handler.getWhereClause(buildTableInfo("kind = 1"), "true", (1, 11)),
+            'true and (kind = 1) and "id" >= 1 and "id" < 11',
+        )
+
+    def test_getKeyRanges(self):
+        handler = StubbedPostgisValidationHandler(
+            lambda sql: [(1, 250, 250)], chunkSize=100
+        )
+        self.assertEqual(
+            handler.getKeyRanges(buildTableInfo("kind = 1")),
+            [(1, 85), (85, 169), (169, 251)],
+        )
+        self.assertEqual(
+            handler.sqlList,
+            [
+                'select min("id"), max("id"), count(*) from "public"."road" '
+                "where true and (kind = 1)"
+            ],
+        )
+
+    def test_getKeyRanges_sparse_keys(self):
+        handler = StubbedPostgisValidationHandler(
+            lambda sql: [(10, 12, 3000)], chunkSize=100
+        )
+        self.assertEqual(
+            handler.getKeyRanges(buildTableInfo()), [(10, 11), (11, 12), (12, 13)]
+        )
+
+    def test_getKeyRanges_empty_table(self):
+        handler = StubbedPostgisValidationHandler(lambda sql: [(None, None, 0)])
+        self.assertEqual(handler.getKeyRanges(buildTableInfo()), [])
+
+    def test_runRowCheck_queries_each_range(self):
+        def rowsFunction(sql):
+            if sql.startswith("select min("):
+                return [(1, 200, 200)]
+            return [(sql,)]
+
+        handler = StubbedPostgisValidationHandler(
+            rowsFunction, tableInfo=buildTableInfo(), chunkSize=100
+        )
+        rowList = handler.runRowCheck(None, "{key}", "ST_IsEmpty({geom})")
+        self.assertEqual(
+            sorted(row[0] for row in rowList),
+            [
+                'select "id" from "public"."road" where ST_IsEmpty("geom") '
+                'and "id" >= 1 and "id" < 101',
+                'select "id" from "public"."road" where ST_IsEmpty("geom") '
+                'and "id" >= 101 and "id" < 201',
+            ],
+        )
+
+    def test_getMeasureFlags(self):
+        def rowsFunction(sql):
+            if sql.startswith("select min("):
+                return [(1, 10, 10)]
+            return [(7, 1.5, None), (2, 0.0, "")]
+
+        handler = StubbedPostgisValidationHandler(
+            rowsFunction, tableInfo=buildTableInfo()
+        )
+        flagList = handler.getSmallLineFlags(None, 5)
+        self.assertEqual(
+            [(featid, value) for featid, value, _ in flagList], [(2, 0.0), (7, 1.5)]
+        )
+        self.assertTrue(all(geom.isNull() for _, _, geom in flagList))
+        self.assertIn('coalesce(ST_Length("geom"), 0) < 5.0', handler.sqlList[-1])
+
+    def test_getDuplicatedGeometryFlags(self):
+        handler = StubbedPostgisValidationHandler(
+            lambda sql: [(1, "4,7", None), (2, "3", None)],
+            tableInfo=buildTableInfo("kind = 1"),
+        )
+        self.assertEqual(
+            [idList for idList, _ in handler.getDuplicatedGeometryFlags(None)],
+            [[1, 4, 7], [2, 3]],
+        )
+        self.assertIn('where "geom" is not null and (kind = 1)', handler.sqlList[0])
+
+    def test_hasNullOrEmptyGeometries(self):
+        handler = StubbedPostgisValidationHandler(
+            lambda sql: [(True,)], tableInfo=buildTableInfo()
+        )
+        self.assertTrue(handler.hasNullOrEmptyGeometries(None))
+        self.assertIn('"geom" is null or ST_IsEmpty("geom")', handler.sqlList[0])
+
+
+class RecordingFeedback(QgsProcessingFeedback):
+    def __init__(self):
+        super(RecordingFeedback, self).__init__()
+        self.warningList = []
+
+    def pushWarning(self, warning):
+        self.warningList.append(warning)
+
+
+@unittest.skipUnless(PG_URI, "DSGTOOLS_TEST_PG_URI is not set")
+class PostgisValidationParityTester(unittest.TestCase):
+    """
+    Each table holds a small feature, a big one, a multipart one, a duplicate
+    of the big one and a null geometry.
+    """
+
+    TABLE_DICT = {
+        "parity_line": (
+            "MultiLineString",
+            [
+                "MULTILINESTRING((0 0, 1 0))",
+                "MULTILINESTRING((0 10, 100 10))",
+                "MULTILINESTRING((0 20, 50 20), (60 20, 100 20))",
+                "MULTILINESTRING((0 10, 100 10))",
+                None,
+            ],
+        ),
+        "parity_polygon": (
+            "MultiPolygon",
+            [
+                "MULTIPOLYGON(((0 0, 1 0, 1 1, 0 1, 0 0)))",
+                "MULTIPOLYGON(((0 10, 100 10, 100 110, 0 110, 0 10)))",
+                "MULTIPOLYGON(((200 0, 300 0, 300 100, 200 100, 200 0)),"
+                "((400 0, 500 0, 500 100, 400 100, 400 0)))",
+                "MULTIPOLYGON(((0 10, 100 10, 100 110, 0 110, 0 10)))",
+                None,
+            ],
+        ),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        connection = (
+            QgsProviderRegistry.instance()
+            .providerMetadata("postgres")
+            .createConnection(PG_URI, {})
+        )
+        connection.executeSql(
+            "create extension if not exists postgis; "
+            "drop schema if exists {0} cascade; create schema {0};".format(
+                PARITY_SCHEMA
+            )
+        )
+        for tableName, (geometryType, wktList) in cls.TABLE_DICT.items():
+            connection.executeSql(
+                "create table {0}.{1} (id serial primary key, "
+                "geom geometry({2}, 31982))".format(
+                    PARITY_SCHEMA, tableName, geometryType
+                )
+            )
+            connection.executeSql(
+                "insert into {0}.{1} (geom) values {2}".format(
+                    PARITY_SCHEMA,
+                    tableName,
+                    ", ".join(
+                        "(ST_GeomFromText('{0}', 31982))".format(wkt)
+                        if wkt is not None
+                        else "(null)"
+                        for wkt in wktList
+                    ),
+                )
+            )
+
+    def getLayer(self, tableName):
+        uri = QgsDataSourceUri(PG_URI)
+        uri.setDataSource(PARITY_SCHEMA, tableName, "geom", "", "id")
+        lyr = QgsVectorLayer(uri.uri(False), tableName, "postgres")
+        self.assertTrue(lyr.isValid())
+        self.assertTrue(PostgisValidationHandler().canRunOnServer(lyr))
+        return lyr
+
+    def runFlagAlgorithm(self, algName, parameters, runOnServer):
+        output = processing.run(
+            algName,
+            dict(parameters, RUN_ON_SERVER=runOnServer, FLAGS="memory:"),
+            None,
+            QgsProcessingFeedback(),
+            QgsProcessingContext(),
+        )
+        return sorted(
+            (
+                feat["reason"],
+                "" if feat.geometry().isNull() else feat.geometry().asWkt(6),
+            )
+            for feat in output["FLAGS"].getFeatures()
+        )
+
+    def assertParity(self, algName, parameters):
+        serverFlagList = self.runFlagAlgorithm(algName, parameters, True)
+        self.assertEqual(
+            serverFlagList, self.runFlagAlgorithm(algName, parameters, False)
+        )
+        return serverFlagList
+
+    def test_small_lines_parity(self):
+        flagList = self.assertParity(
+            "dsgtools:identifysmalllines",
+            {"INPUT": self.getLayer("parity_line"), "SELECTED": False, "TOLERANCE": 5},
+        )
+        self.assertEqual(len(flagList), 2)
+
+    def test_small_polygons_parity(self):
+        flagList = self.assertParity(
+            "dsgtools:identifysmallpolygons",
+            {
+                "INPUT": self.getLayer("parity_polygon"),
+                "SELECTED": False,
+                "TOLERANCE": 625,
+            },
+        )
+        self.assertEqual(len(flagList), 2)
+
+    def test_multipart_parity(self):
+        for tableName in self.TABLE_DICT:
+            flagList = self.assertParity(
+                "dsgtools:identifymultigeometries",
+                {"INPUT": self.getLayer(tableName), "SELECTED": False},
+            )
+            self.assertEqual(len(flagList), 1)
+
+    def test_duplicated_geometries_parity(self):
+        for tableName in self.TABLE_DICT:
+            flagList = self.assertParity(
+                "dsgtools:identifyduplicatedgeometries",
+                {"INPUT": self.getLayer(tableName), "SELECTED": False},
+            )
+            self.assertEqual(len(flagList), 1)
+            self.assertIn("ids=(2, 4)", flagList[0][0])
+
+    def test_null_geometries_parity(self):
+        warningDict = dict()
+        for runOnServer in (True, False):
+            feedback = RecordingFeedback()
+            processing.run(
+                "dsgtools:detectnullgeometriesalgorithm",
+                {
+                    "INPUT_LAYERS": [
+                        self.getLayer(tableName) for tableName in self.TABLE_DICT
+                    ],
+                    "RUN_CHECK_ON_INPUT": True,
+                    "RUN_ON_SERVER": runOnServer,
+                },
+                None,
+                feedback,
+                QgsProcessingContext(),
+            )
+            warningDict[runOnServer] = sorted(feedback.warningList)
+        self.assertEqual(warningDict[True], warningDict[False])
+        self.assertEqual(len(warningDict[True]), len(self.TABLE_DICT))
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(PostgisValidationHandlerTester, filterString))
+    suite.addTests(unittest.makeSuite(PostgisValidationParityTester, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
@@ -152,6 +152,16 @@ class TestRasterHandler(unittest.TestCase):
         expectedNpRaster = np.array([[np.nan, np.nan], [np.nan, np.nan]])
         self.assertTrue(np.array_equal(npRaster, expectedNpRaster))
 
+    def test_blockSamplerIsInvalidWhenGdalRaises(self):
+        useExceptions = gdal.GetUseExceptions()
+        gdal.UseExceptions()
+        try:
+            sampler = rasterHandler.RasterBlockSampler("type=xyz&url=not_a_raster")
+        finally:
+            if not useExceptions:
+                gdal.DontUseExceptions()
+        self.assertFalse(sampler.isValid())
+
 
 def run_all():
     """Default function that is called by the runner if nothing else is specified"""
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import struct
+import sys
+import unittest
+
+import numpy as np
+
+from DsgTools.core.GeometricTools.snapIndex import (
+    END_POINT_TO_END_POINT,
+    PREFER_CLOSEST,
+    PREFER_NODES,
+    PREFER_NODES_NO_EXTRA_VERTICES,
+    PathGeometry,
+    SnapIndex,
+)
+
+
+def lineStringWkb(coords, wkbType=2):
+    dimension = 3 if wkbType == 1002 else 2
+    return struct.pack("<BII", 1, wkbType, len(coords)) + b"".join(
+        struct.pack("<" + "d" * dimension, *tuple(c)) for c in coords
+    )
+
+
+def polygonWkb(ring):
+    return struct.pack("<BIII", 1, 3, 1, len(ring)) + b"".join(
+        struct.pack("<dd", *c) for c in ring
+    )
+
+
+def xyList(geom, part=0, ring=0):
+    return geom.parts[part][ring][:, :2].tolist()
+
+
+class SnapIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.snapIndex = SnapIndex(cellSize=1.0)
+        self.snapIndex.addGeometry(
+            ("reference", 1),
+            PathGeometry.fromWkb(polygonWkb([(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)])),
+        )
+
+    def test_wkb_round_trip(self):
+        for wkb in (
+            lineStringWkb([(0, 0, 1), (1, 1, 2)], wkbType=1002),
+            polygonWkb([(0, 0), (1, 0), (1, 1), (0, 0)]),
+            struct.pack("<BII", 1, 5, 1) + lineStringWkb([(0, 0), (1, 1)]),
+        ):
+            self.assertEqual(PathGeometry.fromWkb(wkb).toWkb(), wkb)
+
+    def test_prefer_nodes_inserts_shared_vertices(self):
+        line = PathGeometry.fromWkb(lineStringWkb([(-3, 0.1), (2, -0.05), (5, 0.1)]))
+        snapped, insertionList = self.snapIndex.snapGeometry(
+            line, 0.2, PREFER_NODES, layers={"reference"}
+        )
+        # the middle vertex is moved onto the bottom edge and the corners of
+        # the polygon are inserted on the line
+        self.assertEqual(xyList(snapped), [[-3, 0.1], [0, 0], [2, 0], [4, 0], [5, 0.1]])
+        updatedDict = self.snapIndex.insertVertices(insertionList)
+        self.assertEqual(
+            xyList(updatedDict[("reference", 1)]),
+            [[0, 0], [2, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+        )
+        self.assertIsNotNone(self.snapIndex.findClosestVertex(2, 0, 1e-9))
+
+    def test_modes_and_layer_filter(self):
+        line = PathGeometry.fromWkb(
+            lineStringWkb([(0.1, 2.1), (2.0, 2.0), (3.9, 0.15)])
+        )
+        snapped, insertionList = self.snapIndex.snapGeometry(
+            line, 0.2, PREFER_NODES_NO_EXTRA_VERTICES
+        )
+        self.assertEqual(xyList(snapped), [[0, 2.1], [2, 2], [4, 0]])
+        self.assertEqual(insertionList, [])
+        snapped, _ = self.snapIndex.snapGeometry(line, 0.2, PREFER_CLOSEST)
+        self.assertEqual(xyList(snapped), [[0, 2.1], [2, 2], [4, 0.15]])
+        snapped, _ = self.snapIndex.snapGeometry(line, 0.2, END_POINT_TO_END_POINT)
+        self.assertIs(snapped, line)
+        snapped, _ = self.snapIndex.snapGeometry(
+            line, 0.2, PREFER_NODES, layers={"other"}
+        )
+        self.assertIs(snapped, line)
+
+    def test_compact_drops_removed_entries(self):
+        line = PathGeometry.fromWkb(lineStringWkb([(10, 10), (12, 10)]))
+        for offset in range(4):
+            self.snapIndex.addGeometry(
+                ("line", 1),
+                PathGeometry.fromWkb(
+                    lineStringWkb([(10, 10 + offset), (12, 10 + offset)])
+                ),
+            )
+        self.assertFalse(self.snapIndex.compact(minRemovedRatio=0.9))
+        self.assertTrue(self.snapIndex.compact(minRemovedRatio=0.4))
+        self.assertEqual(len(self.snapIndex.vertices), 4 + 2)
+        self.assertEqual(len(self.snapIndex.segments), 4 + 1)
+        self.assertNotIn(None, self.snapIndex.vertices)
+        self.assertIsNone(self.snapIndex.findClosestVertex(10, 10, 0.1))
+        self.assertIsNotNone(self.snapIndex.findClosestVertex(12, 13, 0.1))
+        snapped, _ = self.snapIndex.snapGeometry(line, 0.2, PREFER_CLOSEST)
+        self.assertIs(snapped, line)
+        self.snapIndex.removeGeometry(("line", 1))
+        self.assertTrue(self.snapIndex.compact(minRemovedRatio=0))
+        self.assertEqual(
+            sorted(len(idList) for idList in self.snapIndex.vertexCells.values()),
+            [1, 1, 1, 1],
+        )
+        snapped, insertionList = self.snapIndex.snapGeometry(
+            PathGeometry.fromWkb(lineStringWkb([(-3, 0.1), (2, -0.05), (5, 0.1)])),
+            0.2,
+            PREFER_NODES,
+        )
+        self.assertEqual(
+            xyList(self.snapIndex.insertVertices(insertionList)[("reference", 1)]),
+            [[0, 0], [2, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+        )
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(SnapIndexTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
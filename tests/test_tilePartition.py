@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import sys
+import unittest
+
+import numpy as np
+
+from DsgTools.core.GeometricTools.tilePartition import TilePartition
+
+
+def findClosePairMidpoints(points, tolerance):
+    """
+    Toy validation used to compare tiled and whole runs: flags the midpoint
+    of every pair of points closer than tolerance.
+    """
+    diff = points[:, None, :] - points[None, :, :]
+    dist = np.hypot(diff[..., 0], diff[..., 1])
+    i, j = np.nonzero(np.triu(dist < tolerance, k=1))
+    return (points[i] + points[j]) / 2.0
+
+
+class TilePartitionTestCase(unittest.TestCase):
+    def test_regular_grid_covers_extent(self):
+        partition = TilePartition.fromRegularGrid((0, 0, 25, 10), 10)
+        self.assertEqual(len(partition), 3)
+        self.assertEqual(partition.getCoreBox(2), (20.0, 0.0, 25.0, 10.0))
+
+    def test_every_point_has_a_single_owner(self):
+        partition = TilePartition.fromRegularGrid((0, 0, 30, 30), 10, halo=2)
+        points = np.array(
+            [[10, 10], [0, 0], [30, 30], [30, 5], [10, 30], [15, 15], [31, 0]],
+            dtype=float,
+        )
+        owners = partition.getOwnerIndexes(points)
+        # shared borders go to the tile on the right / above
+        self.assertEqual(owners[0], 4)
+        self.assertEqual(owners[1], 0)
+        # outer borders go to the last tile
+        self.assertEqual(owners[2], 8)
+        self.assertEqual(owners[3], 2)
+        self.assertEqual(owners[4], 7)
+        self.assertEqual(owners[6], -1)
+        # points outside every tile go to the nearest one
+        self.assertEqual(partition.getOwnerIndexes(points, nearest=True)[6], 2)
+        ownedCount = sum(
+            partition.getOwnedMask(i, points).astype(int) for i in range(len(partition))
+        )
+        self.assertTrue(np.array_equal(ownedCount, [1, 1, 1, 1, 1, 1, 1]))
+
+    def test_borders_are_compared_with_tolerance(self):
+        # the shared border of the tiles differs by a rounding error, leaving
+        # a tiny gap between them
+        partition = TilePartition([(0.0, 0.0, 0.3, 1.0), (0.1 + 0.2, 0.0, 0.6, 1.0)])
+        self.assertTrue(np.array_equal(partition.closedRight, [False, True]))
+        points = [[0.3, 0.5], [0.6 + 1e-12, 0.5]]
+        self.assertTrue(np.array_equal(partition.getOwnerIndexes(points), [-1, 1]))
+        self.assertTrue(
+            np.array_equal(partition.getOwnerIndexes(points, nearest=True), [0, 1])
+        )
+
+    def test_tiled_run_matches_whole_run(self):
+        rng = np.random.default_rng(42)
+        points = rng.uniform(0, 100, size=(400, 2))
+        tolerance = 3.0
+        expected = findClosePairMidpoints(points, tolerance)
+        partition = TilePartition.fromRegularGrid((0, 0, 100, 100), 17, halo=tolerance)
+        flagList = []
+        for i in range(len(partition)):
+            xmin, ymin, xmax, ymax = partition.getExpandedBox(i)
+            inside = (
+                (points[:, 0] >= xmin)
+                & (points[:, 0] <= xmax)
+                & (points[:, 1] >= ymin)
+                & (points[:, 1] <= ymax)
+            )
+            flags = findClosePairMidpoints(points[inside], tolerance)
+            flagList.append(flags[partition.getOwnedMask(i, flags)])
+        tiled = np.concatenate(flagList)
+        self.assertEqual(tiled.shape, expected.shape)
+        self.assertTrue(
+            np.allclose(tiled[np.lexsort(tiled.T)], expected[np.lexsort(expected.T)])
+        )
+
+    def test_within_expanded_box(self):
+        partition = TilePartition.fromRegularGrid((0, 0, 20, 10), 10, halo=1)
+        mask = partition.isWithinExpandedBox(
+            0, [[0, 0, 5, 5], [-1, 0, 5, 5], [9, 9, 10.5, 10.5]]
+        )
+        self.assertTrue(np.array_equal(mask, [True, False, True]))
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(TilePartitionTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
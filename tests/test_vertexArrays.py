@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import struct
+import sys
+import unittest
+
+import numpy as np
+
+from DsgTools.core.GeometricTools.vertexArrays import (
+    LINE_RING,
+    POLYGON_RING,
+    VertexArrays,
+    anglesBetweenThreePoints,
+)
+
+
+def packCoords(coords, dimension=2):
+    return struct.pack("<I", len(coords)) + b"".join(
+        struct.pack("<" + "d" * dimension, *(tuple(c) + (0.0,) * (dimension - 2)))
+        for c in coords
+    )
+
+
+def polygonWkb(rings):
+    return struct.pack("<BII", 1, 3, len(rings)) + b"".join(
+        packCoords(r) for r in rings
+    )
+
+
+def lineStringWkb(coords):
+    return struct.pack("<BI", 1, 2) + packCoords(coords)
+
+
+def lineStringZWkb(coords):
+    return struct.pack("<BI", 1, 1002) + packCoords(coords, dimension=3)
+
+
+def multiPolygonWkb(polygons):
+    return struct.pack("<BII", 1, 6, len(polygons)) + b"".join(
+        polygonWkb(p) for p in polygons
+    )
+
+
+SQUARE = [(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)]
+HOLE = [(2, 2), (3, 2), (3, 3), (2, 3), (2, 2)]
+TRIANGLE = [(100, 0), (101, 0), (100, 50), (100, 0)]
+LINE = [(0, 0), (1, 0), (1, 1), (2, 1), (2, 1.05)]
+
+
+class VertexArraysTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vertexArrays = VertexArrays.fromWkbList(
+            [
+                polygonWkb([SQUARE, HOLE]),
+                multiPolygonWkb([[TRIANGLE], [SQUARE]]),
+                lineStringZWkb(LINE),
+            ],
+            [10, 20, 30],
+        )
+
+    def test_ring_structure(self):
+        self.assertEqual(self.vertexArrays.ringOffsets.tolist(), [0, 5, 10, 14, 19, 24])
+        self.assertEqual(
+            self.vertexArrays.ringType.tolist(),
+            [POLYGON_RING] * 4 + [LINE_RING],
+        )
+        self.assertEqual(self.vertexArrays.ringPart.tolist(), [0, 0, 0, 1, 0])
+        self.assertEqual(self.vertexArrays.ringIndex.tolist(), [0, 1, 0, 0, 0])
+
+    def test_vertex_angles(self):
+        vertexIndexes, angles, _ = self.vertexArrays.vertexAngles()
+        # closing vertices are not repeated and line ends have no angle
+        self.assertEqual(len(vertexIndexes), 4 + 4 + 3 + 4 + 3)
+        featIds = self.vertexArrays.vertexFeatureIds(vertexIndexes)
+        triangleAngles = angles[featIds == 20][:3]
+        self.assertAlmostEqual(triangleAngles.sum(), 180)
+        self.assertTrue(np.allclose(angles[featIds == 10], 90))
+
+    def test_areas_and_lengths(self):
+        self.assertTrue(np.allclose(self.vertexArrays.featureAreas(), [99, 125, 0]))
+        self.assertAlmostEqual(self.vertexArrays.featureLengths()[2], 3.05)
+
+    def test_close_vertex_pairs(self):
+        first, second = self.vertexArrays.findCloseVertexPairs(0.1)
+        pairs = {
+            tuple(
+                sorted([tuple(self.vertexArrays.xy[i]), tuple(self.vertexArrays.xy[j])])
+            )
+            for i, j in zip(first, second)
+        }
+        self.assertEqual(pairs, {((2.0, 1.0), (2.0, 1.05))})
+
+    def test_junction_windows(self):
+        vertexArrays = VertexArrays.fromWkbList(
+            [
+                lineStringWkb([(0, 0), (1, 0), (2, 0)]),
+                lineStringWkb([(2, 0), (3, 0), (4, 0)]),
+                lineStringWkb([(4, 0), (5, 0)]),
+                lineStringWkb([(5, 0), (6, 0)]),
+                # ends where it starts, no junction with itself
+                lineStringWkb([(9, 9), (9, 8), (8, 8), (9, 9)]),
+            ]
+        )
+        windows = vertexArrays.getJunctionWindowIndexes(1e-9)
+        sequences = {
+            tuple(map(tuple, vertexArrays.xy[window].tolist())) for window in windows
+        }
+        self.assertEqual(
+            sequences,
+            {
+                ((0, 0), (1, 0), (2, 0), (3, 0)),
+                ((1, 0), (2, 0), (3, 0), (4, 0)),
+                ((2, 0), (3, 0), (4, 0), (5, 0)),
+                ((3, 0), (4, 0), (5, 0), (6, 0)),
+            },
+        )
+
+    def test_angle_between_three_points(self):
+        angles = anglesBetweenThreePoints(
+            np.array([[0.0, 0.0], [0.0, 0.0]]),
+            np.array([[1.0, 0.0], [1.0, 0.0]]),
+            np.array([[1.0, 1.0], [1.0, -1.0]]),
+        )
+        # same values as QgsGeometryUtils.angleBetweenThreePoints, in degrees
+        self.assertAlmostEqual(angles[0], 90)
+        self.assertAlmostEqual(angles[1], 270)
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(VertexArraysTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)
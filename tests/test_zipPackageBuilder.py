@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DsgTools
+                                 A QGIS plugin
+ Brazilian Army Cartographic Production Tools
+                              -------------------
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Philipe Borba - Cartographic Engineer @ Brazilian Army
+        email                : borba.philipe@eb.mil.br
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from DsgTools.core.Utils.zipPackageBuilder import (
+    buildZipPackage,
+    buildZipPackages,
+    writeManifest,
+)
+
+
+class ZipPackageBuilderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempDir.name)
+        self.folderList = []
+        for i in range(3):
+            folder = self.root / "input" / f"sheet_{i}"
+            (folder / "raster").mkdir(parents=True)
+            (folder / "layer.shp").write_bytes(b"shape" * 1000 * (i + 1))
+            (folder / "raster" / "image.tif").write_bytes(os.urandom(5000))
+            (folder / ".DS_Store").write_bytes(b"ignored")
+            self.folderList.append(folder)
+        (self.root / "output").mkdir()
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_package_contents_and_checksums(self):
+        zipPath = self.root / "output" / "sheet_0.zip"
+        entry = buildZipPackage(self.folderList[0], zipPath)
+        self.assertFalse(Path(str(zipPath) + ".part").exists())
+        self.assertEqual(
+            [f["name"] for f in entry["files"]],
+            ["sheet_0/layer.shp", "sheet_0/raster/image.tif"],
+        )
+        with zipfile.ZipFile(zipPath) as zf:
+            for fileEntry in entry["files"]:
+                info = zf.getinfo(fileEntry["name"])
+                content = zf.read(info)
+                self.assertEqual(len(content), fileEntry["size"])
+                self.assertEqual(
+                    hashlib.sha256(content).hexdigest(), fileEntry["sha256"]
+                )
+                self.assertEqual(
+                    info.compress_type,
+                    zipfile.ZIP_STORED if fileEntry["stored"] else zipfile.ZIP_DEFLATED,
+                )
+        self.assertEqual(
+            entry["sha256"], hashlib.sha256(zipPath.read_bytes()).hexdigest()
+        )
+
+    def test_archive_folder_is_the_folder_stem(self):
+        folder = self.folderList[0].rename(self.root / "input" / "sheet_0.v2")
+        entry = buildZipPackage(folder, self.root / "output" / "sheet_0.zip")
+        self.assertEqual(
+            [f["name"] for f in entry["files"]],
+            ["sheet_0/layer.shp", "sheet_0/raster/image.tif"],
+        )
+
+    def test_concurrent_packages_and_manifest(self):
+        packageList = [
+            (folder, self.root / "output" / f"{folder.name}.zip")
+            for folder in self.folderList
+        ]
+        entryList = list(buildZipPackages(packageList, maxConcurrency=2))
+        self.assertEqual(len(entryList), 3)
+        manifestPath = self.root / "output" / "manifest.json"
+        writeManifest(manifestPath, entryList)
+        with open(manifestPath) as f:
+            manifest = json.load(f)
+        self.assertEqual(
+            [package["package"] for package in manifest["packages"]],
+            ["sheet_0.zip", "sheet_1.zip", "sheet_2.zip"],
+        )
+
+    def test_compress_level(self):
+        textFile = self.folderList[0] / "layer.dbf"
+        textFile.write_text(
+            "".join(f"{i},{i * i % 7919},feature {i % 97}\n" for i in range(20000))
+        )
+        sizeDict = {
+            level: buildZipPackage(
+                self.folderList[0],
+                self.root / "output" / f"level_{level}.zip",
+                compressLevel=level,
+            )["size"]
+            for level in (1, 9)
+        }
+        self.assertLess(sizeDict[9], sizeDict[1])
+
+
+def run_all(filterString=None):
+    """Default function that is called by the runner if nothing else is specified"""
+    filterString = "test_" if filterString is None else filterString
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.makeSuite(ZipPackageBuilderTestCase, filterString))
+    unittest.TextTestRunner(verbosity=3, stream=sys.stdout).run(suite)